@@ -282,8 +282,8 @@ function renderLatexWhenReady(element, attempt = 0) {
  *
  * Single owner of the post-decryption sequence, shared by the fresh-unlock
  * and cached-key paths: inject the build-rendered step markup into the
- * hidden step pool, publish window.storyData in the same shape open stories
- * get, then dispatch telar:story-unlocked so main.js initialises the story
+ * hidden step pool, publish window.storyData (and window.objectsData) in the
+ * same shape open stories get, then dispatch telar:story-unlocked so main.js initialises the story
  * system on the injected DOM (card pool clones the steps exactly as it does
  * for open stories).
  * @param {object} payload - Decrypted envelope: { steps, html }
@@ -301,12 +301,19 @@ function applyDecryptedPayload(payload, key) {
   }
   container.innerHTML = payload.html;
 
-  const firstStep = payload.steps[0]?._metadata ? payload.steps[1] : payload.steps[0];
+  const metadata = payload.steps[0]?._metadata ? payload.steps[0] : null;
+  const firstStep = metadata ? payload.steps[1] : payload.steps[0];
   window.storyData = {
     steps: payload.steps,
     firstObject: firstStep?.object || '',
   };
 
+  // The story's objects travel in the encrypted _metadata block; older
+  // payloads without them keep the catalogue the page was built with
+  if (Array.isArray(metadata?.objects)) {
+    window.objectsData = metadata.objects;
+  }
+
   // Expose the key for share panel integration
   window.telarStoryKey = key;
 
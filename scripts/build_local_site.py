@@ -26,6 +26,29 @@ Each step can be skipped with flags (--skip-fetch, --skip-iiif,
 has changed. The default behaviour is to run all steps and start a
 local Jekyll server on port 4001.
 
+Steps 2-5 run in this interpreter through the stage runner in
+`telar.pipeline` instead of as separate `python3` processes, so pandas,
+Pillow and the rest are imported once, and the parsed `_config.yml`,
+objects.json, glossary, language strings and objects folder listing are
+shared between steps through a `BuildContext`. The steps that need other
+tools (fetching, esbuild, Jekyll, encryption) still run as commands. A
+table of per-step timings is printed at the end of the build.
+
+The steps are declared as a graph rather than a fixed sequence: audio
+peaks, IIIF tiles and the JavaScript bundle do not depend on each other,
+so with `--jobs` above 1 they run side by side (CSV conversion, which
+uses its own process pool, runs alone). Collections wait for the audio
+step, since object pages read durations from the peaks files. Steps that
+declare their inputs and outputs — collections, audio, IIIF tiles and the
+bundle — are skipped when nothing they read or wrote has changed since
+they last succeeded; `--force` runs everything. The timing table ends
+with the critical path, the chain of steps that bounds the build time.
+
+`--watch` keeps the script running after the build: Jekyll serves in the
+background while `telar.watch` polls `telar-content/` and `_config.yml`
+and, on each change, reruns only the data conversions and collection
+files that depend on the edited files, in this same process.
+
 Version: v1.6.0
 
 Usage:
@@ -35,14 +58,20 @@ Usage:
     python3 scripts/build_local_site.py --skip-iiif  # Skip IIIF tile generation
     python3 scripts/build_local_site.py --skip-fetch # Skip Google Sheets fetch
     python3 scripts/build_local_site.py --skip-audio # Skip audio processing
+    python3 scripts/build_local_site.py --jobs 4     # Run up to 4 CPUs of steps at once
+    python3 scripts/build_local_site.py --force      # Rebuild steps that look up to date
+    python3 scripts/build_local_site.py --watch      # Serve and rebuild on content changes
 """
 
 import argparse
+import os
 import subprocess
 import sys
-import yaml
 from pathlib import Path
 
+from telar.config import load_site_config
+from telar.pipeline import BuildContext, Stage, run_pipeline, output_is_buffered
+
 
 def _run_command(cmd, description, check, use_shell):
     """Run a command (shell string or argument list) with status output."""
@@ -50,7 +79,14 @@ def _run_command(cmd, description, check, use_shell):
     print(f"  {description}")
     print(f"{'='*60}\n")
 
-    result = subprocess.run(cmd, shell=use_shell)
+    if output_is_buffered():
+        # Running alongside other stages: capture the output so it is
+        # printed with this stage's log instead of interleaving
+        result = subprocess.run(cmd, shell=use_shell, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, errors='replace')
+        print(result.stdout, end='')
+    else:
+        result = subprocess.run(cmd, shell=use_shell)
 
     if check and result.returncode != 0:
         print(f"\n❌ Error: {description} failed with exit code {result.returncode}")
@@ -92,6 +128,192 @@ def kill_running_jekyll(port):
         print("✓ Killed running Jekyll process")
 
 
+def fetch_sheets(args):
+    """Step 1: Fetch Google Sheets (if enabled and not skipped)."""
+    if args.skip_fetch:
+        print("\n✓ Step 1/8: Skipping Google Sheets fetch (--skip-fetch)")
+        return
+
+    config_path = Path('_config.yml')
+    if not config_path.exists():
+        print("\n⚠ Step 1/8: No _config.yml found - skipping Google Sheets fetch")
+        return
+
+    config = load_site_config()
+    gs_enabled = config.get('google_sheets', {}).get('enabled', False)
+
+    if gs_enabled:
+        run_command(
+            'python3 scripts/fetch_google_sheets.py',
+            'Step 1/8: Fetching data from Google Sheets'
+        )
+    else:
+        print("\n✓ Step 1/8: Google Sheets disabled - using existing CSV files")
+
+
+def convert_data(context, jobs=None, force=False):
+    """Step 2: Convert CSV to JSON (csv_to_json.py, in-process)."""
+    from telar.core import build_data
+    return build_data(jobs=jobs, force=force)
+
+
+def generate_collection_files(context, jobs=1):
+    """Step 3: Generate Jekyll collections (generate_collections.py, in-process)."""
+    from generate_collections import generate_collections
+    return generate_collections(context=context, jobs=jobs)
+
+
+def generate_waveforms(context):
+    """Step 4: Generate waveform peaks (process_audio.py, in-process)."""
+    # Check if any audio files exist (skip gracefully if none)
+    audio_extensions = ('.mp3', '.ogg', '.m4a')
+    inventory = context.inventory
+    has_audio = inventory is not None and any(
+        entry.path.suffix.lower() in audio_extensions
+        for entry in inventory['files'].values()
+    )
+    if not has_audio:
+        print("✓ No audio objects found - skipping audio processing")
+        return
+
+    import process_audio as audio
+    audio.check_audio_dependencies()
+    return audio.process_audio_objects(
+        objects_dir='telar-content/objects',
+        data_dir='_data',
+        output_dir='assets/audio',
+        objects=context.objects
+    )
+
+
+def generate_tiles(context, base_url):
+    """Step 5: Generate IIIF tiles (generate_iiif.py, in-process)."""
+    from generate_iiif import generate_iiif_tiles
+    return generate_iiif_tiles(base_url=base_url, objects=context.objects)
+
+
+def local_base_url(port):
+    """Base URL for locally served tiles: the local server plus the site's baseurl."""
+    base_url = f"http://127.0.0.1:{port}"
+
+    # Read baseurl from config
+    config_path = Path('_config.yml')
+    if config_path.exists():
+        config = load_site_config()
+        baseurl = config.get('baseurl', '')
+        if baseurl:
+            base_url = f"{base_url}{baseurl}"
+    return base_url
+
+
+def skipped(message):
+    """A stage body that only reports that its step was skipped."""
+    return lambda context: print(f"\n✓ {message}")
+
+
+def build_stages(args, serve, jobs=1):
+    """
+    Declare the build steps as a graph of pipeline stages.
+
+    Stages with a description get their banner from the runner; steps that
+    run a command print their own through run_command. Inputs and outputs
+    let the runner skip a step whose files have not changed; `scripts` is an
+    input of every in-process step so a Telar upgrade reruns them.
+
+    Args:
+        args: Parsed command-line arguments
+        serve: True if the site will be served (Jekyll build and encryption
+            are then left out)
+        jobs: CPU budget of the run (CSV conversion and collection
+            rendering reserve all of it)
+
+    Returns:
+        list[Stage]
+    """
+    stages = [
+        Stage('fetch', None, lambda context: fetch_sheets(args), deps=[]),
+        Stage('csv_to_json', 'Step 2/8: Converting CSV to JSON',
+              lambda context: convert_data(context, args.jobs, args.force),
+              writes=('objects',), deps=['fetch'], cpus=jobs),
+    ]
+
+    if args.skip_audio:
+        stages.append(Stage('audio', None, skipped('Step 4/8: Skipping audio processing (--skip-audio)'),
+                            deps=['csv_to_json']))
+    else:
+        stages.append(Stage('audio', 'Step 4/8: Processing audio objects (waveform peaks)',
+                            generate_waveforms, deps=['csv_to_json'],
+                            inputs=['telar-content/objects', '_data/objects.json', 'scripts'],
+                            outputs=['assets/audio/peaks']))
+
+    # Object pages read audio durations from the peaks files, and glossary
+    # pages are generated from glossary.csv. Glossary and page rendering
+    # reserves the CPU budget, like CSV conversion.
+    stages.append(Stage('collections', 'Step 3/8: Generating Jekyll collections',
+                        lambda context: generate_collection_files(context, jobs),
+                        deps=['csv_to_json', 'audio'], cpus=jobs,
+                        inputs=['_data', 'telar-content/texts', 'telar-content/objects',
+                                'telar-content/spreadsheets', 'assets/audio/peaks',
+                                '_config.yml', 'scripts'],
+                        outputs=['_jekyll-files']))
+
+    if args.skip_iiif:
+        stages.append(Stage('iiif', None, skipped('Step 5/8: Skipping IIIF generation (--skip-iiif)'),
+                            deps=['csv_to_json']))
+    else:
+        base_url = local_base_url(args.port)
+        stages.append(Stage('iiif', f'Step 5/8: Generating IIIF tiles (base URL: {base_url})',
+                            lambda context: generate_tiles(context, base_url),
+                            deps=['csv_to_json'],
+                            inputs=['telar-content/objects', '_data/objects.json', 'scripts'],
+                            outputs=['iiif/objects'], key=base_url))
+
+    # Step 6: Build JavaScript bundle
+    stages.append(Stage('js', None, lambda context: run_command(
+        'npm run build:js',
+        'Step 6/8: Building JavaScript bundle'
+    ), deps=[], inputs=['assets/js/telar-story', 'package.json'],
+        outputs=['assets/js/telar-story.js']))
+
+    if not serve:
+        stages.append(Stage('jekyll', None, lambda context: run_command(
+            'bundle exec jekyll build',
+            'Step 7/8: Building Jekyll site'
+        ), deps=['collections', 'audio', 'iiif', 'js']))
+
+        # Step 8: Encrypt protected stories in the built output. Same gate as
+        # the deploy workflow: a no-op without protected stories, a hard
+        # failure rather than plaintext with them. Serve mode cannot hold
+        # this guarantee (Jekyll regenerates _site continuously), so
+        # protected-story testing uses this build followed by a static
+        # server.
+        stages.append(Stage('encrypt', None, lambda context: run_command(
+            'python3 scripts/encrypt_protected_stories.py',
+            'Step 8/8: Encrypting protected stories (post-build gate)'
+        ), deps=['jekyll']))
+
+    return stages
+
+
+def watch_site(args, serve, context):
+    """Serve Jekyll in the background (unless --build-only) and watch content."""
+    from telar.watch import watch
+
+    server = None
+    if serve:
+        print("\n" + "="*60)
+        print(f"  Step 7/8: Starting Jekyll server on port {args.port} (watch mode)")
+        print("="*60)
+        print(f"\n  Site will be available at: http://127.0.0.1:{args.port}/telar/")
+        server = subprocess.Popen(['bundle', 'exec', 'jekyll', 'serve', '--port', str(args.port)])
+    try:
+        watch(context)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Build Telar site for local development')
     parser.add_argument('--build-only', action='store_true', help='Build without starting server')
@@ -99,6 +321,12 @@ def main():
     parser.add_argument('--skip-iiif', action='store_true', help='Skip IIIF tile generation')
     parser.add_argument('--skip-fetch', action='store_true', help='Skip Google Sheets fetch')
     parser.add_argument('--skip-audio', action='store_true', help='Skip audio processing')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='CPUs to use for independent steps and story conversion (default: all)')
+    parser.add_argument('--force', action='store_true',
+                        help='Run every step, even those whose outputs are up to date')
+    parser.add_argument('--watch', action='store_true',
+                        help='After building, rebuild affected data and pages when telar-content/ changes')
     args = parser.parse_args()
 
     # Serve by default unless --build-only is specified
@@ -111,85 +339,17 @@ def main():
     print("  Telar Local Build")
     print("="*60)
 
-    # Step 1: Fetch Google Sheets (if enabled and not skipped)
-    if not args.skip_fetch:
-        config_path = Path('_config.yml')
-        if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-
-            gs_enabled = config.get('google_sheets', {}).get('enabled', False)
-
-            if gs_enabled:
-                run_command(
-                    'python3 scripts/fetch_google_sheets.py',
-                    'Step 1/8: Fetching data from Google Sheets'
-                )
-            else:
-                print("\n✓ Step 1/8: Google Sheets disabled - using existing CSV files")
-        else:
-            print("\n⚠ Step 1/8: No _config.yml found - skipping Google Sheets fetch")
-    else:
-        print("\n✓ Step 1/8: Skipping Google Sheets fetch (--skip-fetch)")
+    jobs = args.jobs or os.cpu_count() or 1
+    stages = build_stages(args, serve, jobs)
+    context = BuildContext()
+    if not run_pipeline(stages, context, jobs=jobs, force=args.force):
+        sys.exit(1)
 
-    # Step 2: Convert CSV to JSON
-    run_command(
-        'python3 scripts/csv_to_json.py',
-        'Step 2/8: Converting CSV to JSON'
-    )
+    if args.watch:
+        watch_site(args, serve, context)
+        return
 
-    # Step 3: Generate Jekyll collections
-    run_command(
-        'python3 scripts/generate_collections.py',
-        'Step 3/8: Generating Jekyll collections'
-    )
-
-    # Step 4: Process audio objects (unless skipped)
-    if not args.skip_audio:
-        # Check if any audio files exist (skip gracefully if none)
-        audio_extensions = ('.mp3', '.ogg', '.m4a')
-        objects_dir = Path('telar-content/objects')
-        has_audio = objects_dir.exists() and any(
-            f for f in objects_dir.iterdir()
-            if f.suffix.lower() in audio_extensions
-        )
-        if has_audio:
-            run_command(
-                'python3 scripts/process_audio.py --objects-dir telar-content/objects --data-dir _data --output-dir assets/audio',
-                'Step 4/8: Processing audio objects (waveform peaks)'
-            )
-        else:
-            print("\n✓ Step 4/8: No audio objects found - skipping audio processing")
-    else:
-        print("\n✓ Step 4/8: Skipping audio processing (--skip-audio)")
-
-    # Step 5: Generate IIIF tiles (unless skipped)
-    if not args.skip_iiif:
-        base_url = f"http://127.0.0.1:{args.port}"
-
-        # Read baseurl from config
-        config_path = Path('_config.yml')
-        if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-            baseurl = config.get('baseurl', '')
-            if baseurl:
-                base_url = f"{base_url}{baseurl}"
-
-        run_command_list(
-            ['python3', 'scripts/generate_iiif.py', '--base-url', base_url],
-            f'Step 5/8: Generating IIIF tiles (base URL: {base_url})'
-        )
-    else:
-        print("\n✓ Step 5/8: Skipping IIIF generation (--skip-iiif)")
-
-    # Step 6: Build JavaScript bundle
-    run_command(
-        'npm run build:js',
-        'Step 6/8: Building JavaScript bundle'
-    )
-
-    # Step 7: Build or serve Jekyll
+    # Step 7: Serve Jekyll (build mode ran Jekyll and encryption as stages)
     if serve:
         print("\n" + "="*60)
         print(f"  Step 7/8: Starting Jekyll server on port {args.port}")
@@ -207,21 +367,6 @@ def main():
             check=False  # Don't exit on Ctrl+C
         )
     else:
-        run_command(
-            'bundle exec jekyll build',
-            'Step 7/8: Building Jekyll site'
-        )
-
-        # Step 8: Encrypt protected stories in the built output. Same gate as
-        # the deploy workflow: a no-op without protected stories, a hard
-        # failure rather than plaintext with them. Serve mode cannot hold
-        # this guarantee (Jekyll regenerates _site continuously), so
-        # protected-story testing uses this build followed by a static
-        # server.
-        run_command(
-            'python3 scripts/encrypt_protected_stories.py',
-            'Step 8/8: Encrypting protected stories (post-build gate)'
-        )
         print("\n" + "="*60)
         print("  Build complete! Site is in _site/")
         print("="*60 + "\n")
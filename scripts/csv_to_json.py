@@ -44,7 +44,7 @@ from telar.processors.stories import process_story
 from telar.demo import (
     load_demo_bundle, merge_demo_content, fetch_demo_content_if_enabled
 )
-from telar.core import csv_to_json, find_csv_with_fallback, main
+from telar.core import csv_to_json, find_csv_with_fallback, build_data, main
 
 # Re-export third-party names that tests may patch on this module
 from jinja2 import Environment
@@ -38,6 +38,10 @@ metadata like the byline is deliberately not used: bylines recur across a
 site's open and protected stories, and a shared byline must not fail the
 build.
 
+A story whose steps and rendered HTML are unchanged since the last build
+keeps its previous envelope (telar.encryption.encrypt_story_stable), so its
+page is byte-identical between builds.
+
 Version: v1.6.0
 """
 
@@ -52,8 +56,9 @@ import yaml
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from telar.build_state import BUILD_DB_PATH, get_build_state  # noqa: E402
 from telar.encryption import (  # noqa: E402
-    encrypt_story,
+    encrypt_story_stable,
     get_protected_stories,
     get_story_key_from_config,
 )
@@ -262,6 +267,8 @@ def process_site(site_dir, data_dir, config_path):
         )
 
     sentinels_by_story = {}
+    # Unchanged stories keep last build's envelope (the site root holds _config.yml)
+    state = get_build_state(Path(config_path).parent / BUILD_DB_PATH)
 
     for identifier in sorted(protected):
         data_file = data_dir / f"{identifier}.json"
@@ -287,8 +294,8 @@ def process_site(site_dir, data_dir, config_path):
         if not story_page.exists():
             raise GateFailure(f"{identifier}: story page not found ({story_page})")
 
-        envelope = encrypt_story(
-            {'steps': steps, 'html': fragment_html}, story_key, aad=identifier
+        envelope = encrypt_story_stable(
+            {'steps': steps, 'html': fragment_html}, story_key, aad=identifier, state=state
         )
         inject_envelope(story_page, envelope)
 
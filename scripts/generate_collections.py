@@ -27,27 +27,53 @@ skip_collections) from _config.yml, which allow developers to
 temporarily suppress certain collections during development.
 Legacy names (hide_stories, hide_collections) are also supported.
 
+Every collection is written through `telar.collection_files`: each
+file's content is built in memory and compared with the file on disk,
+only new or changed files are written, and files whose source is gone
+are removed, so `jekyll build --incremental` sees only real changes (on
+a 3,000-object site, an edit to one object touches one file, not 3,000).
+Each collection prints how many files were created, updated, unchanged
+and removed. Glossary terms and pages are rendered (widgets, images,
+markdown, glossary links) in a pool of worker processes when there are
+enough of them (`--jobs`). Each page's frontmatter is parsed once, for
+both the sister-file map and the output.
+
+`generate_collections()` runs the whole step and can be called in-process
+by the build pipeline (`telar.pipeline`) with a `BuildContext`, in which
+case the parsed objects.json, glossary and config are taken from the
+context instead of being read again. `main()` only parses the command line.
+
 Version: v1.6.0
 """
 
 import argparse
+import io
 import json
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
-import markdown
 import pandas as pd
 import yaml
 
 # Import processing functions from telar package
-from telar.widgets import process_widgets
+from telar.widgets import process_widgets, reset_widget_ids
 from telar.images import process_images
-from telar.glossary import process_glossary_links, load_glossary_terms
-from telar.markdown import read_markdown_file, process_inline_content
+from telar.glossary import process_glossary_links, load_glossary_terms, GlossaryLinker
+from telar.markdown import (
+    read_markdown_file, process_inline_content, cached_rendering, render_markdown, PAGE_EXTENSIONS
+)
 from telar.core import find_csv_with_fallback
+from telar.config import load_site_config, get_glossary_auto_link
 from telar.latex import has_latex
 from telar.media_type import detect_media_type, AUDIO_EXTENSIONS
+from telar.asset_inventory import find_object_file
+from telar.collection_files import CollectionFiles
+from telar.profiling import add_profile_arguments, profile_stage
 
 # Fields already handled explicitly in generate_objects() frontmatter.
 # Any key NOT in this set is treated as a custom field and written to extra_metadata.
@@ -64,6 +90,15 @@ KNOWN_OBJECT_FIELDS = {
 
 FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
 
+# Fewer files than this render faster in-process than a worker pool starts
+PARALLEL_RENDER_MIN = 8
+
+# Generated pages that belong to generate_protected_fragments()
+FRAGMENT_PAGES = 'telar-fragment-*.md'
+
+# Glossary linker used by the render functions in this process
+_render_glossary = None
+
 
 def _yaml_escape(value):
     """Escape a string value for safe inclusion in double-quoted YAML."""
@@ -73,23 +108,24 @@ def _yaml_escape(value):
     return s
 
 
-def generate_objects():
-    """Generate object markdown files from objects.json"""
-    if not Path('_data/objects.json').exists():
-        print("No objects.json found — skipping object generation")
-        return
+def generate_objects(objects=None):
+    """Generate object markdown files from objects.json
 
-    with open('_data/objects.json', 'r') as f:
-        objects = json.load(f)
+    Only files whose content changed are written; files of objects that no
+    longer exist are removed.
 
-    objects_dir = Path('_jekyll-files/_objects')
+    Args:
+        objects: Already-parsed objects.json list (read from _data/ if None)
+    """
+    if objects is None:
+        if not Path('_data/objects.json').exists():
+            print("No objects.json found — skipping object generation")
+            return
 
-    # Clean up old files to remove orphaned objects
-    if objects_dir.exists():
-        shutil.rmtree(objects_dir)
-        print(f"✓ Cleaned up old object files")
+        with open('_data/objects.json', 'r', encoding='utf-8') as f:
+            objects = json.load(f)
 
-    objects_dir.mkdir(parents=True, exist_ok=True)
+    files = CollectionFiles('_jekyll-files/_objects')
 
     for obj in objects:
         object_id = obj.get('object_id', '')
@@ -99,7 +135,7 @@ def generate_objects():
         is_demo = obj.get('_demo', False)
 
         # Generate main object page
-        filepath = objects_dir / f"{object_id}.md"
+        filename = f"{object_id}.md"
 
         # Build front matter, omitting empty fields so Liquid {% if %}
         # conditionals work correctly (empty strings are truthy in Liquid)
@@ -163,17 +199,15 @@ def generate_objects():
                     pass
 
             # File size and format from disk
-            for ext in AUDIO_EXTENSIONS:
-                audio_path = Path(f'telar-content/objects/{object_id}{ext}')
-                if audio_path.exists():
-                    size_bytes = audio_path.stat().st_size
-                    if size_bytes < 1024 * 1024:
-                        size_str = f'{size_bytes / 1024:.0f} KB'
-                    else:
-                        size_str = f'{size_bytes / (1024 * 1024):.1f} MB'
-                    content += f'audio_filesize: "{size_str}"\n'
-                    content += f'audio_format: "{ext.lstrip(".").upper()}"\n'
-                    break
+            audio_match = find_object_file(object_id, AUDIO_EXTENSIONS)
+            if audio_match:
+                size_bytes = audio_match.size
+                if size_bytes < 1024 * 1024:
+                    size_str = f'{size_bytes / 1024:.0f} KB'
+                else:
+                    size_str = f'{size_bytes / (1024 * 1024):.1f} MB'
+                content += f'audio_filesize: "{size_str}"\n'
+                content += f'audio_format: "{audio_match.path.suffix.lstrip(".").upper()}"\n'
 
         # Collect custom fields not in the known set
         extra = {}
@@ -202,19 +236,158 @@ def generate_objects():
 {description}
 """
 
-        with open(filepath, 'w') as f:
-            f.write(content)
+        if files.write(filename, content) != 'unchanged':
+            demo_label = " [DEMO]" if is_demo else ""
+            print(f"✓ Generated {files.directory / filename}{demo_label}")
+
+    # Remove orphaned objects
+    files.remove_orphans()
+    print(files.summary('Objects'))
+
+
+def _init_render_worker(glossary_terms, auto_link=False):
+    """Compile the glossary once for this process's renders (pool initializer)."""
+    global _render_glossary
+    _render_glossary = GlossaryLinker(glossary_terms, auto_link=auto_link)
+
 
-        demo_label = " [DEMO]" if is_demo else ""
-        print(f"✓ Generated {filepath}{demo_label}")
+def _render_buffered(render, args):
+    """
+    Run one render in a worker process, buffering its log.
+
+    Returns:
+        tuple: (render's result, everything it printed)
+    """
+    log = io.StringIO()
+    with redirect_stdout(log), redirect_stderr(log), cached_rendering():
+        result = render(*args)
+    return result, log.getvalue()
+
+
+def _render_all(render, tasks, glossary_terms, auto_link=False, jobs=1):
+    """
+    Render collection files, spread across worker processes when there are
+    enough of them.
 
-def _generate_glossary_from_csv(csv_path, glossary_dir, glossary_terms):
+    Each worker compiles the glossary once; logs are printed in task order.
+
+    Args:
+        render: Top-level function rendering one file from a task's arguments
+        tasks: List of argument tuples
+        glossary_terms: term_id -> title for glossary links
+        auto_link: Passed to GlossaryLinker
+        jobs: Maximum number of worker processes
+
+    Returns:
+        list: render's result per task
+
+    Raises:
+        Exception: The first failure, as in-process rendering would; the
+            logs of the tasks before it are printed and the rest cancelled
+    """
+    _init_render_worker(glossary_terms, auto_link)
+    if jobs <= 1 or len(tasks) < PARALLEL_RENDER_MIN:
+        return [render(*task) for task in tasks]
+
+    workers = min(jobs, len(tasks))
+    print(f"  [INFO] Rendering {len(tasks)} files with {workers} worker processes")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                             initargs=(glossary_terms, auto_link)) as pool:
+        futures = [pool.submit(_render_buffered, render, task) for task in tasks]
+        try:
+            for future in futures:
+                result, log = future.result()
+                sys.stdout.write(log)
+                results.append(result)
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+    return results
+
+
+def _render_glossary_definition(definition):
+    """Render a glossary.csv definition (file reference or inline) to HTML."""
+    # Each glossary entry is its own page for widget IDs
+    reset_widget_ids()
+
+    # Process definition: file reference or inline content
+    # If definition looks like a filename (short, no spaces/newlines), try as file first
+    looks_like_filename = ('\n' not in definition and ' ' not in definition
+                           and len(definition) <= 200)
+    if looks_like_filename:
+        file_def = definition if definition.endswith('.md') else f'{definition}.md'
+        glossary_path = file_def if file_def.startswith('glossary/') else f'glossary/{file_def}'
+        content_data = read_markdown_file(glossary_path)
+    else:
+        content_data = None
+
+    if content_data:
+        body = content_data['content']
+    else:
+        # No file found or inline content — treat as inline
+        content_data = process_inline_content(definition)
+        body = content_data['content'] if content_data else ''
+
+    # Process glossary-to-glossary links
+    warnings_list = []
+    processed = process_glossary_links(body, _render_glossary, warnings_list)
+
+    for warning in warnings_list:
+        print(f"  Warning: {warning}")
+    return processed
+
+
+def _render_glossary_markdown(body):
+    """Render a legacy glossary markdown body to HTML."""
+    warnings_list = []
+
+    # 1. Process images (size syntax and captions)
+    processed = process_images(body)
+
+    # 2. Convert markdown to HTML
+    processed = render_markdown(processed, PAGE_EXTENSIONS)
+
+    # 3. Process glossary links ([[term]] syntax)
+    processed = process_glossary_links(processed, _render_glossary, warnings_list)
+
+    # Print any warnings
+    for warning in warnings_list:
+        print(f"  Warning: {warning}")
+    return processed
+
+
+def _render_page(source_file, body):
+    """Render a page body through the same pipeline as story layers."""
+    warnings_list = []
+
+    # 1. Process widgets (:::carousel, :::tabs, :::accordion)
+    reset_widget_ids()
+    processed = process_widgets(body, str(source_file), warnings_list)
+
+    # 2. Process images (size syntax and captions)
+    processed = process_images(processed)
+
+    # 3. Convert markdown to HTML
+    processed = render_markdown(processed, PAGE_EXTENSIONS)
+
+    # 4. Process glossary links ([[term]] syntax)
+    processed = process_glossary_links(processed, _render_glossary, warnings_list)
+
+    # Print any warnings
+    for warning in warnings_list:
+        print(f"  Warning: {warning}")
+    return processed
+
+
+def _generate_glossary_from_csv(csv_path, files, glossary_terms, jobs=1):
     """Generate glossary files from CSV.
 
     Args:
         csv_path: Path to glossary.csv
-        glossary_dir: Output directory for Jekyll files
-        glossary_terms: Dict of term_id -> title for link processing
+        files: CollectionFiles for the glossary output directory
+        glossary_terms: term_id -> title for link processing
+        jobs: Maximum number of worker processes for rendering
     """
     df = pd.read_csv(csv_path)
 
@@ -236,6 +409,7 @@ def _generate_glossary_from_csv(csv_path, glossary_dir, glossary_terms):
             print(f"  ⚠️ glossary.csv missing required column: {col}")
             return
 
+    entries = []
     for _, row in df.iterrows():
         term_id = str(row.get('term_id', '')).strip()
         title = str(row.get('title', '')).strip()
@@ -254,31 +428,13 @@ def _generate_glossary_from_csv(csv_path, glossary_dir, glossary_terms):
         if related_terms_raw and related_terms_raw != 'nan':
             related_terms = [t.strip() for t in related_terms_raw.split('|') if t.strip()]
 
-        # Process definition: file reference or inline content
-        # If definition looks like a filename (short, no spaces/newlines), try as file first
-        looks_like_filename = ('\n' not in definition and ' ' not in definition
-                               and len(definition) <= 200)
-        if looks_like_filename:
-            file_def = definition if definition.endswith('.md') else f'{definition}.md'
-            glossary_path = file_def if file_def.startswith('glossary/') else f'glossary/{file_def}'
-            content_data = read_markdown_file(glossary_path)
-        else:
-            content_data = None
+        entries.append((term_id, title, definition, related_terms))
 
-        if content_data:
-            body = content_data['content']
-        else:
-            # No file found or inline content — treat as inline
-            content_data = process_inline_content(definition)
-            body = content_data['content'] if content_data else ''
-
-        # Process glossary-to-glossary links
-        warnings_list = []
-        processed = process_glossary_links(body, glossary_terms, warnings_list)
-
-        for warning in warnings_list:
-            print(f"  Warning: {warning}")
+    rendered = _render_all(_render_glossary_definition, [(entry[2],) for entry in entries],
+                           glossary_terms, jobs=jobs)
 
+    for (term_id, title, _, related_terms), processed in zip(entries, rendered):
+        filename = f"{term_id}.md"
         # Check definition for LaTeX content
         latex_flag = ""
         if has_latex(processed):
@@ -290,7 +446,6 @@ def _generate_glossary_from_csv(csv_path, glossary_dir, glossary_terms):
             related_str = f"\nrelated_terms: {','.join(related_terms)}"
 
         # Write Jekyll file
-        filepath = glossary_dir / f"{term_id}.md"
         output_content = f"""---
 term_id: {term_id}
 title: "{_yaml_escape(title)}"{related_str}{latex_flag}
@@ -299,21 +454,21 @@ layout: glossary
 
 {processed}
 """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(output_content)
+        if files.write(filename, output_content) != 'unchanged':
+            print(f"✓ Generated {files.directory / filename}")
 
-        print(f"✓ Generated {filepath}")
 
-
-def _generate_glossary_from_markdown(md_path, glossary_dir, glossary_terms):
+def _generate_glossary_from_markdown(md_path, files, glossary_terms, jobs=1):
     """Generate glossary files from markdown (legacy method).
 
     Args:
         md_path: Path to telar-content/texts/glossary/
-        glossary_dir: Output directory for Jekyll files
-        glossary_terms: Dict of term_id -> title for link processing
+        files: CollectionFiles for the glossary output directory
+        glossary_terms: term_id -> title for link processing
+        jobs: Maximum number of worker processes for rendering
     """
-    for source_file in md_path.glob('*.md'):
+    entries = []
+    for source_file in sorted(md_path.glob('*.md')):
         # Read the source markdown file
         with open(source_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -334,28 +489,12 @@ def _generate_glossary_from_markdown(md_path, glossary_dir, glossary_terms):
             print(f"Warning: No term_id found in {source_file}")
             continue
 
-        term_id = term_id_match.group(1)
-        filepath = glossary_dir / f"{term_id}.md"
-
-        # Process body through the same pipeline as pages
-        warnings_list = []
+        entries.append((f"{term_id_match.group(1)}.md", frontmatter_text, body))
 
-        # 1. Process images (size syntax and captions)
-        processed = process_images(body)
-
-        # 2. Convert markdown to HTML
-        processed = markdown.markdown(
-            processed,
-            extensions=['extra', 'nl2br', 'sane_lists']
-        )
-
-        # 3. Process glossary links ([[term]] syntax)
-        processed = process_glossary_links(processed, glossary_terms, warnings_list)
-
-        # Print any warnings
-        for warning in warnings_list:
-            print(f"  Warning: {warning}")
+    rendered = _render_all(_render_glossary_markdown, [(entry[2],) for entry in entries],
+                           glossary_terms, jobs=jobs)
 
+    for (filename, frontmatter_text, _), processed in zip(entries, rendered):
         # Check definition for LaTeX content
         latex_flag = ""
         if has_latex(processed):
@@ -369,14 +508,11 @@ layout: glossary{latex_flag}
 
 {processed}
 """
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(output_content)
-
-        print(f"✓ Generated {filepath}")
+        if files.write(filename, output_content) != 'unchanged':
+            print(f"✓ Generated {files.directory / filename}")
 
 
-def generate_glossary():
+def generate_glossary(glossary_terms=None, jobs=1):
     """Generate glossary markdown files from user content and demo JSON.
 
     Reads from (in order of precedence):
@@ -385,18 +521,19 @@ def generate_glossary():
     - _data/demo-glossary.json (demo content from bundle)
 
     If both CSV and markdown exist, CSV takes precedence and a warning is shown.
-    """
-    glossary_dir = Path('_jekyll-files/_glossary')
-
-    # Clean up old files to remove orphaned glossary terms
-    if glossary_dir.exists():
-        shutil.rmtree(glossary_dir)
-        print(f"✓ Cleaned up old glossary files")
+    Only files whose content changed are written; files of terms that no
+    longer exist are removed.
 
-    glossary_dir.mkdir(parents=True, exist_ok=True)
+    Args:
+        glossary_terms: term_id -> title for link processing (loaded if None)
+        jobs: Maximum number of worker processes for rendering
+    """
+    files = CollectionFiles('_jekyll-files/_glossary')
 
-    # Load glossary terms for link processing (enables glossary-to-glossary linking)
-    glossary_terms = load_glossary_terms()
+    # Load glossary terms for link processing (enables glossary-to-glossary
+    # linking); each rendering process compiles them once
+    if glossary_terms is None:
+        glossary_terms = load_glossary_terms()
 
     csv_path = Path(find_csv_with_fallback('telar-content/spreadsheets/glossary', 'glosario'))
     md_path = Path('telar-content/texts/glossary')
@@ -407,10 +544,10 @@ def generate_glossary():
         if md_path.exists() and any(md_path.glob('*.md')):
             print(f"  ⚠️ Found both glossary.csv and markdown files. Using CSV.")
 
-        _generate_glossary_from_csv(csv_path, glossary_dir, glossary_terms)
+        _generate_glossary_from_csv(csv_path, files, glossary_terms, jobs=jobs)
 
     elif md_path.exists() and any(md_path.glob('*.md')):
-        _generate_glossary_from_markdown(md_path, glossary_dir, glossary_terms)
+        _generate_glossary_from_markdown(md_path, files, glossary_terms, jobs=jobs)
 
     # 2. Process demo glossary from JSON
     demo_glossary_path = Path('_data/demo-glossary.json')
@@ -423,7 +560,7 @@ def generate_glossary():
             if not term_id:
                 continue
 
-            filepath = glossary_dir / f"{term_id}.md"
+            filename = f"{term_id}.md"
 
             # Create markdown with frontmatter
             output_content = f"""---
@@ -436,10 +573,13 @@ demo: true
 {term.get('content', '')}
 """
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(output_content)
+            if files.write(filename, output_content) != 'unchanged':
+                print(f"✓ Generated {files.directory / filename} [DEMO]")
+
+    # Remove orphaned glossary terms
+    files.remove_orphans()
+    print(files.summary('Glossary'))
 
-            print(f"✓ Generated {filepath} [DEMO]")
 
 def _story_has_latex(identifier):
     """Check the story's _data JSON metadata for the has_latex flag.
@@ -471,9 +611,10 @@ def generate_protected_fragments():
     reads the rendered fragment from _site, encrypts it into the story's
     envelope, and deletes it — the fragment never deploys.
 
-    Not a collection of its own: that would add _config.yml surface. The
-    pages written here are cleaned up by glob on every run, so a story that
-    stops being protected leaves no orphan behind.
+    Not a collection of its own: that would add _config.yml surface. Fragment
+    pages this run does not produce are removed by glob, so a story that
+    stops being protected leaves no orphan behind; unchanged ones are not
+    rewritten.
     """
     project_path = Path('_data/project.json')
     if not project_path.exists():
@@ -486,13 +627,9 @@ def generate_protected_fragments():
     if project_data and len(project_data) > 0:
         stories = project_data[0].get('stories', [])
 
-    pages_dir = Path('_jekyll-files/_pages')
-    pages_dir.mkdir(parents=True, exist_ok=True)
-
-    # Clean previous fragment pages (generate_pages only clears this
-    # directory when telar-content/texts/pages exists, so do our own)
-    for old in pages_dir.glob('telar-fragment-*.md'):
-        old.unlink()
+    # Fragment pages share _pages/ with the pages; generate_pages leaves
+    # them to us
+    files = CollectionFiles('_jekyll-files/_pages', pattern=FRAGMENT_PAGES)
 
     for story in stories:
         if not story.get('protected'):
@@ -511,17 +648,22 @@ def generate_protected_fragments():
             },
             default_flow_style=False, allow_unicode=True, sort_keys=False,
         )
-        filepath = pages_dir / f'telar-fragment-{identifier}.md'
-        with open(filepath, 'w') as f:
-            f.write(f"---\n{frontmatter}---\n\n")
-        print(f"✓ Generated {filepath} (protected fragment)")
+        filename = f'telar-fragment-{identifier}.md'
+        if files.write(filename, f"---\n{frontmatter}---\n\n") != 'unchanged':
+            print(f"✓ Generated {files.directory / filename} (protected fragment)")
+
+    files.remove_orphans()
+    if any(files.counts.values()):
+        print(files.summary('Protected fragments'))
 
 
 def generate_stories():
     """Generate story markdown files based on project.json stories list
 
     Reads from _data/project.json which includes both user stories and
-    merged demo content (when include_demo_content is enabled).
+    merged demo content (when include_demo_content is enabled). Only files
+    whose content changed are written; files of stories that no longer
+    exist are removed.
     """
 
     # Read from project.json (has merged user + demo stories)
@@ -538,14 +680,7 @@ def generate_stories():
     if project_data and len(project_data) > 0:
         stories = project_data[0].get('stories', [])
 
-    stories_dir = Path('_jekyll-files/_stories')
-
-    # Clean up old files to remove orphaned stories
-    if stories_dir.exists():
-        shutil.rmtree(stories_dir)
-        print(f"✓ Cleaned up old story files")
-
-    stories_dir.mkdir(parents=True, exist_ok=True)
+    files = CollectionFiles('_jekyll-files/_stories')
 
     # Track sort order: demos get 0-999, user stories get 1000+
     demo_index = 0
@@ -585,7 +720,7 @@ def generate_stories():
             user_index += 1
 
         # Use identifier for filename (no additional prefix)
-        filepath = stories_dir / f"{identifier}.md"
+        filename = f"{identifier}.md"
 
         # Build frontmatter as a dict and serialise via yaml.safe_dump so that
         # quotes, colons, or newlines in author-supplied title/subtitle/byline
@@ -617,11 +752,13 @@ def generate_stories():
         )
         content = f"---\n{frontmatter_body}---\n\n"
 
-        with open(filepath, 'w') as f:
-            f.write(content)
+        if files.write(filename, content) != 'unchanged':
+            demo_label = " [DEMO]" if is_demo else ""
+            print(f"✓ Generated {files.directory / filename}{demo_label}")
 
-        demo_label = " [DEMO]" if is_demo else ""
-        print(f"✓ Generated {filepath}{demo_label}")
+    # Remove orphaned stories
+    files.remove_orphans()
+    print(files.summary('Stories'))
 
 
 def _parse_page_frontmatter(source_file):
@@ -647,11 +784,12 @@ def _parse_page_frontmatter(source_file):
     return frontmatter_text, frontmatter_dict, body
 
 
-def generate_pages(telar_language='en'):
+def generate_pages(telar_language='en', glossary_terms=None, jobs=1):
     """Generate processed page files from user markdown sources.
 
     Reads from telar-content/texts/pages/*.md, processes widgets and glossary links,
-    and outputs to _jekyll-files/_pages/ for the pages collection.
+    and outputs to _jekyll-files/_pages/ for the pages collection. Only pages
+    whose content changed are written; pages whose source is gone are removed.
 
     Localization: a sister file with frontmatter `localized_for: <canonical>.md`
     and `language: <code>` is treated as the localized version of <canonical>.md.
@@ -659,33 +797,37 @@ def generate_pages(telar_language='en'):
     in place of the canonical file but is output under the canonical filename
     (so the URL is the same in both languages). Sister files for other
     languages are skipped.
+
+    Args:
+        telar_language: Active site language code
+        glossary_terms: term_id -> title for link processing (loaded if None)
+        jobs: Maximum number of worker processes for rendering
     """
     source_dir = Path('telar-content/texts/pages')
-    output_dir = Path('_jekyll-files/_pages')
 
     # Skip if source directory doesn't exist
     if not source_dir.exists():
         print("No telar-content/texts/pages/ directory found - skipping page generation")
         return
 
-    # Clean up old files
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
-        print("✓ Cleaned up old page files")
-
-    output_dir.mkdir(parents=True, exist_ok=True)
+    files = CollectionFiles('_jekyll-files/_pages')
 
-    # Load glossary terms for link processing
-    glossary_terms = load_glossary_terms()
+    # Load glossary terms for link processing; each rendering process
+    # compiles them once
+    if glossary_terms is None:
+        glossary_terms = load_glossary_terms()
 
-    # Pass 1: separate canonical pages from localized sisters and build a sister map
-    canonicals = []  # list of source files
-    sisters = {}     # {canonical_filename: {language: source_file}}
+    # Pass 1: separate canonical pages from localized sisters and build a sister
+    # map, keeping each parsed file for pass 2
+    parsed_files = {}  # {source_file: (frontmatter_text, frontmatter_dict, body)}
+    canonicals = []    # list of source files
+    sisters = {}       # {canonical_filename: {language: source_file}}
 
-    for source_file in source_dir.glob('*.md'):
+    for source_file in sorted(source_dir.glob('*.md')):
         parsed = _parse_page_frontmatter(source_file)
         if parsed is None:
             continue
+        parsed_files[source_file] = parsed
         _, fm, _ = parsed
         if fm.get('localized_for'):
             canonical = fm['localized_for']
@@ -697,7 +839,8 @@ def generate_pages(telar_language='en'):
         else:
             canonicals.append(source_file)
 
-    # Pass 2: for each canonical page, pick the active-language source and process
+    # Pass 2: for each canonical page, pick the active-language source
+    pages = []  # (canonical_filename, source_file)
     for canonical_file in canonicals:
         canonical_filename = canonical_file.name
 
@@ -708,63 +851,39 @@ def generate_pages(telar_language='en'):
             print(f"  Using {source_file.name} for {canonical_filename} (telar_language={telar_language})")
         else:
             source_file = canonical_file
+        pages.append((canonical_filename, source_file))
 
-        parsed = _parse_page_frontmatter(source_file)
-        if parsed is None:
-            continue
-        frontmatter_text, _, body = parsed
-
-        # Process body through the same pipeline as story layers
-        warnings_list = []
-
-        # 1. Process widgets (:::carousel, :::tabs, :::accordion)
-        processed = process_widgets(body, str(source_file), warnings_list)
-
-        # 2. Process images (size syntax and captions)
-        processed = process_images(processed)
-
-        # 3. Convert markdown to HTML
-        processed = markdown.markdown(
-            processed,
-            extensions=['extra', 'nl2br', 'sane_lists']
-        )
-
-        # 4. Process glossary links ([[term]] syntax)
-        processed = process_glossary_links(processed, glossary_terms, warnings_list)
-
-        # Print any warnings
-        for warning in warnings_list:
-            print(f"  Warning: {warning}")
+    # Render the bodies through the same pipeline as story layers
+    rendered = _render_all(
+        _render_page, [(source_file, parsed_files[source_file][2]) for _, source_file in pages],
+        glossary_terms, auto_link=get_glossary_auto_link(), jobs=jobs
+    )
 
+    for (canonical_filename, source_file), processed in zip(pages, rendered):
         # Write processed file to output directory under the canonical filename,
         # so the URL is stable across languages
-        output_file = output_dir / canonical_filename
-
+        frontmatter_text = parsed_files[source_file][0]
         output_content = f"""---
 {frontmatter_text}
 ---
 
 {processed}
 """
+        if files.write(canonical_filename, output_content) != 'unchanged':
+            print(f"✓ Generated {files.directory / canonical_filename}")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(output_content)
-
-        print(f"✓ Generated {output_file}")
+    # Remove pages whose source is gone (fragment pages are not ours)
+    files.remove_orphans(exclude=(FRAGMENT_PAGES,))
+    print(files.summary('Pages'))
 
 
 def load_config():
     """Load _config.yml and return the full config dict (empty dict if missing)."""
-    config_path = Path('_config.yml')
-    if not config_path.exists():
-        return {}
-
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+    return load_site_config()
 
 
 def main():
-    """Generate all collection files"""
+    """Generate all collection files (command line wrapper)"""
     parser = argparse.ArgumentParser(
         description='Generate Jekyll collection files from Telar JSON data'
     )
@@ -778,20 +897,59 @@ def main():
         action='store_true',
         help='Skip story collection generation'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Render glossary terms and pages in up to N processes (default: number of CPUs; 1 disables)'
+    )
+    add_profile_arguments(parser)
     cli_args = parser.parse_args()
 
+    jobs = cli_args.jobs or os.cpu_count() or 1
+    if (cli_args.profile or cli_args.profile_network) and jobs != 1:
+        # Worker processes would escape the profiler; render here
+        print("[INFO] Profiling: rendering in one process")
+        jobs = 1
+
+    with profile_stage('generate_collections', cli_args.profile, cli_args.profile_network):
+        generate_collections(
+            skip_objects=cli_args.skip_objects,
+            skip_stories=cli_args.skip_stories,
+            jobs=jobs
+        )
+
+
+def generate_collections(skip_objects=False, skip_stories=False, context=None, only=None, jobs=1):
+    """Generate all collection files.
+
+    Args:
+        skip_objects: Skip object collection generation (--skip-objects)
+        skip_stories: Skip story collection generation (--skip-stories)
+        context: Optional telar.pipeline.BuildContext to take config,
+            objects and glossary from
+        only: Optional set of parts to regenerate ('objects', 'glossary',
+            'stories', 'pages'); the others are left as they are (used by
+            watch mode)
+        jobs: Maximum number of worker processes for rendering glossary
+            terms and pages (the command line defaults to one per CPU)
+
+    Returns:
+        bool: True when generation ran
+    """
     print("Generating Jekyll collection files...")
     print("-" * 50)
 
     # Load site config; extract development feature flags and active language
-    config = load_config()
+    config = context.config if context is not None else load_config()
     dev_features = config.get('development-features', {}) or {}
     telar_language = config.get('telar_language', 'en') or 'en'
 
     # Support both old names (hide_*) and new names (skip_*), new takes precedence
     # CLI flags also apply (union of CLI and config flags)
     skip_stories = (
-        cli_args.skip_stories
+        skip_stories
         or dev_features.get('skip_stories', dev_features.get('hide_stories', False))
     )
     skip_collections = dev_features.get('skip_collections', dev_features.get('hide_collections', False))
@@ -801,47 +959,55 @@ def main():
         skip_stories = True
 
     # --skip-objects CLI flag (independent of skip_collections)
-    skip_objects_flag = cli_args.skip_objects
+    skip_objects_flag = skip_objects
+
+    glossary_terms = context.glossary if context is not None else None
+    parts = {'objects', 'glossary', 'stories', 'pages'} if only is None else set(only)
 
     # Generate objects (skip if skip_collections or --skip-objects)
-    if skip_collections:
-        print("Skipping objects (skip_collections enabled)")
-        objects_dir = Path('_jekyll-files/_objects')
-        if objects_dir.exists():
-            shutil.rmtree(objects_dir)
-            print("✓ Cleaned up object files")
-    elif skip_objects_flag:
-        print("Skipping objects (--skip-objects)")
-    else:
-        generate_objects()
-    print()
+    if 'objects' in parts:
+        if skip_collections:
+            print("Skipping objects (skip_collections enabled)")
+            objects_dir = Path('_jekyll-files/_objects')
+            if objects_dir.exists():
+                shutil.rmtree(objects_dir)
+                print("✓ Cleaned up object files")
+        elif skip_objects_flag:
+            print("Skipping objects (--skip-objects)")
+        else:
+            generate_objects(context.objects if context is not None else None)
+        print()
 
     # Always generate glossary
-    generate_glossary()
-    print()
+    if 'glossary' in parts:
+        with cached_rendering():
+            generate_glossary(glossary_terms, jobs=jobs)
+        print()
 
     # Generate stories (skip and clean up if skip_stories or skip_collections)
-    if skip_stories:
-        print("Skipping stories (skip_stories enabled)" if not skip_collections else "Skipping stories (skip_collections enabled)")
-        stories_dir = Path('_jekyll-files/_stories')
-        if stories_dir.exists():
-            shutil.rmtree(stories_dir)
-            print("✓ Cleaned up story files")
-    else:
-        generate_stories()
-    print()
+    if 'stories' in parts:
+        if skip_stories:
+            print("Skipping stories (skip_stories enabled)" if not skip_collections else "Skipping stories (skip_collections enabled)")
+            stories_dir = Path('_jekyll-files/_stories')
+            if stories_dir.exists():
+                shutil.rmtree(stories_dir)
+                print("✓ Cleaned up story files")
+        else:
+            generate_stories()
+        print()
 
     # Always generate pages (passes active language so localized sister files
     # like acerca.md/about.md can be selected at build time)
-    generate_pages(telar_language=telar_language)
+    if 'pages' in parts:
+        generate_pages(telar_language=telar_language, glossary_terms=glossary_terms, jobs=jobs)
 
-    # After generate_pages: it may clean _jekyll-files/_pages/, where the
-    # fragment pages live
-    if not skip_stories:
+    # Fragment pages live in _jekyll-files/_pages/ alongside the pages
+    if not skip_stories and parts & {'stories', 'pages'}:
         generate_protected_fragments()
 
     print("-" * 50)
     print("Generation complete!")
+    return True
 
 if __name__ == '__main__':
     main()
@@ -28,6 +28,12 @@ correct URL prefix so the manifest points to the right location. For
 local development, use the localhost URL; for production, use the
 site's public URL.
 
+Tiling is the slowest step of a build, so each object's source digest,
+base URL and backend are recorded in the build state store
+(.telar-cache/build.db) once its tiles are written. Objects whose record
+still matches and whose manifest exists are skipped; --force regenerates
+everything.
+
 Tile generation backends:
   - libvips (preferred): 28x faster. Uses `vips dzsave --layout iiif3`.
     Install: brew install vips (macOS) / apt-get install libvips-dev (Linux)
@@ -53,6 +59,21 @@ from iiif_utils import (
     generate_tiles_libvips, copy_base_image, create_single_canvas_manifest,
     fix_fallback_region_sizes, generate_full_max,
 )
+from telar.asset_inventory import find_object_file
+from telar.build_ledger import files_digest
+from telar.build_state import get_build_state
+from telar.config import get_base_url, load_site_config
+from telar.profiling import add_profile_arguments, profile_stage
+
+# Source image extensions find_image_for_object() tries, in priority order
+IMAGE_SEARCH_EXTENSIONS = [
+    case_ext
+    for ext in ['.jpg', '.jpeg', '.png', '.heic', '.heif', '.webp', '.tif', '.tiff', '.pdf']
+    for case_ext in (ext, ext.upper())
+]
+
+# Bump when tile or manifest output changes, so existing tiles are regenerated
+TILES_KEY_VERSION = 1
 
 
 # ---------------------------------------------------------------------------
@@ -120,21 +141,25 @@ def generate_iiif_for_image(image_path, output_dir, object_id, base_url, backend
     # Create manifest wrapper for the viewer
     create_single_canvas_manifest(tiles_dir, object_id, image_path, base_url)
 
-def load_objects_needing_tiles():
+def load_objects_needing_tiles(objects=None):
     """
     Load list of object_ids that need IIIF tiles generated from objects.json
 
+    Args:
+        objects: Already-parsed objects.json list (read from _data/ if None)
+
     Returns:
         list: Object IDs that need self-hosted IIIF tiles (have no external source URL)
     """
     try:
-        objects_json = Path('_data/objects.json')
-        if not objects_json.exists():
-            print("⚠️  objects.json not found - run csv_to_json.py first")
-            return None
+        if objects is None:
+            objects_json = Path('_data/objects.json')
+            if not objects_json.exists():
+                print("⚠️  objects.json not found - run csv_to_json.py first")
+                return None
 
-        with open(objects_json, 'r') as f:
-            objects = json.load(f)
+            with open(objects_json, 'r', encoding='utf-8') as f:
+                objects = json.load(f)
 
         # Find objects that need IIIF tiles (no external source URL/IIIF manifest)
         objects_needing_tiles = []
@@ -177,18 +202,11 @@ def find_image_for_object(object_id, source_dir):
     Returns:
         Path object if found, None otherwise
     """
-    source_path = Path(source_dir)
-    # Priority order: Common formats first, then newer/specialized formats
-    image_extensions = ['.jpg', '.jpeg', '.png', '.heic', '.heif', '.webp', '.tif', '.tiff', '.pdf']
-
-    for ext in image_extensions:
-        # Check both lowercase and uppercase extensions
-        for case_ext in [ext, ext.upper()]:
-            image_path = source_path / f"{object_id}{case_ext}"
-            if image_path.exists():
-                return image_path
-
-    return None
+    # Priority order: Common formats first, then newer/specialized formats;
+    # lowercase before uppercase for each. Answered from the shared listing of
+    # source_dir rather than up to 18 exists() calls per object.
+    match = find_object_file(object_id, IMAGE_SEARCH_EXTENSIONS, source_dir)
+    return match.path if match else None
 
 def get_base_url_from_config():
     """
@@ -198,21 +216,34 @@ def get_base_url_from_config():
         Combined URL (e.g., "https://example.com/baseurl") or None if config can't be read
     """
     try:
-        import yaml
-        with open('_config.yml', 'r') as f:
-            config = yaml.safe_load(f)
-
-        url = config.get('url', '')
-        baseurl = config.get('baseurl', '')
-
-        if url:
-            return url + baseurl
-        return None
+        return get_base_url(load_site_config())
     except Exception as e:
         # Silently fail - caller will use fallback
         return None
 
-def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/objects', base_url=None, filter_objects=None):
+def tiles_key(image_file, base_url, backend):
+    """
+    Describe what an object's tiles are generated from.
+
+    Args:
+        image_file: Source image or PDF
+        base_url: Base URL written into the manifests
+        backend: 'libvips' or 'iiif'
+
+    Returns:
+        dict: Compared with the stored key to decide whether tiles are current
+    """
+    return {
+        'version': TILES_KEY_VERSION,
+        'source': image_file.name,
+        'sha256': files_digest([image_file]),
+        'base_url': base_url,
+        'backend': backend,
+    }
+
+
+def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/objects', base_url=None,
+                        filter_objects=None, objects=None, force=False):
     """
     Generate IIIF tiles for objects listed in objects.json
 
@@ -221,6 +252,9 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
         output_dir: Directory to output IIIF tiles and manifests (default: iiif/objects)
         base_url: Base URL for the site
         filter_objects: Comma-separated string of object IDs to process (default: None = all)
+        objects: Already-parsed objects.json list, e.g. from the build
+            pipeline's shared context (default: None = read _data/objects.json)
+        force: Regenerate tiles even for objects whose source is unchanged
     """
     backend = check_dependencies()
     if not backend:
@@ -266,7 +300,7 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
 
     # Load objects from objects.json (CSV-driven approach)
     print("📋 Loading objects from objects.json...")
-    objects_needing_tiles = load_objects_needing_tiles()
+    objects_needing_tiles = load_objects_needing_tiles(objects)
 
     if objects_needing_tiles is None:
         print("❌ Could not load objects.json")
@@ -289,6 +323,8 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
     # Process each object
     processed_count = 0
     skipped_count = 0
+    unchanged_count = 0
+    state = get_build_state()
 
     for i, object_id in enumerate(objects_needing_tiles, 1):
         print(f"[{i}/{len(objects_needing_tiles)}] Processing {object_id}...")
@@ -315,6 +351,19 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
             print()
             continue
 
+        # Tiles from the same source and settings are already in place
+        key = tiles_key(image_file, base_url, backend)
+        if (not force and state is not None and state.get('tiles', object_id) == key
+                and (object_output / 'manifest.json').exists()):
+            print("  ✓ Tiles up to date (unchanged source)")
+            unchanged_count += 1
+            print()
+            continue
+
+        # Forget the old record first, so an interrupted run is redone
+        if state is not None:
+            state.delete('tiles', object_id)
+
         try:
             # Remove existing output if present
             if object_output.exists():
@@ -329,6 +378,8 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
                     process_pdf_object(image_file, object_output, object_id, base_url)
                     print(f"  ✓ Generated multi-page tiles for {object_id}")
                     processed_count += 1
+                    if state is not None:
+                        state.put('tiles', object_id, key)
                 except ImportError:
                     print(f"  ❌ PyMuPDF not installed — cannot process {image_file.name}")
                     skipped_count += 1
@@ -336,6 +387,8 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
                 generate_iiif_for_image(image_file, object_output, object_id, base_url, backend)
                 print(f"  ✓ Generated tiles for {object_id}")
                 processed_count += 1
+                if state is not None:
+                    state.put('tiles', object_id, key)
 
             print()
 
@@ -350,6 +403,8 @@ def generate_iiif_tiles(source_dir='telar-content/objects', output_dir='iiif/obj
     print("=" * 60)
     print("✓ IIIF generation complete!")
     print(f"  Processed: {processed_count} objects")
+    if unchanged_count > 0:
+        print(f"  Up to date: {unchanged_count} objects")
     if skipped_count > 0:
         print(f"  Skipped: {skipped_count} objects (missing images or errors)")
     print(f"  Output directory: {output_dir}")
@@ -382,15 +437,23 @@ def main():
         default=None,
         help='Comma-separated object IDs to process (default: all objects needing tiles)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate tiles even for objects whose source image is unchanged'
+    )
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
-    success = generate_iiif_tiles(
-        source_dir=args.source_dir,
-        output_dir=args.output_dir,
-        base_url=args.base_url,
-        filter_objects=args.objects,
-    )
+    with profile_stage('generate_iiif', args.profile, args.profile_network):
+        success = generate_iiif_tiles(
+            source_dir=args.source_dir,
+            output_dir=args.output_dir,
+            base_url=args.base_url,
+            filter_objects=args.objects,
+            force=args.force,
+        )
 
     sys.exit(0 if success else 1)
 
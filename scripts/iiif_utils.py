@@ -270,7 +270,7 @@ def patch_info_json(tiles_dir, object_id, base_url):
     img_h = info.get('height', 0)
     sizes = []
     if full_dir.exists():
-        for entry in full_dir.iterdir():
+        for entry in sorted(full_dir.iterdir()):
             if not entry.is_dir() or entry.name == 'max':
                 continue
             # "w,h" — both dimensions explicit
@@ -309,8 +309,11 @@ def patch_info_json(tiles_dir, object_id, base_url):
                 sizes.append({'width': img_w, 'height': img_h})
 
     if sizes:
-        sizes.sort(key=lambda s: s['width'])
-        info['sizes'] = sizes
+        # "w,h" and "w," directories for the same thumbnail describe one
+        # size; list each once, in a fixed order, so info.json is identical
+        # whatever order the filesystem returns the directories in
+        unique = {(s['width'], s['height']) for s in sizes}
+        info['sizes'] = [{'width': sw, 'height': sh} for sw, sh in sorted(unique)]
 
     # Ensure scaleFactors is never empty — OpenSeadragon crashes with
     # RangeError when it encounters an empty array. This
@@ -405,7 +408,7 @@ def generate_full_max(processed_path, tiles_dir):
     # thumbnail JS constructs URLs as full/{w},{h}/, not full/{w},/.
     full_dir = tiles_dir / 'full'
     if full_dir.exists():
-        for entry in full_dir.iterdir():
+        for entry in sorted(full_dir.iterdir()):
             if not entry.is_dir():
                 continue
             match = re.match(r'^(\d+),$', entry.name)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Inspect and Trim the Build State Store
+
+The build state store (.telar-cache/build.db, see telar.build_state) keeps
+what one build learns for the next: input fingerprints, fetched IIIF
+manifests, image dimensions, tile and audio keys, rendered markdown panels,
+and the duration of every pipeline stage run. It grows as objects come and go, and is safe to trim or
+delete at any time — the next build simply recomputes what is missing.
+
+Commands:
+
+    python scripts/manage_cache.py stats
+        Entries, size and age of each namespace, the database size, and the
+        mean and last duration of each pipeline stage.
+
+    python scripts/manage_cache.py prune [--older-than DAYS] [--namespace NS]
+        Delete entries not used for DAYS days (default 30), ledger
+        entries whose output file no longer exists, and stage timings older
+        than DAYS; then compact the database. --namespace (repeatable)
+        limits age-based pruning to the given namespaces.
+
+Version: v1.6.0
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from telar.build_state import BUILD_DB_PATH, NAMESPACES, get_build_state  # noqa: E402
+
+# Default age, in days, past which prune deletes an entry
+DEFAULT_PRUNE_DAYS = 30
+
+
+def _format_size(nbytes):
+    for unit in ('B', 'KB', 'MB'):
+        if nbytes < 1024:
+            return f"{nbytes:.0f} {unit}" if unit == 'B' else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} GB"
+
+
+def _format_age(timestamp_ns, now_ns):
+    seconds = max(0, (now_ns - timestamp_ns) / 10**9)
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+def print_stats(state):
+    """
+    Print a summary of the build state store.
+
+    Args:
+        state: telar.build_state.BuildState
+    """
+    stats = state.stats()
+    now = time.time_ns()
+    print(f"Build state: {stats['path']} ({_format_size(stats['bytes'])})\n")
+
+    print(f"{'namespace':<12} {'entries':>8} {'size':>10} {'oldest':>8} {'newest':>8}")
+    for namespace in NAMESPACES:
+        entry = stats['namespaces'].get(namespace)
+        if entry is None:
+            print(f"{namespace:<12} {0:>8} {'-':>10} {'-':>8} {'-':>8}")
+            continue
+        print(f"{namespace:<12} {entry['entries']:>8} {_format_size(entry['bytes']):>10} "
+              f"{_format_age(entry['oldest_ns'], now):>8} {_format_age(entry['newest_ns'], now):>8}")
+
+    if stats['timings']:
+        print(f"\n{'stage':<14} {'runs':>6} {'mean s':>8} {'last s':>8}")
+        for stage, entry in stats['timings'].items():
+            print(f"{stage:<14} {entry['runs']:>6} {entry['mean']:>8.2f} {entry['last']:>8.2f}")
+    else:
+        print("\nNo stage timings recorded yet.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Inspect and trim the build state store (.telar-cache/build.db).'
+    )
+    parser.add_argument('--db', default=str(BUILD_DB_PATH),
+                        help=f'Database path (default: {BUILD_DB_PATH})')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('stats', help='Show entries, sizes, ages and stage timings')
+    prune = commands.add_parser('prune', help='Delete stale entries and compact the database')
+    prune.add_argument('--older-than', type=float, default=DEFAULT_PRUNE_DAYS, metavar='DAYS',
+                       help=f'Delete entries not used for this many days (default: {DEFAULT_PRUNE_DAYS})')
+    prune.add_argument('--namespace', action='append', choices=NAMESPACES,
+                       help='Only prune this namespace by age (repeatable)')
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f"No build state at {args.db} yet — run a build first.")
+        return 0
+
+    state = get_build_state(args.db)
+    if state is None:
+        return 1
+
+    if args.command == 'stats':
+        print_stats(state)
+    else:
+        before = state.stats()['bytes']
+        deleted = state.prune(older_than_s=args.older_than * 86400, namespaces=args.namespace)
+        after = state.stats()['bytes']
+        print(f"✓ Pruned {deleted} entries ({_format_size(before)} → {_format_size(after)})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
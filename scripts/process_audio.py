@@ -30,7 +30,11 @@ does not pre-extract clip segments.
 
 The output structure mirrors the IIIF tile pipeline: peak JSON files go
 to assets/audio/peaks/, and cache files sit alongside them so that
-unchanged audio is not reprocessed on subsequent builds. Like the IIIF
+unchanged audio is not reprocessed on subsequent builds. The content hash
+in each cache file is also remembered in the build state store
+(telar.build_state) with the audio file's size and mtime, so unchanged
+audio is not even re-read to compute it; the sidecar files stay the
+source of truth, since CI caches them with the peaks. Like the IIIF
 tile generator, this script is optional — sites without audio objects
 skip it entirely, and the CI workflow detects this automatically.
 
@@ -59,9 +63,14 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
+from telar.asset_inventory import find_object_file
+from telar.build_state import get_build_state
+from telar.constants import RACY_WINDOW_NS
 from telar.media_type import AUDIO_EXTENSIONS
+from telar.profiling import add_profile_arguments, profile_stage
 
 
 # ---------------------------------------------------------------------------
@@ -145,6 +154,41 @@ def compute_cache_key(audio_path):
     return h.hexdigest()
 
 
+def cached_cache_key(audio_path, state=None):
+    """
+    Return compute_cache_key(audio_path), reusing the hash from the build
+    state store when the file's size and mtime are unchanged.
+
+    Audio files can be hundreds of megabytes, so re-reading every one on
+    every build just to learn it has not changed is the slowest part of an
+    up-to-date audio step. A hash recorded within RACY_WINDOW_NS of the
+    file's mtime is not reused, as the file may still have been changing.
+
+    Args:
+        audio_path (Path): Path to the source audio file.
+        state (BuildState | None): Build state store (None: compute directly).
+
+    Returns:
+        str: 64-character hex SHA256 digest.
+    """
+    if state is None:
+        return compute_cache_key(audio_path)
+
+    stat = os.stat(audio_path)
+    entry = state.get('peaks', str(audio_path))
+    if (entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+            and entry['recorded_ns'] - stat.st_mtime_ns >= RACY_WINDOW_NS):
+        return entry['key']
+
+    recorded_ns = time.time_ns()
+    key = compute_cache_key(audio_path)
+    state.put('peaks', str(audio_path), {
+        'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+        'recorded_ns': recorded_ns, 'key': key,
+    })
+    return key
+
+
 def check_audio_dependencies():
     """
     Check that audiowaveform is installed and accessible.
@@ -168,7 +212,7 @@ def check_audio_dependencies():
             sys.exit(1)
 
 
-def find_audio_objects(objects_json_path, objects_dir):
+def find_audio_objects(objects_json_path, objects_dir, objects=None):
     """
     Load objects.json and filter to objects that have an audio source file.
 
@@ -179,6 +223,8 @@ def find_audio_objects(objects_json_path, objects_dir):
     Args:
         objects_json_path (str | Path): Path to _data/objects.json.
         objects_dir (str | Path): Directory containing source audio files.
+        objects (list | None): Already-parsed objects.json; read from
+                    objects_json_path if None.
 
     Returns:
         list[dict]: List of dicts with keys: object_id (str), file_path (Path),
@@ -187,8 +233,9 @@ def find_audio_objects(objects_json_path, objects_dir):
     objects_json_path = Path(objects_json_path)
     objects_dir = Path(objects_dir)
 
-    with open(objects_json_path, 'r', encoding='utf-8') as f:
-        objects = json.load(f)
+    if objects is None:
+        with open(objects_json_path, 'r', encoding='utf-8') as f:
+            objects = json.load(f)
 
     results = []
     for obj in objects:
@@ -203,15 +250,15 @@ def find_audio_objects(objects_json_path, objects_dir):
                   f"(allowed: letters, digits, hyphen, underscore): {object_id!r}")
             continue
 
-        for ext in AUDIO_EXTENSIONS:
-            candidate = objects_dir / f'{object_id}{ext}'
-            if candidate.exists():
-                results.append({
-                    'object_id': object_id,
-                    'file_path': candidate,
-                    'extension': ext.lstrip('.'),
-                })
-                break  # First match wins; don't add duplicate entries
+        # First match wins (lowercase extensions are listed first); looked up
+        # in the shared directory listing rather than stat'ed per extension
+        match = find_object_file(object_id, AUDIO_EXTENSIONS, objects_dir)
+        if match:
+            results.append({
+                'object_id': object_id,
+                'file_path': match.path,
+                'extension': match.path.suffix.lstrip('.'),
+            })
 
     return results
 
@@ -281,7 +328,7 @@ def generate_peaks(audio_path, output_path, pixels_per_second=100):
 
 
 def process_audio_objects(objects_dir, data_dir, output_dir,
-                          pixels_per_second=100, filter_objects=None):
+                          pixels_per_second=100, filter_objects=None, objects=None):
     """
     Batch-process all audio objects: generate peaks.
 
@@ -296,6 +343,8 @@ def process_audio_objects(objects_dir, data_dir, output_dir,
         output_dir (str | Path): Output base directory (assets/audio/).
         pixels_per_second (int): Waveform resolution passed to audiowaveform.
         filter_objects (str | None): Comma-separated object IDs to restrict processing.
+        objects (list | None): Already-parsed objects.json (e.g. from the build
+                    pipeline's shared context); read from data_dir if None.
 
     Returns:
         bool: True on completion (partial failures are logged but don't abort).
@@ -308,12 +357,12 @@ def process_audio_objects(objects_dir, data_dir, output_dir,
     peaks_dir.mkdir(parents=True, exist_ok=True)
 
     objects_json_path = data_dir / 'objects.json'
-    if not objects_json_path.exists():
+    if objects is None and not objects_json_path.exists():
         print(f'Error: objects.json not found at {objects_json_path}')
         print('Run csv_to_json.py first to generate it.')
         return False
 
-    audio_objects = find_audio_objects(objects_json_path, objects_dir)
+    audio_objects = find_audio_objects(objects_json_path, objects_dir, objects)
 
     if not audio_objects:
         print('No audio objects found in objects/')
@@ -338,6 +387,7 @@ def process_audio_objects(objects_dir, data_dir, output_dir,
 
     processed_count = 0
     skipped_count = 0
+    state = get_build_state()
 
     for i, obj in enumerate(audio_objects, 1):
         object_id = obj['object_id']
@@ -348,7 +398,7 @@ def process_audio_objects(objects_dir, data_dir, output_dir,
         # --- Cache check ---
         cache_path = peaks_dir / f'{object_id}.cache'
         peaks_path = peaks_dir / f'{object_id}.json'
-        current_key = compute_cache_key(audio_path)
+        current_key = cached_cache_key(audio_path, state)
 
         if cache_path.exists() and peaks_path.exists():
             cached_key = cache_path.read_text(encoding='utf-8').strip()
@@ -436,18 +486,20 @@ def main():
         default=None,
         help='Comma-separated object IDs to process (default: all audio objects)',
     )
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
     check_audio_dependencies()
 
-    success = process_audio_objects(
-        objects_dir=args.objects_dir,
-        data_dir=args.data_dir,
-        output_dir=args.output_dir,
-        pixels_per_second=args.pixels_per_second,
-        filter_objects=args.filter_objects,
-    )
+    with profile_stage('process_audio', args.profile, args.profile_network):
+        success = process_audio_objects(
+            objects_dir=args.objects_dir,
+            data_dir=args.data_dir,
+            output_dir=args.output_dir,
+            pixels_per_second=args.pixels_per_second,
+            filter_objects=args.filter_objects,
+        )
 
     sys.exit(0 if success else 1)
 
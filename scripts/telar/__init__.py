@@ -4,37 +4,68 @@ Telar Data Processing Package
 Modular package for processing Telar story data from CSV/Google Sheets
 into JSON format for the Jekyll-based storytelling framework.
 
+The public API below is re-exported lazily: `from telar import process_story`
+imports `telar.processors.stories` (and pandas with it) on first access, so
+scripts that only need a leaf module such as `telar.config` or
+`telar.search` do not pay for the whole package at start-up.
+
 Version: v1.6.0
 """
 
-# Public API re-exports
-from telar.config import load_language_data, get_lang_string, load_site_language
-from telar.csv_utils import (
-    COLUMN_NAME_MAPPING, sanitize_dataframe, get_source_url,
-    normalize_column_names, is_header_row
-)
-from telar.images import (
-    process_images, resolve_path_case_insensitive,
-    validate_image_path, get_image_dimensions
-)
-from telar.iiif_metadata import (
-    detect_iiif_version, extract_language_map_value, strip_html_tags,
-    clean_metadata_value, find_metadata_field, is_legal_boilerplate,
-    extract_credit, apply_metadata_fallback
-)
-from telar.glossary import load_glossary_terms, process_glossary_links
-from telar.widgets import (
-    get_widget_id, parse_key_value_block, parse_carousel_widget,
-    parse_markdown_sections, parse_tabs_widget, parse_accordion_widget,
-    render_widget_html, process_widgets
-)
-from telar.markdown import read_markdown_file, process_inline_content
-from telar.processors.project import process_project_setup
-from telar.processors.objects import (
-    process_objects, inject_christmas_tree_errors
-)
-from telar.processors.stories import process_story
-from telar.demo import (
-    load_demo_bundle, merge_demo_content, fetch_demo_content_if_enabled
-)
-from telar.core import csv_to_json, find_csv_with_fallback, main
+import importlib
+
+# Public API re-exports: name -> module it lives in
+_EXPORTS = {
+    'telar.config': (
+        'load_language_data', 'clear_language_cache', 'get_lang_string', 'load_site_language',
+        'load_site_config',
+    ),
+    'telar.csv_utils': (
+        'COLUMN_NAME_MAPPING', 'sanitize_dataframe', 'get_source_url',
+        'normalize_column_names', 'is_header_row',
+    ),
+    'telar.images': (
+        'process_images', 'resolve_path_case_insensitive',
+        'validate_image_path', 'get_image_dimensions', 'get_image_dimensions_many',
+    ),
+    'telar.iiif_metadata': (
+        'detect_iiif_version', 'extract_language_map_value', 'strip_html_tags',
+        'clean_metadata_value', 'find_metadata_field', 'is_legal_boilerplate',
+        'extract_credit', 'apply_metadata_fallback',
+    ),
+    'telar.glossary': ('load_glossary_terms', 'process_glossary_links', 'GlossaryLinker'),
+    'telar.widgets': (
+        'get_widget_id', 'reset_widget_ids', 'parse_key_value_block', 'parse_carousel_widget',
+        'parse_markdown_sections', 'parse_tabs_widget', 'parse_accordion_widget',
+        'render_widget_html', 'process_widgets',
+    ),
+    'telar.markdown': ('read_markdown_file', 'process_inline_content'),
+    'telar.processors.project': ('process_project_setup',),
+    'telar.processors.objects': ('process_objects', 'inject_christmas_tree_errors'),
+    'telar.processors.stories': ('process_story',),
+    'telar.demo': (
+        'load_demo_bundle', 'merge_demo_content', 'merge_demo_data', 'write_demo_stories',
+        'fetch_demo_content_if_enabled',
+    ),
+    'telar.core': ('csv_to_json', 'find_csv_with_fallback', 'build_data', 'main'),
+    'telar.check': ('check_site',),
+    'telar.pipeline': ('BuildContext', 'Stage', 'run_pipeline'),
+}
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module 'telar' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,269 @@
+"""
+Asset Directory Inventory (leaf module)
+
+Every stage of the build asks the same questions of `telar-content/objects/`:
+is there an `{object_id}.mp3`? which image backs this object? how big is the
+audio file? Answering them with an `exists()` per candidate extension costs
+up to 18 stat calls per object, repeated by the objects processor, the
+stories processor, the collection generator, the audio processor and the
+IIIF tiler. On network filesystems that adds up to tens of thousands of
+stat calls per build.
+
+This module lists a directory once and answers those questions from memory.
+`get_inventory()` returns the listing — every regular file by exact name,
+with its size and mtime, plus stem -> files maps (exact and case-folded) —
+and caches it per process, keyed by the directory's absolute path. The
+cache is invalidated by the directory's mtime, which changes whenever a
+file is added, removed or renamed.
+
+Directory timestamps are coarse on some filesystems, so a file created in
+the same tick as the listing could go unnoticed. As git does for its index,
+a listing taken within `RACY_WINDOW_NS` of the directory's mtime is treated
+as unsettled: lookups against it fall back to direct stat calls, and the
+directory is listed again once the window has passed.
+
+Lookups match exact file names, like the `exists()` probes they replace, so
+behaviour on case-sensitive hosts (GitHub Pages) is unchanged. Where the
+filesystem ignores case (macOS, Windows), an `exists()` probe also found
+`Song.MP3` for `song.mp3`; each listing checks once whether its directory
+folds case, and if so a name missing from the listing is looked up again in
+the case-folded stem map. Sizes and
+mtimes are a snapshot from the listing; an edit that rewrites a file in
+place does not change the directory mtime.
+
+`file_exists()` answers an `exists()` probe for a file in any directory
+from that directory's listing. The case-insensitive path resolution in
+`telar.images` uses it for `assets/images/` and `telar-content/texts/`
+(markdown panels), so trying the exact, lowercased and extension-case
+variants of a reference costs one directory stat instead of a stat per
+variant, for every carousel item and panel of every build.
+
+Each listing request is reported to the build ledger
+(`telar.build_ledger.record_listing`), so outputs that looked files up here
+are rebuilt when the set of files changes.
+
+Imports only the standard library, `telar.build_ledger` and
+`telar.constants`, so the leaf modules, such as `telar.media_type`, can use
+it.
+
+Version: v1.6.0
+"""
+
+import os
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from telar.build_ledger import record_listing
+from telar.constants import RACY_WINDOW_NS
+
+OBJECTS_DIR = 'telar-content/objects'
+
+FileEntry = namedtuple('FileEntry', ['path', 'size', 'mtime_ns'])
+
+_inventory_cache = {}
+
+
+def _folds_case(directory, names):
+    """
+    Whether a directory's filesystem ignores case, probed with one listed name.
+
+    Args:
+        directory: Path of the directory
+        names: File names in the directory
+
+    Returns:
+        bool: True if a case-swapped name reaches the same file
+    """
+    for name in names:
+        swapped = name.swapcase()
+        if swapped == name:
+            continue
+        if swapped in names:
+            # Two names differing only in case: the filesystem keeps them apart
+            return False
+        try:
+            return os.path.samefile(directory / name, directory / swapped)
+        except OSError:
+            return False
+    return False
+
+
+def _scan(directory, dir_stat):
+    """List one directory into an inventory dict."""
+    scanned_at = time.time_ns()
+    files = {}
+    by_stem = {}
+    by_folded_stem = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            path = directory / entry.name
+            files[entry.name] = FileEntry(path, stat.st_size, stat.st_mtime_ns)
+            by_stem.setdefault(path.stem, []).append(path)
+            by_folded_stem.setdefault(path.stem.casefold(), []).append(path)
+
+    return {
+        'directory': directory,
+        'mtime_ns': dir_stat.st_mtime_ns,
+        'settled': scanned_at - dir_stat.st_mtime_ns >= RACY_WINDOW_NS,
+        'files': files,
+        'by_stem': by_stem,
+        'by_folded_stem': by_folded_stem,
+        'folds_case': _folds_case(directory, files),
+    }
+
+
+def get_inventory(directory=OBJECTS_DIR):
+    """
+    Return the cached listing of a directory, listing it again if it changed.
+
+    Args:
+        directory: Path or str of the directory (default: telar-content/objects)
+
+    Returns:
+        dict or None: None if the directory does not exist; otherwise
+        'files' (name -> FileEntry), 'by_stem' and 'by_folded_stem'
+        (stem -> list of Paths, in listing order), 'folds_case' (True if the
+        filesystem ignores case) and 'settled' (False while the listing is
+        too close to the directory's mtime to be trusted).
+        Treat the dict as read-only; it is shared by every caller.
+    """
+    directory = Path(directory)
+    record_listing(directory)
+    try:
+        dir_stat = directory.stat()
+    except OSError:
+        return None
+
+    key = os.path.abspath(directory)
+    inventory = _inventory_cache.get(key)
+    if (inventory is None
+            or inventory['mtime_ns'] != dir_stat.st_mtime_ns
+            or (not inventory['settled']
+                and time.time_ns() - dir_stat.st_mtime_ns >= RACY_WINDOW_NS)):
+        inventory = _scan(directory, dir_stat)
+        _inventory_cache[key] = inventory
+    return inventory
+
+
+def _lookup(inventory, name):
+    """
+    FileEntry for a name in a settled listing, matched as exists() would.
+
+    Args:
+        inventory: Listing from get_inventory()
+        name: File name
+
+    Returns:
+        FileEntry or None: the entry, under the requested name if it was
+        matched regardless of case
+    """
+    entry = inventory['files'].get(name)
+    if entry is not None or not inventory['folds_case']:
+        return entry
+    folded = name.casefold()
+    for path in inventory['by_folded_stem'].get(Path(name).stem.casefold(), ()):
+        if path.name.casefold() == folded:
+            entry = inventory['files'][path.name]
+            return FileEntry(inventory['directory'] / name, entry.size, entry.mtime_ns)
+    return None
+
+
+def find_object_file(object_id, extensions, directory=OBJECTS_DIR):
+    """
+    Find the file named `{object_id}{ext}` for the first matching extension.
+
+    Replaces a loop of `(directory / f'{object_id}{ext}').exists()` probes
+    with dictionary lookups; extensions are tried in the order given. Names
+    match exactly, or regardless of case where the filesystem ignores it.
+
+    Args:
+        object_id: Object identifier (file stem)
+        extensions: Candidate extensions including the dot, in priority order
+        directory: Directory to look in (default: telar-content/objects)
+
+    Returns:
+        FileEntry or None: path, size and mtime of the first match
+    """
+    inventory = get_inventory(directory)
+    if inventory is None:
+        return None
+
+    for ext in extensions:
+        name = f'{object_id}{ext}'
+        if inventory['settled']:
+            entry = _lookup(inventory, name)
+        else:
+            entry = None
+            try:
+                path = inventory['directory'] / name
+                stat = path.stat()
+                if path.is_file():
+                    entry = FileEntry(path, stat.st_size, stat.st_mtime_ns)
+            except (OSError, ValueError):
+                pass
+        if entry is not None:
+            return entry
+    return None
+
+
+def file_exists(path):
+    """
+    Whether a regular file exists, answered from its directory's listing.
+
+    Args:
+        path: Path or str of the file
+
+    Returns:
+        bool: True if the file exists (directories do not count)
+    """
+    path = Path(path)
+    inventory = get_inventory(path.parent)
+    if inventory is None:
+        return False
+    if not inventory['settled']:
+        return path.is_file()
+    return _lookup(inventory, path.name) is not None
+
+
+def stem_index(directory=OBJECTS_DIR):
+    """
+    Map filename stem -> list of Paths for one directory.
+
+    Args:
+        directory: Path or str of the directory (default: telar-content/objects)
+
+    Returns:
+        dict[str, list[Path]]: stem -> files with that stem (empty if the
+        directory is absent). Shared with other callers; do not modify.
+    """
+    inventory = get_inventory(directory)
+    if inventory is None:
+        return {}
+    if not inventory['settled']:
+        # Too fresh to trust from cache: list again, as a caller building its
+        # own index would have
+        return _scan(inventory['directory'], Path(inventory['directory']).stat())['by_stem']
+    return inventory['by_stem']
+
+
+def invalidate(directory=None):
+    """
+    Drop cached listings (all of them, or one directory's).
+
+    For callers that write into an asset directory and need the change seen
+    immediately, without relying on directory mtimes.
+
+    Args:
+        directory: Path or str of the directory to forget, or None for all
+    """
+    if directory is None:
+        _inventory_cache.clear()
+    else:
+        _inventory_cache.pop(os.path.abspath(directory), None)
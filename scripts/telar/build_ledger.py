@@ -0,0 +1,413 @@
+"""
+Build Ledger for Incremental CSV-to-JSON Builds
+
+This module deals with deciding which `_data/*.json` files actually need
+rebuilding. Converting a story re-renders every markdown panel, resolves
+every glossary link and probes every widget image; converting the objects
+CSV revalidates every IIIF manifest over the network. On a site with dozens
+of stories, editing one panel should not pay for all of that again.
+
+The ledger (the `ledger` namespace of the build state store,
+`.telar-cache/build.db`, see telar.build_state) records, for each output
+JSON, a fingerprint of everything that went into it:
+
+- **inputs** — every file the conversion read, recorded by the readers
+  themselves through `record_input()`: the source CSV, each markdown file
+  under `telar-content/texts/`, glossary sources, widget templates, local
+  images, `_data/objects.json` for stories. A path that was probed but not
+  found is recorded as missing, so creating it later triggers a rebuild.
+- **listings** — directories whose contents were looked up by name
+  (`telar-content/objects/`, `telar-content/texts/glossary/`), recorded
+  through `record_listing()` as a digest of the file names.
+- **keys** — build-wide digests computed once by the caller: the relevant
+  `_config.yml` settings, the language strings and the pipeline code
+  itself, so upgrading Telar rebuilds everything.
+
+`is_up_to_date()` compares an entry against the tree. File fingerprints are
+(size, mtime, sha256); as git does for its index, a file whose size and
+mtime match is only trusted without hashing if it had not been modified
+within `RACY_WINDOW_NS` (telar.constants) of when it was fingerprinted. The output file is
+fingerprinted too, so a JSON that was deleted or rewritten by a later step
+(the demo merge, a hand edit) is rebuilt.
+
+Conversions that depended on something outside the tree and could not reach
+it — a manifest that timed out or was rate-limited — call `mark_volatile()`
+and are not recorded, so the next build tries again. Successful network
+results are not revalidated until an input changes; `--force` on
+csv_to_json.py rebuilds everything.
+
+Tracking is per thread, so pipeline stages running side by side in
+threads each record only their own reads; work handed to other threads is
+tracked there and replayed with `replay_inputs()`.
+
+Imports only the standard library, `telar.build_state` and
+`telar.constants`, so leaf modules such as `telar.asset_inventory` can
+report what they read.
+
+Version: v1.6.0
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from telar.build_state import BUILD_DB_PATH, get_build_state
+from telar.constants import RACY_WINDOW_NS
+
+LEDGER_PATH = BUILD_DB_PATH
+
+# Bump when the entry layout or the meaning of a fingerprint changes; older
+# ledgers are then discarded and everything is rebuilt once
+LEDGER_VERSION = 1
+
+# Inputs recorded by the conversion this thread is tracking ('inputs'
+# attribute, None when there is none)
+_tracking = threading.local()
+
+
+def _tracked():
+    return getattr(_tracking, 'inputs', None)
+
+
+@contextmanager
+def track_inputs():
+    """
+    Collect the inputs this thread records while the block runs.
+
+    Yields:
+        dict: 'files' and 'listings' (sets of paths) and 'volatile' (list of
+        reasons the result must not be reused), filled in as readers call
+        record_input(), record_listing() and mark_volatile()
+    """
+    previous = _tracked()
+    _tracking.inputs = tracked = {'files': set(), 'listings': set(), 'volatile': []}
+    try:
+        yield tracked
+    finally:
+        _tracking.inputs = previous
+
+
+def record_input(path):
+    """
+    Note that the tracked conversion read (or looked for) a file.
+
+    A no-op outside track_inputs(), so readers can call it unconditionally.
+
+    Args:
+        path: Path or str of the file, relative to the site root
+    """
+    tracked = _tracked()
+    if tracked is not None:
+        tracked['files'].add(os.path.normpath(str(path)))
+
+
+def record_listing(directory):
+    """
+    Note that the tracked conversion looked up files in a directory by name.
+
+    Args:
+        directory: Path or str of the directory, relative to the site root
+    """
+    tracked = _tracked()
+    if tracked is not None:
+        tracked['listings'].add(os.path.normpath(str(directory)))
+
+
+def mark_volatile(reason):
+    """
+    Note that the tracked conversion's result should not be reused.
+
+    Args:
+        reason: Short description, e.g. 'IIIF manifest for obj-1 timed out'
+    """
+    tracked = _tracked()
+    if tracked is not None:
+        tracked['volatile'].append(reason)
+
+
+def replay_inputs(files=(), listings=(), volatile=()):
+    """
+    Record inputs read elsewhere into the tracked conversion.
+
+    Used for work that was tracked on its own (a nested track_inputs()
+    block) or reused from a cache, so the enclosing conversion still
+    depends on everything that work read.
+
+    Args:
+        files: Paths, as record_input()
+        listings: Directories, as record_listing()
+        volatile: Reasons, as mark_volatile()
+    """
+    for path in files:
+        record_input(path)
+    for directory in listings:
+        record_listing(directory)
+    for reason in volatile:
+        mark_volatile(reason)
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_fingerprint(path, previous=None, previous_ns=0):
+    """
+    Fingerprint a file as [size, mtime_ns, sha256], or None if absent.
+
+    The previous fingerprint's hash is reused when size and mtime match and
+    the file had settled before that fingerprint was taken.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isfile(path):
+        return None
+    if (previous is not None
+            and previous[0] == stat.st_size
+            and previous[1] == stat.st_mtime_ns
+            and previous_ns - stat.st_mtime_ns >= RACY_WINDOW_NS):
+        return previous
+    return [stat.st_size, stat.st_mtime_ns, _sha256_file(path)]
+
+
+def _same_file(path, recorded, recorded_ns):
+    """Check a file against its recorded fingerprint, hashing only if needed."""
+    current = _file_fingerprint(path, recorded, recorded_ns)
+    if current is None or recorded is None:
+        return current is None and recorded is None
+    return current[0] == recorded[0] and current[2] == recorded[2]
+
+
+def listing_digest(directory):
+    """
+    Digest the sorted file names of a directory (None if it does not exist).
+
+    Args:
+        directory: Path or str of the directory
+
+    Returns:
+        str or None: sha256 hex digest of the names
+    """
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return None
+    return hashlib.sha256('\0'.join(names).encode('utf-8')).hexdigest()
+
+
+def files_digest(paths):
+    """
+    Digest the contents of several files, missing ones included as absent.
+
+    Args:
+        paths: Iterable of paths, in a stable order
+
+    Returns:
+        str: sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode('utf-8') + b'\0')
+        try:
+            digest.update(_sha256_file(path).encode('ascii'))
+        except OSError:
+            digest.update(b'-')
+    return digest.hexdigest()
+
+
+def config_digest(config, keys):
+    """
+    Digest the values of selected _config.yml settings.
+
+    Args:
+        config: Parsed config dict
+        keys: Top-level keys whose values affect the outputs
+
+    Returns:
+        str: sha256 hex digest
+    """
+    subset = {key: config.get(key) for key in keys}
+    text = json.dumps(subset, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def code_digest():
+    """
+    Digest the telar package source, so a Telar upgrade rebuilds everything.
+
+    Returns:
+        str: sha256 hex digest of scripts/telar/**/*.py
+    """
+    package_dir = Path(__file__).resolve().parent
+    return files_digest(sorted(package_dir.rglob('*.py')))
+
+
+def load_ledger(path=LEDGER_PATH):
+    """
+    Load the ledger, or start an empty one if it is missing or unreadable.
+
+    Args:
+        path: Build state database path
+
+    Returns:
+        dict: {'version': LEDGER_VERSION, 'outputs': {output path: entry}}
+    """
+    state = get_build_state(path)
+    if state is not None and state.get_meta('ledger_version') == str(LEDGER_VERSION):
+        return {'version': LEDGER_VERSION, 'outputs': state.items('ledger')}
+    return {'version': LEDGER_VERSION, 'outputs': {}}
+
+
+def save_ledger(ledger, path=LEDGER_PATH):
+    """
+    Store the ledger, dropping entries whose output is gone.
+
+    Only entries that changed since they were loaded are rewritten.
+
+    Args:
+        ledger: Ledger dict from load_ledger()
+        path: Build state database path
+
+    Raises:
+        OSError: If the database cannot be written
+    """
+    outputs = {output: entry for output, entry in ledger['outputs'].items()
+               if os.path.exists(output)}
+    ledger['outputs'] = outputs
+    state = get_build_state(path)
+    if state is None:
+        raise OSError(f"cannot open {path}")
+    try:
+        with state.transaction():
+            state.replace_namespace('ledger', outputs)
+            state.set_meta('ledger_version', LEDGER_VERSION)
+    except sqlite3.Error as e:
+        raise OSError(f"cannot write {path}: {e}") from e
+
+
+def is_up_to_date(ledger, output, keys):
+    """
+    Check whether an output JSON can be reused as is.
+
+    Args:
+        ledger: Ledger dict from load_ledger()
+        output: Output path, as passed to record_build()
+        keys: Build-wide digests (dict), compared for equality
+
+    Returns:
+        bool: True if the output and every recorded input are unchanged
+    """
+    entry = ledger['outputs'].get(os.path.normpath(str(output)))
+    if entry is None or entry.get('keys') != keys:
+        return False
+
+    if not _same_file(output, entry.get('output'), entry.get('recorded_ns', 0)):
+        return False
+    return inputs_unchanged(entry)
+
+
+def inputs_unchanged(entry):
+    """
+    Check the inputs and listings of a fingerprint_inputs() result.
+
+    Args:
+        entry: dict with 'recorded_ns', 'inputs' and 'listings'
+
+    Returns:
+        bool: True if every recorded file and listing is unchanged
+    """
+    recorded_ns = entry.get('recorded_ns', 0)
+    for directory, digest in entry.get('listings', {}).items():
+        if listing_digest(directory) != digest:
+            return False
+    for path, recorded in entry.get('inputs', {}).items():
+        if not _same_file(path, recorded, recorded_ns):
+            return False
+    return True
+
+
+def fingerprint_inputs(tracked, previous=None):
+    """
+    Fingerprint the files and listings a tracked conversion read.
+
+    Args:
+        tracked: Dict yielded by track_inputs()
+        previous: An earlier result for the same work, whose file hashes are
+            reused where the files have not changed
+
+    Returns:
+        dict: 'recorded_ns', 'inputs' (path -> fingerprint) and 'listings'
+        (directory -> digest)
+    """
+    previous = previous or {}
+    previous_inputs = previous.get('inputs', {})
+    previous_ns = previous.get('recorded_ns', 0)
+    return {
+        'recorded_ns': time.time_ns(),
+        'inputs': {
+            path: _file_fingerprint(path, previous_inputs.get(path), previous_ns)
+            for path in sorted(tracked['files'])
+        },
+        'listings': {
+            directory: listing_digest(directory)
+            for directory in sorted(tracked['listings'])
+        },
+    }
+
+
+def record_build(ledger, output, tracked, keys):
+    """
+    Record a successful conversion, or forget it if it was volatile.
+
+    Args:
+        ledger: Ledger dict from load_ledger()
+        output: Output path that was written
+        tracked: Dict yielded by track_inputs() for the conversion
+        keys: Build-wide digests the conversion ran under
+    """
+    output = os.path.normpath(str(output))
+    if tracked['volatile']:
+        forget(ledger, output)
+        return
+
+    entry = fingerprint_inputs(tracked, ledger['outputs'].get(output))
+    entry.update(keys=keys, output=_file_fingerprint(output))
+    ledger['outputs'][output] = entry
+
+
+def refresh_output(ledger, output):
+    """
+    Fingerprint an output again after a later step rewrote it on purpose.
+
+    The demo merge adds demo entries to project.json and objects.json after
+    they are converted; without this the merged file would never match its
+    entry and would be converted again on every build.
+
+    Args:
+        ledger: Ledger dict from load_ledger()
+        output: Output path, as passed to record_build()
+    """
+    entry = ledger['outputs'].get(os.path.normpath(str(output)))
+    if entry is not None:
+        entry['output'] = _file_fingerprint(output)
+
+
+def forget(ledger, output):
+    """
+    Drop an output's entry so it is rebuilt next time.
+
+    Args:
+        ledger: Ledger dict from load_ledger()
+        output: Output path
+    """
+    ledger['outputs'].pop(os.path.normpath(str(output)), None)
@@ -0,0 +1,391 @@
+"""
+Build State Store (.telar-cache/build.db)
+
+This module deals with keeping what one build learns for the next one in
+a single place. Incremental features each used to keep their own files —
+a JSON build ledger, a JSON stage state, `.cache` sidecars next to the
+audio peaks, nothing at all for tiles — each read and rewritten whole. The
+build state store is one SQLite database with indexed lookups, so a build
+reads only the entries it asks for and writes only the ones that changed.
+
+Entries live in namespaces, each a table of key -> JSON value with the time
+it was last written and the time it was last used:
+
+- `ledger` — input fingerprints of each `_data/*.json` (telar.build_ledger)
+- `stage` — input/output fingerprints of pipeline stages (telar.pipeline)
+- `manifest` — IIIF manifests with their ETag/Last-Modified validators,
+  for conditional requests and as a fallback when a server rate-limits
+- `image_size` — image dimensions for widgets, keyed by path (with the
+  file's size and mtime) or URL (with its ETag/Last-Modified validators)
+- `tiles` — the source fingerprint and settings each object's IIIF tiles
+  were generated from
+- `peaks` — content hashes of audio files, so unchanged audio is not
+  re-read to compute its cache key
+- `envelope` — each protected story's last encrypted envelope, reused while
+  the story's plaintext and key are unchanged (telar.encryption)
+- `render` — rendered markdown panels keyed by a hash of their text, with
+  their widget warnings and input fingerprints (telar.markdown)
+
+A separate `timings` table records the duration of every pipeline stage
+run, for spotting regressions over time.
+
+The database runs in WAL mode with a busy timeout, so story conversion
+workers in other processes can read and write while the main process
+does. Each process opens its own connection on first use
+(`get_build_state()`); a database that cannot be opened or turns out to
+be corrupt is set aside and recreated, since everything in it can be
+rebuilt. `scripts/manage_cache.py stats` and `prune` inspect and trim it;
+prune goes by last use, so an entry that is read on every build (a render
+cache hit, an unchanged image's size) but never rewritten is kept. A read
+records its use at most once every USE_REFRESH_S, so hits stay reads.
+
+Kept dependency-free (standard library only) so leaf modules can use it.
+
+Version: v1.6.0
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+BUILD_DB_PATH = Path('.telar-cache/build.db')
+
+# Bump when the schema changes; older databases are then recreated
+SCHEMA_VERSION = 2
+
+# Wait this long for another process's write to finish
+BUSY_TIMEOUT_MS = 10000
+
+# Refresh an entry's last-use time on a read at most this often (seconds)
+USE_REFRESH_S = 3600
+
+NAMESPACES = ('ledger', 'stage', 'manifest', 'image_size', 'tiles', 'peaks', 'envelope', 'render')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_ns INTEGER NOT NULL,
+    used_ns INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_use ON entries (namespace, used_ns);
+CREATE TABLE IF NOT EXISTS timings (
+    recorded_ns INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    skipped INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS timings_by_stage ON timings (stage, recorded_ns);
+"""
+
+
+class BuildState:
+    """
+    Connection to the build state database.
+
+    Methods are safe to call from several threads; writes outside a
+    transaction() block are committed immediately.
+    """
+
+    def __init__(self, path=BUILD_DB_PATH):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._connection = self._open()
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return self._connect()
+        except sqlite3.DatabaseError as e:
+            # Everything in the store can be rebuilt: set a broken file aside
+            print(f"  [WARN] Build state database unusable ({e}); starting a new one")
+            os.replace(self.path, self.path.with_suffix('.db.corrupt'))
+            for suffix in ('-wal', '-shm'):
+                try:
+                    os.remove(f'{self.path}{suffix}')
+                except OSError:
+                    pass
+            return self._connect()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000,
+                                     check_same_thread=False, isolation_level=None)
+        try:
+            connection.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}')
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            version = connection.execute('PRAGMA user_version').fetchone()[0]
+            if version != SCHEMA_VERSION:
+                connection.executescript(
+                    'DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS entries; '
+                    'DROP TABLE IF EXISTS timings;'
+                )
+            connection.executescript(_SCHEMA)
+            connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def transaction(self):
+        """
+        Group writes into one transaction (one fsync instead of one each).
+
+        Returns:
+            context manager
+        """
+        return _Transaction(self)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connection.execute(sql, params)
+
+    def get(self, namespace, key, default=None):
+        """
+        Look up one entry.
+
+        Args:
+            namespace: One of NAMESPACES
+            key: Entry key
+
+        Returns:
+            The stored value (decoded from JSON), or default
+        """
+        row = self._execute('SELECT value, used_ns FROM entries WHERE namespace = ? AND key = ?',
+                            (namespace, key)).fetchone()
+        if row is None:
+            return default
+        self._note_use(namespace, key, row[1])
+        return json.loads(row[0])
+
+    def get_with_age(self, namespace, key):
+        """
+        Look up one entry with the time it was written.
+
+        Returns:
+            tuple: (value, updated_ns), or (None, None) if absent
+        """
+        row = self._execute(
+            'SELECT value, updated_ns, used_ns FROM entries WHERE namespace = ? AND key = ?',
+            (namespace, key)).fetchone()
+        if row is None:
+            return None, None
+        self._note_use(namespace, key, row[2])
+        return json.loads(row[0]), row[1]
+
+    def _note_use(self, namespace, key, used_ns):
+        now = time.time_ns()
+        if now - used_ns >= USE_REFRESH_S * 10**9:
+            self._execute('UPDATE entries SET used_ns = ? WHERE namespace = ? AND key = ?',
+                          (now, namespace, key))
+
+    def put(self, namespace, key, value):
+        """
+        Store or replace one entry.
+
+        Args:
+            namespace: One of NAMESPACES
+            key: Entry key
+            value: JSON-serialisable value
+        """
+        now = time.time_ns()
+        self._execute(
+            'INSERT OR REPLACE INTO entries (namespace, key, value, updated_ns, used_ns) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (namespace, key, json.dumps(value, sort_keys=True), now, now)
+        )
+
+    def delete(self, namespace, key):
+        """Remove one entry (no-op if absent)."""
+        self._execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (namespace, key))
+
+    def items(self, namespace):
+        """
+        Load every entry of a namespace.
+
+        Returns:
+            dict: key -> value
+        """
+        rows = self._execute('SELECT key, value FROM entries WHERE namespace = ?',
+                             (namespace,)).fetchall()
+        now = time.time_ns()
+        self._execute('UPDATE entries SET used_ns = ? WHERE namespace = ? AND used_ns <= ?',
+                      (now, namespace, now - USE_REFRESH_S * 10**9))
+        return {key: json.loads(value) for key, value in rows}
+
+    def replace_namespace(self, namespace, entries):
+        """
+        Make a namespace hold exactly the given entries, rewriting only changes.
+
+        Args:
+            namespace: One of NAMESPACES
+            entries: dict of key -> value
+        """
+        with self.transaction():
+            stored = dict(self._execute('SELECT key, value FROM entries WHERE namespace = ?',
+                                        (namespace,)).fetchall())
+            for key in stored.keys() - entries.keys():
+                self.delete(namespace, key)
+            for key, value in entries.items():
+                if stored.get(key) != json.dumps(value, sort_keys=True):
+                    self.put(namespace, key, value)
+
+    def get_meta(self, name, default=None):
+        row = self._execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, name, value):
+        self._execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)', (name, str(value)))
+
+    def record_timings(self, timings, skipped=()):
+        """
+        Append one run's stage durations to the timings table.
+
+        Args:
+            timings: Stage name -> seconds
+            skipped: Names of stages skipped as up to date
+        """
+        now = time.time_ns()
+        with self.transaction():
+            for stage, seconds in timings.items():
+                self._execute('INSERT INTO timings (recorded_ns, stage, seconds, skipped) VALUES (?, ?, ?, ?)',
+                              (now, stage, seconds, int(stage in skipped)))
+
+    def stats(self):
+        """
+        Summarise the store.
+
+        Returns:
+            dict: 'path', 'bytes' (database plus WAL), 'namespaces'
+            (namespace -> {'entries', 'bytes', 'oldest_ns', 'newest_ns'}) and
+            'timings' (stage -> {'runs', 'mean', 'last'})
+        """
+        namespaces = {}
+        rows = self._execute(
+            'SELECT namespace, COUNT(*), SUM(LENGTH(value)), MIN(updated_ns), MAX(updated_ns) '
+            'FROM entries GROUP BY namespace'
+        ).fetchall()
+        for namespace, count, size, oldest, newest in rows:
+            namespaces[namespace] = {'entries': count, 'bytes': size or 0,
+                                     'oldest_ns': oldest, 'newest_ns': newest}
+
+        timings = {}
+        rows = self._execute(
+            'SELECT stage, COUNT(*), AVG(seconds), '
+            '(SELECT seconds FROM timings AS t2 WHERE t2.stage = t1.stage '
+            ' ORDER BY recorded_ns DESC LIMIT 1) '
+            'FROM timings AS t1 WHERE skipped = 0 GROUP BY stage ORDER BY stage'
+        ).fetchall()
+        for stage, runs, mean, last in rows:
+            timings[stage] = {'runs': runs, 'mean': mean, 'last': last}
+
+        size = sum(os.path.getsize(p) for p in (self.path, Path(f'{self.path}-wal'))
+                   if os.path.exists(p))
+        return {'path': str(self.path), 'bytes': size, 'namespaces': namespaces, 'timings': timings}
+
+    def prune(self, older_than_s=None, namespaces=None, missing_outputs=True):
+        """
+        Delete stale entries and compact the database.
+
+        Args:
+            older_than_s: Delete entries not used, and timings not
+                recorded, for this many seconds; None keeps them regardless
+                of age
+            namespaces: Limit age-based pruning to these namespaces (all if None)
+            missing_outputs: Also delete ledger entries whose output file is gone
+
+        Returns:
+            int: Number of entries deleted
+        """
+        deleted = 0
+        with self.transaction():
+            if older_than_s is not None:
+                cutoff = time.time_ns() - int(older_than_s * 10**9)
+                for namespace in namespaces or NAMESPACES:
+                    deleted += self._execute(
+                        'DELETE FROM entries WHERE namespace = ? AND used_ns < ?',
+                        (namespace, cutoff)).rowcount
+                if namespaces is None:
+                    self._execute('DELETE FROM timings WHERE recorded_ns < ?', (cutoff,))
+            if missing_outputs:
+                for key in list(self.items('ledger')):
+                    if not os.path.exists(key):
+                        self.delete('ledger', key)
+                        deleted += 1
+        with self._lock:
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._connection.execute('VACUUM')
+        return deleted
+
+
+class _Transaction:
+    """Re-entrant BEGIN IMMEDIATE ... COMMIT around a block."""
+
+    def __init__(self, state):
+        self.state = state
+
+    def __enter__(self):
+        self.state._lock.acquire()
+        if self.state._depth == 0:
+            self.state._connection.execute('BEGIN IMMEDIATE')
+        self.state._depth += 1
+        return self.state
+
+    def __exit__(self, exc_type, exc, tb):
+        self.state._depth -= 1
+        try:
+            if self.state._depth == 0:
+                self.state._connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.state._lock.release()
+
+
+_states = {}
+_states_lock = threading.Lock()
+
+
+def get_build_state(path=BUILD_DB_PATH):
+    """
+    Return this process's connection to a build state database.
+
+    Connections are cached per process and absolute path, so worker
+    processes forked from a build open their own.
+
+    Args:
+        path: Database path (relative paths resolve against the working directory)
+
+    Returns:
+        BuildState, or None if the database cannot be opened at all (the
+        build then runs without cached state)
+    """
+    key = (os.getpid(), os.path.abspath(path))
+    with _states_lock:
+        state = _states.get(key)
+        if state is None:
+            try:
+                state = BuildState(path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"  [WARN] Build state unavailable: {e}")
+                return None
+            _states[key] = state
+        return state
+
+
+def close_build_states():
+    """Close every connection this process opened (e.g. before deleting the file)."""
+    with _states_lock:
+        for key, state in list(_states.items()):
+            if key[0] == os.getpid():
+                state.close()
+            del _states[key]
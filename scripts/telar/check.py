@@ -0,0 +1,171 @@
+"""
+Validate-Only Content Check (csv_to_json.py --check)
+
+This module deals with telling an author what is wrong with their content
+without building anything. A full `csv_to_json.py` run renders every
+markdown panel, fetches every IIIF manifest and writes every JSON file,
+which is a lot of waiting just to learn that step 7 references an object
+that does not exist.
+
+`check_site()` runs the same processors the build does —
+`process_project_setup()`, `process_objects()` and `process_story()` — so
+the rules cannot drift apart: story_id format and duplicates, object IDs,
+thumbnails, source URL syntax, object references from story steps, page
+numbers, missing markdown files, glossary links and widget syntax. While
+`validate_only()` is active the processors skip the expensive parts that
+validation does not need:
+
+- IIIF manifests are not fetched (the URL is still checked for syntax)
+- panel markdown is not converted to HTML, images are not processed and
+  widget templates are not rendered (widgets are still parsed and
+  validated)
+- carousel image dimensions are not looked up
+- nothing is written: stories are validated against the objects read from
+  the objects spreadsheet in the same run, not `_data/objects.json`
+
+The result is a JSON report with one entry per spreadsheet and its issues
+(`step` and `type` when the processor knows them, and the message the build
+would print or show in the story's intro panel), for the Compositor or an
+editor to show inline. On the template site the check takes a fraction of a
+second.
+
+The mode is per-thread state, like the build ledger's input tracking, so
+the processors only need `checking()` at the few places they would
+otherwise render or fetch, and a check does not leak into build stages
+running in other threads.
+
+Version: v1.6.0
+"""
+
+import io
+import os
+import re
+import time
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+# Validate-only mode of this thread ('active' attribute)
+_mode = threading.local()
+
+# Spreadsheets that are not stories (the glossary is loaded by the processors)
+NON_STORY_CSVS = {
+    'project.csv', 'proyecto.csv', 'objects.csv', 'objetos.csv', 'glossary.csv', 'glosario.csv'
+}
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+@contextmanager
+def validate_only():
+    """Run the block in validate-only mode (see module docstring)."""
+    previous = checking()
+    _mode.active = True
+    try:
+        yield
+    finally:
+        _mode.active = previous
+
+
+def checking():
+    """
+    Whether processors are running in validate-only mode.
+
+    Returns:
+        bool
+    """
+    return getattr(_mode, 'active', False)
+
+
+def _issue(message, issue_type, step=None):
+    issue = {'type': issue_type, 'message': _TAG_PATTERN.sub('', str(message))}
+    if step is not None and str(step).strip():
+        issue['step'] = step
+    return issue
+
+
+def _check_csv(csv_path, process_func, kind):
+    """
+    Read and process one spreadsheet, collecting its issues.
+
+    Args:
+        csv_path: Spreadsheet path
+        process_func: Processor the build would run on it
+        kind: 'project', 'objects' or 'story'
+
+    Returns:
+        tuple: (report entry, processed DataFrame or None)
+    """
+    from telar.core import read_csv_for_processing
+
+    entry = {'path': csv_path, 'kind': kind, 'issues': []}
+    if not os.path.exists(csv_path):
+        if kind != 'story':
+            entry['issues'].append(_issue(f"{csv_path} not found", 'file'))
+        return entry, None
+
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            df = process_func(read_csv_for_processing(csv_path))
+    except Exception as e:
+        entry['issues'].append(_issue(f"Could not process {csv_path}: {e}", 'file'))
+        return entry, None
+
+    issue_type = 'project' if kind == 'project' else 'object'
+    for message in df.attrs.get('validation_warnings') or []:
+        entry['issues'].append(_issue(message, issue_type))
+    for warning in df.attrs.get('step_warnings') or []:
+        entry['issues'].append(_issue(warning['message'], warning['type'], warning.get('step')))
+    for warning in df.attrs.get('viewer_warnings') or []:
+        entry['issues'].append(_issue(warning['message'], warning['type'], warning.get('step')))
+    return entry, df
+
+
+def check_site(story=None):
+    """
+    Validate every spreadsheet without fetching, rendering or writing.
+
+    Args:
+        story: Story ID (CSV stem) to limit story checks to, or None for all
+
+    Returns:
+        dict: {'ok': bool, 'seconds': float, 'issue_count': int,
+        'files': [{'path', 'kind', 'issues': [{'type', 'message', 'step'?}]}]}
+    """
+    from pathlib import Path
+    from functools import partial
+    from telar.core import find_csv_with_fallback
+    from telar.processors.project import process_project_setup
+    from telar.processors.objects import process_objects
+    from telar.processors.stories import process_story
+
+    start = time.perf_counter()
+    files = []
+    with validate_only():
+        with redirect_stdout(io.StringIO()):
+            project_path = find_csv_with_fallback('telar-content/spreadsheets/project', 'proyecto')
+            objects_path = find_csv_with_fallback('telar-content/spreadsheets/objects', 'objetos')
+
+        entry, _ = _check_csv(project_path, process_project_setup, 'project')
+        files.append(entry)
+
+        entry, objects_df = _check_csv(objects_path, process_objects, 'objects')
+        files.append(entry)
+        objects_data = {}
+        if objects_df is not None:
+            objects_data = {obj['object_id']: obj for obj in objects_df.to_dict('records')}
+
+        structures_dir = Path('telar-content/spreadsheets')
+        for csv_file in sorted(structures_dir.glob('*.csv')):
+            if csv_file.name.lower() in NON_STORY_CSVS or (story and csv_file.stem != story):
+                continue
+            entry, _ = _check_csv(str(csv_file), partial(process_story, objects_data=objects_data), 'story')
+            files.append(entry)
+
+    issue_count = sum(len(entry['issues']) for entry in files)
+    return {
+        'ok': issue_count == 0,
+        'seconds': round(time.perf_counter() - start, 3),
+        'issue_count': issue_count,
+        'files': files,
+    }
@@ -0,0 +1,107 @@
+"""
+Generated Collection Files, Written Only When Changed
+
+This module deals with writing the markdown files that
+`generate_collections.py` produces for Jekyll's collections
+(`_jekyll-files/_pages/`, `_glossary/` and so on). The generators used to
+delete a collection directory and write every file again on each run, so
+every file got a new mtime whether or not its content had changed, and
+`jekyll build --incremental` (and anything else that watches those
+directories) saw the whole collection as modified.
+
+`CollectionFiles` wraps one collection directory. `write()` compares the
+new content with the file on disk and only writes a file that is new or
+different, through a temporary file and a rename, so a reader never sees
+a half-written page. `remove_orphans()` then deletes the files the run did
+not produce (a page or term that was removed from the source), leaving
+alone any it is told belong to someone else. The counts of created,
+updated, unchanged and removed files are kept for a one-line summary.
+
+Kept dependency-free (standard library only).
+
+Version: v1.6.0
+"""
+
+import os
+from pathlib import Path
+
+STATUSES = ('created', 'updated', 'unchanged', 'removed')
+
+
+class CollectionFiles:
+    """
+    One generated collection directory, written only where content changed.
+    """
+
+    def __init__(self, directory, pattern='*.md'):
+        """
+        Args:
+            directory: Collection directory (created if missing)
+            pattern: Glob of the files this collection owns, for orphan removal
+        """
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.counts = dict.fromkeys(STATUSES, 0)
+        self._produced = set()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name, content):
+        """
+        Write one file unless it already has this content.
+
+        Args:
+            name: File name within the directory
+            content: Full file content (str)
+
+        Returns:
+            str: 'created', 'updated' or 'unchanged'
+        """
+        path = self.directory / name
+        self._produced.add(name)
+        data = content.encode('utf-8')
+        try:
+            existing = path.read_bytes()
+        except FileNotFoundError:
+            existing = None
+
+        if existing == data:
+            status = 'unchanged'
+        else:
+            tmp_path = path.with_name(f'.{name}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            status = 'created' if existing is None else 'updated'
+        self.counts[status] += 1
+        return status
+
+    def remove_orphans(self, exclude=()):
+        """
+        Delete the collection's files that this run did not produce.
+
+        Args:
+            exclude: Glob patterns of files owned by another generator
+
+        Returns:
+            list: Paths that were removed
+        """
+        removed = []
+        for path in sorted(self.directory.glob(self.pattern)):
+            if path.name in self._produced or any(path.match(pattern) for pattern in exclude):
+                continue
+            path.unlink()
+            removed.append(path)
+        self.counts['removed'] += len(removed)
+        return removed
+
+    def summary(self, label):
+        """
+        One-line summary of what the run changed.
+
+        Args:
+            label: What the files are, e.g. 'Pages'
+
+        Returns:
+            str: e.g. "✓ Pages: 1 created, 2 updated, 40 unchanged, 0 removed"
+        """
+        counts = ', '.join(f'{self.counts[status]} {status}' for status in STATUSES)
+        return f"✓ {label}: {counts}"
@@ -8,27 +8,181 @@ configured language. It reads the `telar_language` setting from `_config.yml`
 `_data/languages/` (e.g., `en.yml` or `es.yml`).
 
 The loaded strings are cached in the module-level `_lang_data` dictionary to
-avoid repeated file reads during a build. The main entry point for the rest
-of the codebase is `get_lang_string()`, which takes a dot-separated key path
-like `'errors.object_warnings.iiif_503'` and walks the nested dictionary to
-find the matching string. It also supports variable interpolation using
-`{{ var }}` syntax — for example, `get_lang_string('errors.missing', id=obj_id)`
-replaces `{{ id }}` in the template with the value of `obj_id`.
+avoid repeated file reads during a build; `clear_language_cache()` drops
+them when the language file or setting may have changed. The main entry
+point for the rest of the codebase is `get_lang_string()`, which takes a
+dot-separated key path like `'errors.object_warnings.iiif_503'` and walks
+the nested dictionary to find the matching string. It also supports
+variable interpolation using `{{ var }}` syntax — for example,
+`get_lang_string('errors.missing', id=obj_id)` replaces `{{ id }}` in the
+template with the value of `obj_id`.
 
 `load_site_language()` is a lighter utility that just returns the language
 code ('en', 'es', etc.) without loading the full string dictionary. This is
 used by IIIF metadata extraction to choose the preferred language when
 reading multilingual manifests.
 
-Version: v1.5.0
+`load_site_config()` is the one place the build reads `_config.yml`. The
+parsed file is cached per process and parsed again only when the file
+changes (its mtime and size, or — when the mtime is too recent to trust —
+its bytes), using libyaml's C loader when PyYAML was built with it. Typed
+views sit on top of it for the settings several scripts need:
+`load_site_language()`, `get_base_url()`, `get_development_features()` and
+`get_story_key()`. Each call returns its own copy of the parse (a deep copy
+of a small dict is far cheaper than parsing the YAML again), so a caller
+that modifies the config cannot change what the next caller reads.
+
+Version: v1.6.0
 """
 
+import copy
+import hashlib
+import json
+import os
+import time
 from pathlib import Path
 import yaml
 
+from telar.constants import RACY_WINDOW_NS
+
 # Global language data cache
 _lang_data = None
 
+CONFIG_PATH = '_config.yml'
+
+# libyaml's C loader when PyYAML was built with it; same safe subset of YAML
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed config per absolute path: {'mtime_ns', 'size', 'raw', 'config', 'settled'}
+_config_cache = {}
+
+
+def load_site_config(path=CONFIG_PATH):
+    """
+    Return the parsed _config.yml, cached until the file changes.
+
+    Args:
+        path: Path to the config file (default: _config.yml in the cwd)
+
+    Returns:
+        dict: Parsed config (empty if the file is missing or empty), a copy
+        the caller may modify
+
+    Raises:
+        OSError, yaml.YAMLError: If the file exists but cannot be read or
+        parsed. Callers keep their own fallbacks for these.
+    """
+    config_path = Path(path)
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    key = os.path.abspath(config_path)
+    entry = _config_cache.get(key)
+    if (entry is not None and entry['settled']
+            and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size):
+        return copy.deepcopy(entry['config'])
+
+    read_at = time.time_ns()
+    raw = config_path.read_bytes()
+    if entry is None or entry['raw'] != raw:
+        config = yaml.load(raw.decode('utf-8'), Loader=YAML_LOADER) or {}
+    else:
+        config = entry['config']
+
+    _config_cache[key] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'raw': raw,
+        'config': config,
+        'settled': read_at - stat.st_mtime_ns >= RACY_WINDOW_NS,
+    }
+    return copy.deepcopy(config)
+
+
+def get_base_url(config=None):
+    """
+    Combine url and baseurl from the site config.
+
+    Args:
+        config: Parsed config (default: load_site_config())
+
+    Returns:
+        str or None: e.g. "https://example.com/baseurl", or None if url is unset
+    """
+    config = load_site_config() if config is None else config
+    url = config.get('url', '')
+    baseurl = config.get('baseurl', '')
+    if url:
+        return url + baseurl
+    return None
+
+
+def get_development_features(config=None):
+    """
+    Return the development feature flags (christmas_tree_mode, skip_stories...).
+
+    Reads `development-features` (v0.6.2+) and falls back to the legacy
+    `testing-features` block.
+
+    Args:
+        config: Parsed config (default: load_site_config())
+
+    Returns:
+        dict: Feature flags (empty if none are set)
+    """
+    config = load_site_config() if config is None else config
+    return config.get('development-features', config.get('testing-features', {})) or {}
+
+
+def get_story_key(config=None):
+    """
+    Return the story_key used to encrypt protected stories.
+
+    Args:
+        config: Parsed config (default: load_site_config())
+
+    Returns:
+        str: The key, or empty string if not configured
+    """
+    config = load_site_config() if config is None else config
+    return config.get('story_key', '')
+
+
+def get_glossary_auto_link(config=None):
+    """
+    Whether bare glossary titles in panel text are linked automatically.
+
+    Args:
+        config: Parsed config (default: load_site_config())
+
+    Returns:
+        bool: The `glossary_auto_link` setting (default False)
+    """
+    config = load_site_config() if config is None else config
+    return bool(config.get('glossary_auto_link', False))
+
+
+def clear_language_cache():
+    """Forget the loaded language strings, so the next lookup reads them again."""
+    global _lang_data
+    _lang_data = None
+
+
+def language_digest():
+    """
+    Digest the language strings in use, as load_language_data() returns them.
+
+    Build caches key on this rather than on the language files, so a cache
+    entry always describes the strings the output was actually made with.
+
+    Returns:
+        str: sha256 hex digest
+    """
+    text = json.dumps(load_language_data(), sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
 
 def load_language_data():
     """
@@ -45,12 +199,10 @@ def load_language_data():
 
     try:
         # Read _config.yml to get telar_language setting
-        config_path = Path('_config.yml')
-        if not config_path.exists():
+        if not Path(CONFIG_PATH).exists():
             return None
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_site_config()
 
         # Get language setting, default to English
         language = config.get('telar_language', 'en')
@@ -66,7 +218,7 @@ def load_language_data():
             return None
 
         with open(lang_file, 'r', encoding='utf-8') as f:
-            _lang_data = yaml.safe_load(f)
+            _lang_data = yaml.load(f, Loader=YAML_LOADER)
 
         return _lang_data
 
@@ -120,13 +272,6 @@ def load_site_language():
         str: Language code (default: 'en')
     """
     try:
-        config_path = Path('_config.yml')
-        if not config_path.exists():
-            return 'en'
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-
-        return config.get('telar_language', 'en')
+        return load_site_config().get('telar_language', 'en')
     except Exception:
         return 'en'
@@ -0,0 +1,18 @@
+"""
+Build-wide Constants (leaf module)
+
+Values shared by modules that must stay cheap to import, such as
+`telar.config`, which every script loads. This module imports nothing, so
+reading a constant does not pull in the build state store (and sqlite3)
+the way importing it from `telar.build_ledger` would.
+
+Version: v1.6.0
+"""
+
+# A file (or directory listing) whose mtime is this close to the moment it
+# was fingerprinted may still change without its mtime moving: filesystem
+# clocks are coarse (FAT-style filesystems have 2-second timestamps), so a
+# same-size edit within the same tick looks unchanged. Such fingerprints are
+# confirmed by content in every cache that trusts (size, mtime): the build
+# ledger, the config parse, directory listings, stage state and audio peaks.
+RACY_WINDOW_NS = 2 * 10**9
@@ -14,13 +14,39 @@ names from Spanish to English, sanitises user data, then hands the
 DataFrame to a processor function (`process_project_setup`,
 `process_objects`, or `process_story`). After processing, it serialises
 the result to JSON, prepending a `_metadata` block with viewer warnings
-if the processor attached any.
+if the processor attached any (and, for stories, the objects they use).
+
+Very large objects spreadsheets are streamed instead: with a `chunksize`,
+`csv_to_json()` reads, cleans and processes the CSV a block of rows at a
+time, spools the records to disk and writes the same JSON layout in a
+second pass, so memory is bounded by one chunk. `build_data()` switches to
+this automatically for objects CSVs over 50 MB; `--chunk-size` overrides it.
+
+`csv_to_json.py --check` runs the same processors in validate-only mode
+(`telar.check`): nothing is fetched, rendered or written, and the issues
+are printed as a JSON report.
+
+Conversions are incremental. `build_data()` consults the build ledger
+(`telar.build_ledger`), which records every file each output JSON was built
+from — the CSV, the markdown panels, glossary sources, images, the objects
+folder listing, `_data/objects.json` for stories — plus digests of the
+relevant config settings, language strings and pipeline code. An output
+whose inputs are all unchanged is left as is; `--force` rebuilds everything.
+
+Stories that do need converting are independent of each other once
+`_data/objects.json` exists, so they are fanned out to a pool of worker
+processes (`--jobs`, default: one per CPU); the glossary and objects
+lookups they share are loaded once per run, or once per worker
+(`telar.lookups`). Each worker buffers its story's log, which is printed
+in spreadsheet order when the story finishes, and a story that fails or
+crashes its worker only fails that story.
 
 `find_csv_with_fallback()` supports bilingual file naming by checking for
 the English filename first (e.g., `project.csv`) and falling back to the
 Spanish equivalent (e.g., `proyecto.csv`).
 
-`main()` drives the full build. It fetches demo content if enabled,
+`build_data()` drives the full build (`main()` parses the command line and
+calls it, and `telar.pipeline` can call it in-process). It fetches demo content if enabled,
 checks for Christmas Tree Mode in `_config.yml`, then converts the three
 CSV types in order: project setup, objects, and story files. Story files
 are discovered dynamically — every CSV in `telar-content/spreadsheets/` that
@@ -32,6 +58,10 @@ merged if available. Finally, `generate_search_data()` builds the
 Lunr.js search index and facet counts that power the gallery's
 browse-and-search interface.
 
+`--profile` and `--profile-network` write cProfile, memory and per-host
+network reports for the run to `_build-profile/` (see `telar.profiling`);
+stories are then converted in one process so the profile covers them.
+
 Protected stories are NOT encrypted here. Their `_data` JSON stays
 plaintext (gitignored, consumed only at build time); encryption happens
 post-build in `scripts/encrypt_protected_stories.py`, which encrypts the
@@ -44,24 +74,119 @@ predates the build-time encryption step.
 Version: v1.6.0
 """
 
+import io
 import os
+import sys
 import json
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
-import yaml
 
 from telar.csv_utils import sanitize_dataframe, normalize_column_names, is_header_row
 from telar.processors.project import process_project_setup
 from telar.processors.objects import process_objects
 from telar.processors.stories import process_story
-from telar.demo import load_demo_bundle, merge_demo_content, fetch_demo_content_if_enabled
-from telar.encryption import get_protected_stories, get_story_key_from_config
+from telar.markdown import cached_rendering
+from telar.lookups import BuildLookups, shared_lookups, activate_lookups
+from telar.demo import (
+    load_demo_bundle, merge_demo_data, write_demo_stories, fetch_demo_content_if_enabled
+)
+from telar.config import load_site_config, get_development_features, get_story_key, language_digest
+from telar.encryption import get_protected_stories
+from telar.asset_inventory import OBJECTS_DIR, get_inventory, find_object_file
 from telar.media_type import AUDIO_EXTENSIONS
 from telar.search import generate_search_data
+from telar.profiling import add_profile_arguments, profile_stage
+from telar.build_ledger import (
+    load_ledger, save_ledger, is_up_to_date, track_inputs, record_input,
+    record_build, forget, refresh_output, code_digest, config_digest
+)
+
+
+# Objects CSVs larger than this are streamed in chunks by build_data() unless
+# --chunk-size says otherwise
+STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+DEFAULT_CHUNK_ROWS = 10000
+
+# _config.yml settings the processors read; other settings (title, theme...)
+# do not affect _data/*.json, so editing them does not rebuild anything
+LEDGER_CONFIG_KEYS = (
+    'telar_language', 'development-features', 'testing-features', 'collection_interface',
+    'glossary_auto_link',
+)
+
+
+def _filter_comments(df):
+    """
+    Drop comment rows and instruction columns from a freshly read CSV.
+
+    Args:
+        df: DataFrame (or chunk) as read from the CSV
+
+    Returns:
+        DataFrame: Rows and columns the processors should see
+    """
+    # Filter out comment rows (first column value starts with #)
+    # This handles both # and "# patterns while preserving markdown headers in multi-line cells.
+    # A non-string first column (all numbers or all empty) cannot hold a comment.
+    first = df[df.columns[0]]
+    if pd.api.types.is_string_dtype(first) or first.dtype == object:
+        df = df[~first.str.strip().str.startswith('#', na=False)]
+
+    # Filter out columns starting with # (instruction columns)
+    return df.loc[:, ~df.columns.astype(str).str.startswith('#')]
+
+
+def _clean_dataframe(df):
+    """
+    Run the ingest steps every CSV shares before its processor sees it.
+
+    Filters comment rows and instruction columns, skips a duplicate header
+    row, normalises column names and sanitises user data. Every step works
+    on whole columns with pandas string methods, so ingest cost does not grow
+    with a Python call per cell.
+
+    Args:
+        df: DataFrame as read from the CSV
+
+    Returns:
+        DataFrame: Cleaned dataframe ready for a processor
+    """
+    df = _filter_comments(df)
+
+    # Check if first data row is actually a duplicate header row (bilingual CSVs)
+    if len(df) > 0 and is_header_row(df.iloc[0].values):
+        print(f"  [WARN] Detected duplicate header row - skipping row 2")
+        df = df.iloc[1:].reset_index(drop=True)
+
+    # Normalize column names (Spanish -> English) for bilingual support
+    df = normalize_column_names(df)
+
+    # Sanitize user data - remove Christmas tree emoji to prevent accidental triggering
+    return sanitize_dataframe(df)
+
+
+def read_csv_for_processing(csv_path):
+    """
+    Read a CSV whole and clean it for a processor.
 
+    Args:
+        csv_path: Path to the CSV file
 
-def csv_to_json(csv_path, json_path, process_func=None):
+    Returns:
+        DataFrame: Cleaned dataframe (see _clean_dataframe)
+    """
+    # Note: We can't use pandas' comment parameter because it treats # anywhere as a comment,
+    # which breaks hex color codes like #2c3e50 and markdown headers (## Title) in multi-line cells
+    df = pd.read_csv(csv_path, on_bad_lines='warn')
+    return _clean_dataframe(df)
+
+
+def csv_to_json(csv_path, json_path, process_func=None, chunksize=None):
     """
     Convert CSV file to JSON.
 
@@ -69,6 +194,8 @@ def csv_to_json(csv_path, json_path, process_func=None):
         csv_path: Path to input CSV file
         json_path: Path to output JSON file
         process_func: Optional function to process the dataframe before conversion
+        chunksize: If set, stream the CSV in chunks of this many rows instead of
+            loading it whole (see _csv_to_json_streaming)
 
     Returns:
         bool: True if the JSON was written, False on skip (missing input) or error.
@@ -78,32 +205,11 @@ def csv_to_json(csv_path, json_path, process_func=None):
         print(f"Warning: {csv_path} not found. Skipping.")
         return False
 
-    try:
-        # Read CSV file with pandas
-        # Note: We can't use pandas' comment parameter because it treats # anywhere as a comment,
-        # which breaks hex color codes like #2c3e50 and markdown headers (## Title) in multi-line cells
-        df = pd.read_csv(csv_path, on_bad_lines='warn')
-
-        # Filter out comment rows (first column value starts with #)
-        # This handles both # and "# patterns while preserving markdown headers in multi-line cells
-        first_col = df.columns[0]
-        df = df[~df[first_col].astype(str).str.strip().str.startswith('#')]
-
-        # Filter out columns starting with # (instruction columns)
-        df = df[[col for col in df.columns if not col.startswith('#')]]
+    if chunksize:
+        return _csv_to_json_streaming(csv_path, json_path, process_func, chunksize)
 
-        # Check if first data row is actually a duplicate header row (bilingual CSVs)
-        if len(df) > 0:
-            first_row = df.iloc[0]
-            if is_header_row(first_row.values):
-                print(f"  [WARN] Detected duplicate header row - skipping row 2")
-                df = df.iloc[1:].reset_index(drop=True)
-
-        # Normalize column names (Spanish -> English) for bilingual support
-        df = normalize_column_names(df)
-
-        # Sanitize user data - remove Christmas tree emoji to prevent accidental triggering
-        df = sanitize_dataframe(df)
+    try:
+        df = read_csv_for_processing(csv_path)
 
         # Apply processing function if provided
         if process_func:
@@ -120,12 +226,15 @@ def csv_to_json(csv_path, json_path, process_func=None):
                 metadata['viewer_warnings'] = viewer_warnings
             if df.attrs.get('has_latex'):
                 metadata['has_latex'] = True
+            # Stories always list their objects; an empty list means none
+            if 'objects' in df.attrs:
+                metadata['objects'] = df.attrs['objects']
             if len(metadata) > 1:  # Only add if there's actual metadata beyond the flag
                 data.insert(0, metadata)
 
         # Write JSON file
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
 
         print(f"\u2713 Converted {csv_path} to {json_path}")
         return True
@@ -135,6 +244,317 @@ def csv_to_json(csv_path, json_path, process_func=None):
         return False
 
 
+def _merge_columns(columns, chunk_columns):
+    """
+    Merge a chunk's column order into the running output column order.
+
+    Processors add some columns only when a row needs them (an
+    object_warning_short, say), so chunks can disagree. A new column is
+    slotted in after the column that precedes it in the chunk, which keeps
+    the order a single whole-file pass would have produced.
+
+    Args:
+        columns: Running list of output columns (updated in place)
+        chunk_columns: Columns of the processed chunk
+    """
+    known = set(columns)
+    previous = None
+    for col in chunk_columns:
+        if col not in known:
+            position = columns.index(previous) + 1 if previous is not None else 0
+            columns.insert(position, col)
+            known.add(col)
+        previous = col
+
+
+def _dump_indented(obj):
+    """Serialise one top-level list item exactly as json.dump(indent=2, sort_keys=True) would."""
+    return '  ' + json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).replace('\n', '\n  ')
+
+
+def _csv_to_json_streaming(csv_path, json_path, process_func, chunksize):
+    """
+    Convert a large CSV to JSON a chunk of rows at a time.
+
+    Peak memory is bounded by one chunk plus its processed records rather
+    than the whole spreadsheet. Each chunk is cleaned like a whole file
+    (the duplicate header row is only looked for at the top), processed, and
+    its records spooled to a temporary JSON-lines file next to the output.
+    A second pass writes the final JSON in the same layout csv_to_json()
+    produces, with the `_metadata` block first, and swaps it into place.
+
+    Processors see each chunk with `df.attrs['chunk_number']` set, and hand
+    back per-chunk state in attrs that is merged here: viewer_warnings and
+    has_latex (as in whole-file mode), validation_warnings (one summary is
+    printed for the file) and featured_candidates (the homepage sample is
+    decided once over every chunk).
+
+    Values are read as text, so numeric-looking cells stay strings in the
+    JSON instead of becoming numbers as they can in whole-file mode.
+    Processors whose output depends on other rows (story step ordering)
+    should not be streamed.
+
+    Args:
+        csv_path: Path to input CSV file
+        json_path: Path to output JSON file
+        process_func: Optional function to process each chunk
+        chunksize: Number of CSV rows per chunk
+
+    Returns:
+        bool: True if the JSON was written, False on error.
+    """
+    out_dir = os.path.dirname(os.path.abspath(json_path))
+    spool_path = None
+    partial_path = None
+    try:
+        fd, spool_path = tempfile.mkstemp(suffix='.jsonl', dir=out_dir)
+        columns = []
+        viewer_warnings = []
+        has_latex = False
+        warning_count = 0
+        candidates = None
+        header_names = None
+        relabel = False
+        offset = 0
+        chunk_number = 0
+
+        with os.fdopen(fd, 'w', encoding='utf-8') as spool:
+            reader = pd.read_csv(csv_path, on_bad_lines='warn', dtype=str, chunksize=chunksize)
+            for chunk in reader:
+                df = _filter_comments(chunk)
+                if header_names is None:
+                    if len(df) == 0:
+                        continue
+                    # Only the top of the file can hold the bilingual header row.
+                    # Dropping it renumbers rows in whole-file mode, so keep
+                    # numbering later chunks the same way.
+                    if is_header_row(df.iloc[0].values):
+                        print(f"  [WARN] Detected duplicate header row - skipping row 2")
+                        df = df.iloc[1:]
+                        relabel = True
+                    df = normalize_column_names(df)
+                    header_names = list(df.columns)
+                else:
+                    df = df.set_axis(header_names, axis=1)
+
+                if relabel:
+                    df = df.set_axis(pd.RangeIndex(offset, offset + len(df)), axis=0)
+                    offset += len(df)
+
+                df = sanitize_dataframe(df)
+                df.attrs['chunk_number'] = chunk_number
+                chunk_number += 1
+
+                if process_func:
+                    df = process_func(df)
+
+                attrs = df.attrs
+                viewer_warnings.extend(attrs.get('viewer_warnings') or [])
+                has_latex = has_latex or bool(attrs.get('has_latex'))
+                warning_count += len(attrs.get('validation_warnings') or [])
+
+                # Rows still eligible for the homepage sample keep their label so
+                # the second pass can flag the ones chosen across all chunks
+                eligible = set()
+                chunk_candidates = attrs.get('featured_candidates')
+                if chunk_candidates is not None:
+                    if candidates is None:
+                        candidates = {'explicit': [], 'valid': []}
+                    for kind in ('explicit', 'valid'):
+                        labels = [int(label) for label in chunk_candidates[kind]]
+                        candidates[kind].extend(labels)
+                        eligible.update(labels)
+
+                _merge_columns(columns, list(df.columns))
+                for label, record in zip(df.index, df.to_dict('records')):
+                    key = int(label) if eligible and int(label) in eligible else None
+                    spool.write(json.dumps([key, record], ensure_ascii=False))
+                    spool.write('\n')
+
+        if warning_count:
+            print(f"\n  Validation summary: {warning_count} warning(s) across {chunk_number} chunk(s)")
+
+        selected = set()
+        if candidates is not None:
+            from telar.processors.objects import resolve_featured_sample
+            selected = set(resolve_featured_sample(candidates))
+
+        metadata = {'_metadata': True}
+        if viewer_warnings:
+            metadata['viewer_warnings'] = viewer_warnings
+        if has_latex:
+            metadata['has_latex'] = True
+
+        fd, partial_path = tempfile.mkstemp(suffix='.json', dir=out_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f, \
+                open(spool_path, 'r', encoding='utf-8') as spool:
+            items = 0
+            f.write('[')
+            if len(metadata) > 1:
+                f.write('\n' + _dump_indented(metadata))
+                items += 1
+            for line in spool:
+                key, record = json.loads(line)
+                # Chunks that never produced a column get the '' fill the
+                # processors give missing values in whole-file mode
+                record = {col: record.get(col, '') for col in columns}
+                if candidates is not None:
+                    record['is_featured_sample'] = key is not None and key in selected
+                f.write((',\n' if items else '\n') + _dump_indented(record))
+                items += 1
+            f.write('\n]' if items else ']')
+        os.replace(partial_path, json_path)
+        partial_path = None
+
+        print(f"\u2713 Converted {csv_path} to {json_path} ({chunk_number} chunk(s) of up to {chunksize} rows)")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error converting {csv_path}: {e}")
+        return False
+
+    finally:
+        for path in (spool_path, partial_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+
+
+def _ledger_keys():
+    """
+    Compute the build-wide digests every ledger entry is checked against.
+
+    Returns:
+        dict: 'code', 'config' and 'language' digests
+    """
+    return {
+        'code': code_digest(),
+        'config': config_digest(load_site_config(), LEDGER_CONFIG_KEYS),
+        # The strings the conversions will use, not the files on disk: a
+        # process still holding an older language is then not recorded as
+        # having built with the new one
+        'language': language_digest(),
+    }
+
+
+def _convert_incremental(ledger, keys, csv_path, json_path, process_func,
+                         force=False, chunksize=None):
+    """
+    Run csv_to_json() unless the ledger shows the output is up to date.
+
+    Args:
+        ledger: Build ledger dict (updated in place)
+        keys: Build-wide digests from _ledger_keys()
+        csv_path: Path to input CSV file
+        json_path: Path to output JSON file
+        process_func: Processor function passed to csv_to_json()
+        force: Convert even if the output is up to date
+        chunksize: Passed to csv_to_json()
+
+    Returns:
+        bool: True if the JSON is current (reused or written), as csv_to_json()
+    """
+    if not force and is_up_to_date(ledger, json_path, keys):
+        print(f"\u2713 Up to date: {json_path}")
+        return True
+
+    with track_inputs() as tracked:
+        record_input(csv_path)
+        ok = csv_to_json(csv_path, json_path, process_func, chunksize=chunksize)
+
+    _record_conversion(ledger, keys, json_path, ok, tracked)
+    return ok
+
+
+def _record_conversion(ledger, keys, json_path, ok, tracked):
+    """Update the ledger entry for one conversion result."""
+    if ok:
+        record_build(ledger, json_path, tracked, keys)
+        if tracked['volatile']:
+            print(f"  [INFO] {json_path} will be rebuilt next time "
+                  f"({len(tracked['volatile'])} transient failure(s))")
+    else:
+        forget(ledger, json_path)
+
+
+def _convert_story(csv_path, json_path, christmas_tree=False):
+    """
+    Convert one story CSV in a worker process, buffering its log.
+
+    Args:
+        csv_path: Path to the story CSV
+        json_path: Path to the output JSON
+        christmas_tree: Passed to process_story()
+
+    Returns:
+        tuple: (ok, log, tracked) — csv_to_json()'s result, everything the
+        conversion printed, and the inputs it recorded for the build ledger
+    """
+    process_func = partial(process_story, christmas_tree=True) if christmas_tree else process_story
+    log = io.StringIO()
+    with redirect_stdout(log), redirect_stderr(log), track_inputs() as tracked, cached_rendering():
+        record_input(csv_path)
+        ok = csv_to_json(csv_path, json_path, process_func)
+    return ok, log.getvalue(), tracked
+
+
+def _convert_stories(ledger, keys, stories, christmas_tree=False, force=False, jobs=1,
+                     lookups=None):
+    """
+    Convert story CSVs, in parallel when there is more than one to do.
+
+    Up-to-date stories are skipped first. With jobs > 1 the rest go to a
+    process pool; each story's log is printed in input order as a block, and
+    an exception or a crashed worker fails only the story it was running.
+
+    Args:
+        ledger: Build ledger dict (updated in place)
+        keys: Build-wide digests from _ledger_keys()
+        stories: List of (csv_path, json_path) pairs
+        christmas_tree: Passed to process_story()
+        force: Convert even if the output is up to date
+        jobs: Maximum number of worker processes
+        lookups: BuildLookups shared by the stories converted in this
+            process (default: new ones); each worker loads its own once
+
+    Returns:
+        dict: json_path -> bool, as csv_to_json() returns
+    """
+    results = {}
+    pending = []
+    for csv_path, json_path in stories:
+        if not force and is_up_to_date(ledger, json_path, keys):
+            print(f"\u2713 Up to date: {json_path}")
+            results[json_path] = True
+        else:
+            pending.append((csv_path, json_path))
+
+    if jobs <= 1 or len(pending) <= 1:
+        process_func = partial(process_story, christmas_tree=True) if christmas_tree else process_story
+        with cached_rendering(), shared_lookups(lookups):
+            for csv_path, json_path in pending:
+                results[json_path] = _convert_incremental(
+                    ledger, keys, csv_path, json_path, process_func, force=True
+                )
+        return results
+
+    workers = min(jobs, len(pending))
+    print(f"  [INFO] Converting {len(pending)} stories with {workers} worker processes")
+    with ProcessPoolExecutor(max_workers=workers, initializer=activate_lookups) as pool:
+        futures = [
+            pool.submit(_convert_story, csv_path, json_path, christmas_tree)
+            for csv_path, json_path in pending
+        ]
+        for (csv_path, json_path), future in zip(pending, futures):
+            try:
+                ok, log, tracked = future.result()
+            except Exception as e:
+                ok, log, tracked = False, f"❌ Error converting {csv_path}: {e!r}\n", None
+            sys.stdout.write(log)
+            _record_conversion(ledger, keys, json_path, ok, tracked)
+            results[json_path] = ok
+    return results
+
+
 def find_csv_with_fallback(base_path, spanish_name):
     """
     Find CSV file with bilingual fallback support.
@@ -204,14 +624,10 @@ def _check_protected_prerequisites(data_dir, workflow_path=None):
 
     # Prerequisite 1: a story_key must exist for the downstream encrypt step.
     story_key = None
-    config_path = Path('_config.yml')
-    if config_path.exists():
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            story_key = get_story_key_from_config(config)
-        except Exception as e:
-            print(f"  [WARN] Could not read _config.yml: {e}")
+    try:
+        story_key = get_story_key(load_site_config())
+    except Exception as e:
+        print(f"  [WARN] Could not read _config.yml: {e}")
 
     if not story_key:
         print(f"  ❌ {len(protected_stories)} story/stories are marked protected but "
@@ -270,8 +686,7 @@ def _generate_audio_manifest(data_dir):
     with open(objects_json, 'r', encoding='utf-8') as f:
         objects = json.load(f)
 
-    objects_dir = Path('telar-content/objects')
-    if not objects_dir.exists():
+    if get_inventory(OBJECTS_DIR) is None:
         return
 
     manifest = {}
@@ -279,15 +694,21 @@ def _generate_audio_manifest(data_dir):
         object_id = obj.get('object_id', '').strip()
         if not object_id:
             continue
-        for ext in AUDIO_EXTENSIONS:
-            if (objects_dir / f'{object_id}{ext}').exists():
-                manifest[object_id] = ext.lstrip('.')
-                break
+        match = find_object_file(object_id, AUDIO_EXTENSIONS)
+        if match:
+            manifest[object_id] = match.path.suffix.lstrip('.')
 
     manifest_path = data_dir / 'audio_objects.json'
     if manifest:
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        text = json.dumps(manifest, indent=2)
+        try:
+            unchanged = manifest_path.read_text(encoding='utf-8') == text
+        except OSError:
+            unchanged = False
+        # Leave an unchanged manifest untouched so its mtime does not make
+        # later pipeline stages look out of date
+        if not unchanged:
+            manifest_path.write_text(text, encoding='utf-8')
         print(f"  [INFO] Audio manifest: {len(manifest)} audio object(s) → {manifest_path}")
     elif manifest_path.exists():
         # No audio objects — remove stale manifest
@@ -337,7 +758,7 @@ def _cleanup_stale_data_files(data_dir, structures_dir, demo_bundle):
 
 
 def main():
-    """Main conversion process."""
+    """Main conversion process (command line wrapper for build_data)."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -348,34 +769,105 @@ def main():
         default=None,
         help='Story ID (CSV stem) to process; skips all other story CSVs (system CSVs always processed)'
     )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=None,
+        metavar='ROWS',
+        help=(
+            'Stream the objects CSV in chunks of ROWS rows to bound memory '
+            f'(default: {DEFAULT_CHUNK_ROWS} for CSVs over '
+            f'{STREAMING_THRESHOLD_BYTES // (1024 * 1024)} MB; 0 disables streaming)'
+        )
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Convert up to N story CSVs in parallel (default: number of CPUs; 1 disables)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild every JSON file, even those whose inputs have not changed'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help=('Only validate the spreadsheets and content files: print a JSON report and '
+              'exit with status 1 if there are issues (no fetching, rendering or writing)')
+    )
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
+    if args.check:
+        from telar.check import check_site
+        report = check_site(story=args.story)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        raise SystemExit(0 if report['ok'] else 1)
+
+    jobs = args.jobs
+    if (args.profile or args.profile_network) and jobs != 1:
+        # Worker processes would escape the profiler; convert stories here
+        print("[INFO] Profiling: converting stories in one process")
+        jobs = 1
+
+    with profile_stage('csv_to_json', args.profile, args.profile_network):
+        build_data(
+            story=args.story,
+            chunk_size=args.chunk_size,
+            jobs=jobs,
+            force=args.force
+        )
+
+
+def build_data(story=None, chunk_size=None, jobs=None, force=False, fetch_demo=True):
+    """
+    Convert every CSV to _data/*.json and build the derived data files.
+
+    This is the whole csv_to_json.py step, callable in-process (see
+    telar.pipeline); main() only parses the command line.
+
+    Args:
+        story: Story ID (CSV stem) to limit story conversion to, or None for all
+        chunk_size: Objects CSV chunk size in rows; None picks automatically,
+            0 disables streaming
+        jobs: Maximum number of worker processes for story conversion
+            (None: one per CPU)
+        force: Rebuild every JSON file, even those whose inputs have not changed
+        fetch_demo: Run the demo content fetch first (watch mode skips it
+            unless _config.yml changed)
+
+    Returns:
+        bool: True when the build ran (individual conversion failures are
+        reported in the log, as before)
+    """
     # Fetch demo content FIRST (before any CSV processing)
-    fetch_demo_content_if_enabled()
+    if fetch_demo:
+        fetch_demo_content_if_enabled()
 
     # Check if Christmas Tree Mode is enabled in _config.yml
     christmas_tree_mode = False
     try:
         config_path = Path('_config.yml')
         if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                # Check development-features (v0.6.2+) or testing-features (legacy)
-                dev_features = config.get('development-features', config.get('testing-features', {}))
-                christmas_tree_mode = dev_features.get('christmas_tree_mode', False)
-
-                if christmas_tree_mode:
-                    print("\U0001f384 Christmas Tree Mode enabled - injecting test objects with errors")
-                else:
-                    # Clean up test object files when Christmas Tree Mode is disabled
-                    objects_dir = Path('_jekyll-files/_objects')
-                    if objects_dir.exists():
-                        test_files = list(objects_dir.glob('test-*.md'))
-                        if test_files:
-                            print("  [INFO] Cleaning up test object files from previous Christmas Tree Mode session")
-                            for test_file in test_files:
-                                test_file.unlink()
-                                print(f"  [INFO] Removed {test_file.name}")
+            # Check development-features (v0.6.2+) or testing-features (legacy)
+            dev_features = get_development_features(load_site_config())
+            christmas_tree_mode = dev_features.get('christmas_tree_mode', False)
+
+            if christmas_tree_mode:
+                print("\U0001f384 Christmas Tree Mode enabled - injecting test objects with errors")
+            else:
+                # Clean up test object files when Christmas Tree Mode is disabled
+                objects_dir = Path('_jekyll-files/_objects')
+                if objects_dir.exists():
+                    test_files = list(objects_dir.glob('test-*.md'))
+                    if test_files:
+                        print("  [INFO] Cleaning up test object files from previous Christmas Tree Mode session")
+                        for test_file in test_files:
+                            test_file.unlink()
+                            print(f"  [INFO] Removed {test_file.name}")
     except Exception as e:
         print(f"  [WARN] Could not read Christmas Tree Mode setting: {e}")
 
@@ -393,12 +885,19 @@ def main():
     print("Converting CSV files to JSON...")
     print("-" * 50)
 
+    ledger = load_ledger()
+    ledger_keys = _ledger_keys()
+    # Glossary and objects.json, loaded once for all stories (telar.lookups)
+    lookups = BuildLookups()
+
     # Convert project setup (with bilingual fallback: project.csv or proyecto.csv)
     project_path = find_csv_with_fallback('telar-content/spreadsheets/project', 'proyecto')
-    csv_to_json(
+    _convert_incremental(
+        ledger, ledger_keys,
         project_path,
         '_data/project.json',
-        process_project_setup
+        process_project_setup,
+        force=force
     )
 
     # Convert objects (with bilingual fallback: objects.csv or objetos.csv)
@@ -407,12 +906,29 @@ def main():
         (lambda df: process_objects(df, christmas_tree=True)) if christmas_tree_mode
         else process_objects
     )
-    objects_ok = csv_to_json(
+    objects_chunksize = chunk_size
+    if objects_chunksize is None and os.path.exists(objects_path):
+        if os.path.getsize(objects_path) > STREAMING_THRESHOLD_BYTES:
+            objects_chunksize = DEFAULT_CHUNK_ROWS
+            print(f"  [INFO] Large objects CSV - streaming in chunks of {objects_chunksize} rows")
+    objects_ok = _convert_incremental(
+        ledger, dict(ledger_keys, chunk_size=objects_chunksize or None),
         objects_path,
         '_data/objects.json',
-        process_objects_func
+        process_objects_func,
+        force=force,
+        chunksize=objects_chunksize or None
     )
 
+    # Merge demo projects and objects before anything reads them, so the
+    # stories see the same objects.json on every build whether or not the
+    # conversions above ran. The ledger entries then describe the merged files.
+    demo_bundle = load_demo_bundle()
+    with shared_lookups(lookups):
+        merge_demo_data(demo_bundle)
+    for json_path in ('_data/project.json', '_data/objects.json'):
+        refresh_output(ledger, json_path)
+
     # The audio manifest and search index both read _data/objects.json. If the
     # objects conversion was skipped or failed, that file is missing or stale, so
     # skip the downstream steps rather than build them from out-of-date data.
@@ -432,29 +948,34 @@ def main():
     # v0.6.0+: Process ALL CSVs except system files
     system_csvs = {'project.csv', 'proyecto.csv', 'objects.csv', 'objetos.csv'}
 
-    process_story_func = (
-        (lambda df: process_story(df, christmas_tree=True)) if christmas_tree_mode
-        else process_story
-    )
-    for csv_file in structures_dir.glob('*.csv'):
+    stories = []
+    for csv_file in sorted(structures_dir.glob('*.csv')):
         if csv_file.name not in system_csvs:
             # --story flag: skip all story CSVs except the requested one
-            if args.story and csv_file.stem != args.story:
+            if story and csv_file.stem != story:
                 continue
             json_filename = csv_file.stem + '.json'
             json_file = data_dir / json_filename
-            csv_to_json(
-                str(csv_file),
-                str(json_file),
-                process_story_func
-            )
+            stories.append((str(csv_file), str(json_file)))
+    _convert_stories(
+        ledger, ledger_keys, stories,
+        christmas_tree=christmas_tree_mode,
+        force=force,
+        jobs=jobs or os.cpu_count() or 1,
+        lookups=lookups
+    )
+
+    try:
+        save_ledger(ledger)
+    except OSError as e:
+        print(f"  [WARN] Could not save build ledger: {e}")
 
-    # Merge demo content if available
+    # Write demo stories and glossary if available
     print("-" * 50)
-    demo_bundle = load_demo_bundle()
     if demo_bundle:
         print("Merging demo content...")
-        merge_demo_content(demo_bundle)
+        with shared_lookups(lookups):
+            write_demo_stories(demo_bundle)
 
     # Remove _data/*.json files left behind by renamed/removed CSVs or a
     # changed demo bundle (language switch, version bump, disabled demo)
@@ -467,3 +988,4 @@ def main():
 
     print("-" * 50)
     print("Conversion complete!")
+    return True
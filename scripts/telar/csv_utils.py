@@ -43,10 +43,10 @@ rename of the gallery classification column from `object_type` to `medium`
 Version: v1.6.0
 """
 
-from pathlib import Path
-
 import pandas as pd
 
+from telar.asset_inventory import stem_index
+
 
 # Canonical set of local image/document extensions, shared by the objects and
 # stories processors. Single source of truth so the extension lists used for
@@ -62,19 +62,17 @@ def build_stem_index(directory):
     pass. Lets per-object existence checks be O(1) lookups instead of each
     re-scanning the whole directory (the old O(objects x files) behaviour).
 
+    Served from the shared per-process listing in telar.asset_inventory, so
+    the objects and stories processors no longer list the directory twice.
+
     Args:
         directory: Path or str of the directory to index.
 
     Returns:
         dict[str, list[Path]]: stem -> files with that stem (empty if dir absent).
+        Shared with other callers; do not modify.
     """
-    index = {}
-    d = Path(directory)
-    if d.exists():
-        for f in d.iterdir():
-            if f.is_file():
-                index.setdefault(f.stem, []).append(f)
-    return index
+    return stem_index(directory)
 
 
 # Bilingual column name mapping (Spanish -> English)
@@ -159,6 +157,21 @@ COLUMN_NAME_MAPPING = {
 }
 
 
+# Every name a duplicate header row may contain (English and Spanish), plus the
+# coordinate columns that are the same in both languages. Built once at import
+# rather than on every is_header_row() call.
+HEADER_ROW_NAMES = frozenset(
+    set(COLUMN_NAME_MAPPING.keys()) | set(COLUMN_NAME_MAPPING.values()) | {'x', 'y', 'zoom'}
+)
+
+# Christmas tree emoji (U+1F384), stripped from user data by sanitize_dataframe
+TREE_EMOJI = chr(0x1F384)
+
+# Columns that feed href/src sinks, and the schemes flagged in them
+URL_COLUMNS = frozenset({'source_url', 'iiif_manifest', 'thumbnail', 'image'})
+SUSPICIOUS_URL_SCHEMES = ('javascript:', 'data:')
+
+
 def sanitize_dataframe(df):
     """
     Remove Christmas tree emoji from all string fields in dataframe.
@@ -173,34 +186,35 @@ def sanitize_dataframe(df):
     As a diagnostic aid it also warns (without modifying anything) when a URL
     column carries a `javascript:` or `data:` scheme, so authors can correct it.
 
+    Both passes are column-wise pandas string operations, so the cost scales
+    with the number of columns rather than the number of cells.
+
     Args:
         df: pandas DataFrame to sanitize
 
     Returns:
         DataFrame: Sanitized dataframe (copy of input)
     """
-    import re
-    # Christmas tree emoji: U+1F384
-    tree_emoji = chr(0x1F384)
-    tree_pattern = re.compile(re.escape(tree_emoji))
-    df = df.copy()
+    # Shallow copy: pandas 3 is copy-on-write, so replacing a column on the
+    # copy never touches the caller's frame, and untouched columns share memory.
+    df = df.copy(deep=False)
     for col in df.columns:
         if pd.api.types.is_string_dtype(df[col]):  # String columns (works with pandas 2.x and 3.x)
-            df[col] = df[col].apply(lambda x: tree_pattern.sub('', str(x)) if pd.notna(x) else x)
+            values = df[col]
+            # Only rewrite columns that actually carry the emoji
+            if values.str.contains(TREE_EMOJI, regex=False, na=False).any():
+                df[col] = values.str.replace(TREE_EMOJI, '', regex=False)
 
     # Warn-only URL-scheme check for columns that feed href/src sinks. We do not
     # strip or rewrite the value — the author owns the fix.
-    url_columns = {'source_url', 'iiif_manifest', 'thumbnail', 'image'}
     for col in df.columns:
-        if col.lower().strip() not in url_columns:
+        if str(col).lower().strip() not in URL_COLUMNS:
             continue
-        for value in df[col]:
-            if not pd.notna(value):
-                continue
-            stripped = str(value).strip().lower()
-            if stripped.startswith('javascript:') or stripped.startswith('data:'):
-                print(f"  [WARN] Suspicious URL scheme in '{col}': {str(value).strip()!r} "
-                      f"— links/images with javascript:/data: schemes can be unsafe")
+        values = df[col].dropna().astype(str).str.strip()
+        suspicious = values[values.str.lower().str.startswith(SUSPICIOUS_URL_SCHEMES)]
+        for value in suspicious:
+            print(f"  [WARN] Suspicious URL scheme in '{col}': {value!r} "
+                  f"— links/images with javascript:/data: schemes can be unsafe")
 
     return df
 
@@ -244,13 +258,14 @@ def normalize_column_names(df):
     Returns:
         DataFrame: DataFrame with normalized (English) column names
     """
-    # Create a mapping for this dataframe's columns
+    # Create a mapping for this dataframe's columns in one pass over the header
+    lookup = df.columns.astype(str).str.lower().str.strip()
     rename_map = {}
-    for col in df.columns:
-        col_lower = col.lower().strip()
-        if col_lower in COLUMN_NAME_MAPPING:
-            rename_map[col] = COLUMN_NAME_MAPPING[col_lower]
-            print(f"  [INFO] Normalized column '{col}' -> '{COLUMN_NAME_MAPPING[col_lower]}'")
+    for col, col_lower in zip(df.columns, lookup):
+        target = COLUMN_NAME_MAPPING.get(col_lower)
+        if target is not None:
+            rename_map[col] = target
+            print(f"  [INFO] Normalized column '{col}' -> '{target}'")
 
     # Rename columns if any mappings found
     if rename_map:
@@ -269,20 +284,13 @@ def is_header_row(row_values):
     Returns:
         bool: True if row appears to be a header row
     """
-    # Get all valid column names (English and Spanish)
-    valid_names = set(COLUMN_NAME_MAPPING.keys()) | set(COLUMN_NAME_MAPPING.values())
-
-    # Also include common column names not in the mapping
-    valid_names.update(['x', 'y', 'zoom'])
-
     # Count how many cells match known column names
     matches = 0
     total = 0
     for val in row_values:
         if pd.notna(val):
-            val_lower = str(val).lower().strip()
             total += 1
-            if val_lower in valid_names:
+            if str(val).lower().strip() in HEADER_ROW_NAMES:
                 matches += 1
 
     # If 80%+ of non-empty cells are column names, it's a header row.
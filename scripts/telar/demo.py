@@ -24,13 +24,24 @@ bundle contains a `_meta` key with version and language information, plus
 `merge_demo_content()` integrates the bundle into the user's site data.
 It prepends demo stories to `_data/project.json`, appends demo objects to
 `_data/objects.json` (skipping duplicates by object ID), creates individual
-story JSON files in `_data/`, and writes demo glossary terms to
+story JSON files in `_data/` (listing the objects each one uses, as user
+stories do), and writes demo glossary terms to
 `_data/demo-glossary.json` for `generate_collections.py` to pick up. Each
 demo entry is tagged with `_demo: True` so that templates can distinguish
 demo content from user content. During story merging, layer content goes
 through the same widget, image, markdown, and glossary pipeline that
 regular stories use.
 
+The build runs the merge in two parts. `merge_demo_data()` merges the
+projects and objects right after project.csv and objects.csv are converted,
+so the stories are converted against the same objects.json on every build;
+`write_demo_stories()` writes the stories and glossary at the end. The
+data merge replaces the demo entries of an earlier merge instead of adding
+them again, because the build ledger keeps an up-to-date project.json or
+objects.json from the last build — merged — rather than converting it
+again. Every file is written only when its content changed, so an
+unchanged build leaves `_data/` as it was.
+
 Bundle format compatibility: v0.6.0 bundles use `medium`, `dimensions`, and
 `location` object fields; v0.8.0+ bundles use `year`, `object_type`,
 `subjects`, `featured`, and `source`. Both formats are supported — new fields
@@ -42,12 +53,12 @@ Version: v1.6.0
 import json
 from pathlib import Path
 
-import markdown as md_lib
 import pandas as pd
 
 from telar.images import process_images
-from telar.widgets import process_widgets
-from telar.glossary import process_glossary_links
+from telar.widgets import process_widgets, reset_widget_ids
+from telar.glossary import process_glossary_links, GlossaryLinker
+from telar.lookups import invalidate_lookups, load_objects
 
 
 def load_demo_bundle():
@@ -75,6 +86,26 @@ def load_demo_bundle():
         return None
 
 
+def _write_json(path, data):
+    """
+    Write data as JSON unless the file already holds exactly that.
+
+    Leaving an unchanged file untouched keeps its mtime, so later pipeline
+    stages that read _data/ do not look out of date.
+
+    Returns:
+        bool: True if the file was written
+    """
+    text = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True)
+    try:
+        if Path(path).read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    Path(path).write_text(text, encoding='utf-8')
+    return True
+
+
 def merge_demo_content(bundle):
     """
     Merge demo bundle content with user content.
@@ -88,19 +119,41 @@ def merge_demo_content(bundle):
     Args:
         bundle: Demo bundle dict
     """
+    merge_demo_data(bundle)
+    write_demo_stories(bundle)
+
+
+def merge_demo_data(bundle):
+    """
+    Merge the bundle's projects and objects into project.json and objects.json.
+
+    Demo entries left by an earlier merge are replaced rather than added
+    again, so merging into a file the build ledger kept from the last build
+    gives the same data as merging into a fresh conversion; without a
+    bundle they are removed. A file is rewritten only if its data changed.
+
+    Args:
+        bundle: Demo bundle dict, or None
+
+    Returns:
+        list: Paths that were rewritten
+    """
+    bundle = bundle or {}
     data_dir = Path('_data')
+    written = []
 
     # Merge projects
     project_path = data_dir / 'project.json'
-    if project_path.exists() and bundle.get('project'):
+    if project_path.exists():
         try:
             with open(project_path, 'r', encoding='utf-8') as f:
                 user_project = json.load(f)
+            merged_project = json.loads(json.dumps(user_project))
 
             # Convert demo project format to match user format
             # Use order for number field, story_id for identifier (v0.6.0+)
             demo_stories = []
-            for proj in bundle['project']:
+            for proj in bundle.get('project') or []:
                 demo_stories.append({
                     'number': str(proj.get('order', '')),
                     'story_id': proj.get('story_id', ''),
@@ -111,32 +164,34 @@ def merge_demo_content(bundle):
                 })
 
             # Merge: demo stories first, then user stories
-            if 'stories' in user_project[0]:
-                user_project[0]['stories'] = demo_stories + user_project[0]['stories']
-            else:
-                user_project[0]['stories'] = demo_stories
-
-            with open(project_path, 'w', encoding='utf-8') as f:
-                json.dump(user_project, f, indent=2, ensure_ascii=False)
+            if merged_project and 'stories' in merged_project[0]:
+                user_stories = [story for story in merged_project[0]['stories'] if not story.get('_demo')]
+                merged_project[0]['stories'] = demo_stories + user_stories
+            elif merged_project and demo_stories:
+                merged_project[0]['stories'] = demo_stories
 
-            print(f"  Merged {len(demo_stories)} demo project(s) into project.json")
+            if merged_project != user_project and _write_json(project_path, merged_project):
+                written.append(project_path)
+            if demo_stories:
+                print(f"  Merged {len(demo_stories)} demo project(s) into project.json")
 
         except Exception as e:
             print(f"  [WARN] Could not merge demo projects: {e}")
 
     # Merge objects
     objects_path = data_dir / 'objects.json'
-    if objects_path.exists() and bundle.get('objects'):
+    if objects_path.exists():
         try:
             with open(objects_path, 'r', encoding='utf-8') as f:
                 user_objects = json.load(f)
+            merged_objects = [obj for obj in user_objects if not obj.get('_demo')]
 
             # Get existing object IDs to avoid duplicates
-            existing_ids = {obj.get('object_id') for obj in user_objects if not obj.get('_metadata')}
+            existing_ids = {obj.get('object_id') for obj in merged_objects if not obj.get('_metadata')}
 
             # Convert demo objects format and add new ones
             demo_count = 0
-            for obj_id, obj_data in bundle['objects'].items():
+            for obj_id, obj_data in (bundle.get('objects') or {}).items():
                 if obj_id not in existing_ids:
                     # Build object with v0.8.0 fields; fall back for v0.6.0 bundles
                     # where 'location' was the field name and year/object_type/subjects
@@ -158,32 +213,55 @@ def merge_demo_content(bundle):
                         'thumbnail': obj_data.get('thumbnail', ''),
                         '_demo': True
                     }
-                    user_objects.append(demo_obj)
+                    merged_objects.append(demo_obj)
                     demo_count += 1
 
-            with open(objects_path, 'w', encoding='utf-8') as f:
-                json.dump(user_objects, f, indent=2, ensure_ascii=False)
-
-            print(f"  Merged {demo_count} demo object(s) into objects.json")
+            if merged_objects != user_objects and _write_json(objects_path, merged_objects):
+                written.append(objects_path)
+                invalidate_lookups('objects')
+            if bundle.get('objects'):
+                print(f"  Merged {demo_count} demo object(s) into objects.json")
 
         except Exception as e:
             print(f"  [WARN] Could not merge demo objects: {e}")
 
+    return written
+
+
+def write_demo_stories(bundle):
+    """
+    Write the bundle's stories and glossary terms to _data/.
+
+    Each story lists the objects it uses from the merged objects.json, so
+    merge_demo_data() runs first. Files whose content is unchanged are left
+    untouched.
+
+    Args:
+        bundle: Demo bundle dict
+    """
+    data_dir = Path('_data')
+    objects_path = data_dir / 'objects.json'
+
     # Create demo story files
     if bundle.get('stories'):
+        # Build glossary terms dict from bundle for link processing, compiled
+        # once for every story
+        glossary_terms = {}
+        if bundle.get('glossary'):
+            for term_id, term_data in bundle['glossary'].items():
+                glossary_terms[term_id] = term_data.get('term', term_id)
+        glossary = GlossaryLinker(glossary_terms)
+        # Merged objects, for the objects each story page needs
+        objects_data, _ = load_objects(objects_path)
+
         for story_id, story_data in bundle['stories'].items():
             try:
                 story_path = data_dir / f'{story_id}.json'
+                reset_widget_ids()
 
                 # Convert demo story format to match user format
                 steps = []
 
-                # Build glossary terms dict from bundle for link processing
-                glossary_terms = {}
-                if bundle.get('glossary'):
-                    for term_id, term_data in bundle['glossary'].items():
-                        glossary_terms[term_id] = term_data.get('term', term_id)
-
                 for step in story_data.get('steps', []):
                     step_data = {
                         'step': step.get('step'),
@@ -217,20 +295,28 @@ def merge_demo_content(bundle):
                                 content = process_images(content)
 
                                 # Convert markdown to HTML
-                                content = md_lib.markdown(content, extensions=['extra', 'nl2br'])
+                                from telar.markdown import render_markdown, PANEL_EXTENSIONS
+                                content = render_markdown(content, PANEL_EXTENSIONS)
 
                                 # Process glossary links AFTER markdown conversion
-                                content = process_glossary_links(content, glossary_terms)
+                                content = process_glossary_links(content, glossary)
 
                             step_data[f'{layer_key}_text'] = content
                             step_data[f'{layer_key}_demo'] = True  # All demo bundle layers are demo content
 
                     steps.append(step_data)
 
-                with open(story_path, 'w', encoding='utf-8') as f:
-                    json.dump(steps, f, indent=2, ensure_ascii=False)
+                # Objects the story uses, as process_story() lists them
+                story_objects = {}
+                for step_data in steps:
+                    object_id = step_data['object']
+                    if object_id in objects_data:
+                        story_objects.setdefault(object_id, objects_data[object_id])
+                steps.insert(0, {'_metadata': True, 'objects': list(story_objects.values())})
+
+                _write_json(story_path, steps)
 
-                print(f"  Created demo story: {story_id}.json ({len(steps)} steps)")
+                print(f"  Created demo story: {story_id}.json ({len(steps) - 1} steps)")
 
             except Exception as e:
                 print(f"  [WARN] Could not create demo story {story_id}: {e}")
@@ -247,9 +333,7 @@ def merge_demo_content(bundle):
                 '_demo': True
             })
 
-        glossary_json_path = Path('_data/demo-glossary.json')
-        with open(glossary_json_path, 'w', encoding='utf-8') as f:
-            json.dump(glossary_data, f, indent=2, ensure_ascii=False)
+        _write_json(data_dir / 'demo-glossary.json', glossary_data)
 
         print(f"  Created _data/demo-glossary.json ({len(glossary_data)} demo terms)")
 
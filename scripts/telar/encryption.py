@@ -13,6 +13,15 @@ The encryption uses:
 The encrypted format stores salt and IV alongside the ciphertext so the
 browser can derive the same key and decrypt the content.
 
+Fresh randomness means every encryption of a story produces different
+bytes, so an unchanged protected story would otherwise re-publish a new
+page on every build. `encrypt_story_stable()` keeps the last envelope in
+the build state store and reuses it while the story's plaintext, key and
+identifier are unchanged; the check is an HMAC over the plaintext keyed
+with the PBKDF2-derived key, so the stored fingerprint is no easier to
+attack than the published envelope. Salt and IV are never derived from
+the content — reusing an IV with a different plaintext breaks AES-GCM.
+
 Security model:
     This provides a deterrent against casual access (the step data is not
     readable in plain text from the page source), not confidentiality. On a
@@ -25,12 +34,12 @@ Version: v1.6.0
 """
 
 import base64
+import hashlib
+import hmac
 import json
 import os
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
+from telar.config import get_story_key
 
 
 # PBKDF2 iterations — must match the JavaScript decryption code.
@@ -51,6 +60,11 @@ def derive_key(password: str, salt: bytes) -> bytes:
     Returns:
         32-byte derived key for AES-256
     """
+    # cryptography is imported on first use: the build imports this module
+    # for get_protected_stories(), but only the post-build step encrypts
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives import hashes
+
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
@@ -82,6 +96,13 @@ def encrypt_story(story_data, story_key: str, aad: str = None) -> dict:
             "ciphertext": base64-encoded encrypted data
         }
     """
+    plaintext = json.dumps(story_data, ensure_ascii=False).encode('utf-8')
+    envelope, _ = _encrypt(plaintext, story_key, aad)
+    return envelope
+
+
+def _encrypt(plaintext: bytes, story_key: str, aad: str = None):
+    """Encrypt with a fresh salt and IV; returns (envelope, derived key)."""
     # Generate random salt and IV
     salt = os.urandom(16)
     iv = os.urandom(12)  # 96 bits for AES-GCM
@@ -90,8 +111,8 @@ def encrypt_story(story_data, story_key: str, aad: str = None) -> dict:
     key = derive_key(story_key, salt)
 
     # Encrypt story data
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     aesgcm = AESGCM(key)
-    plaintext = json.dumps(story_data, ensure_ascii=False).encode('utf-8')
     ciphertext = aesgcm.encrypt(iv, plaintext, aad.encode('utf-8') if aad else None)
 
     # Return encrypted format
@@ -100,7 +121,55 @@ def encrypt_story(story_data, story_key: str, aad: str = None) -> dict:
         'salt': base64.b64encode(salt).decode('ascii'),
         'iv': base64.b64encode(iv).decode('ascii'),
         'ciphertext': base64.b64encode(ciphertext).decode('ascii')
-    }
+    }, key
+
+
+def _fingerprint(key: bytes, plaintext: bytes, aad: str = None) -> str:
+    message = (aad or '').encode('utf-8') + b'\0' + plaintext
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def encrypt_story_stable(story_data, story_key: str, aad: str = None, state=None) -> dict:
+    """
+    Encrypt story data, reusing the previous envelope if nothing changed.
+
+    Same arguments and result as encrypt_story(). The envelope is kept in
+    the build state store under the story identifier (aad), with an HMAC
+    fingerprint of the plaintext; when the fingerprint still matches, the
+    stored envelope is returned unchanged so the story page is byte-identical
+    to the previous build.
+
+    Args:
+        story_data: JSON-serializable story payload
+        story_key: User-provided encryption key from _config.yml
+        aad: Story identifier (see encrypt_story())
+        state: telar.build_state.BuildState (default: the build's store)
+
+    Returns:
+        dict: Encrypted format, as encrypt_story()
+    """
+    if state is None:
+        from telar.build_state import get_build_state
+        state = get_build_state()
+    plaintext = json.dumps(story_data, ensure_ascii=False).encode('utf-8')
+    if state is None:
+        return _encrypt(plaintext, story_key, aad)[0]
+
+    stored = state.get('envelope', aad or '')
+    if stored:
+        try:
+            key = derive_key(story_key, base64.b64decode(stored['envelope']['salt']))
+            if hmac.compare_digest(_fingerprint(key, plaintext, aad), stored['fingerprint']):
+                return stored['envelope']
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    envelope, key = _encrypt(plaintext, story_key, aad)
+    state.put('envelope', aad or '', {
+        'fingerprint': _fingerprint(key, plaintext, aad),
+        'envelope': envelope,
+    })
+    return envelope
 
 
 def get_protected_stories(project_data: list) -> set:
@@ -137,7 +206,7 @@ def get_protected_stories(project_data: list) -> set:
 
 def get_story_key_from_config(config: dict) -> str:
     """
-    Extract story_key from _config.yml data.
+    Extract story_key from _config.yml data (see telar.config.get_story_key).
 
     Args:
         config: Parsed _config.yml dictionary
@@ -145,4 +214,4 @@ def get_story_key_from_config(config: dict) -> str:
     Returns:
         Story key string, or empty string if not configured
     """
-    return config.get('story_key', '')
+    return get_story_key(config)
@@ -38,14 +38,33 @@ Term matching is case-insensitive (v1.5.1): an author's `[[Term]]` resolves
 against the stored key regardless of casing, and the rendered `data-term-id`
 uses the stored key so it matches the published glossary page slug.
 
-Version: v1.5.2
+`GlossaryLinker` holds the compiled state for one glossary — the
+case-folded term lookup and, in auto-link mode, a matcher for the term
+titles — so it is built once and shared by every cell of a story, or every
+page, rather than rebuilt per call. `process_glossary_links()` accepts a
+linker or a plain term dictionary.
+
+Auto-link mode (`glossary_auto_link: true` in `_config.yml`) also links the
+first bare mention of each term's title in a panel's prose, for terms the
+panel does not already link. Titles are found with an Aho-Corasick
+automaton over the case-folded text, so a scan is linear in the length of
+the text however many terms the glossary has; only whole-word matches in
+text outside tags, links, code, headings and scripts are linked, the longest title
+winning where titles overlap. Character references such as `&amp;` are
+decoded before matching, so a title containing `&` or `<` matches its
+escaped form and no title matches inside a reference. Titles shorter than AUTO_LINK_MIN_LENGTH
+characters are never auto-linked.
+
+Version: v1.6.0
 """
 
 import html
 import re
+from collections import deque
 from pathlib import Path
 import pandas as pd
 from telar.config import get_lang_string
+from telar.build_ledger import record_input, record_listing
 
 
 def load_glossary_from_csv(csv_path):
@@ -100,7 +119,8 @@ def load_glossary_from_markdown(glossary_dir):
     glossary_terms = {}
 
     try:
-        for glossary_file in glossary_dir.glob('*.md'):
+        for glossary_file in sorted(glossary_dir.glob('*.md')):
+            record_input(glossary_file)
             with open(glossary_file, 'r', encoding='utf-8') as f:
                 content = f.read()
 
@@ -144,6 +164,11 @@ def load_glossary_terms():
             csv_path = fallback
     md_path = Path('telar-content/texts/glossary')
 
+    # Report every source that could decide the result to the build ledger
+    record_input('telar-content/spreadsheets/glossary.csv')
+    record_input('telar-content/spreadsheets/glosario.csv')
+    record_listing(md_path)
+
     # Check if CSV exists (preferred source)
     if csv_path.exists():
         return load_glossary_from_csv(csv_path)
@@ -196,13 +221,323 @@ def strip_glossary_links(text):
     return _GLOSSARY_MARKUP_RE.sub(unwrap, text)
 
 
+# [[display|term]] or [[term]] with flexible spacing
+# Captures: (term_id or display) | (optional term_id after the pipe)
+GLOSSARY_LINK_PATTERN = re.compile(r'\[\[\s*([^|\]]+?)(?:\s*\|\s*([^|\]]+?))?\s*\]\]')
+
+# Titles shorter than this are too likely to be ordinary words to auto-link
+AUTO_LINK_MIN_LENGTH = 3
+
+# Tags whose text is never auto-linked (already links, code, headings, or
+# not prose)
+_AUTO_LINK_SKIP_TAGS = {
+    'a', 'code', 'pre', 'script', 'style', 'kbd', 'samp',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+}
+
+_TAG_SPLIT_PATTERN = re.compile(r'(<[^>]*>)')
+_ENTITY_PATTERN = re.compile(r'&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[a-zA-Z][a-zA-Z0-9]*);')
+_TAG_NAME_PATTERN = re.compile(r'^<\s*(/?)\s*([a-zA-Z][a-zA-Z0-9]*)')
+
+
+def _glossary_link(term_id, display_html):
+    """Inline link markup for a resolved term (display_html already escaped)."""
+    # Note: data-term-url is intentionally omitted; JavaScript fallback in telar.js
+    # constructs the URL dynamically from the current page URL, which correctly
+    # handles baseurl for all deployment scenarios (GitHub Pages, subpaths, etc.)
+    # Add data-demo attribute for demo terms (prefixed with demo-)
+    demo_attr = ' data-demo="true"' if term_id.startswith('demo-') else ''
+    return (f'<a href="#" class="glossary-inline-link" '
+            f'data-term-id="{html.escape(term_id, quote=True)}"{demo_attr}>{display_html}</a>')
+
+
+def _fold(text):
+    """Lower-case text without changing its length (so offsets still line up)."""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _unescape_with_offsets(text):
+    """
+    Decode the character references in a run of HTML text.
+
+    Args:
+        text: HTML text without tags
+
+    Returns:
+        tuple: (plain text, start offsets, end offsets), where character i
+            of the plain text comes from text[starts[i]:ends[i]]
+    """
+    plain, starts, ends = [], [], []
+    position = 0
+    for match in _ENTITY_PATTERN.finditer(text):
+        for offset in range(position, match.start()):
+            plain.append(text[offset])
+            starts.append(offset)
+            ends.append(offset + 1)
+        decoded = html.unescape(match.group())
+        if decoded == match.group():
+            # Not a known reference: its characters are text
+            for offset in range(match.start(), match.end()):
+                plain.append(text[offset])
+                starts.append(offset)
+                ends.append(offset + 1)
+        else:
+            for char in decoded:
+                plain.append(char)
+                starts.append(match.start())
+                ends.append(match.end())
+        position = match.end()
+    for offset in range(position, len(text)):
+        plain.append(text[offset])
+        starts.append(offset)
+        ends.append(offset + 1)
+    return ''.join(plain), starts, ends
+
+
+class _TitleMatcher:
+    """
+    Aho-Corasick automaton over case-folded glossary titles.
+
+    find() returns whole-word, non-overlapping matches, leftmost first and
+    longest where several titles start at the same place.
+    """
+
+    def __init__(self, titles):
+        """
+        Args:
+            titles: Folded title -> term_id
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [None]    # (length, term_id) of the title ending at a node
+        for title, term_id in titles.items():
+            node = 0
+            for char in title:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(None)
+                node = child
+            self.output[node] = (len(title), term_id)
+
+        # Nearest node on the fail chain that ends a title (0 if none)
+        self.next_output = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                target = self.fail[child]
+                self.next_output[child] = target if self.output[target] else self.next_output[target]
+
+    def find(self, text):
+        """
+        Find title matches in text.
+
+        Args:
+            text: Plain text (no markup)
+
+        Returns:
+            list: (start, end, term_id) tuples, in text order
+        """
+        folded = _fold(text)
+        candidates = []
+        node = 0
+        for end, char in enumerate(folded, 1):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            match = node if self.output[node] else self.next_output[node]
+            while match:
+                length, term_id = self.output[match]
+                start = end - length
+                if ((start == 0 or not folded[start - 1].isalnum())
+                        and (end == len(folded) or not folded[end].isalnum())):
+                    candidates.append((start, -length, term_id))
+                match = self.next_output[match]
+
+        matches = []
+        position = 0
+        for start, negative_length, term_id in sorted(candidates):
+            if start >= position:
+                matches.append((start, start - negative_length, term_id))
+                position = start - negative_length
+        return matches
+
+
+class GlossaryLinker:
+    """
+    Compiled glossary for resolving [[term]] links (and auto-linking titles).
+
+    Build one per glossary with the terms from load_glossary_terms() and
+    pass it wherever process_glossary_links() takes glossary_terms.
+    """
+
+    def __init__(self, glossary_terms, auto_link=False):
+        """
+        Args:
+            glossary_terms: Dictionary mapping term_id to term title
+            auto_link: Also link bare mentions of term titles (see module docstring)
+        """
+        self.terms = dict(glossary_terms or {})
+        self.auto_link = auto_link
+
+        # Build a case-insensitive lookup that resolves an author's [[term]] (any
+        # casing) to the ACTUAL stored key. Glossary loaders store term_id verbatim
+        # — load_glossary_from_csv, load_glossary_from_markdown, and the demo bundle
+        # do not lowercase keys (e.g. the demo glossary stores 'IIIF'). Resolving to
+        # the stored key (rather than a lowercased copy) keeps the rendered
+        # data-term-id equal to the published glossary page slug, which telar.js
+        # fetches on click. Mirrors the objects_lower_map pattern in stories.py.
+        # If two keys differ only by case, the last one wins — acceptable because the
+        # glossary page system would already collide on such keys.
+        self.lower_map = {key.lower(): key for key in self.terms}
+
+        self._matcher = None
+        if auto_link:
+            titles = {}
+            for term_id, title in self.terms.items():
+                folded = _fold(str(title).strip())
+                if len(folded) >= AUTO_LINK_MIN_LENGTH:
+                    titles.setdefault(folded, term_id)
+            if titles:
+                self._matcher = _TitleMatcher(titles)
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    def link(self, text, warnings_list=None, step_num=None, layer_name=None, auto_link=None):
+        """
+        Transform [[term]] or [[display|term]] syntax into glossary link HTML.
+
+        Args:
+            text: HTML text to process (already converted from markdown)
+            warnings_list: Optional list to append warning messages
+            step_num: Optional step number for warning messages
+            layer_name: Optional layer name (e.g., 'layer1', 'layer2') for warning context
+            auto_link: Override the linker's auto-link mode for this text
+                (False for markdown source, where a link could land inside
+                markdown link syntax)
+
+        Returns:
+            str: Text with glossary links transformed to HTML
+        """
+        if not text or not self.terms:
+            return text
+
+        linked = set()
+
+        def replace_glossary_link(match):
+            # If pipe is present: [[term|display]], else [[term]]
+            if match.group(2):  # Has pipe
+                raw_term_id = match.group(1).strip()
+                display_text = match.group(2).strip()
+                has_custom_display = True
+            else:  # No pipe
+                raw_term_id = match.group(1).strip()
+                display_text = None
+                has_custom_display = False
+
+            # Authors type whatever casing reads naturally, e.g. [[KCSB]] or
+            # [[Colonial-Period]], while the stored key may be lowercase (the common
+            # compositor case) or not (hand-authored CSV / demo bundle, e.g. 'IIIF').
+            # Match case-insensitively and resolve to the actual stored key so the
+            # title lookup succeeds and the rendered data-term-id matches the glossary
+            # page slug telar.js fetches to open the panel.
+            canonical_id = self.lower_map.get(raw_term_id.lower())
+
+            # Check if term exists in glossary (case-insensitive)
+            if canonical_id is not None:
+                term_id = canonical_id
+                linked.add(term_id)
+                if not has_custom_display:
+                    # Use the glossary title as display text
+                    display_text = self.terms[term_id]
+                # Escape the canonical term id (attribute) and display text so a
+                # quote or angle bracket in either cannot break out of the link markup.
+                return _glossary_link(term_id, html.escape(display_text))
+            else:
+                # Invalid term - create error indicator (author's original casing preserved)
+                if warnings_list is not None:
+                    warning_msg = get_lang_string('errors.object_warnings.glossary_term_not_found', term_id=raw_term_id)
+                    warnings_list.append({
+                        'step': step_num,
+                        'type': 'glossary',
+                        'term_id': raw_term_id,
+                        'layer': layer_name,
+                        'message': warning_msg
+                    })
+                return f'<span class="glossary-link-error" data-term-id="{html.escape(raw_term_id, quote=True)}">\u26a0\ufe0f [[{html.escape(match.group(1))}]]</span>'
+
+        text = GLOSSARY_LINK_PATTERN.sub(replace_glossary_link, text)
+
+        if self._matcher is not None and (self.auto_link if auto_link is None else auto_link):
+            text = self._auto_link(text, linked)
+        return text
+
+    def _auto_link(self, text, linked):
+        """Link the first bare mention of each title not already linked."""
+        parts = _TAG_SPLIT_PATTERN.split(text)
+        skip_tag = None
+        skip_depth = 0
+        for i, part in enumerate(parts):
+            if i % 2:
+                # A tag: track whether we are inside one whose text is skipped
+                tag = _TAG_NAME_PATTERN.match(part)
+                if tag is None or part.endswith('/>'):
+                    continue
+                closing, name = tag.group(1), tag.group(2).lower()
+                if skip_tag is None:
+                    if not closing and (name in _AUTO_LINK_SKIP_TAGS
+                                        or 'glossary-link-error' in part):
+                        skip_tag, skip_depth = name, 1
+                elif name == skip_tag:
+                    skip_depth += -1 if closing else 1
+                    if skip_depth == 0:
+                        skip_tag = None
+                continue
+            if skip_tag is not None or not part:
+                continue
+
+            # Titles are matched on the decoded text (so "Rock &amp; Roll"
+            # matches "Rock & Roll" and no title matches inside "&amp;"),
+            # then mapped back to the escaped source
+            plain, starts, ends = _unescape_with_offsets(part)
+            pieces = []
+            position = 0
+            for start, end, term_id in self._matcher.find(plain):
+                if term_id in linked:
+                    continue
+                linked.add(term_id)
+                start, end = starts[start], ends[end - 1]
+                pieces.append(part[position:start])
+                pieces.append(_glossary_link(term_id, part[start:end]))
+                position = end
+            if pieces:
+                pieces.append(part[position:])
+                parts[i] = ''.join(pieces)
+        return ''.join(parts)
+
+
 def process_glossary_links(text, glossary_terms, warnings_list=None, step_num=None, layer_name=None):
     """
     Transform [[term]] or [[display|term]] syntax into glossary link HTML.
 
     Args:
         text: HTML text to process (already converted from markdown)
-        glossary_terms: Dictionary mapping term_id to term title
+        glossary_terms: GlossaryLinker, or dictionary mapping term_id to term
+            title (compiled on every call; build a GlossaryLinker once for
+            repeated use)
         warnings_list: Optional list to append warning messages
         step_num: Optional step number for warning messages
         layer_name: Optional layer name (e.g., 'layer1', 'layer2') for warning context
@@ -213,66 +548,5 @@ def process_glossary_links(text, glossary_terms, warnings_list=None, step_num=No
     if not text or not glossary_terms:
         return text
 
-    # Build a case-insensitive lookup that resolves an author's [[term]] (any
-    # casing) to the ACTUAL stored key. Glossary loaders store term_id verbatim
-    # — load_glossary_from_csv, load_glossary_from_markdown, and the demo bundle
-    # do not lowercase keys (e.g. the demo glossary stores 'IIIF'). Resolving to
-    # the stored key (rather than a lowercased copy) keeps the rendered
-    # data-term-id equal to the published glossary page slug, which telar.js
-    # fetches on click. Mirrors the objects_lower_map pattern in stories.py.
-    # If two keys differ only by case, the last one wins — acceptable because the
-    # glossary page system would already collide on such keys.
-    glossary_lower_map = {key.lower(): key for key in glossary_terms}
-
-    # Pattern: [[display|term]] or [[term]] with flexible spacing
-    # Captures: (optional_display) | (term_id)
-    pattern = r'\[\[\s*([^|\]]+?)(?:\s*\|\s*([^|\]]+?))?\s*\]\]'
-
-    def replace_glossary_link(match):
-        # If pipe is present: [[term|display]], else [[term]]
-        if match.group(2):  # Has pipe
-            raw_term_id = match.group(1).strip()
-            display_text = match.group(2).strip()
-            has_custom_display = True
-        else:  # No pipe
-            raw_term_id = match.group(1).strip()
-            display_text = None
-            has_custom_display = False
-
-        # Authors type whatever casing reads naturally, e.g. [[KCSB]] or
-        # [[Colonial-Period]], while the stored key may be lowercase (the common
-        # compositor case) or not (hand-authored CSV / demo bundle, e.g. 'IIIF').
-        # Match case-insensitively and resolve to the actual stored key so the
-        # title lookup succeeds and the rendered data-term-id matches the glossary
-        # page slug telar.js fetches to open the panel.
-        canonical_id = glossary_lower_map.get(raw_term_id.lower())
-
-        # Check if term exists in glossary (case-insensitive)
-        if canonical_id is not None:
-            term_id = canonical_id
-            if not has_custom_display:
-                # Use the glossary title as display text
-                display_text = glossary_terms[term_id]
-            # Valid term - create glossary link
-            # Note: data-term-url is intentionally omitted; JavaScript fallback in telar.js
-            # constructs the URL dynamically from the current page URL, which correctly
-            # handles baseurl for all deployment scenarios (GitHub Pages, subpaths, etc.)
-            # Add data-demo attribute for demo terms (prefixed with demo-)
-            demo_attr = ' data-demo="true"' if term_id.startswith('demo-') else ''
-            # Escape the canonical term id (attribute) and display text so a
-            # quote or angle bracket in either cannot break out of the link markup.
-            return f'<a href="#" class="glossary-inline-link" data-term-id="{html.escape(term_id, quote=True)}"{demo_attr}>{html.escape(display_text)}</a>'
-        else:
-            # Invalid term - create error indicator (author's original casing preserved)
-            if warnings_list is not None:
-                warning_msg = get_lang_string('errors.object_warnings.glossary_term_not_found', term_id=raw_term_id)
-                warnings_list.append({
-                    'step': step_num,
-                    'type': 'glossary',
-                    'term_id': raw_term_id,
-                    'layer': layer_name,
-                    'message': warning_msg
-                })
-            return f'<span class="glossary-link-error" data-term-id="{html.escape(raw_term_id, quote=True)}">\u26a0\ufe0f [[{html.escape(match.group(1))}]]</span>'
-
-    return re.sub(pattern, replace_glossary_link, text)
+    linker = glossary_terms if isinstance(glossary_terms, GlossaryLinker) else GlossaryLinker(glossary_terms)
+    return linker.link(text, warnings_list, step_num, layer_name)
@@ -26,24 +26,70 @@ Linux (case-sensitive). `resolve_path_case_insensitive()` tries three
 fallbacks: the exact path, then lowercase filename only, then the entire
 path lowercased. `validate_image_path()` adds a further legacy fallback
 that tries swapping the file extension case (e.g., `.jpg` to `.JPG`).
-External URLs (http/https) bypass validation entirely.
+External URLs (http/https) bypass validation entirely. Each candidate is
+looked up in its directory's cached listing (`telar.asset_inventory`)
+rather than probed with `exists()`.
 
 `get_image_dimensions()` reads image width and height, used by the
 carousel widget to calculate aspect ratios and choose an appropriate
 size class. It supports both local files (via Pillow) and remote URLs
 (fetched with urllib). Failures are silent — dimension detection is
-a nice-to-have, not a build blocker.
-
-Version: v1.5.0
+a nice-to-have, not a build blocker. Dimensions are remembered in the
+build state store (`telar.build_state`), so a forced rebuild does not
+download every remote carousel image again.
+
+Only the image header is read. Pillow's `Image.open()` stops after the
+header of a local file, and a remote image is requested with an HTTP
+Range header for its first HEADER_PROBE_BYTES, fed to Pillow's
+incremental parser until the size is known (a header that runs past
+that range, such as a JPEG with a large EXIF block, is read on from
+there). A carousel of 20 large remote photographs used to download every
+one of them in full on each build. Remote sizes are stored with the
+image's ETag/Last-Modified, so after REMOTE_DIMENSIONS_TTL_S they are
+revalidated with a conditional request rather than probed again.
+`get_image_dimensions_many()` probes the remote images of a carousel
+concurrently; what each probe thread reports to the build ledger is
+replayed into the caller's conversion.
+
+Every local path these functions probe is reported to the build ledger
+(`telar.build_ledger.record_input`), found or not, so a story is rebuilt
+when an image it references appears, disappears or changes. A remote image
+that cannot be fetched marks the conversion as volatile, so it is retried.
+
+Version: v1.6.0
 """
 
 from html import escape as html_escape
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import urllib.request
-import markdown
-from PIL import Image as PILImage
-from io import BytesIO
+
+from telar.asset_inventory import file_exists
+from telar.build_ledger import record_input, mark_volatile, track_inputs, replay_inputs
+from telar.build_state import get_build_state
+
+# Image line with optional size: ![alt](path){size}
+IMAGE_LINE_PATTERN = re.compile(
+    r'^!\[([^\]]*)\]\(([^)]+)\)(?:\{(sm|small|md|medium|lg|large|full)\})?$', re.IGNORECASE
+)
+
+# The <p>...</p> that markdown wraps around a one-line caption
+WRAPPING_PARAGRAPH_PATTERN = re.compile(r'^<p>(.*)</p>$')
+
+# Remote image dimensions are re-fetched after this long (the image at a URL
+# can be replaced)
+REMOTE_DIMENSIONS_TTL_S = 7 * 24 * 3600
+
+# Bytes of a remote image requested for its header; enough for the size of
+# PNG, GIF, WebP and nearly all JPEGs
+HEADER_PROBE_BYTES = 64 * 1024
+
+# Read size while feeding a remote header to Pillow's parser
+PROBE_CHUNK_BYTES = 8 * 1024
+
+# Remote images probed at once by get_image_dimensions_many()
+REMOTE_PROBE_WORKERS = 8
 
 
 def process_images(text):
@@ -77,12 +123,9 @@ def process_images(text):
     result = []
     i = 0
 
-    # Pattern for image with optional size
-    img_pattern = r'^!\[([^\]]*)\]\(([^)]+)\)(?:\{(sm|small|md|medium|lg|large|full)\})?$'
-
     while i < len(lines):
         line = lines[i]
-        match = re.match(img_pattern, line.strip(), re.IGNORECASE)
+        match = IMAGE_LINE_PATTERN.match(line.strip())
 
         if match:
             alt = match.group(1)
@@ -116,8 +159,9 @@ def process_images(text):
             img_tag = f'<img src="{html_escape(src, quote=True)}" alt="{html_escape(alt, quote=True)}"{class_attr}>'
             if caption:
                 # Convert caption markdown to HTML (strip wrapping <p> tags)
-                caption_html = markdown.markdown(caption)
-                caption_html = re.sub(r'^<p>(.*)</p>$', r'\1', caption_html.strip())
+                from telar.markdown import render_markdown
+                caption_html = render_markdown(caption)
+                caption_html = WRAPPING_PARAGRAPH_PATTERN.sub(r'\1', caption_html.strip())
                 html = f'<figure class="telar-image-figure">{img_tag}<figcaption class="telar-image-caption">{caption_html}</figcaption></figure>'
             else:
                 html = f'<figure class="telar-image-figure">{img_tag}</figure>'
@@ -152,17 +196,20 @@ def resolve_path_case_insensitive(base_dir, relative_path):
     full_path = Path(base_dir) / relative_path
 
     # 1. Try exact path
-    if full_path.exists():
+    record_input(full_path)
+    if file_exists(full_path):
         return full_path
 
     # 2. Try lowercase filename only (preserve directory case)
     lowercase_filename = full_path.parent / full_path.name.lower()
-    if lowercase_filename.exists():
+    record_input(lowercase_filename)
+    if file_exists(lowercase_filename):
         return lowercase_filename
 
     # 3. Try lowercase entire path
     lowercase_path = Path(base_dir) / relative_path.lower()
-    if lowercase_path.exists():
+    record_input(lowercase_path)
+    if file_exists(lowercase_path):
         return lowercase_path
 
     return None
@@ -198,45 +245,169 @@ def validate_image_path(image_path, file_context):
     if full_path.suffix:
         # Try with uppercase extension
         path_with_upper = full_path.with_suffix(full_path.suffix.upper())
-        if path_with_upper.exists():
+        record_input(path_with_upper)
+        if file_exists(path_with_upper):
             return (True, str(path_with_upper))
 
         # Try with lowercase extension
         path_with_lower = full_path.with_suffix(full_path.suffix.lower())
-        if path_with_lower.exists():
+        record_input(path_with_lower)
+        if file_exists(path_with_lower):
             return (True, str(path_with_lower))
 
     return (False, str(full_path))
 
 
+def _is_remote(image_path):
+    return image_path.startswith('http://') or image_path.startswith('https://')
+
+
+def _feed_until_size(parser, response):
+    """
+    Feed a response to a Pillow parser until it knows the image size.
+
+    Args:
+        parser: PIL.ImageFile.Parser, possibly already fed a first part
+        response: Open urllib response to read from
+
+    Returns:
+        tuple: (width, height), or None if the response ended first
+    """
+    while parser.image is None:
+        chunk = response.read(PROBE_CHUNK_BYTES)
+        if not chunk:
+            return None
+        parser.feed(chunk)
+    return parser.image.size
+
+
+def _probe_remote_dimensions(url, cached=None):
+    """
+    Read the size of a remote image from its header.
+
+    Args:
+        url: http(s) URL of the image
+        cached: Stored entry for the URL ({'size', 'etag', 'last_modified'});
+            its validators make the request conditional
+
+    Returns:
+        dict: Entry to store, {'size': [width, height], 'etag', 'last_modified'}
+
+    Raises:
+        urllib.error.URLError, OSError, ValueError: when the size cannot be read
+    """
+    import urllib.error
+    import urllib.request
+    from PIL import ImageFile
+
+    headers = {'User-Agent': 'Telar/1.0', 'Range': f'bytes=0-{HEADER_PROBE_BYTES - 1}'}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    parser = ImageFile.Parser()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=10) as response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            # A server that ignores Range sends the whole image (200); reading
+            # stops at the header all the same
+            partial = response.status == 206
+            size = _feed_until_size(parser, response)
+    except urllib.error.HTTPError as e:
+        if cached and e.code == 304:
+            return cached
+        raise
+
+    if size is None and partial:
+        # The header runs past the first range: read on from where it ended
+        request = urllib.request.Request(url, headers={
+            'User-Agent': 'Telar/1.0', 'Range': f'bytes={HEADER_PROBE_BYTES}-'
+        })
+        with urllib.request.urlopen(request, timeout=10) as response:
+            size = _feed_until_size(parser, response)
+    if size is None:
+        raise ValueError('no image size in header')
+    return {'size': list(size), 'etag': etag, 'last_modified': last_modified}
+
+
 def get_image_dimensions(image_path):
     """
     Get dimensions of an image (local or remote).
 
+    Results are kept in the build state store: local images until the file
+    changes, remote ones for REMOTE_DIMENSIONS_TTL_S and then revalidated.
+
     Args:
         image_path: Path relative to assets/images/, or external URL
 
     Returns:
         tuple: (width, height) or None if unable to determine
     """
+    state = get_build_state()
+    remote = _is_remote(image_path)
     try:
-        if image_path.startswith('http://') or image_path.startswith('https://'):
-            # Fetch remote image
-            request = urllib.request.Request(
-                image_path,
-                headers={'User-Agent': 'Telar/1.0'}
-            )
-            with urllib.request.urlopen(request, timeout=10) as response:
-                image_data = response.read()
-                img = PILImage.open(BytesIO(image_data))
-                return img.size  # Returns (width, height)
+        if remote:
+            cached, updated_ns = state.get_with_age('image_size', image_path) if state else (None, None)
+            if isinstance(cached, list):
+                # Stored before validators were kept
+                cached = {'size': cached}
+            if cached and time.time_ns() - updated_ns < REMOTE_DIMENSIONS_TTL_S * 10**9:
+                return tuple(cached['size'])
+
+            entry = _probe_remote_dimensions(image_path, cached)
+            if state is not None:
+                state.put('image_size', image_path, entry)
+            return tuple(entry['size'])
         else:
             # Load local image
             full_path = Path('assets/images') / image_path
-            if full_path.exists():
-                with PILImage.open(full_path) as img:
-                    return img.size  # Returns (width, height)
-            return None
-    except Exception:
+            record_input(full_path)
+            if not full_path.exists():
+                return None
+            stat = full_path.stat()
+            fingerprint = [stat.st_size, stat.st_mtime_ns]
+            cached = state.get('image_size', str(full_path)) if state else None
+            if cached and cached[:2] == fingerprint:
+                return tuple(cached[2:])
+
+            # open() reads the header only; the pixels are never decoded
+            from PIL import Image as PILImage
+            with PILImage.open(full_path) as img:
+                size = img.size  # Returns (width, height)
+            if state is not None:
+                state.put('image_size', str(full_path), fingerprint + list(size))
+            return size
+    except Exception as e:
         # Silently fail - dimension detection is not critical
+        if remote:
+            mark_volatile(f"could not fetch {image_path}: {e}")
         return None
+
+
+def _probe_tracked(image_path):
+    """get_image_dimensions() in a probe thread, returning what it recorded."""
+    with track_inputs() as tracked:
+        size = get_image_dimensions(image_path)
+    return size, tracked
+
+
+def get_image_dimensions_many(image_paths):
+    """
+    Get dimensions of several images, probing the remote ones concurrently.
+
+    Args:
+        image_paths: Paths relative to assets/images/, or external URLs
+
+    Returns:
+        list: (width, height) or None for each path, in order
+    """
+    remote = sorted({path for path in image_paths if _is_remote(path)})
+    sizes = {}
+    if len(remote) > 1:
+        with ThreadPoolExecutor(max_workers=min(REMOTE_PROBE_WORKERS, len(remote))) as pool:
+            for path, (size, tracked) in zip(remote, pool.map(_probe_tracked, remote)):
+                sizes[path] = size
+                replay_inputs(**tracked)
+    return [sizes[path] if path in sizes else get_image_dimensions(path) for path in image_paths]
@@ -15,7 +15,11 @@ Display math ($$...$$), environments (\\begin{...}), alternative
 delimiters (\\(...\\) and \\[...\\]), and chemistry notation (\\ce{...})
 are detected unconditionally.
 
-Version: v1.5.0
+`texts_have_latex()` answers the same question for a whole story at once:
+the texts are joined with a separator no pattern can cross and scanned in
+one pass for the unconditional forms and one for inline math.
+
+Version: v1.6.0
 """
 
 import re
@@ -79,6 +83,39 @@ def has_latex(text):
     return False
 
 
+# The same checks for many texts at once: the texts are joined with NUL and
+# no pattern may cross one, so each text is scanned exactly as on its own.
+# The unconditional patterns are one alternation; inline math keeps its
+# heuristic.
+_TEXT_SEPARATOR = '\x00'
+_ANY_UNCONDITIONAL = re.compile(r'\$\$[^\x00]+?\$\$|\\begin\{|\\\(|\\\[|\\ce\{')
+_INLINE_MATH_JOINED = re.compile(r'\$([^\s\x00][^$\x00]*?[^\s\x00]|[^\s\x00])\$')
+
+
+def texts_have_latex(texts):
+    """Check whether any of *texts* contains LaTeX math notation.
+
+    Equivalent to ``any(has_latex(text) for text in texts)`` for texts
+    without NUL characters, but scans them in two regex passes instead of
+    six per text.
+
+    Args:
+        texts: Iterable of strings (empty strings are fine).
+
+    Returns:
+        bool: ``True`` if LaTeX patterns are detected in any text.
+    """
+    joined = _TEXT_SEPARATOR.join(texts)
+    if '$' not in joined and '\\' not in joined:
+        return False
+    if _ANY_UNCONDITIONAL.search(joined):
+        return True
+    for match in _INLINE_MATH_JOINED.finditer(joined):
+        if _LATEX_CHARS.search(match.group(1)):
+            return True
+    return False
+
+
 # Patterns for extracting LaTeX blocks to protect from markdown processing.
 # Order matters: longer/greedy patterns first to avoid partial matches.
 _PROTECT_PATTERNS = [
@@ -0,0 +1,190 @@
+"""
+Build-Scoped Lookups Shared by Story Conversions
+
+This module deals with the data every story conversion looks things up in:
+the glossary (term_id -> title, compiled into a `GlossaryLinker`) and
+`_data/objects.json` (object_id -> object, plus a case-folded ID map for
+the "did you mean" check). `process_story()` used to load both itself, so a
+site with 60 story spreadsheets parsed the glossary CSV with pandas 60
+times and read objects.json 60 times, although neither changes while the
+stories are being converted.
+
+`build_data()` creates one `BuildLookups` per run and `shared_lookups()`
+makes it active while the stories are converted. Each lookup is loaded on
+first use and kept until it is invalidated; `process_story()` takes its
+glossary and objects from the active lookups and only loads them itself
+outside such a block (tests, one-off calls). Story worker processes
+activate their own lookups once per process (`activate_lookups()` is the
+pool initializer), so a worker loads them once for all the stories it
+converts.
+
+Whoever rewrites one of the source files while lookups are active must say
+so with `invalidate_lookups()`, as `merge_demo_content()` does after
+appending demo objects to objects.json. The folder listing of
+`telar-content/objects/` is not kept here; `telar.asset_inventory` already
+lists it once per process and notices changes by itself.
+
+The active lookups are per thread (like the build ledger's tracking), so
+only the conversion that activated them uses them. The build ledger still
+sees every input. Loading runs under its own
+`track_inputs()` block, and the files and listings it read are replayed
+into the conversion that uses the lookup, so a story is rebuilt when the
+glossary or objects.json changes exactly as before.
+
+Version: v1.6.0
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from telar.build_ledger import track_inputs, replay_inputs, record_input
+
+LOOKUP_NAMES = ('objects', 'glossary')
+
+# Lookups active in this thread ('lookups' attribute)
+_local = threading.local()
+
+
+class BuildLookups:
+    """
+    Glossary and objects lookups, each loaded once and shared until invalidated.
+
+    Treat the values as read-only; they are shared by every story.
+    """
+
+    def __init__(self, data_dir='_data'):
+        self.data_dir = Path(data_dir)
+        self._values = {}
+
+    def _get(self, name, loader):
+        """Return a loaded value, loading it on first use, and replay its inputs."""
+        if name not in self._values:
+            with track_inputs() as tracked:
+                value = loader()
+            self._values[name] = (value, tracked)
+        value, tracked = self._values[name]
+        replay_inputs(tracked['files'], tracked['listings'], tracked['volatile'])
+        return value
+
+    def objects(self):
+        """
+        Objects from _data/objects.json, by object_id.
+
+        Returns:
+            tuple: (object_id -> object dict, lowercased object_id -> object_id);
+            both empty if the file is missing or unreadable
+        """
+        return self._get('objects', self._load_objects)
+
+    def glossary(self, auto_link=False):
+        """
+        Glossary linker for the site's terms.
+
+        Args:
+            auto_link: Passed to GlossaryLinker
+
+        Returns:
+            GlossaryLinker
+        """
+        from telar.glossary import GlossaryLinker
+
+        terms = self._get('glossary', self._load_glossary)
+        linkers = self._values.setdefault('linkers', {})
+        if auto_link not in linkers:
+            linkers[auto_link] = GlossaryLinker(terms, auto_link=auto_link)
+        return linkers[auto_link]
+
+    def _load_objects(self):
+        return load_objects(self.data_dir / 'objects.json')
+
+    def _load_glossary(self):
+        from telar.glossary import load_glossary_terms
+        return load_glossary_terms()
+
+    def invalidate(self, *names):
+        """
+        Forget loaded values so they are read again on next use.
+
+        Args:
+            *names: Lookups to forget ('objects', 'glossary'); all of them
+                if none are given
+        """
+        for name in names or LOOKUP_NAMES:
+            self._values.pop(name, None)
+            if name == 'glossary':
+                self._values.pop('linkers', None)
+
+
+def load_objects(objects_json_path):
+    """
+    Read objects.json into the lookups process_story() validates against.
+
+    Args:
+        objects_json_path: Path to objects.json
+
+    Returns:
+        tuple: (object_id -> object dict, lowercased object_id -> object_id)
+    """
+    objects_data = {}
+    objects_json_path = Path(objects_json_path)
+    record_input(objects_json_path)
+    if objects_json_path.exists():
+        try:
+            with open(objects_json_path, 'r', encoding='utf-8') as f:
+                objects_list = json.load(f)
+                # Create lookup dictionary by object_id
+                objects_data = {obj['object_id']: obj for obj in objects_list}
+        except Exception as e:
+            print(f"  [WARN] Could not load objects.json for validation: {e}")
+    return objects_data, {k.lower(): k for k in objects_data}
+
+
+@contextmanager
+def shared_lookups(lookups=None):
+    """
+    Share one set of lookups with the processors while the block runs.
+
+    Args:
+        lookups: BuildLookups to activate (default: a new one)
+
+    Yields:
+        BuildLookups: The active lookups
+    """
+    previous = active_lookups()
+    _local.lookups = active = lookups or BuildLookups()
+    try:
+        yield active
+    finally:
+        _local.lookups = previous
+
+
+def activate_lookups():
+    """Share new lookups for the rest of this thread (story worker initializer;
+    a worker process runs its tasks in the thread that ran the initializer)."""
+    _local.lookups = BuildLookups()
+
+
+def active_lookups():
+    """
+    The lookups shared by the current block, if any.
+
+    Returns:
+        BuildLookups or None
+    """
+    return getattr(_local, 'lookups', None)
+
+
+def invalidate_lookups(*names):
+    """
+    Tell the active lookups that their source files were rewritten.
+
+    A no-op outside shared_lookups(), so writers can call it unconditionally.
+
+    Args:
+        *names: Lookups to forget ('objects', 'glossary'); all if none given
+    """
+    active = active_lookups()
+    if active is not None:
+        active.invalidate(*names)
@@ -24,9 +24,39 @@ as horizontal rules), and then runs the same pipeline. The markdown
 library's `nl2br` extension is enabled so that single line breaks in
 the spreadsheet cell produce `<br>` tags in the output.
 
+In validate-only runs (`csv_to_json.py --check`) both stop once widgets
+have been validated and return the text without converting it.
+
+Rendering engine
+----------------
+`render_markdown()` converts text with one pre-configured `Markdown`
+instance per extension profile (PANEL_EXTENSIONS for panels and widget
+sections, PAGE_EXTENSIONS for pages and legacy glossary files, none for
+captions), reset between documents, instead of building a new instance and
+reloading its extensions for every cell as `markdown.markdown()` does.
+Instances are kept per thread, since a `Markdown` object is not safe to
+share between pipeline stages running side by side.
+
+Render cache
+------------
+Inside `cached_rendering()` — story conversion and glossary generation —
+rendered panels are kept in the `render` namespace of the build state store
+(see telar.build_state), so a panel that has not changed, or a shared file
+such as a bibliography referenced from many steps, is converted once rather
+than on every step of every build. An entry is keyed on a hash of the text,
+its source name and the pipeline itself (RENDER_CACHE_VERSION, the markdown
+library version, the telar package source and the language strings), and
+holds the HTML, the widget warnings to replay into the caller's list, the
+widget IDs the HTML uses, and fingerprints of the files the render read
+(carousel images, widget templates) as recorded through
+telar.build_ledger. A hit is used only if those files are unchanged and its
+widget IDs are still free on the page, so cached output is identical to a
+fresh render; renders that hit a transient failure (a remote image that
+could not be measured) are not stored.
+
 Content trust model (raw-HTML pass-through is intentional)
 ----------------------------------------------------------
-`markdown.markdown()` is called WITHOUT an HTML sanitiser, so raw HTML
+`render_markdown()` converts panels WITHOUT an HTML sanitiser, so raw HTML
 embedded in author markdown/CSV content passes straight through to the
 rendered page. This is by design: Telar is a minimal-computing static-site
 framework whose content is authored by trusted contributors (the same
@@ -46,14 +76,104 @@ Version: v1.6.0
 """
 
 import re
+import json
+import hashlib
+import threading
+from contextlib import contextmanager
+
 import markdown
 from telar.images import process_images, resolve_path_case_insensitive
 from telar.latex import protect_latex, restore_latex
-from telar.widgets import process_widgets
+from telar.widgets import process_widgets, used_widget_ids, claim_widget_ids
+from telar.check import checking
+from telar.config import load_language_data
+from telar.build_state import get_build_state
+from telar.build_ledger import (
+    track_inputs, replay_inputs, fingerprint_inputs, inputs_unchanged, code_digest
+)
 
 FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
 TITLE_PATTERN = re.compile(r'title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
 
+# Extension profiles for render_markdown()
+PANEL_EXTENSIONS = ('extra', 'nl2br')
+PAGE_EXTENSIONS = ('extra', 'nl2br', 'sane_lists')
+
+# Markdown instances per extension profile, per thread
+_engines = threading.local()
+
+# Bump when the pipeline's output changes in a way the package source digest
+# does not capture (e.g. a markdown extension's configuration)
+RENDER_CACHE_VERSION = 1
+
+# Build state used by the render cache in this thread ('state' attribute,
+# None outside cached_rendering()) and the pipeline digest of the outermost
+# cached_rendering() block ('digest' attribute, computed on first use)
+_render_local = threading.local()
+
+
+@contextmanager
+def cached_rendering(state=None):
+    """
+    Reuse rendered panels from the build state store while the block runs.
+
+    The pipeline digest in the cache keys is taken once per outermost block,
+    so a long-running process (telar.watch) picks up changed language
+    strings or package source on its next build.
+
+    Args:
+        state: telar.build_state.BuildState (default: the build's store);
+            without one, panels are rendered as usual
+    """
+    previous = getattr(_render_local, 'state', None)
+    previous_digest = getattr(_render_local, 'digest', None)
+    _render_local.state = state if state is not None else get_build_state()
+    if previous is None:
+        _render_local.digest = None
+    try:
+        yield
+    finally:
+        _render_local.state = previous
+        _render_local.digest = previous_digest
+
+
+def _pipeline_digest():
+    digest = getattr(_render_local, 'digest', None)
+    if digest is None:
+        parts = [
+            str(RENDER_CACHE_VERSION),
+            getattr(markdown, '__version__', ''),
+            code_digest(),
+            json.dumps(load_language_data(), sort_keys=True, default=str),
+        ]
+        digest = hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+        _render_local.digest = digest
+    return digest
+
+
+def render_markdown(text, extensions=()):
+    """
+    Convert markdown to HTML, as markdown.markdown(text, extensions=...).
+
+    Args:
+        text: Markdown text
+        extensions: Extension profile, e.g. PANEL_EXTENSIONS
+
+    Returns:
+        str: Rendered HTML
+    """
+    engines = getattr(_engines, 'by_profile', None)
+    if engines is None:
+        engines = _engines.by_profile = {}
+    profile = tuple(extensions)
+    engine = engines.get(profile)
+    if engine is None:
+        engine = engines[profile] = markdown.Markdown(extensions=list(profile))
+    try:
+        return engine.convert(text)
+    finally:
+        engine.reset()
+
 
 def _split_frontmatter(content, require_title=False):
     """
@@ -88,10 +208,13 @@ def _process_pipeline(body, widget_source, widget_warnings):
     """
     Run the widget/image/LaTeX/markdown pipeline shared by file-based and
     inline panel content: process_widgets -> process_images -> protect_latex
-    -> markdown.markdown(extensions=['extra', 'nl2br']) -> restore_latex.
+    -> render_markdown(PANEL_EXTENSIONS) -> restore_latex.
 
     Raw HTML passes through unsanitised by design (trusted-author model) —
-    see the module docstring.
+    see the module docstring. Validate-only runs (csv_to_json.py --check)
+    stop after the widgets are validated and return the text unrendered.
+    Inside cached_rendering() an unchanged panel is served from the render
+    cache, its widget warnings replayed into widget_warnings.
 
     Args:
         body: Markdown text to process
@@ -101,10 +224,44 @@ def _process_pipeline(body, widget_source, widget_warnings):
     Returns:
         str: Rendered HTML
     """
+    state = getattr(_render_local, 'state', None)
+    if state is None or checking():
+        return _render(body, widget_source, widget_warnings)
+
+    key = hashlib.sha256(
+        f'{_pipeline_digest()}\0{widget_source}\0{body}'.encode('utf-8')
+    ).hexdigest()
+    entry = state.get('render', key)
+    if entry is not None and inputs_unchanged(entry) and claim_widget_ids(entry['widget_ids']):
+        replay_inputs(entry['inputs'], entry['listings'])
+        widget_warnings.extend(entry['warnings'])
+        return entry['html']
+
+    first_warning = len(widget_warnings)
+    ids_before = used_widget_ids()
+    with track_inputs() as tracked:
+        html_content = _render(body, widget_source, widget_warnings)
+    replay_inputs(tracked['files'], tracked['listings'], tracked['volatile'])
+
+    # A repeated widget gets a "-2" suffix that depends on what else is on
+    # the page; only store renders whose IDs follow from their own content
+    widget_ids = used_widget_ids() - ids_before
+    if not tracked['volatile'] and all(widget_id.count('-') == 1 for widget_id in widget_ids):
+        entry = fingerprint_inputs(tracked)
+        entry.update(html=html_content, warnings=widget_warnings[first_warning:],
+                     widget_ids=sorted(widget_ids))
+        state.put('render', key, entry)
+    return html_content
+
+
+def _render(body, widget_source, widget_warnings):
+    """Run the pipeline (see _process_pipeline) without the render cache."""
     body = process_widgets(body, widget_source, widget_warnings)
+    if checking():
+        return body
     body = process_images(body)
     body, latex_replacements = protect_latex(body)
-    html_content = markdown.markdown(body, extensions=['extra', 'nl2br'])
+    html_content = render_markdown(body, PANEL_EXTENSIONS)
     html_content = restore_latex(html_content, latex_replacements)
     return html_content
 
@@ -9,7 +9,7 @@ a circular import.
 Version: v1.6.0
 """
 
-from pathlib import Path
+from telar.asset_inventory import find_object_file
 
 # Source-URL substrings that mark an object as video, and the audio file
 # extensions probed on disk. Imported by callers so the lists never drift.
@@ -34,10 +34,7 @@ def detect_media_type(source_url, object_id):
     if any(pat in url for pat in VIDEO_URL_PATTERNS):
         return 'Video'
 
-    objects_dir = Path('telar-content/objects')
-    if objects_dir.exists():
-        for ext in AUDIO_EXTENSIONS:
-            if (objects_dir / f'{object_id}{ext}').exists():
-                return 'Audio'
+    if find_object_file(object_id, AUDIO_EXTENSIONS):
+        return 'Audio'
 
     return 'Image'
@@ -0,0 +1,488 @@
+"""
+In-Process Build Pipeline
+
+This module deals with running the build's stages in one Python
+interpreter. `build_local_site.py` used to launch `csv_to_json.py`,
+`generate_collections.py`, `process_audio.py` and `generate_iiif.py` as
+separate `python3` processes, so every stage paid again for importing
+pandas, Pillow, markdown and cryptography and for re-reading `_config.yml`,
+`_data/objects.json`, the language file and the glossary. Run in-process,
+those imports happen once and the module-level caches (`load_site_config`,
+the asset inventory, the language strings) carry over from stage to stage.
+
+`BuildContext` holds what the stages share, loaded on first use:
+
+- `config` — the parsed `_config.yml`
+- `objects` — the parsed `_data/objects.json` (None before it exists)
+- `glossary` — term_id -> title, from `load_glossary_terms()`
+- `inventory` — the listing of `telar-content/objects/`
+- `lang` — the language strings for the site's language
+
+A stage that rewrites one of these declares it in `Stage.writes`; the
+runner invalidates those entries when the stage finishes, so later stages
+(and later runs with the same context) see the new data.
+
+Stages form a graph. `Stage.deps` names the stages that must finish first
+(by default, the stage listed just before, which keeps a plain list
+sequential); dependencies must be listed earlier, so the list order is
+always a valid run order. `run_pipeline()` starts every stage whose
+dependencies have finished, in list order, as long as the stages running
+together fit in the `jobs` CPU budget (`Stage.cpus` each). Concurrent
+stages run in threads with their output buffered and printed as one block
+when they finish; `run_command`-style helpers can ask
+`output_is_buffered()` whether to capture a subprocess's output too.
+
+A stage that declares `inputs` and `outputs` is skipped when neither has
+changed since it last succeeded. Inputs and outputs are files or
+directories, compared by the size and mtime of every file under them (as
+make does), plus the stage's `key` (for settings such as a base URL). The
+state lives in the `stage` namespace of the build state store
+(`.telar-cache/build.db`, see telar.build_state), which also keeps every
+run's stage timings; an input modified within `RACY_WINDOW_NS` of being
+snapshotted is not trusted, and the stage runs again next time.
+
+At the end the runner prints each stage's time and the critical path:
+the chain of dependent stages whose durations add up to the longest
+total, which bounds the wall-clock time however many CPUs are available.
+
+Version: v1.6.0
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from pathlib import Path
+
+from telar import config as telar_config
+from telar import asset_inventory
+from telar.asset_inventory import OBJECTS_DIR, get_inventory
+from telar.build_state import BUILD_DB_PATH, get_build_state
+from telar.constants import RACY_WINDOW_NS
+from telar.config import load_site_config, load_language_data
+
+STAGE_STATE_PATH = BUILD_DB_PATH
+
+# Directories never treated as stage inputs or outputs
+_IGNORED_DIRS = {'__pycache__', '.git', '.telar-cache', 'node_modules'}
+
+# name: short key for the timing table; description: banner text (None if the
+# stage prints its own); run: callable(context) returning False on failure;
+# writes: context entries the stage changes on disk; deps: names of stages
+# that must finish first (None: the previous stage); inputs/outputs: paths
+# for up-to-date checks (inputs None: always run); cpus: share of the CPU
+# budget; key: extra text folded into the input fingerprint
+Stage = namedtuple(
+    'Stage',
+    ['name', 'description', 'run', 'writes', 'deps', 'inputs', 'outputs', 'cpus', 'key'],
+    defaults=[(), None, None, (), 1, '']
+)
+
+
+class BuildContext:
+    """
+    State shared by the stages of one build, loaded on first use.
+
+    Treat the values as read-only; they are shared by every stage.
+    """
+
+    def __init__(self, data_dir='_data'):
+        self.data_dir = Path(data_dir)
+        self._values = {}
+
+    def _get(self, name, loader):
+        if name not in self._values:
+            self._values[name] = loader()
+        return self._values[name]
+
+    @property
+    def config(self):
+        """Parsed _config.yml (cached by telar.config until the file changes)."""
+        return load_site_config()
+
+    @property
+    def objects(self):
+        """Parsed _data/objects.json as a list, or None if it does not exist."""
+        return self._get('objects', self._load_objects)
+
+    @property
+    def glossary(self):
+        """Glossary term_id -> title mapping."""
+        from telar.glossary import load_glossary_terms
+        return self._get('glossary', load_glossary_terms)
+
+    @property
+    def inventory(self):
+        """Listing of telar-content/objects (see telar.asset_inventory), or None."""
+        return get_inventory(OBJECTS_DIR)
+
+    @property
+    def lang(self):
+        """Language strings for the configured telar_language."""
+        return self._get('lang', load_language_data)
+
+    def _load_objects(self):
+        objects_path = self.data_dir / 'objects.json'
+        if not objects_path.exists():
+            return None
+        with open(objects_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def invalidate(self, *names):
+        """
+        Forget loaded values so they are read again on next use.
+
+        Args:
+            *names: Entries to forget ('objects', 'glossary', 'inventory',
+                'lang'); all of them if none are given
+        """
+        names = names or ('objects', 'glossary', 'inventory', 'lang')
+        for name in names:
+            self._values.pop(name, None)
+            if name == 'lang':
+                telar_config.clear_language_cache()
+            elif name == 'inventory':
+                asset_inventory.invalidate(OBJECTS_DIR)
+
+
+class _ThreadOutput:
+    """sys.stdout/stderr stand-in that sends a stage thread's writes to its buffer."""
+
+    def __init__(self, stream, local):
+        self._stream = stream
+        self._local = local
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+_output_local = threading.local()
+
+
+def output_is_buffered():
+    """
+    Tell whether this thread's prints are being buffered by the runner.
+
+    Stages that run a subprocess should capture its output and print it
+    when this is True; otherwise it would bypass the buffer and interleave
+    with other stages.
+
+    Returns:
+        bool
+    """
+    return getattr(_output_local, 'buffer', None) is not None
+
+
+@contextmanager
+def _buffered_output():
+    """Route stdout/stderr through per-thread buffers while the block runs."""
+    saved = sys.stdout, sys.stderr
+    sys.stdout = _ThreadOutput(saved[0], _output_local)
+    sys.stderr = _ThreadOutput(saved[1], _output_local)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved
+
+
+def _print_banner(text):
+    print(f"\n{'='*60}")
+    print(f"  {text}")
+    print(f"{'='*60}\n")
+
+
+def _walk_files(path):
+    """Yield (relative path, stat) for a file, or every file under a directory."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return
+    if path.is_file():
+        yield str(path), stat
+        return
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in _IGNORED_DIRS)
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            try:
+                yield file_path, os.stat(file_path)
+            except OSError:
+                continue
+
+
+def fingerprint_paths(paths, key=''):
+    """
+    Fingerprint files and directory trees by name, size and mtime.
+
+    Args:
+        paths: Iterable of file or directory paths (missing ones count as absent)
+        key: Extra text folded into the digest
+
+    Returns:
+        tuple: (sha256 hex digest, newest mtime_ns seen or 0)
+    """
+    digest = hashlib.sha256(key.encode('utf-8'))
+    newest = 0
+    for path in paths:
+        digest.update(f'\0{path}\0'.encode('utf-8'))
+        for file_path, stat in _walk_files(path):
+            digest.update(f'{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n'.encode('utf-8'))
+            newest = max(newest, stat.st_mtime_ns)
+    return digest.hexdigest(), newest
+
+
+def _load_state(path):
+    state = get_build_state(path)
+    try:
+        return state.items('stage') if state is not None else {}
+    except sqlite3.Error:
+        return {}
+
+
+def _save_state(stage_state, timings, skipped, path):
+    state = get_build_state(path)
+    if state is None:
+        return
+    try:
+        with state.transaction():
+            if stage_state is not None:
+                state.replace_namespace('stage', stage_state)
+            state.record_timings(timings, skipped)
+    except sqlite3.Error as e:
+        print(f"  [WARN] Could not save stage state: {e}")
+
+
+def _resolve_deps(stages):
+    """Map stage name -> dependency names, checking they are listed earlier."""
+    deps = {}
+    previous = None
+    for stage in stages:
+        if stage.name in deps:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        names = tuple(stage.deps) if stage.deps is not None else ((previous,) if previous else ())
+        for name in names:
+            if name not in deps:
+                raise ValueError(f"Stage {stage.name} depends on {name}, which is not listed before it")
+        deps[stage.name] = names
+        previous = stage.name
+    return deps
+
+
+def _execute(stage, context, state, force):
+    """
+    Run one stage, or skip it if its outputs are up to date.
+
+    Returns:
+        tuple: (result, skipped) — the stage's return value and whether
+        it was skipped
+    """
+    if stage.description:
+        _print_banner(stage.description)
+
+    cacheable = stage.inputs is not None and stage.outputs
+    if cacheable:
+        inputs_digest, newest = fingerprint_paths(stage.inputs, stage.key)
+        recorded = state.get(stage.name)
+        if (not force and recorded is not None
+                and recorded.get('inputs') == inputs_digest
+                and recorded.get('outputs') == fingerprint_paths(stage.outputs)[0]
+                and all(Path(p).exists() for p in stage.outputs)):
+            print(f"✓ {stage.name}: up to date, skipped")
+            return None, True
+        snapshot_ns = time.time_ns()
+
+    try:
+        result = stage.run(context)
+    finally:
+        if stage.writes:
+            context.invalidate(*stage.writes)
+
+    if cacheable:
+        if result is not False and snapshot_ns - newest >= RACY_WINDOW_NS:
+            state[stage.name] = {
+                'inputs': inputs_digest,
+                'outputs': fingerprint_paths(stage.outputs)[0],
+            }
+        else:
+            state.pop(stage.name, None)
+    return result, False
+
+
+def _execute_buffered(stage, context, state, force):
+    """Run a stage in a worker thread with its output buffered."""
+    _output_local.buffer = io.StringIO()
+    try:
+        result, skipped = _execute(stage, context, state, force)
+        return result, skipped, _output_local.buffer.getvalue()
+    except BaseException as e:
+        e.stage_output = _output_local.buffer.getvalue()
+        raise
+    finally:
+        _output_local.buffer = None
+
+
+def critical_path(stages, deps, timings):
+    """
+    Find the chain of dependent stages with the longest total duration.
+
+    Args:
+        stages: Stages in list order
+        deps: Stage name -> dependency names
+        timings: Stage name -> seconds (stages that did not run are left out)
+
+    Returns:
+        tuple: (list of stage names along the path, total seconds)
+    """
+    best = {}
+    for stage in stages:
+        if stage.name not in timings:
+            continue
+        previous = max(
+            (best[name] for name in deps[stage.name] if name in best),
+            key=lambda entry: entry[1], default=([], 0.0)
+        )
+        best[stage.name] = (previous[0] + [stage.name], previous[1] + timings[stage.name])
+    if not best:
+        return [], 0.0
+    return max(best.values(), key=lambda entry: entry[1])
+
+
+def print_timings(timings, stages=None, deps=None, wall=None, skipped=()):
+    """
+    Print a per-stage timing table and the critical path.
+
+    Args:
+        timings: Stage name -> seconds, in run order
+        stages: Stages in list order (for the critical path; optional)
+        deps: Stage name -> dependency names (for the critical path)
+        wall: Wall-clock seconds for the whole run, if stages overlapped
+        skipped: Names of stages skipped as up to date
+    """
+    _print_banner('Stage timings')
+    width = max([len(name) for name in timings] + [len('total')])
+    for name, seconds in timings.items():
+        note = '  (up to date)' if name in skipped else ''
+        print(f"  {name:<{width}}  {seconds:7.2f}s{note}")
+    print(f"  {'total':<{width}}  {sum(timings.values()):7.2f}s")
+    if wall is not None:
+        print(f"  {'wall':<{width}}  {wall:7.2f}s")
+    if stages is not None and deps is not None:
+        path, seconds = critical_path(stages, deps, timings)
+        if len(path) > 1:
+            print(f"\n  Critical path ({seconds:.2f}s): {' -> '.join(path)}")
+
+
+def run_pipeline(stages, context=None, jobs=1, force=False, state_path=STAGE_STATE_PATH):
+    """
+    Run build stages in dependency order in this interpreter.
+
+    Args:
+        stages: Iterable of Stage; dependencies must be listed before dependents
+        context: BuildContext to share (a new one if None)
+        jobs: CPU budget; with more than 1, independent stages run
+            concurrently in threads with buffered output
+        force: Run stages even if their outputs are up to date
+        state_path: Build state database for up-to-date state and timings
+
+    Returns:
+        bool: True if every stage ran, False if one returned False (stages
+        that depend on it, and any not yet started, are not run)
+    """
+    stages = list(stages)
+    deps = _resolve_deps(stages)
+    context = context or BuildContext()
+    jobs = max(1, jobs)
+    cacheable = any(stage.inputs is not None for stage in stages)
+    state = _load_state(state_path) if cacheable else {}
+    timings = {}
+    skipped = set()
+    started = time.perf_counter()
+    ok = True
+
+    try:
+        if jobs == 1:
+            for stage in stages:
+                start = time.perf_counter()
+                try:
+                    result, was_skipped = _execute(stage, context, state, force)
+                finally:
+                    timings[stage.name] = time.perf_counter() - start
+                if was_skipped:
+                    skipped.add(stage.name)
+                if result is False:
+                    print(f"\n❌ Error: {stage.description or stage.name} failed")
+                    ok = False
+                    break
+        else:
+            ok = _run_concurrent(stages, deps, context, state, force, jobs, timings, skipped)
+    finally:
+        _save_state(state if cacheable else None, timings, skipped, state_path)
+
+    wall = time.perf_counter() - started if jobs > 1 else None
+    print_timings(timings, stages, deps, wall, skipped)
+    return ok
+
+
+def _run_concurrent(stages, deps, context, state, force, jobs, timings, skipped):
+    """Scheduler loop for run_pipeline() with a CPU budget above one."""
+    pending = list(stages)
+    running = {}
+    done = set()
+    ok = True
+    error = None
+
+    with _buffered_output(), ThreadPoolExecutor(max_workers=jobs) as pool:
+        while running or (pending and ok and error is None):
+            if ok and error is None:
+                in_use = sum(min(stage.cpus, jobs) for stage, _ in running.values())
+                for stage in list(pending):
+                    if not all(name in done for name in deps[stage.name]):
+                        continue
+                    cpus = min(max(stage.cpus, 1), jobs)
+                    if running and in_use + cpus > jobs:
+                        continue
+                    pending.remove(stage)
+                    future = pool.submit(_execute_buffered, stage, context, state, force)
+                    running[future] = (stage, time.perf_counter())
+                    in_use += cpus
+
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, start = running.pop(future)
+                timings[stage.name] = time.perf_counter() - start
+                try:
+                    result, was_skipped, output = future.result()
+                except BaseException as e:
+                    print(getattr(e, 'stage_output', ''), end='')
+                    error = error or e
+                    continue
+                print(output, end='')
+                if was_skipped:
+                    skipped.add(stage.name)
+                if result is False:
+                    print(f"\n❌ Error: {stage.description or stage.name} failed")
+                    ok = False
+                else:
+                    done.add(stage.name)
+
+    if error is not None:
+        raise error
+    return ok
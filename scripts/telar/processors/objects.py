@@ -26,11 +26,18 @@ steps before returning the cleaned DataFrame for JSON serialisation:
    IIIF structure (`@context`, `type`), and handles HTTP error codes
    (404, 429, 500, etc.) with localised warning messages. A previous-build
    cache (`_data/objects.json`) lets the validator skip 429 rate-limiting
-   errors for manifests that haven't changed. This step is media-aware:
-   objects classified as Video or Audio (see step 7) skip IIIF validation
-   entirely — video objects are instead checked against a list of
-   recognised hosts (YouTube, Vimeo, Google Drive), and audio objects are
-   served from local files rather than manifests.
+   errors for manifests that haven't changed, and manifests are kept in the
+   build state store (`.telar-cache/build.db`) with their ETag and
+   Last-Modified headers, so unchanged ones are revalidated with a
+   conditional request and a stored copy stands in when a server answers
+   429. Timeouts, rate limits and server errors mark the conversion
+   volatile for the build ledger, so the next build validates again
+   instead of reusing the result. Validate-only runs
+   (`csv_to_json.py --check`) check the URL syntax but fetch nothing. This
+   step is media-aware: objects classified as Video or Audio (see step 7)
+   skip IIIF validation entirely — video objects are instead checked
+   against a list of recognised hosts (YouTube, Vimeo, Google Drive), and
+   audio objects are served from local files rather than manifests.
 
 5. **IIIF metadata extraction** — when a manifest validates successfully,
    extracts title, description, creator, period, source, and credit — plus the
@@ -45,7 +52,9 @@ steps before returning the cleaned DataFrame for JSON serialisation:
    else looks for a matching image. If no exact image match is found,
    `_find_similar_image_filenames()` uses fuzzy string matching (via
    `difflib.SequenceMatcher` at 85% threshold) to suggest near-matches like
-   case differences or hyphen/underscore variations.
+   case differences or hyphen/underscore variations. The objects directory
+   is indexed once by normalised-stem bigrams, and only files that pass
+   cheap upper bounds on the similarity ratio reach SequenceMatcher.
 
 7. **Media-type classification** — every object is tagged with a
    `media_type` of Video, Audio, or Image, written into `objects.json` so
@@ -86,11 +95,14 @@ from urllib.parse import urlparse
 from difflib import SequenceMatcher
 
 import pandas as pd
-import yaml
 
-from telar.config import get_lang_string, load_site_language
+from telar.config import get_lang_string, load_site_language, load_site_config
 from telar.csv_utils import IMAGE_EXTENSIONS, build_stem_index, get_source_url
 from telar.media_type import detect_media_type, VIDEO_URL_PATTERNS, AUDIO_EXTENSIONS
+from telar.asset_inventory import find_object_file
+from telar.build_ledger import mark_volatile
+from telar.build_state import get_build_state
+from telar.check import checking
 
 
 def _detect_media_type(source_url, object_id):
@@ -110,11 +122,8 @@ def _detect_media_type(source_url, object_id):
     url = (source_url or '').strip()
     if any(pat in url for pat in VIDEO_URL_PATTERNS):
         return 'Video'
-    objects_dir = Path('telar-content/objects')
-    if objects_dir.exists():
-        for ext in AUDIO_EXTENSIONS:
-            if (objects_dir / f'{object_id}{ext}').exists():
-                return 'Audio'
+    if find_object_file(object_id, AUDIO_EXTENSIONS):
+        return 'Audio'
     return 'Image'
 from telar.iiif_metadata import (
     detect_iiif_version, extract_language_map_value, strip_html_tags,
@@ -123,6 +132,108 @@ from telar.iiif_metadata import (
 )
 
 
+# Extensions considered when suggesting near-match image filenames
+SIMILAR_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.tif', '.tiff'}
+
+# Suggestions must be more than this similar (SequenceMatcher ratio)
+SIMILARITY_THRESHOLD = 0.85
+
+# Normalised-stem index per images directory, keyed by (path, mtime) so that
+# adding or renaming a file invalidates it
+_similar_filename_index_cache = {}
+
+
+def _normalize_stem(name):
+    """Lowercase and drop hyphens, underscores and whitespace for fuzzy matching."""
+    return re.sub(r'[-_\s]', '', name.lower())
+
+
+def _bigram_counts(text):
+    """Count the character bigrams of a string."""
+    counts = {}
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _min_matches(total_length):
+    """
+    Smallest number of matched characters SequenceMatcher needs to pass.
+
+    Mirrors SequenceMatcher.ratio() (2.0 * matches / total_length) so that
+    the bound agrees with the real check, float rounding included.
+    """
+    if total_length == 0:
+        return 0
+    matches = int(SIMILARITY_THRESHOLD * total_length / 2)
+    while not 2.0 * matches / total_length > SIMILARITY_THRESHOLD:
+        matches += 1
+    return matches
+
+
+def _lcs_length(pattern_masks, pattern_length, text):
+    """
+    Length of the longest common subsequence, computed bit-parallel.
+
+    Args:
+        pattern_masks: char -> bitmask of its positions in the pattern
+        pattern_length: Length of the pattern
+        text: String to compare against the pattern
+
+    Returns:
+        int: LCS length
+    """
+    full = (1 << pattern_length) - 1
+    row = full
+    for char in text:
+        matched = row & pattern_masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return pattern_length - bin(row).count('1')
+
+
+def _similar_filename_index(images_dir):
+    """
+    Build (or reuse) the normalised-stem bigram index of an images directory.
+
+    Args:
+        images_dir: Path object to the images directory
+
+    Returns:
+        dict: 'entries' — (filename, lowercase stem, normalised stem) in
+        directory order; 'bigrams' — bigram -> normalised length ->
+        [(entry position, count)]; 'by_length' — normalised length -> [entry
+        positions]
+    """
+    stat = images_dir.stat()
+    key = (str(images_dir.resolve()), stat.st_mtime_ns)
+    if key in _similar_filename_index_cache:
+        return _similar_filename_index_cache[key]
+
+    entries = []
+    bigrams = {}
+    by_length = {}
+    for file_path in sorted(images_dir.iterdir()):
+        if not file_path.is_file():
+            continue
+
+        # Only check image files
+        if file_path.suffix.lower() not in SIMILAR_IMAGE_EXTENSIONS:
+            continue
+
+        position = len(entries)
+        normalized = _normalize_stem(file_path.stem)
+        entries.append((file_path.name, file_path.stem.lower(), normalized))
+        by_length.setdefault(len(normalized), []).append(position)
+        for gram, count in _bigram_counts(normalized).items():
+            bigrams.setdefault(gram, {}).setdefault(len(normalized), []).append((position, count))
+
+    index = {'entries': entries, 'bigrams': bigrams, 'by_length': by_length}
+    _similar_filename_index_cache.clear()
+    _similar_filename_index_cache[key] = index
+    return index
+
+
 def _find_similar_image_filenames(object_id, images_dir):
     """
     Find image files that are similar to object_id but not exact matches.
@@ -132,6 +243,15 @@ def _find_similar_image_filenames(object_id, images_dir):
     - Hyphen/underscore variations: "my-object" vs "my_object" vs "myobject"
     - Extra characters or minor typos
 
+    The directory is indexed once (normalised stems and their bigrams), and
+    SequenceMatcher only runs on files that pass cheaper upper bounds on its
+    ratio, so the suggestions are exactly those of a full scan. The ratio is
+    2M/T for M matched characters out of T combined; M can be no more than
+    the shorter length or the longest common subsequence L. M characters in
+    B matching blocks share at least M - B bigrams, and consecutive blocks
+    are separated by an unmatched character, so B - 1 <= T - 2M and the
+    shared bigram count must be at least 3M - T - 1.
+
     Args:
         object_id: The object ID to match against
         images_dir: Path object to the images directory
@@ -142,38 +262,192 @@ def _find_similar_image_filenames(object_id, images_dir):
     if not images_dir.exists():
         return []
 
+    index = _similar_filename_index(images_dir)
+    entries = index['entries']
+
     # Normalize object_id for comparison (remove hyphens, underscores, lowercase)
-    normalized_id = re.sub(r'[-_\s]', '', object_id.lower())
+    normalized_id = _normalize_stem(object_id)
+    id_length = len(normalized_id)
+    object_id_lower = object_id.lower()
+
+    # Shared bigrams each file length needs, for lengths that can pass at all
+    required = {}
+    for length in index['by_length']:
+        needed = _min_matches(id_length + length)
+        if min(id_length, length) >= needed:
+            required[length] = (needed, 3 * needed - (id_length + length) - 1)
+
+    # Shared-bigram counts for every file that shares at least one bigram
+    shared = {}
+    for gram, count in _bigram_counts(normalized_id).items():
+        buckets = index['bigrams'].get(gram)
+        if not buckets:
+            continue
+        for length in required:
+            for position, file_count in buckets.get(length, ()):
+                shared[position] = shared.get(position, 0) + (count if count < file_count else file_count)
 
-    similar_files = []
-    valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.tif', '.tiff'}
+    # Short stems can pass while sharing no bigram at all
+    for length, (needed, min_shared) in required.items():
+        if min_shared <= 0:
+            for position in index['by_length'][length]:
+                shared.setdefault(position, 0)
 
-    for file_path in images_dir.iterdir():
-        if not file_path.is_file():
-            continue
+    pattern_masks = {}
+    for i, char in enumerate(normalized_id):
+        pattern_masks[char] = pattern_masks.get(char, 0) | (1 << i)
 
-        # Only check image files
-        if file_path.suffix.lower() not in valid_extensions:
+    similar_files = []
+    for position in sorted(shared):
+        filename, stem_lower, normalized_file = entries[position]
+        needed, min_shared = required[len(normalized_file)]
+        if shared[position] < min_shared:
             continue
 
-        # Get filename without extension
-        basename = file_path.stem
-        normalized_file = re.sub(r'[-_\s]', '', basename.lower())
-
         # Skip if this is the exact object_id (exact matches are checked elsewhere)
-        if basename.lower() == object_id.lower():
+        if stem_lower == object_id_lower:
+            continue
+
+        if _lcs_length(pattern_masks, id_length, normalized_file) < needed:
             continue
 
         # Calculate similarity ratio
         similarity = SequenceMatcher(None, normalized_id, normalized_file).ratio()
 
         # Consider similar if > 85% match
-        if similarity > 0.85:
-            similar_files.append(file_path.name)
+        if similarity > SIMILARITY_THRESHOLD:
+            similar_files.append(filename)
 
     return similar_files
 
 
+class _CachedManifest:
+    """Stored manifest body, read through the same interface as a response."""
+
+    def __init__(self, content_type, body):
+        self.headers = {'Content-Type': content_type}
+        self._body = body
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _fetch_manifest(req, ssl_context, object_id=''):
+    """
+    Fetch a IIIF manifest, revalidating the copy in the build state store.
+
+    A manifest fetched before is requested with If-None-Match /
+    If-Modified-Since, so an unchanged one costs a 304 instead of a full
+    download. When the server rate-limits (429) the stored copy is used; the
+    conversion is still marked volatile so the next build asks again.
+
+    Args:
+        req: urllib.request.Request for the manifest URL
+        ssl_context: SSL context for the request
+        object_id: Object the manifest belongs to (for messages)
+
+    Returns:
+        Context manager with `.headers.get()` and `.read()`, like urlopen()'s
+
+    Raises:
+        urllib.error.HTTPError, urllib.error.URLError: as urlopen() does,
+            when there is no stored copy to fall back on
+    """
+    state = get_build_state()
+    url = req.full_url
+    cached = state.get('manifest', url) if state is not None else None
+    if cached:
+        if cached.get('etag'):
+            req.add_header('If-None-Match', cached['etag'])
+        if cached.get('last_modified'):
+            req.add_header('If-Modified-Since', cached['last_modified'])
+
+    try:
+        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
+            content_type = response.headers.get('Content-Type', '')
+            body = response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if cached and e.code == 304:
+            return _CachedManifest(cached['content_type'], cached['body'].encode('utf-8'))
+        if cached and e.code == 429:
+            print(f"  [INFO] Rate limited; using stored manifest for {object_id} ({url})")
+            mark_volatile(f"IIIF manifest for object {object_id} returned HTTP 429")
+            return _CachedManifest(cached['content_type'], cached['body'].encode('utf-8'))
+        raise
+
+    if state is not None and 'json' in content_type.lower():
+        try:
+            state.put('manifest', url, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_type': content_type,
+                'body': body.decode('utf-8'),
+            })
+        except UnicodeDecodeError:
+            pass
+    return _CachedManifest(content_type, body)
+
+
+# Previous-build lookup for the 429 skip, keyed by the objects.json path and
+# its (mtime, size) so a rewritten file is picked up
+_previous_objects_cache = {}
+
+
+def _load_previous_objects(path='_data/objects.json'):
+    """
+    Load the previous build's objects.json as a 429-skip lookup.
+
+    Only needed when a manifest actually answers 429, so it is loaded on the
+    first 429 rather than up front. That keeps the whole previous catalogue
+    out of memory on normal builds, which matters when a large objects CSV is
+    streamed in chunks.
+
+    Args:
+        path: Path to the previous objects.json
+
+    Returns:
+        dict: object_id -> {'manifest_url', 'had_warning'} (empty if unavailable)
+    """
+    previous_path = Path(path)
+    try:
+        stat = previous_path.stat()
+    except OSError:
+        return {}
+
+    key = (str(previous_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key in _previous_objects_cache:
+        return _previous_objects_cache[key]
+
+    previous_objects = {}
+    try:
+        with open(previous_path, 'r', encoding='utf-8') as f:
+            previous_data = json.load(f)
+        # Create lookup: object_id -> {manifest_url, had_warning}
+        for obj in previous_data:
+            if obj.get('_metadata'):
+                continue
+            previous_objects[obj.get('object_id')] = {
+                'manifest_url': obj.get('iiif_manifest', ''),
+                'had_warning': bool(obj.get('object_warning'))
+            }
+        print(f"[INFO] Loaded {len(previous_objects)} objects from previous build for 429 checking")
+    except Exception as e:
+        print(f"[INFO] Could not load previous objects.json: {e}")
+        previous_objects = {}
+
+    _previous_objects_cache.clear()
+    _previous_objects_cache[key] = previous_objects
+    return previous_objects
+
+
 def inject_christmas_tree_errors(df):
     """
     Inject test objects with various error conditions for testing multilingual warnings.
@@ -271,6 +545,13 @@ def process_objects(df, christmas_tree=False):
 
     Expected columns: object_id, title, creator, date, description, etc.
 
+    When the core streams a large CSV it calls this once per chunk and sets
+    `df.attrs['chunk_number']`. In that mode the test objects are injected
+    into the first chunk only, and the featured-sample decision and the
+    warnings summary are left to the core, which merges them across chunks
+    (see `featured_candidates()` and `resolve_featured_sample()`). The
+    warnings are returned in `df.attrs['validation_warnings']` either way.
+
     Args:
         df: pandas DataFrame from objects CSV
         christmas_tree: If True, inject test objects with intentional errors
@@ -281,10 +562,13 @@ def process_objects(df, christmas_tree=False):
     # Tracking for summary
     warnings = []
 
+    chunk_number = df.attrs.get('chunk_number')
+    streaming = chunk_number is not None
+
     # Inject Christmas Tree test errors first, before any normalisation, so the
     # test objects flow through source_url/iiif_manifest aliasing, the alt_text
     # fallback and object_id sanitisation identically to real objects.
-    if christmas_tree:
+    if christmas_tree and not chunk_number:
         df = inject_christmas_tree_errors(df)
 
     # Drop example column if it exists
@@ -395,24 +679,6 @@ def process_objects(df, christmas_tree=False):
                 warnings.append(msg)
                 # Don't clear - file might be added later or exist in different environment
 
-    # Load previous objects.json to skip 429 errors for unchanged manifests
-    previous_objects = {}
-    previous_objects_path = Path('_data/objects.json')
-    if previous_objects_path.exists():
-        try:
-            with open(previous_objects_path, 'r', encoding='utf-8') as f:
-                previous_data = json.load(f)
-                # Create lookup: object_id -> {manifest_url, had_warning}
-                for obj in previous_data:
-                    previous_objects[obj.get('object_id')] = {
-                        'manifest_url': obj.get('iiif_manifest', ''),
-                        'had_warning': bool(obj.get('object_warning'))
-                    }
-                print(f"[INFO] Loaded {len(previous_objects)} objects from previous build for 429 checking")
-        except Exception as e:
-            print(f"[INFO] Could not load previous objects.json: {e}")
-            previous_objects = {}
-
     # Validate source URL field (checks both source_url and iiif_manifest for backward compatibility)
     if 'source_url' in df.columns or 'iiif_manifest' in df.columns:
         for idx, row in df.iterrows():
@@ -454,6 +720,10 @@ def process_objects(df, christmas_tree=False):
                 warnings.append(msg)
                 continue
 
+            # Validate-only runs (csv_to_json.py --check) stop at the URL syntax
+            if checking():
+                continue
+
             # Try to fetch the manifest (with timeout). Verify TLS certificates
             # so a man-in-the-middle cannot substitute the manifest metadata that
             # gets written into the site. Use certifi's CA bundle when available
@@ -470,7 +740,7 @@ def process_objects(df, christmas_tree=False):
                 req = urllib.request.Request(manifest_url)
                 req.add_header('User-Agent', 'Telar/1.0.0-beta (IIIF validator)')
 
-                with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
+                with _fetch_manifest(req, ssl_context, object_id) as response:
                     content_type = response.headers.get('Content-Type', '')
 
                     # Check if response is JSON
@@ -641,13 +911,19 @@ def process_objects(df, christmas_tree=False):
             except urllib.error.HTTPError as e:
                 # Check if we should skip this 429 error (unchanged manifest from previous build)
                 skip_429 = False
-                if e.code == 429 and object_id in previous_objects:
+                previous_objects = _load_previous_objects() if e.code == 429 else {}
+                if object_id in previous_objects:
                     prev = previous_objects[object_id]
                     # Skip if: same URL as before AND no warning in previous build
                     if prev['manifest_url'] == manifest_url and not prev['had_warning']:
                         skip_429 = True
                         print(f"  [INFO] Skipping 429 error for unchanged manifest: {object_id} ({manifest_url})")
 
+                # Rate limits and server errors are usually temporary: don't let
+                # the build ledger reuse this result
+                if e.code == 429 or e.code >= 500:
+                    mark_volatile(f"IIIF manifest for object {object_id} returned HTTP {e.code}")
+
                 # Only process error if not skipping
                 if not skip_429:
                     known_codes = (404, 429, 403, 401, 500, 503, 502)
@@ -666,12 +942,14 @@ def process_objects(df, christmas_tree=False):
                 msg = f"IIIF manifest for object {object_id} slow to respond: {e.reason}"
                 print(f"  [WARN] {msg}")
                 warnings.append(msg)
+                mark_volatile(msg)
             except Exception as e:
                 df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_validation_failed')
                 df.at[idx, 'object_warning_short'] = get_lang_string('errors.object_warnings.short_validation_error')
                 msg = f"Error validating IIIF manifest for object {object_id}: {str(e)}"
                 print(f"  [WARN] {msg}")
                 warnings.append(msg)
+                mark_volatile(msg)
 
     # Validate that objects have either source URL (IIIF manifest) OR local image file.
     # Index telar-content/objects once so the per-object existence check is an O(1)
@@ -689,14 +967,8 @@ def process_objects(df, christmas_tree=False):
         obj_media_type = _detect_media_type('', object_id)
         if obj_media_type == 'Audio':
             # Find which audio extension matches
-            audio_dir = Path('telar-content/objects')
-            audio_found = None
-            if audio_dir.exists():
-                for ext in AUDIO_EXTENSIONS:
-                    audio_path = audio_dir / f'{object_id}{ext}'
-                    if audio_path.exists():
-                        audio_found = audio_path
-                        break
+            audio_match = find_object_file(object_id, AUDIO_EXTENSIONS)
+            audio_found = audio_match.path if audio_match else None
             if audio_found:
                 print(f"  [INFO] Object {object_id} uses local audio: {audio_found}")
                 # Check for peaks JSON (optional but recommended)
@@ -752,8 +1024,9 @@ def process_objects(df, christmas_tree=False):
             print(f"  [WARN] {msg}")
             warnings.append(msg)
 
-    # Print summary if there were issues
-    if warnings:
+    # Print summary if there were issues (a streamed chunk hands its
+    # warnings to the core, which prints one summary for the whole file)
+    if warnings and not streaming:
         print(f"\n  Objects validation summary: {len(warnings)} warning(s)")
 
     # Final cleanup: ensure no NaN values in output
@@ -770,79 +1043,122 @@ def process_objects(df, christmas_tree=False):
 
     # Featured objects selection for homepage display
     # Mark objects with is_featured_sample: true for Liquid to filter
-    df = _select_featured_objects(df)
+    if streaming:
+        df['is_featured_sample'] = False
+        df.attrs['featured_candidates'] = featured_candidates(df)
+    else:
+        df = _select_featured_objects(df)
+    df.attrs['validation_warnings'] = warnings
 
     return df
 
 
-def _select_featured_objects(df):
-    """
-    Select objects to feature on the homepage.
+# Values of the `featured` column that mark an object for the homepage sample
+FEATURED_VALUES = {'yes', 'true', 'si', 'sí', '1'}
 
-    If any objects have featured=yes, those are selected.
-    Otherwise, randomly select objects (count from config, default 4).
-    Selected objects are marked with is_featured_sample=true.
 
-    Args:
-        df: pandas DataFrame of objects
+def _featured_settings():
+    """
+    Read the homepage sample settings from _config.yml.
 
     Returns:
-        pandas DataFrame with is_featured_sample column added
+        tuple: (show_sample_on_homepage, featured_count)
     """
-    # Read config for settings
     config = {}
-    config_path = Path('_config.yml')
-    if config_path.exists():
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-        except Exception as e:
-            print(f"  [WARN] Could not read _config.yml for featured objects: {e}")
+    try:
+        config = load_site_config()
+    except Exception as e:
+        print(f"  [WARN] Could not read _config.yml for featured objects: {e}")
 
     # Get settings from collection_interface
     collection_config = config.get('collection_interface', {})
     show_sample = collection_config.get('show_sample_on_homepage', False)
     featured_count = collection_config.get('featured_count', 4)
+    return show_sample, featured_count
 
-    # Initialize column
-    df['is_featured_sample'] = False
 
-    # Skip if show_sample_on_homepage is disabled
-    if not show_sample:
-        return df
+def featured_candidates(df):
+    """
+    Collect the index labels the featured-sample decision needs from a frame.
+
+    Split out from the decision itself so that a streamed objects CSV can
+    collect candidates chunk by chunk and decide once over the whole file.
 
-    # Check for explicitly featured objects (case-insensitive yes/true/si)
-    featured_values = {'yes', 'true', 'si', 'sí', '1'}
+    Args:
+        df: pandas DataFrame of processed objects (with object_warning)
+
+    Returns:
+        dict: {'explicit': [labels flagged featured], 'valid': [labels without warnings]}
+    """
+    explicit = []
     if 'featured' in df.columns:
-        featured_mask = df['featured'].astype(str).str.lower().str.strip().isin(featured_values)
-        featured_objects = df[featured_mask]
+        featured_mask = df['featured'].astype(str).str.lower().str.strip().isin(FEATURED_VALUES)
+        explicit = list(df.index[featured_mask])
+    valid = list(df.index[df['object_warning'].astype(str).str.strip() == ''])
+    return {'explicit': explicit, 'valid': valid}
+
+
+def resolve_featured_sample(candidates):
+    """
+    Decide which objects appear in the homepage sample.
 
-        if len(featured_objects) > 0:
-            # Use explicitly featured objects
-            df.loc[featured_mask, 'is_featured_sample'] = True
-            print(f"  [INFO] Selected {len(featured_objects)} explicitly featured object(s) for homepage")
-            return df
+    If any objects have featured=yes, those are selected. Otherwise a
+    reproducible random sample (count from config, default 4) is drawn from
+    the objects without warnings.
 
-    # No explicit featured objects — select randomly
-    # Filter to objects without warnings (only show good objects on homepage)
-    valid_objects = df[df['object_warning'].astype(str).str.strip() == '']
+    Args:
+        candidates: dict as returned by featured_candidates()
+
+    Returns:
+        list: Index labels to mark with is_featured_sample=true
+    """
+    show_sample, featured_count = _featured_settings()
+
+    # Skip if show_sample_on_homepage is disabled
+    if not show_sample:
+        return []
 
-    if len(valid_objects) == 0:
+    # Explicitly featured objects win
+    if candidates['explicit']:
+        print(f"  [INFO] Selected {len(candidates['explicit'])} explicitly featured object(s) for homepage")
+        return list(candidates['explicit'])
+
+    # No explicit featured objects — select randomly from objects without
+    # warnings (only show good objects on homepage)
+    valid = list(candidates['valid'])
+    if len(valid) == 0:
         print("  [INFO] No valid objects available for homepage sample")
-        return df
+        return []
 
     # Select up to featured_count objects. Seed a local RNG from the sorted
     # object IDs so the homepage sample is reproducible across builds of
     # unchanged content (authors who want a fixed set use the `featured` flag).
     # Use a stable hash (sha256) rather than the built-in hash(), which is
     # salted per-process (PYTHONHASHSEED) and would not be reproducible.
-    sample_size = min(featured_count, len(valid_objects))
-    seed_key = '\n'.join(sorted(str(i) for i in valid_objects.index)).encode('utf-8')
+    sample_size = min(featured_count, len(valid))
+    seed_key = '\n'.join(sorted(str(i) for i in valid)).encode('utf-8')
     seed = int.from_bytes(hashlib.sha256(seed_key).digest()[:8], 'big')
     rng = random.Random(seed)
-    sample_indices = rng.sample(list(valid_objects.index), sample_size)
-
-    df.loc[sample_indices, 'is_featured_sample'] = True
+    sample = rng.sample(valid, sample_size)
     print(f"  [INFO] Randomly selected {sample_size} object(s) for homepage sample")
+    return sample
+
+
+def _select_featured_objects(df):
+    """
+    Select objects to feature on the homepage.
 
+    Selected objects are marked with is_featured_sample=true; see
+    resolve_featured_sample() for the selection rules.
+
+    Args:
+        df: pandas DataFrame of objects
+
+    Returns:
+        pandas DataFrame with is_featured_sample column added
+    """
+    df['is_featured_sample'] = False
+    selected = resolve_featured_sample(featured_candidates(df))
+    if selected:
+        df.loc[selected, 'is_featured_sample'] = True
     return df
@@ -25,7 +25,8 @@ at build time, requiring a key to view.
 
 The function returns a pandas DataFrame wrapping a single dictionary with
 a `stories` key, which `csv_to_json()` in the core module serialises to
-`_data/project.json`.
+`_data/project.json`. Warnings are also attached as
+`df.attrs['validation_warnings']` for `csv_to_json.py --check`.
 
 Version: v1.5.0
 """
@@ -34,6 +35,12 @@ import re
 import pandas as pd
 
 
+def _warn(msg, warnings):
+    """Print a warning and record it in the warnings list."""
+    print(f"  Warning: {msg}")
+    warnings.append(msg)
+
+
 def process_project_setup(df):
     """
     Process project setup CSV.
@@ -48,6 +55,7 @@ def process_project_setup(df):
         pandas DataFrame with single row containing {'stories': [...]}
     """
     stories_list = []
+    warnings = []
     seen_ids = set()  # Track duplicate story_ids
     seen_orders = set()  # Track duplicate order numbers
 
@@ -73,21 +81,21 @@ def process_project_setup(df):
         # Warn on duplicate order numbers — two stories sharing an order would
         # collide on the same story number / output slug
         if order in seen_orders:
-            print(f"  Warning: Duplicate order '{order}' found in project.csv (row {row_idx})")
+            _warn(f"Duplicate order '{order}' found in project.csv (row {row_idx})", warnings)
         seen_orders.add(order)
 
         # Validate story_id if provided
         if story_id:
             # Check for invalid characters (must be lowercase, numbers, hyphens, underscores)
             if not re.match(r'^[a-z0-9\-_]+$', story_id):
-                print(f"  Warning: story_id '{story_id}' contains invalid characters (lowercase letters, numbers, hyphens, underscores only) — skipping this row so a malformed id cannot become a data-file name.")
+                _warn(f"story_id '{story_id}' contains invalid characters (lowercase letters, numbers, hyphens, underscores only) — skipping this row so a malformed id cannot become a data-file name.", warnings)
                 continue
 
             # Check for duplicates — skip the duplicate row entirely so routing
             # and encryption decisions stay unambiguous (one row can no longer
             # silently shadow another)
             if story_id in seen_ids:
-                print(f"  Warning: Duplicate story_id '{story_id}' in project.csv (row {row_idx}) — skipping duplicate row")
+                _warn(f"Duplicate story_id '{story_id}' in project.csv (row {row_idx}) — skipping duplicate row", warnings)
                 continue
             seen_ids.add(story_id)
 
@@ -121,4 +129,7 @@ def process_project_setup(df):
 
     # Return stories list structure
     result = {'stories': stories_list}
-    return pd.DataFrame([result])
+    result_df = pd.DataFrame([result])
+    # For csv_to_json.py --check (not written to project.json)
+    result_df.attrs['validation_warnings'] = warnings
+    return result_df
@@ -11,10 +11,15 @@ slide in from the side with text, images, or interactive widgets).
 from one story CSV and performs several passes over the data:
 
 1. **Object validation** — checks that every object ID referenced in the
-   `object` column actually exists in `_data/objects.json`. Lookups are
+   `object` column actually exists in `_data/objects.json` (or in the
+   objects passed in, as `csv_to_json.py --check` does). Lookups are
    case-insensitive, so `MyMap` matches `mymap`. Missing references
    produce localised viewer warnings that appear in the story's intro
-   panel.
+   panel. During a build the objects and the glossary come from the
+   build's shared lookups (`telar.lookups`), loaded once for all stories.
+   The objects that are found are kept in `df.attrs['objects']`, in order
+   of first use; the story's `_metadata` block carries them so the story
+   page only ships the objects it shows, not the whole catalogue.
 
 2. **Content processing** — for each content column (`layer1_content`,
    `layer2_content`, and their legacy `_file` equivalents), the function
@@ -27,7 +32,8 @@ from one story CSV and performs several passes over the data:
    (`[[term_id]]` syntax) are resolved by `process_glossary_links()`. As of
    v1.5.1 the step's `answer` prose is glossary-processed too (the `question`
    is a heading and is left alone), so `[[term]]` works in the main story
-   text, not only in layer panels.
+   text, not only in layer panels. A referenced file that does not exist
+   is reported as a panel warning naming the file.
 
 3. **Coordinate defaults** — empty `x`, `y`, and `zoom` cells get default
    values (0.5, 0.5, 1) so the viewer always has a valid starting
@@ -37,27 +43,42 @@ from one story CSV and performs several passes over the data:
    markdown files, broken glossary links, widget errors) are collected
    into a `viewer_warnings` list stored in `df.attrs`, which the core
    module later injects into the JSON output for display in the story's
-   intro panel.
+   intro panel. Invalid page values are only logged; they are kept in
+   `df.attrs['step_warnings']` for `csv_to_json.py --check`.
 
 In Christmas Tree Mode, `process_story()` appends additional fake
 warnings covering every warning type (viewer, panel, glossary) so that
 the intro panel's error display can be visually tested.
 
+Each pass works on whole columns: values are read out as lists, processed
+in one loop and written back as a column, and LaTeX is detected with one
+scan over all prose cells. Panels are still processed column by column and
+step by step, because widget IDs get their per-page suffixes in that order.
+
 Version: v1.6.0
 """
 
 import re
-import json
-from pathlib import Path
 
 import pandas as pd
 
-from telar.config import get_lang_string
-from telar.glossary import load_glossary_terms, process_glossary_links
+from telar.config import get_lang_string, get_glossary_auto_link
+from telar.glossary import load_glossary_terms, process_glossary_links, GlossaryLinker
 from telar.markdown import read_markdown_file, process_inline_content
+from telar.widgets import reset_widget_ids
 from telar.csv_utils import IMAGE_EXTENSIONS, build_stem_index
-from telar.latex import has_latex
+from telar.latex import texts_have_latex
 from telar.media_type import AUDIO_EXTENSIONS
+from telar.lookups import active_lookups, load_objects
+
+# A trailing image extension on an object reference ("photo.jpg")
+OBJECT_EXTENSION_PATTERN = re.compile(
+    '(?:' + '|'.join(re.escape(ext) for ext in sorted(IMAGE_EXTENSIONS)) + r')\Z',
+    re.IGNORECASE | re.ASCII
+)
+
+# The file name in a legacy "Content Missing" panel
+STRONG_PATTERN = re.compile(r'<strong>(.*?)</strong>')
 
 
 def _warn(msg, warnings):
@@ -66,7 +87,18 @@ def _warn(msg, warnings):
     warnings.append(msg)
 
 
-def process_story(df, christmas_tree=False):
+def _page_number(value):
+    """Parse a page cell as a positive whole number, or return None."""
+    if not value:
+        return None
+    try:
+        page_int = int(float(value))
+    except (ValueError, TypeError):
+        return None
+    return page_int if page_int >= 1 else None
+
+
+def process_story(df, christmas_tree=False, objects_data=None):
     """
     Process story CSV with panel content (file references or inline text).
 
@@ -77,6 +109,9 @@ def process_story(df, christmas_tree=False):
     Args:
         df: pandas DataFrame from story CSV
         christmas_tree: If True, inject fake warnings for testing
+        objects_data: object_id -> object dict to validate references
+            against (default: None = the build's shared lookups, or
+            _data/objects.json read here)
 
     Returns:
         pandas DataFrame with processed content and aggregated warnings
@@ -84,12 +119,24 @@ def process_story(df, christmas_tree=False):
     # Tracking for summary
     warnings = []
 
-    # Load glossary terms for auto-linking
-    glossary_terms = load_glossary_terms()
+    # Warnings about step values that only the build log reports
+    step_warnings = []
+
+    # Panels whose markdown file does not exist
+    panel_warnings = []
+
+    # Glossary linker for every cell: shared by the build's stories when
+    # lookups are active, else compiled here
+    lookups = active_lookups()
+    if lookups is not None:
+        glossary = lookups.glossary(auto_link=get_glossary_auto_link())
+    else:
+        glossary = GlossaryLinker(load_glossary_terms(), auto_link=get_glossary_auto_link())
     glossary_warnings = []
 
-    # Initialize widget warnings list
+    # Initialize widget warnings list; widget IDs are unique per story page
     widget_warnings = []
+    reset_widget_ids()
 
     # Drop example column if it exists
     if 'example' in df.columns:
@@ -105,66 +152,67 @@ def process_story(df, christmas_tree=False):
     # Remove completely empty rows
     df = df[df.astype(str).apply(lambda x: x.str.strip()).ne('').any(axis=1)]
 
-    # Validate and normalize page column
+    # Step numbers by row position, for messages (rows are not dropped below)
+    steps = df['step'].tolist() if 'step' in df.columns else ['unknown'] * len(df)
+
+    # Validate and normalize page column: a positive whole number becomes an
+    # int, any other non-blank value is reported and cleared
     if 'page' in df.columns:
-        for idx, row in df.iterrows():
-            page_val = row.get('page', '')
-            step_num = row.get('step', 'unknown')
-            if pd.notna(page_val) and str(page_val).strip():
-                try:
-                    page_int = int(float(str(page_val).strip()))
-                    if page_int < 1:
-                        raise ValueError
-                    df.at[idx, 'page'] = page_int
-                except (ValueError, TypeError):
-                    msg = f"Story step {step_num}: invalid page value '{page_val}' (must be positive integer)"
-                    _warn(msg, warnings)
-                    df.at[idx, 'page'] = ''
+        page_values = df['page'].tolist()
+        page_column = []
+        for page_val, step_num in zip(page_values, steps):
+            page_text = str(page_val).strip()
+            page_int = _page_number(page_text)
+            if page_int is not None:
+                page_column.append(page_int)
+            elif page_text:
+                msg = f"Story step {step_num}: invalid page value '{page_val}' (must be positive integer)"
+                _warn(msg, warnings)
+                step_warnings.append({'step': step_num, 'type': 'page', 'message': msg})
+                page_column.append('')
+            else:
+                page_column.append(page_val)
+        # Assigned as a whole column: pandas' string dtype rejects an int
+        # written into a single cell
+        df['page'] = pd.Series(page_column, index=df.index, dtype=object)
 
     # Load objects data for validation
-    objects_data = {}
-    objects_json_path = Path('_data/objects.json')
-    if objects_json_path.exists():
-        try:
-            with open(objects_json_path, 'r', encoding='utf-8') as f:
-                objects_list = json.load(f)
-                # Create lookup dictionary by object_id
-                objects_data = {obj['object_id']: obj for obj in objects_list}
-        except Exception as e:
-            print(f"  [WARN] Could not load objects.json for validation: {e}")
+    if objects_data is not None:
+        objects_lower_map = {k.lower(): k for k in objects_data.keys()}
+    elif lookups is not None:
+        objects_data, objects_lower_map = lookups.objects()
+    else:
+        objects_data, objects_lower_map = load_objects('_data/objects.json')
 
     # Add viewer_warning column if it doesn't exist
     if 'viewer_warning' not in df.columns:
         df['viewer_warning'] = ''
 
+    # Objects the story references, in order of first use, for the page's
+    # objects data (see module docstring)
+    story_objects = {}
+
     # Validate object references
     if 'object' in df.columns and objects_data:
-        # Build case-insensitive lookup map for objects
-        objects_lower_map = {k.lower(): k for k in objects_data.keys()}
-
-        # Shared canonical extension set for stripping object references.
-        strippable_extensions = IMAGE_EXTENSIONS
-
         # Index telar-content/objects once so the per-reference local-file check
         # is an O(1) lookup instead of an iterdir scan per story step.
         _obj_file_index = build_stem_index('telar-content/objects')
 
-        for idx, row in df.iterrows():
-            object_id = str(row.get('object', '')).strip()
-            step_num = row.get('step', 'unknown')
+        # Strip file extensions from object references (users may type
+        # "photo.jpg" instead of "photo"), for the whole column at once
+        references = df['object'].astype(str).str.strip()
+        object_ids = references.str.replace(OBJECT_EXTENSION_PATTERN, '', regex=True)
 
+        object_column = df['object'].tolist()
+        viewer_column = df['viewer_warning'].tolist()
+        for pos, (reference, object_id, step_num) in enumerate(zip(references, object_ids, steps)):
             # Skip if no object specified
-            if not object_id:
+            if not reference:
                 continue
 
-            # Strip file extensions from object references (users may type "photo.jpg" instead of "photo")
-            for ext in strippable_extensions:
-                if object_id.lower().endswith(ext):
-                    stripped_id = object_id[:-len(ext)]
-                    print(f"  [INFO] Stripped extension from story object reference: '{object_id}' -> '{stripped_id}'")
-                    object_id = stripped_id
-                    df.at[idx, 'object'] = object_id
-                    break
+            if object_id != reference:
+                print(f"  [INFO] Stripped extension from story object reference: '{reference}' -> '{object_id}'")
+                object_column[pos] = object_id
 
             # Check if object exists (case-insensitive)
             actual_object_id = None
@@ -174,18 +222,16 @@ def process_story(df, christmas_tree=False):
             elif object_id.lower() in objects_lower_map:
                 # Case-insensitive match - use the correct-case version
                 actual_object_id = objects_lower_map[object_id.lower()]
-                # Update the DataFrame with correct case
-                df.at[idx, 'object'] = actual_object_id
+                object_column[pos] = actual_object_id
 
             if actual_object_id is None:
-                error_msg = get_lang_string('errors.object_warnings.object_not_found', object_id=object_id)
-                df.at[idx, 'viewer_warning'] = error_msg
-                msg = f"Story step {step_num} references missing object: {object_id}"
-                _warn(msg, warnings)
+                viewer_column[pos] = get_lang_string('errors.object_warnings.object_not_found', object_id=object_id)
+                _warn(f"Story step {step_num} references missing object: {object_id}", warnings)
                 continue
 
             # Check if object has IIIF manifest or local image
             obj = objects_data[actual_object_id]
+            story_objects.setdefault(actual_object_id, obj)
             iiif_manifest = obj.get('iiif_manifest', '').strip()
 
             # If no external IIIF manifest, check for local image file
@@ -206,10 +252,13 @@ def process_story(df, christmas_tree=False):
 
                 # Only warn if object has neither external manifest nor local image
                 if not has_local_image:
-                    error_msg = get_lang_string('errors.object_warnings.object_no_source', object_id=actual_object_id)
-                    df.at[idx, 'viewer_warning'] = error_msg
-                    msg = f"Story step {step_num} references object without IIIF source: {actual_object_id}"
-                    _warn(msg, warnings)
+                    viewer_column[pos] = get_lang_string('errors.object_warnings.object_no_source',
+                                                         object_id=actual_object_id)
+                    _warn(f"Story step {step_num} references object without IIIF source: {actual_object_id}",
+                          warnings)
+
+        df['object'] = object_column
+        df['viewer_warning'] = viewer_column
 
     # Process content columns (layer1_content, layer2_content, etc.)
     # Also handles legacy _file suffix for backward compatibility
@@ -225,19 +274,17 @@ def process_story(df, christmas_tree=False):
             title_col = f'{base_name}_title'
             text_col = f'{base_name}_text'
 
-            # Initialize new columns with empty strings
-            if title_col not in df.columns:
-                df[title_col] = ''
-            if text_col not in df.columns:
-                df[text_col] = ''
+            # Start from any existing title/text values (empty by default);
+            # the results are written back as whole columns
+            titles = df[title_col].tolist() if title_col in df.columns else [''] * len(df)
+            texts = df[text_col].tolist() if text_col in df.columns else [''] * len(df)
 
             # Read markdown files or process inline content
-            for idx, row in df.iterrows():
-                cell_value = row[col]
+            for pos, (cell_value, step_num) in enumerate(zip(df[col], steps)):
                 if cell_value and str(cell_value).strip():
                     cell_value = str(cell_value).strip()
-                    step_num = row.get('step', 'unknown')
                     content_data = None
+                    widget_warning_count = len(widget_warnings)
 
                     # Check if this looks like a file reference (.md extension)
                     if cell_value.endswith('.md'):
@@ -252,22 +299,40 @@ def process_story(df, christmas_tree=False):
                             # Try to load as markdown file
                             file_path = f"stories/{cell_value}"
                             content_data = read_markdown_file(file_path, widget_warnings)
+                            if content_data is None:
+                                _warn(f"Story step {step_num}: {col} file not found: "
+                                      f"telar-content/texts/{file_path}", warnings)
+                                panel_warnings.append({
+                                    'step': step_num,
+                                    'type': 'panel',
+                                    'message': get_lang_string(
+                                        'errors.object_warnings.layer_file_missing_named',
+                                        layer_num=re.sub(r'\D', '', base_name) or base_name,
+                                        filename=cell_value
+                                    )
+                                })
 
                     # If not a file reference or file not found, treat as inline content
                     if content_data is None:
                         content_data = process_inline_content(cell_value, widget_warnings)
 
+                    # Widget warnings are raised without knowing the step
+                    for warning in widget_warnings[widget_warning_count:]:
+                        warning.setdefault('step', step_num)
+
                     if content_data:
-                        df.at[idx, title_col] = content_data['title']
+                        titles[pos] = content_data['title']
                         # Apply glossary link transformation to content
-                        content_with_glossary = process_glossary_links(
+                        texts[pos] = process_glossary_links(
                             content_data['content'],
-                            glossary_terms,
+                            glossary,
                             glossary_warnings,
                             step_num,
                             base_name
                         )
-                        df.at[idx, text_col] = content_with_glossary
+
+            df[title_col] = titles
+            df[text_col] = texts
 
             # Drop the _content/_file column as it's no longer needed in JSON
             df = df.drop(columns=[col])
@@ -281,19 +346,14 @@ def process_story(df, christmas_tree=False):
     # (<h2 class="step-question"> / <h2 class="title-card-heading">), and inline
     # links do not belong in a heading, so [[term]] in the question is left
     # literal. Not alt_text, button labels, or coordinates either. layer_name is
-    # None because this is step prose, not a layer panel.
+    # None because this is step prose, not a layer panel. Bare titles are not
+    # auto-linked here: a link could land inside markdown link syntax.
     if 'answer' in df.columns:
-        for idx, row in df.iterrows():
-            cell_value = row['answer']
-            if cell_value and str(cell_value).strip():
-                step_num = row.get('step', 'unknown')
-                df.at[idx, 'answer'] = process_glossary_links(
-                    str(cell_value),
-                    glossary_terms,
-                    glossary_warnings,
-                    step_num,
-                    None
-                )
+        df['answer'] = [
+            glossary.link(str(cell_value), glossary_warnings, step_num, None, auto_link=False)
+            if cell_value and str(cell_value).strip() else cell_value
+            for cell_value, step_num in zip(df['answer'], steps)
+        ]
 
     # Set default coordinates for empty values
     coordinate_defaults = {'x': '0.5', 'y': '0.5', 'zoom': '1'}
@@ -304,13 +364,18 @@ def process_story(df, christmas_tree=False):
             # Set defaults for empty or 'nan' values
             df.loc[df[col].isin(['', 'nan']), col] = default
 
-    # Collect all warnings for intro display
+    # Collect all warnings for intro display, in one pass over the steps
     all_warnings = []
-    for idx, row in df.iterrows():
-        step_num = row.get('step', 'unknown')
-
+    # A "Content Missing" panel title marks a missing markdown file
+    content_missing_label = get_lang_string('errors.object_warnings.content_missing_label')
+    layer_columns = [
+        (layer[-1], df[f'{layer}_title'].tolist(),
+         df[f'{layer}_text'].tolist() if f'{layer}_text' in df.columns else [''] * len(df))
+        for layer in ('layer1', 'layer2') if f'{layer}_title' in df.columns
+    ]
+    for pos, (step_num, viewer_warning) in enumerate(zip(steps, df['viewer_warning'])):
         # Check for viewer warnings (missing object/IIIF)
-        viewer_warning = row.get('viewer_warning', '').strip()
+        viewer_warning = viewer_warning.strip()
         if viewer_warning:
             all_warnings.append({
                 'step': step_num,
@@ -319,33 +384,24 @@ def process_story(df, christmas_tree=False):
             })
 
         # Check for panel content warnings (missing markdown files)
-        # Look for "Content Missing" title which indicates missing files
-        content_missing_label = get_lang_string('errors.object_warnings.content_missing_label')
-        for layer in ['layer1', 'layer2']:
-            title_col = f'{layer}_title'
-            if title_col in row and row[title_col] == content_missing_label:
-                # Extract the filename from the error HTML in the text column
-                text_col = f'{layer}_text'
-                text = row.get(text_col, '')
+        for layer_num, titles, texts in layer_columns:
+            if titles[pos] == content_missing_label:
                 # Extract filename from the HTML (it's between <strong> tags)
-                filename_match = re.search(r'<strong>(.*?)</strong>', text)
-                # Get layer number for display (1 or 2)
-                layer_num = layer[-1]  # Get '1' or '2' from 'layer1' or 'layer2'
+                filename_match = STRONG_PATTERN.search(texts[pos])
                 if filename_match:
                     # Extract content_file_missing message from HTML
                     message = filename_match.group(1)
-                    all_warnings.append({
-                        'step': step_num,
-                        'type': 'panel',
-                        'message': message
-                    })
                 else:
                     # Fallback if regex fails
-                    all_warnings.append({
-                        'step': step_num,
-                        'type': 'panel',
-                        'message': get_lang_string('errors.object_warnings.layer_file_missing', layer_num=layer_num)
-                    })
+                    message = get_lang_string('errors.object_warnings.layer_file_missing', layer_num=layer_num)
+                all_warnings.append({
+                    'step': step_num,
+                    'type': 'panel',
+                    'message': message
+                })
+
+    # Add missing panel file warnings
+    all_warnings.extend(panel_warnings)
 
     # Add glossary link warnings
     all_warnings.extend(glossary_warnings)
@@ -355,22 +411,16 @@ def process_story(df, christmas_tree=False):
 
     # Store warnings in dataframe as metadata (will be added to JSON)
     df.attrs['viewer_warnings'] = all_warnings
+    # Log-only warnings, for csv_to_json.py --check (not added to JSON)
+    df.attrs['step_warnings'] = step_warnings
+    df.attrs['objects'] = list(story_objects.values())
 
     # Check for LaTeX content across all steps. Scans every documented LaTeX
     # surface ("Where LaTeX Works" in the markdown-syntax docs): step
-    # question/answer prose and resolved layer content (*_text columns).
-    latex_detected = False
-    for idx, row in df.iterrows():
-        for col in df.columns:
-            if col in ('question', 'answer') or col.endswith('_text'):
-                text = str(row.get(col, ''))
-                if text and has_latex(text):
-                    latex_detected = True
-                    break
-        if latex_detected:
-            break
-
-    df.attrs['has_latex'] = latex_detected
+    # question/answer prose and resolved layer content (*_text columns),
+    # all cells in one scan.
+    latex_columns = [col for col in df.columns if col in ('question', 'answer') or col.endswith('_text')]
+    df.attrs['has_latex'] = texts_have_latex(df[latex_columns].astype(str).to_numpy().ravel())
 
     # Christmas Tree Mode: Inject fake warnings for testing
     if christmas_tree:
@@ -0,0 +1,268 @@
+"""
+Build Profiling (--profile / --profile-network)
+
+This module deals with answering "why is my build slow?" with data rather
+than guesses. `csv_to_json.py`, `generate_collections.py`,
+`generate_iiif.py` and `process_audio.py` accept `--profile`, which wraps
+the step in `profile_stage()` and writes, into `_build-profile/`:
+
+- `{stage}.prof` — the full cProfile data, for `python -m pstats`,
+  snakeviz or any other cProfile viewer
+- `{stage}-hotspots.txt` — the functions in Telar's own code (`scripts/`)
+  that took the most time, flat, with own time, cumulative time and call
+  counts — usually enough to see which step of the pipeline is at fault
+- `{stage}-memory.txt` — peak traced memory and the source lines that
+  allocated the most, from a tracemalloc snapshot taken at the end
+
+`--profile-network` adds `{stage}-network.txt`, which attributes time spent
+waiting on remote servers to each host: IIIF manifests, remote images,
+Google Sheets, the demo bundle. It works by timing every
+`urllib.request.urlopen()` call and the reads from its response, which is
+how all of the pipeline's network access is done. The two flags can be
+used together or apart.
+
+Profiling has a cost: tracemalloc roughly doubles the run time, so timings
+in a `--profile` run are best read relative to each other. Story CSVs are
+converted in one process while profiling, so that their work shows up in
+the profile instead of in worker processes.
+
+`_build-profile/` starts with an underscore, so Jekyll does not publish it.
+
+Version: v1.6.0
+"""
+
+import os
+import time
+import pstats
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+PROFILE_DIR = Path('_build-profile')
+
+# Rows in the hotspot and memory summaries
+TOP_N = 30
+
+# Telar's own code: the scripts directory this package lives in
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def add_profile_arguments(parser):
+    """
+    Add --profile and --profile-network to a script's argument parser.
+
+    Args:
+        parser: argparse.ArgumentParser
+    """
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=f'Write cProfile, hotspot and memory reports for this step to {PROFILE_DIR}/'
+    )
+    parser.add_argument(
+        '--profile-network',
+        action='store_true',
+        help=f'Write time spent on each remote host to {PROFILE_DIR}/'
+    )
+
+
+class NetworkLog:
+    """Per-host totals of requests made through urllib.request.urlopen()."""
+
+    def __init__(self):
+        self.hosts = {}
+
+    def add(self, host, seconds, nbytes=0, requests=0, errors=0):
+        entry = self.hosts.setdefault(host, {'requests': 0, 'errors': 0, 'seconds': 0.0, 'bytes': 0})
+        entry['requests'] += requests
+        entry['errors'] += errors
+        entry['seconds'] += seconds
+        entry['bytes'] += nbytes
+
+    def report(self):
+        """
+        Format the totals as a table, slowest host first.
+
+        Returns:
+            str
+        """
+        lines = [f"{'seconds':>9}  {'requests':>8}  {'errors':>6}  {'KB':>9}  host"]
+        ordered = sorted(self.hosts.items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for host, entry in ordered:
+            lines.append(
+                f"{entry['seconds']:9.2f}  {entry['requests']:8d}  {entry['errors']:6d}  "
+                f"{entry['bytes'] / 1024:9.1f}  {host}"
+            )
+        total = sum(entry['seconds'] for entry in self.hosts.values())
+        lines.append(f"{total:9.2f}  total")
+        return '\n'.join(lines) + '\n'
+
+
+class _TimedResponse:
+    """Response wrapper that adds the time spent reading to the host's total."""
+
+    def __init__(self, response, host, log):
+        self._response = response
+        self._host = host
+        self._log = log
+
+    def read(self, *args, **kwargs):
+        start = time.perf_counter()
+        data = self._response.read(*args, **kwargs)
+        self._log.add(self._host, time.perf_counter() - start, len(data))
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._response.__exit__(*exc_info)
+
+    def __iter__(self):
+        return iter(self._response)
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+@contextmanager
+def track_network():
+    """
+    Time every urllib.request.urlopen() call made while the block runs.
+
+    Yields:
+        NetworkLog: filled in per host as requests complete
+    """
+    import urllib.request
+
+    log = NetworkLog()
+    original = urllib.request.urlopen
+
+    def timed_urlopen(url, *args, **kwargs):
+        full_url = url.full_url if isinstance(url, urllib.request.Request) else str(url)
+        host = urlparse(full_url).netloc or full_url
+        start = time.perf_counter()
+        try:
+            response = original(url, *args, **kwargs)
+        except Exception:
+            log.add(host, time.perf_counter() - start, requests=1, errors=1)
+            raise
+        log.add(host, time.perf_counter() - start, requests=1)
+        return _TimedResponse(response, host, log)
+
+    urllib.request.urlopen = timed_urlopen
+    try:
+        yield log
+    finally:
+        urllib.request.urlopen = original
+
+
+def _is_own_code(filename):
+    return os.path.abspath(filename).startswith(SCRIPTS_DIR + os.sep)
+
+
+def hotspot_report(stats, top_n=TOP_N):
+    """
+    Format the functions in Telar's own code with the most own time.
+
+    Args:
+        stats: pstats.Stats of the run
+        top_n: Number of rows
+
+    Returns:
+        str
+    """
+    rows = []
+    for (filename, lineno, function), (_, calls, own, cumulative, _) in stats.stats.items():
+        if _is_own_code(filename):
+            where = os.path.relpath(filename, SCRIPTS_DIR)
+            rows.append((own, cumulative, calls, f'{where}:{lineno}({function})'))
+    rows.sort(reverse=True)
+
+    lines = [f"Total time: {stats.total_tt:.2f}s",
+             f"{'own s':>9}  {'cum s':>9}  {'calls':>9}  function"]
+    for own, cumulative, calls, name in rows[:top_n]:
+        lines.append(f"{own:9.3f}  {cumulative:9.3f}  {calls:9d}  {name}")
+    return '\n'.join(lines) + '\n'
+
+
+def memory_report(snapshot, peak, top_n=TOP_N):
+    """
+    Format peak traced memory and the lines that allocated the most.
+
+    Args:
+        snapshot: tracemalloc.Snapshot taken at the end of the run
+        peak: Peak traced size in bytes
+        top_n: Number of rows
+
+    Returns:
+        str
+    """
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*'),
+    ])
+    lines = [f"Peak traced memory: {peak / (1024 * 1024):.1f} MB",
+             f"{'KB':>10}  {'blocks':>8}  line (allocations still held at the end)"]
+    for stat in snapshot.statistics('lineno')[:top_n]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:10.1f}  {stat.count:8d}  {frame.filename}:{frame.lineno}")
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def profile_stage(name, profile=True, network=False, output_dir=PROFILE_DIR):
+    """
+    Profile the block and write the reports for one build step.
+
+    Does nothing (beyond running the block) when both flags are off.
+
+    Args:
+        name: Step name used in the report file names (e.g. 'csv_to_json')
+        profile: Write cProfile, hotspot and memory reports
+        network: Write the per-host network report
+        output_dir: Directory for the reports
+    """
+    if not (profile or network):
+        yield
+        return
+
+    output_dir = Path(output_dir)
+    profiler = cProfile.Profile() if profile else None
+    was_tracing = tracemalloc.is_tracing()
+    network_cm = track_network() if network else None
+    log = network_cm.__enter__() if network_cm else None
+
+    if profile:
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        written = []
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if profile:
+            profiler.disable()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if not was_tracing:
+                tracemalloc.stop()
+
+            prof_path = output_dir / f'{name}.prof'
+            profiler.dump_stats(prof_path)
+            hotspots_path = output_dir / f'{name}-hotspots.txt'
+            hotspots_path.write_text(hotspot_report(pstats.Stats(profiler)), encoding='utf-8')
+            memory_path = output_dir / f'{name}-memory.txt'
+            memory_path.write_text(memory_report(snapshot, peak), encoding='utf-8')
+            written += [prof_path, hotspots_path, memory_path]
+        if network_cm:
+            network_cm.__exit__(None, None, None)
+            network_path = output_dir / f'{name}-network.txt'
+            network_path.write_text(log.report(), encoding='utf-8')
+            written.append(network_path)
+        for path in written:
+            print(f"  [INFO] Profile report: {path}")
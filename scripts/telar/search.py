@@ -36,8 +36,6 @@ import os
 import sys
 from pathlib import Path
 
-import yaml
-
 # search.py lives inside the telar package but is also run as a standalone
 # script from build.yml (`python scripts/telar/search.py`). In that mode Python
 # puts this file's own directory (scripts/telar/) on sys.path, which makes the
@@ -49,6 +47,7 @@ _pkg_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.dirname(_pkg_dir))
 sys.path[:] = [p for p in sys.path if os.path.abspath(p) != _pkg_dir]
 
+from telar.config import load_site_config
 from telar.media_type import detect_media_type
 
 
@@ -61,13 +60,8 @@ def _media_type_of(obj):
 
 
 def load_config():
-    """Load _config.yml and return relevant settings."""
-    config_path = Path('_config.yml')
-    if not config_path.exists():
-        return {}
-
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    """Load _config.yml and return relevant settings (shared cached parse)."""
+    return load_site_config()
 
 
 def is_browse_and_search_enabled(config):
@@ -167,6 +161,8 @@ def generate_search_data(objects_path='_data/objects.json', output_path='search-
 
     with open(objects_file, 'r', encoding='utf-8') as f:
         objects = json.load(f)
+    # Demo objects merged in by telar.demo are not indexed
+    objects = [obj for obj in objects if not obj.get('_demo')]
 
     if not objects:
         print("  [INFO] No objects found, skipping search index generation")
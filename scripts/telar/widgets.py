@@ -17,7 +17,7 @@ Each widget type has its own parser:
 - `parse_carousel_widget()` expects `key: value` blocks separated by `---`,
   where each block defines one slide (image, alt, caption, credit). It
   validates that images exist using `validate_image_path()` from the images
-  module, and calls `get_image_dimensions()` to calculate aspect ratios.
+  module, and calls `get_image_dimensions_many()` to calculate aspect ratios.
   The maximum aspect ratio across all slides determines the carousel's
   CSS size class (compact, default, tall, or portrait). It also resolves
   each slide's final `src`: absolute http(s) URLs pass through unchanged,
@@ -30,9 +30,18 @@ Each widget type has its own parser:
   titled sections. Tabs require 2-4 sections; accordions require 2-6.
   Each section's body is converted from markdown to HTML.
 
-The module-level `_widget_counter` integer generates unique IDs for each
-widget instance within a build, ensuring that multiple widgets on the
-same page don't collide.
+In validate-only runs (`csv_to_json.py --check`, see telar.check) widgets
+are parsed and validated but not rendered, section bodies are not converted
+to HTML and carousel image dimensions are not looked up.
+
+Widget IDs are derived from the widget's type and content, so a page
+renders to the same bytes on every build no matter how many widgets other
+pages had before it (a build-wide counter shifted every later ID whenever
+one widget was added, defeating the build caches). `reset_widget_ids()`
+starts a new page; an identical widget repeated on the same page gets a
+`-2`, `-3`… suffix. The page's IDs are kept per thread, so pages rendered
+in concurrent build threads do not share them. Called without content, `get_widget_id()` still
+numbers widgets from the module-level `_widget_counter`.
 
 `parse_key_value_block()` is a simple helper that extracts `key: value`
 pairs from a text block, used by the carousel parser.
@@ -45,18 +54,35 @@ Version: v1.6.0
 """
 
 import html
+import hashlib
 import re
-import markdown
+import threading
 from html.parser import HTMLParser
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from telar.config import get_lang_string
-from telar.images import validate_image_path, get_image_dimensions
+from telar.images import validate_image_path, get_image_dimensions_many, WRAPPING_PARAGRAPH_PATTERN
+from telar.build_ledger import record_input
+from telar.check import checking
+
 
+# A :::type ... ::: block
+WIDGET_PATTERN = re.compile(r':::(\w+)\s*\n(.*?)\n:::', re.DOTALL)
 
 # Widget instance counter for unique IDs within a build
 _widget_counter = 0
 
+# Content-derived IDs already used on the current page, per thread ('ids'
+# attribute)
+_page_local = threading.local()
+
+
+def _page_widget_ids():
+    ids = getattr(_page_local, 'ids', None)
+    if ids is None:
+        ids = _page_local.ids = set()
+    return ids
+
 
 # Inline tags a caption or credit realistically needs. Everything else
 # (script, img, iframe, block elements, …) is dropped to text, and all
@@ -121,11 +147,65 @@ def sanitize_caption_html(rendered_html):
     return parser.get_html()
 
 
-def get_widget_id():
-    """Generate unique widget ID for this build"""
+def get_widget_id(content=None):
+    """
+    Generate a unique widget ID.
+
+    Args:
+        content: Widget type and source text; when given, the ID is derived
+            from it and is unique within the current page (see
+            reset_widget_ids()). Without it, IDs are numbered build-wide.
+
+    Returns:
+        str: e.g. "widget-3f2a9c01b7" or "widget-1"
+    """
     global _widget_counter
-    _widget_counter += 1
-    return f"widget-{_widget_counter}"
+    if content is None:
+        _widget_counter += 1
+        return f"widget-{_widget_counter}"
+
+    base = f"widget-{hashlib.sha1(content.encode('utf-8')).hexdigest()[:10]}"
+    page_ids = _page_widget_ids()
+    widget_id = base
+    repeat = 1
+    while widget_id in page_ids:
+        repeat += 1
+        widget_id = f"{base}-{repeat}"
+    page_ids.add(widget_id)
+    return widget_id
+
+
+def reset_widget_ids():
+    """Start a new page: content-derived widget IDs may be reused from here on."""
+    _page_widget_ids().clear()
+
+
+def used_widget_ids():
+    """
+    Content-derived widget IDs taken on the current page.
+
+    Returns:
+        set: A copy of the IDs
+    """
+    return set(_page_widget_ids())
+
+
+def claim_widget_ids(widget_ids):
+    """
+    Take IDs rendered earlier (a cached panel) on the current page.
+
+    Args:
+        widget_ids: IDs the cached HTML uses
+
+    Returns:
+        bool: True if all were free and are now taken; False (nothing
+        taken) if any is already in use, so the panel must be re-rendered
+    """
+    page_ids = _page_widget_ids()
+    if page_ids.intersection(widget_ids):
+        return False
+    page_ids.update(widget_ids)
+    return True
 
 
 def parse_key_value_block(content):
@@ -166,6 +246,9 @@ def parse_carousel_widget(content, file_path, warnings_list):
     Returns:
         dict: Parsed carousel data with 'items' list and 'size_class'
     """
+    # telar.markdown imports this module, so its engine is imported on use
+    from telar.markdown import render_markdown
+
     items = []
     blocks = content.split('---')
 
@@ -216,20 +299,21 @@ def parse_carousel_widget(content, file_path, warnings_list):
         # sanitise the result so an author-supplied <script>/<img onerror>/etc.
         # cannot reach the rendered page through these fields.
         if 'caption' in data:
-            caption_html = markdown.markdown(data['caption'])
-            stripped = re.sub(r'^<p>(.*)</p>$', r'\1', caption_html.strip())
+            caption_html = render_markdown(data['caption'])
+            stripped = WRAPPING_PARAGRAPH_PATTERN.sub(r'\1', caption_html.strip())
             data['caption'] = sanitize_caption_html(stripped)
         if 'credit' in data:
-            credit_html = markdown.markdown(data['credit'])
-            stripped = re.sub(r'^<p>(.*)</p>$', r'\1', credit_html.strip())
+            credit_html = render_markdown(data['credit'])
+            stripped = WRAPPING_PARAGRAPH_PATTERN.sub(r'\1', credit_html.strip())
             data['credit'] = sanitize_caption_html(stripped)
 
         items.append(data)
 
-    # Analyze aspect ratios to determine optimal carousel height
+    # Analyze aspect ratios to determine optimal carousel height (skipped when
+    # only validating, since remote images would be fetched)
     aspect_ratios = []
-    for item in items:
-        dimensions = get_image_dimensions(item['image'])
+    all_dimensions = [] if checking() else get_image_dimensions_many([item['image'] for item in items])
+    for dimensions in all_dimensions:
         if dimensions:
             width, height = dimensions
             if width > 0:  # Avoid division by zero
@@ -262,6 +346,8 @@ def parse_markdown_sections(content):
     Returns:
         list: List of dicts with 'title' and 'content' keys
     """
+    from telar.markdown import render_markdown, PANEL_EXTENSIONS
+
     sections = []
     current_section = None
 
@@ -284,8 +370,11 @@ def parse_markdown_sections(content):
     # Convert content lists to strings and process markdown
     for section in sections:
         content_text = '\n'.join(section['content']).strip()
-        # Convert markdown to HTML
-        section['content_html'] = markdown.markdown(content_text, extensions=['extra', 'nl2br'])
+        # Convert markdown to HTML (validation only needs to know it is non-empty)
+        if checking():
+            section['content_html'] = content_text
+        else:
+            section['content_html'] = render_markdown(content_text, PANEL_EXTENSIONS)
 
     return sections
 
@@ -393,12 +482,14 @@ def parse_bibliography_widget(content, file_path, warnings_list):
     Returns:
         dict: Parsed bibliography data with 'entries' list
     """
+    from telar.markdown import render_markdown, PANEL_EXTENSIONS
+
     entries = []
     for block in content.split('\n\n'):
         block = block.strip()
         if not block:
             continue
-        html = markdown.markdown(block, extensions=['extra', 'nl2br'])
+        html = block if checking() else render_markdown(block, PANEL_EXTENSIONS)
         entries.append({'content_html': html})
 
     if not entries:
@@ -434,6 +525,7 @@ def render_widget_html(widget_type, widget_data, widget_id):
             loader=FileSystemLoader(str(template_path)),
             autoescape=select_autoescape(['html', 'xml']),
         )
+        record_input(template_path / f'{widget_type}.html')
         template = env.get_template(f'{widget_type}.html')
 
         # Render with data. Control labels are resolved from the language pack
@@ -473,13 +565,10 @@ def process_widgets(text, file_path, warnings_list):
     Returns:
         str: Text with widgets replaced by rendered HTML
     """
-    # Pattern to match :::type ... :::
-    pattern = r':::(\w+)\s*\n(.*?)\n:::'
-
     def replace_widget(match):
         widget_type = match.group(1).lower()
         content = match.group(2)
-        widget_id = get_widget_id()
+        widget_id = get_widget_id(f'{widget_type}\n{content}')
 
         # Parse based on widget type
         widget_parsers = {
@@ -505,9 +594,13 @@ def process_widgets(text, file_path, warnings_list):
         parser = widget_parsers[widget_type]
         widget_data = parser(content, file_path, warnings_list)
 
+        # Validate-only runs (csv_to_json.py --check) need the warnings, not the HTML
+        if checking():
+            return ''
+
         # Render HTML
         html = render_widget_html(widget_type, widget_data, widget_id)
 
         return html
 
-    return re.sub(pattern, replace_widget, text, flags=re.DOTALL)
+    return WIDGET_PATTERN.sub(replace_widget, text)
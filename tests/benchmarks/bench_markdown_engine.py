@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: Reusable Markdown Engine vs markdown.markdown()
+
+Renders N short panel-like cells (default 10,000) with a fresh
+`markdown.markdown()` call per cell, as the build used to, and with
+telar.markdown.render_markdown(), which keeps one configured `Markdown`
+instance per extension profile, then checks the outputs are identical.
+Also times process_images() and process_widgets() over the same cells,
+the other two per-cell steps of the panel pipeline.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_markdown_engine.py [--cells N]
+
+Not collected by pytest (the file name does not start with test_).
+
+Version: v1.6.0
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import markdown  # noqa: E402
+
+from telar.markdown import render_markdown, PANEL_EXTENSIONS  # noqa: E402
+from telar.images import process_images  # noqa: E402
+from telar.widgets import process_widgets  # noqa: E402
+
+
+def make_cells(count):
+    return [
+        f"Step {n}: the **map** of *1580* shows [the river](https://example.org/{n}).\n"
+        f"A second line with `code` and a footnote.[^{n}]\n\n[^{n}]: Source {n}."
+        for n in range(count)
+    ]
+
+
+def timed(label, func, cells):
+    start = time.perf_counter()
+    results = [func(cell) for cell in cells]
+    seconds = time.perf_counter() - start
+    print(f"  {label:<32} {seconds:8.3f} s  ({seconds / len(cells) * 1e6:7.1f} µs/cell)")
+    return results, seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--cells', type=int, default=10000, help='Number of cells (default: 10000)')
+    args = parser.parse_args(argv)
+
+    cells = make_cells(args.cells)
+    print(f"Rendering {len(cells)} cells")
+    fresh, fresh_s = timed('markdown.markdown() per cell',
+                           lambda cell: markdown.markdown(cell, extensions=list(PANEL_EXTENSIONS)), cells)
+    reused, reused_s = timed('render_markdown()',
+                             lambda cell: render_markdown(cell, PANEL_EXTENSIONS), cells)
+    timed('process_images()', process_images, cells)
+    timed('process_widgets()', lambda cell: process_widgets(cell, 'bench', []), cells)
+
+    if fresh != reused:
+        print("❌ Outputs differ")
+        return 1
+    print(f"✓ Identical output, {fresh_s / reused_s:.1f}x faster")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
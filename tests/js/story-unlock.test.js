@@ -78,6 +78,19 @@ describe('applyDecryptedPayload', () => {
     expect(unlocked).toBe(true);
   });
 
+  it('publishes the objects listed in the payload metadata', () => {
+    const objects = [{ object_id: 'fixture-obj', title: 'Fixture object' }];
+    const steps = [{ ...fixture.payload.steps[0], objects }, ...fixture.payload.steps.slice(1)];
+    window.objectsData = [];
+
+    window.TelarUnlock.applyDecryptedPayload({ ...fixture.payload, steps }, fixture.key);
+    expect(window.objectsData).toEqual(objects);
+
+    window.objectsData = [{ object_id: 'catalogue' }];
+    window.TelarUnlock.applyDecryptedPayload(fixture.payload, fixture.key);
+    expect(window.objectsData).toEqual([{ object_id: 'catalogue' }]);
+  });
+
   it('refuses a payload that is not a {steps, html} envelope', () => {
     expect(() =>
       window.TelarUnlock.applyDecryptedPayload(fixture.payload.steps, fixture.key)
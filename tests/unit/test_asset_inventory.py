@@ -0,0 +1,142 @@
+"""
+Unit Tests for the Asset Directory Inventory
+
+This module tests telar.asset_inventory, the cached one-pass listing of
+telar-content/objects that replaces per-extension exists() probes across
+the build.
+
+Key behavior:
+- find_object_file tries extensions in order and matches exact file names
+- Where the filesystem ignores case, names match regardless of case
+- Sizes come from the listing
+- A settled listing is reused until the directory mtime changes
+- A listing taken too close to the directory mtime falls back to stat calls
+- stem_index groups files by stem; missing directories are empty
+- file_exists answers from the parent directory's listing
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar import asset_inventory
+from telar.asset_inventory import find_object_file, get_inventory, stem_index, invalidate, file_exists
+
+
+def settle(directory):
+    """Backdate a directory's mtime so its listing is trusted from cache."""
+    past = time.time_ns() - 60 * 10**9
+    os.utime(directory, ns=(past, past))
+    return past
+
+
+class TestFindObjectFile:
+    def test_extension_priority_and_size(self, tmp_path):
+        (tmp_path / 'song.ogg').write_bytes(b'x' * 10)
+        (tmp_path / 'song.MP3').write_bytes(b'x' * 20)
+        settle(tmp_path)
+        match = find_object_file('song', ['.mp3', '.ogg', '.MP3'], tmp_path)
+        assert match.path == tmp_path / 'song.ogg'
+        assert match.size == 10
+
+    def test_exact_names_only(self, tmp_path):
+        (tmp_path / 'Song.mp3').write_text('')
+        settle(tmp_path)
+        assert find_object_file('song', ['.mp3'], tmp_path) is None
+        assert find_object_file('Song', ['.mp3'], tmp_path) is not None
+
+    def test_case_folding_filesystem_matches_any_case(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(asset_inventory, '_folds_case', lambda directory, names: True)
+        (tmp_path / 'Song.MP3').write_bytes(b'x' * 20)
+        settle(tmp_path)
+        match = find_object_file('song', ['.ogg', '.mp3'], tmp_path)
+        assert match.path == tmp_path / 'song.mp3'
+        assert match.size == 20
+        assert file_exists(tmp_path / 'SONG.mp3')
+        assert find_object_file('other', ['.mp3'], tmp_path) is None
+
+    def test_case_probe_matches_the_filesystem(self, tmp_path):
+        (tmp_path / 'Song.mp3').write_text('')
+        settle(tmp_path)
+        assert get_inventory(tmp_path)['folds_case'] == (tmp_path / 'sONG.MP3').exists()
+
+    def test_missing_directory(self, tmp_path):
+        assert find_object_file('song', ['.mp3'], tmp_path / 'missing') is None
+        assert get_inventory(tmp_path / 'missing') is None
+
+    def test_directories_are_not_files(self, tmp_path):
+        (tmp_path / 'song.mp3').mkdir()
+        settle(tmp_path)
+        assert find_object_file('song', ['.mp3'], tmp_path) is None
+
+
+class TestCaching:
+    def test_settled_listing_is_reused_until_mtime_changes(self, tmp_path):
+        (tmp_path / 'a.jpg').write_text('')
+        past = settle(tmp_path)
+        assert get_inventory(tmp_path)['settled']
+
+        # A new file with the mtime forced back: the cached listing is served
+        (tmp_path / 'b.jpg').write_text('')
+        os.utime(tmp_path, ns=(past, past))
+        assert find_object_file('b', ['.jpg'], tmp_path) is None
+
+        invalidate(tmp_path)
+        assert find_object_file('b', ['.jpg'], tmp_path) is not None
+
+    def test_mtime_change_triggers_relisting(self, tmp_path):
+        (tmp_path / 'a.jpg').write_text('')
+        past = settle(tmp_path)
+        get_inventory(tmp_path)
+        (tmp_path / 'b.jpg').write_text('')
+        os.utime(tmp_path, ns=(past + 10**9, past + 10**9))
+        assert find_object_file('b', ['.jpg'], tmp_path) is not None
+
+    def test_fresh_directory_falls_back_to_stat(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(asset_inventory, 'RACY_WINDOW_NS', 3600 * 10**9)
+        (tmp_path / 'a.jpg').write_text('')
+        assert not get_inventory(tmp_path)['settled']
+
+        # Same mtime tick as the listing: only a stat can see the new file
+        mtime = tmp_path.stat().st_mtime_ns
+        (tmp_path / 'b.jpg').write_text('')
+        os.utime(tmp_path, ns=(mtime, mtime))
+        assert find_object_file('b', ['.jpg'], tmp_path) is not None
+        assert 'b' in stem_index(tmp_path)
+
+
+class TestStemIndex:
+    def test_groups_files_by_stem(self, tmp_path):
+        for name in ('obj.jpg', 'obj.mp3', 'other.png'):
+            (tmp_path / name).write_text('')
+        settle(tmp_path)
+        index = stem_index(tmp_path)
+        assert sorted(p.name for p in index['obj']) == ['obj.jpg', 'obj.mp3']
+        assert get_inventory(tmp_path)['by_folded_stem']['other'] == index['other']
+
+    def test_missing_directory(self, tmp_path):
+        assert stem_index(tmp_path / 'missing') == {}
+
+
+class TestFileExists:
+    def test_answers_from_listing(self, tmp_path, monkeypatch):
+        (tmp_path / 'photo.jpg').write_text('')
+        (tmp_path / 'folder.jpg').mkdir()
+        settle(tmp_path)
+        monkeypatch.setattr(type(tmp_path), 'is_file', lambda self: pytest.fail('stat call'))
+        assert file_exists(tmp_path / 'photo.jpg')
+        assert not file_exists(tmp_path / 'Photo.jpg')
+        assert not file_exists(tmp_path / 'folder.jpg')
+        assert not file_exists(tmp_path / 'missing' / 'photo.jpg')
+
+    def test_fresh_directory_falls_back_to_stat(self, tmp_path):
+        assert not file_exists(tmp_path / 'new.png')
+        (tmp_path / 'new.png').write_text('')
+        assert file_exists(tmp_path / 'new.png')
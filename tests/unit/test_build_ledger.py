@@ -0,0 +1,297 @@
+"""
+Unit Tests for Incremental Builds (Build Ledger)
+
+This module tests telar.build_ledger and core._convert_incremental, which
+skip a CSV-to-JSON conversion when none of the files it read have changed.
+
+Key behavior:
+- A second build with unchanged inputs does not run the processor
+- Editing a markdown panel, creating a previously missing file, adding a
+  file to a listed directory or changing a build key triggers a rebuild
+- A deleted or rewritten output is rebuilt
+- Same-size edits inside the mtime window are caught by hashing
+- Volatile conversions (network failures) are not recorded
+- The ledger survives a save/load round trip; a corrupt ledger is ignored
+- Conversions tracked in concurrent threads record only their own inputs
+- The language key digests the strings the conversion uses
+- With a demo bundle, a second build converts nothing and rewrites no
+  data file; removing the bundle removes the merged demo entries
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import threading
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.core import _convert_incremental, _ledger_keys, build_data
+from telar.markdown import read_markdown_file
+from telar.asset_inventory import get_inventory
+from telar.build_ledger import (
+    load_ledger, save_ledger, is_up_to_date, track_inputs, record_input,
+    mark_volatile, record_build, LEDGER_PATH
+)
+
+KEYS = {'code': 'c1', 'config': 'k1', 'language': 'l1'}
+
+
+def backdate(path, seconds=60):
+    """Move a file's mtime into the past so its fingerprint is trusted."""
+    past = time.time_ns() - seconds * 10**9
+    os.utime(path, ns=(past, past))
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'telar-content' / 'texts').mkdir(parents=True)
+    (tmp_path / 'telar-content' / 'objects').mkdir(parents=True)
+    (tmp_path / '_data').mkdir()
+    (tmp_path / 'story.csv').write_text('step,layer1_content\n1,panel.md\n', encoding='utf-8')
+    (tmp_path / 'telar-content' / 'texts' / 'panel.md').write_text('Hello', encoding='utf-8')
+    return tmp_path
+
+
+class Processor:
+    """Story-like processor that reads its panels and the objects folder."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, df):
+        self.calls += 1
+        get_inventory('telar-content/objects')
+        for name in df['layer1_content']:
+            result = read_markdown_file(name)
+            df['layer1_content'] = result['content'] if result else ''
+        return df
+
+
+def build(ledger, processor, keys=KEYS, force=False):
+    return _convert_incremental(ledger, keys, 'story.csv', '_data/story.json',
+                                processor, force=force)
+
+
+def settle_all(site):
+    for path in ('story.csv', 'telar-content/texts/panel.md', '_data/story.json'):
+        backdate(site / path)
+
+
+class TestConvertIncremental:
+    def test_unchanged_inputs_are_skipped(self, site, capsys):
+        ledger = load_ledger()
+        processor = Processor()
+        assert build(ledger, processor)
+        settle_all(site)
+        assert build(ledger, processor)
+        assert processor.calls == 1
+        assert 'Up to date: _data/story.json' in capsys.readouterr().out
+
+    def test_force_rebuilds(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+        build(ledger, processor, force=True)
+        assert processor.calls == 2
+
+    def test_markdown_edit_triggers_rebuild(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+        settle_all(site)
+        (site / 'telar-content' / 'texts' / 'panel.md').write_text('Changed', encoding='utf-8')
+        build(ledger, processor)
+        assert processor.calls == 2
+
+    def test_same_size_edit_in_mtime_window_is_seen(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        panel = site / 'telar-content' / 'texts' / 'panel.md'
+        build(ledger, processor)
+        mtime = panel.stat().st_mtime_ns
+        panel.write_text('Jello', encoding='utf-8')
+        os.utime(panel, ns=(mtime, mtime))
+        build(ledger, processor)
+        assert processor.calls == 2
+
+    def test_missing_file_appearing_triggers_rebuild(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        (site / 'story.csv').write_text('step,layer1_content\n1,later.md\n', encoding='utf-8')
+        build(ledger, processor)
+        settle_all(site)
+        build(ledger, processor)
+        assert processor.calls == 1
+
+        (site / 'telar-content' / 'texts' / 'later.md').write_text('Now here', encoding='utf-8')
+        build(ledger, processor)
+        assert processor.calls == 2
+
+    def test_new_object_file_triggers_rebuild(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+        (site / 'telar-content' / 'objects' / 'new.jpg').write_bytes(b'')
+        build(ledger, processor)
+        assert processor.calls == 2
+
+    def test_key_change_triggers_rebuild(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+        build(ledger, processor, keys=dict(KEYS, config='k2'))
+        assert processor.calls == 2
+
+    def test_deleted_or_edited_output_is_rebuilt(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+        (site / '_data' / 'story.json').unlink()
+        build(ledger, processor)
+        (site / '_data' / 'story.json').write_text('[]', encoding='utf-8')
+        build(ledger, processor)
+        assert processor.calls == 3
+
+    def test_volatile_conversion_is_not_recorded(self, site):
+        ledger = load_ledger()
+
+        def flaky(df):
+            mark_volatile('manifest timed out')
+            return df
+
+        build(ledger, flaky)
+        assert '_data/story.json' not in ledger['outputs']
+        assert not is_up_to_date(ledger, '_data/story.json', KEYS)
+
+    def test_failed_conversion_is_forgotten(self, site):
+        ledger = load_ledger()
+        processor = Processor()
+        build(ledger, processor)
+
+        def broken(df):
+            raise ValueError('boom')
+
+        (site / 'story.csv').write_text('step,layer1_content\n2,panel.md\n', encoding='utf-8')
+        assert not build(ledger, broken)
+        assert '_data/story.json' not in ledger['outputs']
+
+
+class TestLedgerFile:
+    def test_round_trip_and_pruning(self, site):
+        ledger = load_ledger()
+        build(ledger, Processor())
+        (site / '_data' / 'gone.json').write_text('[]', encoding='utf-8')
+        with track_inputs() as tracked:
+            record_input('story.csv')
+        record_build(ledger, '_data/gone.json', tracked, KEYS)
+        (site / '_data' / 'gone.json').unlink()
+
+        save_ledger(ledger)
+        reloaded = load_ledger()
+        assert set(reloaded['outputs']) == {os.path.normpath('_data/story.json')}
+        assert is_up_to_date(reloaded, '_data/story.json', KEYS)
+
+    def test_corrupt_ledger_starts_empty(self, site):
+        LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+        LEDGER_PATH.write_text('{not json', encoding='utf-8')
+        assert load_ledger()['outputs'] == {}
+
+    def test_recording_outside_tracking_is_a_no_op(self, site):
+        record_input('anything.md')
+        mark_volatile('ignored')
+
+    def test_tracking_is_per_thread(self, site):
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def convert(name):
+            with track_inputs() as tracked:
+                barrier.wait()
+                record_input(f'{name}.csv')
+                barrier.wait()
+            results[name] = tracked['files']
+
+        threads = [threading.Thread(target=convert, args=(name,)) for name in ('a', 'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {'a': {'a.csv'}, 'b': {'b.csv'}}
+
+
+class TestLedgerKeys:
+    def test_language_key_follows_the_strings_in_use(self, site):
+        from telar.config import clear_language_cache
+        languages = site / '_data' / 'languages'
+        languages.mkdir()
+        (languages / 'en.yml').write_text('greeting: Hello\n', encoding='utf-8')
+        (languages / 'es.yml').write_text('greeting: Hola\n', encoding='utf-8')
+        (site / '_config.yml').write_text('telar_language: en\n', encoding='utf-8')
+        clear_language_cache()
+        try:
+            english = _ledger_keys()['language']
+            # Still converting with the English strings: the key must say so
+            (site / '_config.yml').write_text('telar_language: es\n', encoding='utf-8')
+            assert _ledger_keys()['language'] == english
+            clear_language_cache()
+            assert _ledger_keys()['language'] != english
+        finally:
+            clear_language_cache()
+
+
+class TestBuildDataWithDemo:
+    REPO = os.path.join(os.path.dirname(__file__), '..', '..')
+    BUNDLE = {
+        '_meta': {'telar_version': '1.6.0', 'language': 'en'},
+        'project': [{'order': 1, 'story_id': 'demo-one', 'title': 'Demo one'}],
+        'objects': {'demo-map': {'title': 'Demo map', 'source_url': ''}},
+        'stories': {'demo-one': {'steps': [{'step': 1, 'object': 'demo-map', 'question': 'Q',
+                                            'answer': 'A', 'layers': {}}]}},
+    }
+
+    @pytest.fixture
+    def demo_site(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        sheets = tmp_path / 'telar-content' / 'spreadsheets'
+        sheets.mkdir(parents=True)
+        for name in ('project.csv', 'objects.csv', 'blank_template.csv'):
+            shutil.copy(os.path.join(self.REPO, 'telar-content', 'spreadsheets', name), sheets)
+        (tmp_path / 'telar-content' / 'objects').mkdir()
+        (tmp_path / '_data').mkdir()
+        (tmp_path / '_demo_content').mkdir()
+        (tmp_path / '_demo_content' / 'telar-demo-bundle.json').write_text(
+            json.dumps(self.BUNDLE), encoding='utf-8')
+        return tmp_path
+
+    @staticmethod
+    def _data_files(site):
+        return {path.name: (path.stat().st_mtime_ns, path.read_text(encoding='utf-8'))
+                for path in sorted((site / '_data').glob('*.json'))}
+
+    def test_second_build_converts_nothing(self, demo_site, capsys):
+        build_data(jobs=1, fetch_demo=False)
+        assert capsys.readouterr().out.count('✓ Converted') == 3
+        project = json.loads((demo_site / '_data' / 'project.json').read_text(encoding='utf-8'))
+        assert [story['story_id'] for story in project[0]['stories']] == ['demo-one', 'blank_template', 'plantilla_en_blanco']
+        before = self._data_files(demo_site)
+
+        build_data(jobs=1, fetch_demo=False)
+        assert '✓ Converted' not in capsys.readouterr().out
+        assert self._data_files(demo_site) == before
+
+    def test_disabling_demo_removes_merged_entries(self, demo_site):
+        build_data(jobs=1, fetch_demo=False)
+        shutil.rmtree(demo_site / '_demo_content')
+        build_data(jobs=1, fetch_demo=False)
+        project = json.loads((demo_site / '_data' / 'project.json').read_text(encoding='utf-8'))
+        objects = json.loads((demo_site / '_data' / 'objects.json').read_text(encoding='utf-8'))
+        assert [story['story_id'] for story in project[0]['stories']] == ['blank_template', 'plantilla_en_blanco']
+        assert not any(obj.get('_demo') for obj in objects)
@@ -0,0 +1,221 @@
+"""
+Unit Tests for the Build State Store
+
+This module tests telar.build_state, the SQLite database in .telar-cache/
+that keeps the build ledger, stage fingerprints, fetched manifests, image
+dimensions, tile and audio keys, and stage timings between builds.
+
+Key behavior:
+- Entries round-trip as JSON per namespace; replace_namespace rewrites only
+  the entries that changed
+- A corrupt database is set aside and recreated
+- prune deletes entries by age and ledger entries whose output is gone
+- Reads refresh an entry's last use, so prune keeps entries still in use
+- Several processes can write to the database at once (WAL mode)
+- IIIF manifests are revalidated with conditional requests, and a stored
+  copy stands in for a 429
+- scripts/manage_cache.py prints stats and prunes
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+import urllib.error
+import urllib.request
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.build_state import BuildState, get_build_state, close_build_states, BUILD_DB_PATH
+from telar.processors.objects import _fetch_manifest
+import manage_cache
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = BuildState(tmp_path / 'build.db')
+    yield state
+    state.close()
+
+
+@pytest.fixture(autouse=True)
+def _close_states():
+    yield
+    close_build_states()
+
+
+class TestEntries:
+    def test_round_trip(self, state):
+        state.put('image_size', 'a.jpg', [10, 20])
+        state.put('tiles', 'a', {'sha256': 'x'})
+        assert state.get('image_size', 'a.jpg') == [10, 20]
+        assert state.get('image_size', 'missing', 'default') == 'default'
+        assert state.items('tiles') == {'a': {'sha256': 'x'}}
+        value, updated_ns = state.get_with_age('image_size', 'a.jpg')
+        assert value == [10, 20] and updated_ns <= time.time_ns()
+        state.delete('image_size', 'a.jpg')
+        assert state.get('image_size', 'a.jpg') is None
+
+    def test_replace_namespace_rewrites_only_changes(self, state):
+        state.replace_namespace('stage', {'iiif': {'in': 1}, 'audio': {'in': 2}})
+        _, iiif_written = state.get_with_age('stage', 'iiif')
+        time.sleep(0.01)
+        state.replace_namespace('stage', {'iiif': {'in': 1}, 'js': {'in': 3}})
+        assert state.items('stage') == {'iiif': {'in': 1}, 'js': {'in': 3}}
+        assert state.get_with_age('stage', 'iiif')[1] == iiif_written
+
+    def test_transaction_rolls_back_on_error(self, state):
+        with pytest.raises(RuntimeError):
+            with state.transaction():
+                state.put('peaks', 'a.mp3', {'key': 'x'})
+                raise RuntimeError('interrupted')
+        assert state.get('peaks', 'a.mp3') is None
+
+    def test_corrupt_database_is_recreated(self, tmp_path, capsys):
+        path = tmp_path / 'build.db'
+        path.write_bytes(b'not a database' * 100)
+        state = BuildState(path)
+        state.put('ledger', 'x', 1)
+        assert state.get('ledger', 'x') == 1
+        assert (tmp_path / 'build.db.corrupt').exists()
+        assert 'starting a new one' in capsys.readouterr().out
+        state.close()
+
+
+class TestMaintenance:
+    def test_prune_by_age_and_missing_outputs(self, state, tmp_path):
+        kept = tmp_path / 'kept.json'
+        kept.write_text('[]', encoding='utf-8')
+        state.put('ledger', str(kept), {'inputs': 'a'})
+        state.put('ledger', str(tmp_path / 'gone.json'), {'inputs': 'b'})
+        state.put('manifest', 'https://example.org/old', {'body': '{}'})
+        state._execute("UPDATE entries SET updated_ns = 0, used_ns = 0 WHERE namespace = 'manifest'")
+        state.put('manifest', 'https://example.org/new', {'body': '{}'})
+
+        assert state.prune(older_than_s=3600) == 2
+        assert list(state.items('ledger')) == [str(kept)]
+        assert list(state.items('manifest')) == ['https://example.org/new']
+
+    def test_prune_keeps_entries_still_read(self, state):
+        state.put('render', 'hit', {'html': '<p>x</p>'})
+        state.put('image_size', 'a.jpg', [10, 20])
+        state.put('render', 'unused', {'html': '<p>y</p>'})
+        state._execute("UPDATE entries SET updated_ns = 0, used_ns = 0")
+
+        assert state.get('render', 'hit') == {'html': '<p>x</p>'}
+        assert state.get_with_age('image_size', 'a.jpg') == ([10, 20], 0)
+        assert state.prune(older_than_s=3600) == 1
+        assert list(state.items('render')) == ['hit']
+        # Only the use was recorded: the write time still dates the value
+        assert state.get_with_age('image_size', 'a.jpg')[1] == 0
+
+    def test_stats_and_timings(self, state):
+        state.put('tiles', 'a', {'sha256': 'x'})
+        state.record_timings({'iiif': 4.0, 'jekyll': 2.0}, skipped={'jekyll'})
+        state.record_timings({'iiif': 2.0})
+        stats = state.stats()
+        assert stats['namespaces']['tiles']['entries'] == 1
+        assert stats['timings'] == {'iiif': {'runs': 2, 'mean': 3.0, 'last': 2.0}}
+        assert stats['bytes'] > 0
+
+    def test_manage_cache_cli(self, tmp_path, capsys):
+        db = tmp_path / 'build.db'
+        assert manage_cache.main(['--db', str(db), 'stats']) == 0
+        assert 'run a build first' in capsys.readouterr().out
+
+        get_build_state(db).record_timings({'csv_to_json': 1.5})
+        assert manage_cache.main(['--db', str(db), 'stats']) == 0
+        out = capsys.readouterr().out
+        assert 'csv_to_json' in out and 'namespace' in out
+        assert manage_cache.main(['--db', str(db), 'prune', '--older-than', '0']) == 0
+        assert 'Pruned 0 entries' in capsys.readouterr().out
+
+
+def _write_entries(path, worker):
+    state = get_build_state(path)
+    for i in range(50):
+        state.put('image_size', f'{worker}-{i}', [i, i])
+
+
+class TestConcurrency:
+    def test_processes_write_concurrently(self, tmp_path):
+        path = tmp_path / 'build.db'
+        BuildState(path).close()
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=_write_entries, args=(str(path), n)) for n in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert len(get_build_state(path).items('image_size')) == 150
+
+
+class ManifestHandler(BaseHTTPRequestHandler):
+    status = 200
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        if self.status != 200:
+            self.send_error(self.status)
+            return
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({'@context': 'http://iiif.io/api/presentation/3/context.json'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/ld+json')
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def manifest_server():
+    ManifestHandler.status = 200
+    ManifestHandler.requests = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ManifestHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}/manifest.json'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestManifestCache:
+    def fetch(self, url):
+        with _fetch_manifest(urllib.request.Request(url), None, 'obj') as response:
+            return response.headers.get('Content-Type', ''), json.loads(response.read())
+
+    def test_conditional_request_and_429_fallback(self, tmp_path, monkeypatch, manifest_server):
+        monkeypatch.chdir(tmp_path)
+        first = self.fetch(manifest_server)
+        assert first[0] == 'application/ld+json'
+        assert get_build_state().get('manifest', manifest_server)['etag'] == '"v1"'
+
+        assert self.fetch(manifest_server) == first
+        assert ManifestHandler.requests[-1]['If-None-Match'] == '"v1"'
+
+        ManifestHandler.status = 429
+        assert self.fetch(manifest_server) == first
+        assert (tmp_path / BUILD_DB_PATH).exists()
+
+    def test_errors_without_stored_copy_propagate(self, tmp_path, monkeypatch, manifest_server):
+        monkeypatch.chdir(tmp_path)
+        ManifestHandler.status = 429
+        with pytest.raises(urllib.error.HTTPError):
+            self.fetch(manifest_server)
@@ -0,0 +1,113 @@
+"""
+Unit Tests for the Validate-Only Content Check
+
+This module tests telar.check, which backs `csv_to_json.py --check`: the
+build's processors run over every spreadsheet, but nothing is fetched,
+rendered or written, and the issues come back as a JSON-ready report.
+
+Key behavior:
+- Story issues (missing objects, missing markdown files, invalid pages,
+  unknown glossary terms, widget errors) carry their step and type
+- Project and objects issues come from the processors' own validation
+- Stories are checked against the objects spreadsheet, not _data/objects.json
+- No manifest is fetched, no markdown is rendered and no file is written
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.check import check_site, checking, validate_only
+from telar.markdown import process_inline_content
+
+STORY_CSV = (
+    'step,question,answer,object,page,x,y,zoom,layer1_button,layer1_content\n'
+    '1,Intro,See [[known-term]],map,,0.5,0.5,1,More,panel.md\n'
+    '2,Next,See [[no-such-term]],ghost,,0.5,0.5,1,More,missing.md\n'
+    '3,Last,Done,map,zero,0.5,0.5,1,More,":::tabs\n## Only tab\nText\n:::"\n'
+)
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sheets = tmp_path / 'telar-content' / 'spreadsheets'
+    sheets.mkdir(parents=True)
+    stories = tmp_path / 'telar-content' / 'texts' / 'stories'
+    stories.mkdir(parents=True)
+    (tmp_path / 'telar-content' / 'objects').mkdir()
+    (sheets / 'project.csv').write_text(
+        'order,title,story_id\n1,First,tour\n2,Second,Bad ID\n', encoding='utf-8')
+    (sheets / 'objects.csv').write_text(
+        'object_id,title,source_url\n'
+        'map,Map,https://example.invalid/iiif/manifest.json\n'
+        'bad id,Bad,\n', encoding='utf-8')
+    (sheets / 'glossary.csv').write_text('term_id,title\nknown-term,Known\n', encoding='utf-8')
+    (sheets / 'tour.csv').write_text(STORY_CSV, encoding='utf-8')
+    (stories / 'panel.md').write_text('---\ntitle: Panel\n---\n**Body**', encoding='utf-8')
+    return tmp_path
+
+
+def issues_of(report, kind):
+    return [issue for entry in report['files'] if entry['kind'] == kind for issue in entry['issues']]
+
+
+class TestCheckSite:
+    def test_reports_issues_by_step(self, site):
+        report = check_site()
+        assert report['ok'] is False
+        assert report['issue_count'] == sum(len(entry['issues']) for entry in report['files'])
+        json.dumps(report)
+
+        story = {(issue.get('step'), issue['type']) for issue in issues_of(report, 'story')}
+        assert (2, 'viewer') in story        # ghost is not in objects.csv
+        assert (2, 'panel') in story         # missing.md
+        assert (2, 'glossary') in story      # [[no-such-term]]
+        assert (3, 'page') in story          # page value 'zero'
+        assert (3, 'widget') in story        # tabs widget with one tab
+        assert (1, 'viewer') not in story and (1, 'glossary') not in story
+
+        assert any("Bad ID" in issue['message'] for issue in issues_of(report, 'project'))
+        assert any("'bad id' contains spaces" in issue['message'] for issue in issues_of(report, 'objects'))
+        # The glossary spreadsheet is not checked as a story
+        assert [entry['path'] for entry in report['files'] if entry['kind'] == 'story'] == [
+            os.path.join('telar-content', 'spreadsheets', 'tour.csv')
+        ]
+
+    def test_fetches_and_writes_nothing(self, site, monkeypatch):
+        import urllib.request
+
+        def no_network(*args, **kwargs):
+            raise AssertionError('check mode must not fetch')
+
+        monkeypatch.setattr(urllib.request, 'urlopen', no_network)
+        before = sorted(p.relative_to(site) for p in site.rglob('*'))
+        check_site()
+        assert sorted(p.relative_to(site) for p in site.rglob('*')) == before
+
+    def test_clean_site_is_ok(self, site):
+        sheets = site / 'telar-content' / 'spreadsheets'
+        (sheets / 'project.csv').write_text('order,title,story_id\n1,First,tour\n', encoding='utf-8')
+        (sheets / 'objects.csv').write_text('object_id,title,source_url\nmap,Map,https://example.invalid/m.json\n',
+                                            encoding='utf-8')
+        (sheets / 'tour.csv').write_text(STORY_CSV.splitlines()[0] + '\n' + STORY_CSV.splitlines()[1] + '\n',
+                                         encoding='utf-8')
+        report = check_site(story='tour')
+        assert report == dict(report, ok=True, issue_count=0)
+
+
+class TestValidateOnly:
+    def test_mode_is_scoped(self):
+        assert not checking()
+        with validate_only():
+            assert checking()
+            assert process_inline_content('**bold**')['content'] == '**bold**'
+        assert not checking()
+        assert '<strong>bold</strong>' in process_inline_content('**bold**')['content']
@@ -0,0 +1,56 @@
+"""
+Unit Tests for Write-If-Changed Collection Files
+
+This module tests telar.collection_files, which writes the generated
+markdown of a Jekyll collection only where the content changed, so
+incremental Jekyll builds see real changes only.
+
+Key behavior:
+- New and changed files are written; identical ones keep their mtime
+- Files the run did not produce are removed, except excluded ones
+- The summary counts created, updated, unchanged and removed files
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.collection_files import CollectionFiles
+
+
+def backdate(path):
+    past = 1_600_000_000 * 10**9
+    os.utime(path, ns=(past, past))
+    return past
+
+
+class TestCollectionFiles:
+    def test_writes_only_changes(self, tmp_path):
+        directory = tmp_path / '_pages'
+        first = CollectionFiles(directory)
+        assert first.write('a.md', 'one') == 'created'
+        assert first.write('b.md', 'two') == 'created'
+        kept_ns = backdate(directory / 'a.md')
+
+        second = CollectionFiles(directory)
+        assert second.write('a.md', 'one') == 'unchanged'
+        assert second.write('b.md', 'two, edited') == 'updated'
+        assert (directory / 'a.md').stat().st_mtime_ns == kept_ns
+        assert (directory / 'b.md').read_text(encoding='utf-8') == 'two, edited'
+        assert sorted(p.name for p in directory.iterdir()) == ['a.md', 'b.md']
+
+    def test_removes_orphans(self, tmp_path):
+        for name in ('old.md', 'telar-fragment-x.md', 'notes.txt'):
+            (tmp_path / name).write_text('', encoding='utf-8')
+        files = CollectionFiles(tmp_path)
+        files.write('new.md', 'content')
+        removed = files.remove_orphans(exclude=('telar-fragment-*.md',))
+        assert [path.name for path in removed] == ['old.md']
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'new.md', 'notes.txt', 'telar-fragment-x.md'
+        ]
+        assert files.summary('Pages') == '✓ Pages: 1 created, 0 updated, 0 unchanged, 1 removed'
@@ -42,3 +42,85 @@ class TestCsvToJsonReturnValue:
             raise ValueError('processing failed')
 
         assert csv_to_json(str(csv), str(out), boom) is False
+
+
+class TestCsvToJsonIngest:
+    def test_drops_comment_rows_instruction_columns_and_header_row(self, tmp_path):
+        csv = tmp_path / 'in.csv'
+        csv.write_text(
+            'object_id,title,description,#notes\n'
+            'id_objeto,titulo,descripcion,\n'
+            '# instructions for authors,,,\n'
+            'obj-1,Title 🎄 One,## Heading,keep out\n',
+            encoding='utf-8',
+        )
+        out = tmp_path / 'out.json'
+        assert csv_to_json(str(csv), str(out)) is True
+        data = json.loads(out.read_text(encoding='utf-8'))
+        assert data == [{'object_id': 'obj-1', 'title': 'Title  One', 'description': '## Heading'}]
+
+    def test_spanish_headers_are_normalised(self, tmp_path):
+        csv = tmp_path / 'in.csv'
+        csv.write_text('id_objeto,titulo\nobj-1,Uno\n', encoding='utf-8')
+        out = tmp_path / 'out.json'
+        assert csv_to_json(str(csv), str(out)) is True
+        data = json.loads(out.read_text(encoding='utf-8'))
+        assert data == [{'object_id': 'obj-1', 'title': 'Uno'}]
+
+
+class TestCsvToJsonStreaming:
+    def _write_objects_csv(self, path, rows):
+        lines = ['object_id,title,source_url,featured,#notes',
+                 'id_objeto,titulo,url_fuente,destacado,']
+        for i in range(rows):
+            if i == 4:
+                lines.append('# comment,,,,')
+            lines.append(f'obj-{i},Title {i},,{"yes" if i in (2, 9) else ""},note')
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    def test_streamed_output_matches_whole_file(self, tmp_path):
+        csv = tmp_path / 'in.csv'
+        self._write_objects_csv(csv, 20)
+        whole = tmp_path / 'whole.json'
+        streamed = tmp_path / 'streamed.json'
+        assert csv_to_json(str(csv), str(whole)) is True
+        assert csv_to_json(str(csv), str(streamed), chunksize=3) is True
+        assert streamed.read_bytes() == whole.read_bytes()
+        assert not [p for p in tmp_path.iterdir() if p.suffix == '.jsonl']
+
+    def test_metadata_is_merged_across_chunks(self, tmp_path):
+        csv = tmp_path / 'in.csv'
+        self._write_objects_csv(csv, 10)
+
+        def process(df):
+            df.attrs['viewer_warnings'] = [f"chunk {df.attrs['chunk_number']}"]
+            if df.attrs['chunk_number'] == 1:
+                df.attrs['has_latex'] = True
+            return df
+
+        out = tmp_path / 'out.json'
+        assert csv_to_json(str(csv), str(out), process, chunksize=4) is True
+        data = json.loads(out.read_text(encoding='utf-8'))
+        assert data[0] == {'_metadata': True,
+                           'viewer_warnings': ['chunk 0', 'chunk 1', 'chunk 2'],
+                           'has_latex': True}
+        assert [r['object_id'] for r in data[1:]] == [f'obj-{i}' for i in range(10)]
+
+    def test_featured_sample_is_decided_across_chunks(self, tmp_path, monkeypatch):
+        from telar.processors.objects import process_objects
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / '_config.yml').write_text(
+            'collection_interface:\n  show_sample_on_homepage: true\n', encoding='utf-8'
+        )
+        csv = tmp_path / 'in.csv'
+        self._write_objects_csv(csv, 12)
+        whole = tmp_path / 'whole.json'
+        streamed = tmp_path / 'streamed.json'
+        assert csv_to_json(str(csv), str(whole), process_objects) is True
+        assert csv_to_json(str(csv), str(streamed), process_objects, chunksize=5) is True
+
+        data = json.loads(streamed.read_text(encoding='utf-8'))
+        featured = [r['object_id'] for r in data if r.get('is_featured_sample')]
+        assert featured == ['obj-2', 'obj-9']
+        assert streamed.read_bytes() == whole.read_bytes()
@@ -64,6 +64,25 @@ class TestSanitizeDataframe:
         assert pd.isna(result['title'].iloc[1])
         assert result['title'].iloc[2] == 'World'
 
+    def test_does_not_mutate_input(self):
+        """The caller's DataFrame keeps its emoji; only the copy is cleaned."""
+        df = pd.DataFrame({'title': ['Hello 🎄 World']})
+        result = sanitize_dataframe(df)
+        assert df['title'].iloc[0] == 'Hello 🎄 World'
+        assert result['title'].iloc[0] == 'Hello  World'
+
+    def test_warns_on_suspicious_url_scheme(self, capsys):
+        """javascript:/data: values in URL columns are reported but left as-is."""
+        df = pd.DataFrame({
+            'source_url': ['https://example.org/manifest.json', ' JavaScript:alert(1)', None],
+            'title': ['data:not-a-url-column', 'b', 'c'],
+        })
+        result = sanitize_dataframe(df)
+        out = capsys.readouterr().out
+        assert out.count('Suspicious URL scheme') == 1
+        assert "'JavaScript:alert(1)'" in out
+        assert result['source_url'].iloc[1] == ' JavaScript:alert(1)'
+
 
 class TestGetSourceUrl:
     """Tests for get_source_url function."""
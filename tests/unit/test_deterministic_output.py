@@ -0,0 +1,110 @@
+"""
+Unit Tests for Byte-Stable Build Outputs
+
+This module tests that unchanged content produces byte-identical output
+files from one build to the next, so the build caches (and the deploy
+diff) only see the files that really changed.
+
+Key behavior:
+- Widget IDs are derived from the widget's content, unique within a page,
+  and unaffected by widgets on other pages
+- IIIF info.json lists each size once, in a fixed order
+- csv_to_json writes object keys sorted, streaming or not
+- Protected stories keep their envelope while their plaintext and key are
+  unchanged, and get a fresh one otherwise
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+import base64
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.widgets import get_widget_id, reset_widget_ids
+from telar.core import csv_to_json
+from telar.build_state import BuildState
+from telar.encryption import derive_key, encrypt_story_stable
+from iiif_utils import patch_info_json
+
+STORY_KEY = 'unit-test-key'
+
+
+def decrypt_envelope(envelope, key=STORY_KEY, aad=None):
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    aesgcm = AESGCM(derive_key(key, base64.b64decode(envelope['salt'])))
+    plaintext = aesgcm.decrypt(base64.b64decode(envelope['iv']),
+                               base64.b64decode(envelope['ciphertext']), aad.encode() if aad else None)
+    return json.loads(plaintext)
+
+
+class TestWidgetIds:
+    def test_ids_follow_content_not_position(self):
+        reset_widget_ids()
+        first = get_widget_id('tabs\n## A\nx\n## B\ny')
+        reset_widget_ids()
+        get_widget_id('carousel\nimage: a.jpg')
+        assert get_widget_id('tabs\n## A\nx\n## B\ny') == first
+        assert first.startswith('widget-')
+
+    def test_repeated_widget_on_a_page_gets_a_suffix(self):
+        reset_widget_ids()
+        first = get_widget_id('accordion\nsame')
+        assert get_widget_id('accordion\nsame') == f'{first}-2'
+        assert get_widget_id('accordion\nsame') == f'{first}-3'
+        reset_widget_ids()
+        assert get_widget_id('accordion\nsame') == first
+
+
+class TestInfoJsonSizes:
+    def test_sizes_are_unique_and_sorted(self, tmp_path):
+        (tmp_path / 'info.json').write_text(json.dumps({'width': 1024, 'height': 683}))
+        for name in ('512,', '256,171', '256,', '1024,683', 'max'):
+            (tmp_path / 'full' / name).mkdir(parents=True)
+        patch_info_json(tmp_path, 'obj', 'https://example.org')
+        info = json.loads((tmp_path / 'info.json').read_text())
+        assert info['sizes'] == [
+            {'width': 256, 'height': 171},
+            {'width': 512, 'height': 342},
+            {'width': 1024, 'height': 683},
+        ]
+
+
+class TestSortedKeys:
+    @pytest.mark.parametrize('chunksize', [None, 1])
+    def test_keys_are_sorted(self, tmp_path, chunksize):
+        csv = tmp_path / 'in.csv'
+        csv.write_text('zeta,alpha,mid\n1,2,3\n4,5,6\n', encoding='utf-8')
+        out = tmp_path / 'out.json'
+        assert csv_to_json(str(csv), str(out), chunksize=chunksize) is True
+        records = json.loads(out.read_text(encoding='utf-8'))
+        assert [list(record) for record in records] == [['alpha', 'mid', 'zeta']] * 2
+
+
+class TestStableEnvelope:
+    @pytest.fixture
+    def state(self, tmp_path):
+        state = BuildState(tmp_path / 'build.db')
+        yield state
+        state.close()
+
+    def test_unchanged_story_keeps_its_envelope(self, state):
+        payload = {'steps': [{'step': '1'}], 'html': '<div>a</div>'}
+        first = encrypt_story_stable(payload, STORY_KEY, aad='s', state=state)
+        assert encrypt_story_stable(dict(payload), STORY_KEY, aad='s', state=state) == first
+        assert decrypt_envelope(first, aad='s') == payload
+
+    def test_changed_plaintext_or_key_re_encrypts(self, state):
+        payload = {'steps': [], 'html': 'a'}
+        first = encrypt_story_stable(payload, STORY_KEY, aad='s', state=state)
+        changed = encrypt_story_stable({'steps': [], 'html': 'b'}, STORY_KEY, aad='s', state=state)
+        assert changed['iv'] != first['iv']
+        assert decrypt_envelope(changed, aad='s') == {'steps': [], 'html': 'b'}
+        rekeyed = encrypt_story_stable(payload, 'another-key', aad='s', state=state)
+        assert rekeyed['iv'] != changed['iv']
+        assert decrypt_envelope(rekeyed, key='another-key', aad='s') == payload
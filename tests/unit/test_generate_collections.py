@@ -2,8 +2,9 @@
 Unit Tests for generate_collections.py
 
 Tests focus on the media_type detection logic, source_url injection
-for video objects, and (v1.3.0) sister-file localization in
-generate_pages().
+for video objects, (v1.3.0) sister-file localization in
+generate_pages(), pages and glossary terms rendered in worker
+processes, and every collection written only where it changed.
 
 Version: v1.5.0
 """
@@ -377,6 +378,146 @@ class TestGeneratePagesLocalization:
         assert '<h1>About Telar</h1>' in out  # EN content because default is 'en'
 
 
+class TestIncrementalPagesAndGlossary:
+    """Pages and glossary terms are rendered in worker processes when there
+    are enough of them, and written only when their content changed."""
+
+    @pytest.fixture
+    def site(self, tmp_path, monkeypatch):
+        pages = tmp_path / 'telar-content' / 'texts' / 'pages'
+        pages.mkdir(parents=True)
+        for n in range(3):
+            (pages / f'page{n}.md').write_text(
+                f"---\ntitle: Page {n}\n---\n\n# Page {n}\n\nSee [[loom]].\n", encoding='utf-8')
+        sheets = tmp_path / 'telar-content' / 'spreadsheets'
+        sheets.mkdir()
+        (sheets / 'glossary.csv').write_text(
+            'term_id,title,definition\nloom,Loom,A **frame** for [[weft]]\nweft,Weft,Threads across the [[loom]]\n',
+            encoding='utf-8')
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def _outputs(site):
+        root = site / '_jekyll-files'
+        return {str(path.relative_to(root)): path.read_text(encoding='utf-8')
+                for path in sorted(root.rglob('*.md'))}
+
+    def test_unchanged_files_are_not_rewritten(self, site):
+        from generate_collections import generate_pages, generate_glossary
+        generate_glossary()
+        generate_pages()
+        past = 1_600_000_000 * 10**9
+        for path in (site / '_jekyll-files').rglob('*.md'):
+            os.utime(path, ns=(past, past))
+
+        (site / 'telar-content' / 'texts' / 'pages' / 'page1.md').unlink()
+        fragment = site / '_jekyll-files' / '_pages' / 'telar-fragment-x.md'
+        fragment.write_text('---\n---\n', encoding='utf-8')
+        generate_glossary()
+        generate_pages()
+
+        outputs = sorted((site / '_jekyll-files').rglob('*.md'))
+        assert [path.name for path in outputs] == [
+            'loom.md', 'weft.md', 'page0.md', 'page2.md', 'telar-fragment-x.md'
+        ]
+        assert all(path.stat().st_mtime_ns == past for path in outputs if path != fragment)
+
+    def test_worker_processes_match_in_process(self, site, monkeypatch):
+        import generate_collections
+        from generate_collections import generate_pages, generate_glossary
+        generate_glossary(jobs=1)
+        generate_pages(jobs=1)
+        serial = self._outputs(site)
+        shutil.rmtree(site / '_jekyll-files')
+
+        monkeypatch.setattr(generate_collections, 'PARALLEL_RENDER_MIN', 1)
+        generate_glossary(jobs=2)
+        generate_pages(jobs=2)
+        assert self._outputs(site) == serial
+        assert 'data-term-id="weft"' in serial['_glossary/loom.md']
+        assert 'data-term-id="loom"' in serial['_pages/page0.md']
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_failed_render_fails_the_run(self, site, monkeypatch, jobs):
+        import generate_collections
+        from generate_collections import generate_pages
+        generate_pages()
+        page_path = site / '_jekyll-files' / '_pages' / 'page1.md'
+        before = page_path.read_text(encoding='utf-8')
+
+        def process_images(text):
+            if 'Page 1' in text:
+                raise ValueError('bad image syntax')
+            return text
+
+        (site / 'telar-content' / 'texts' / 'pages' / 'page1.md').write_text(
+            '---\ntitle: Page 1\n---\n\n# Page 1\n\nEdited.\n', encoding='utf-8')
+        monkeypatch.setattr(generate_collections, 'process_images', process_images)
+        monkeypatch.setattr(generate_collections, 'PARALLEL_RENDER_MIN', 1)
+        # Worker processes fail the same way as in-process rendering
+        with pytest.raises(ValueError, match='bad image syntax'):
+            generate_pages(jobs=jobs)
+        assert page_path.read_text(encoding='utf-8') == before
+
+
+class TestIncrementalObjectsAndStories:
+    """Objects, stories and protected fragments are written only when their
+    content changed, and orphans are removed."""
+
+    PAST = 1_600_000_000 * 10**9
+
+    @pytest.fixture
+    def site(self, tmp_path, monkeypatch):
+        data = tmp_path / '_data'
+        data.mkdir()
+        stories = [{'number': n, 'title': f'Story {n}', 'story_id': f'story{n}', 'protected': n == 2}
+                   for n in (1, 2)]
+        (data / 'project.json').write_text(json.dumps([{'stories': stories}]), encoding='utf-8')
+        for n in (1, 2):
+            (data / f'story{n}.json').write_text('[]', encoding='utf-8')
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def _backdate(self, site):
+        for path in (site / '_jekyll-files').rglob('*.md'):
+            os.utime(path, ns=(self.PAST, self.PAST))
+
+    def _changed(self, site):
+        return sorted(str(path.relative_to(site / '_jekyll-files'))
+                      for path in (site / '_jekyll-files').rglob('*.md')
+                      if path.stat().st_mtime_ns != self.PAST)
+
+    def test_objects(self, site, capsys):
+        from generate_collections import generate_objects
+        objects = [{'object_id': f'obj{n}', 'title': f'Object {n}'} for n in range(3)]
+        generate_objects(objects)
+        self._backdate(site)
+
+        objects[1]['title'] = 'Renamed'
+        generate_objects(objects[:2])
+        assert self._changed(site) == ['_objects/obj1.md']
+        assert sorted(p.name for p in (site / '_jekyll-files' / '_objects').iterdir()) == ['obj0.md', 'obj1.md']
+        assert '✓ Objects: 0 created, 1 updated, 1 unchanged, 1 removed' in capsys.readouterr().out
+
+    def test_stories_and_fragments(self, site, capsys):
+        from generate_collections import generate_stories, generate_protected_fragments
+        generate_stories()
+        generate_protected_fragments()
+        self._backdate(site)
+
+        generate_stories()
+        generate_protected_fragments()
+        assert self._changed(site) == []
+        assert '✓ Stories: 0 created, 0 updated, 2 unchanged, 0 removed' in capsys.readouterr().out
+
+        (site / '_data' / 'story2.json').unlink()
+        generate_stories()
+        generate_protected_fragments()
+        outputs = sorted(p.name for p in (site / '_jekyll-files').rglob('*.md'))
+        assert outputs == ['story1.md']
+
+
 class TestStoryFrontmatterSerialization:
     """generate_stories() writes injection-safe YAML frontmatter."""
 
@@ -13,6 +13,10 @@ The syntax supports two forms:
 Invalid terms (not found in glossary) are marked with a warning indicator
 to help authors catch typos and missing definitions.
 
+GlossaryLinker compiles a glossary once for many calls; in auto-link mode
+it also links the first bare mention of each term title in prose, skipping
+headings, links and code.
+
 Version: v1.5.1
 """
 
@@ -28,7 +32,7 @@ import csv_to_json
 csv_to_json.get_lang_string = lambda key, **kwargs: f"Term not found: {kwargs.get('term_id', 'unknown')}"
 
 from csv_to_json import process_glossary_links
-from telar.glossary import strip_glossary_links
+from telar.glossary import strip_glossary_links, GlossaryLinker
 
 
 class TestProcessGlossaryLinks:
@@ -247,3 +251,75 @@ class TestProcessGlossaryLinks:
         result = process_glossary_links(text, glossary_terms)
         assert 'data-term-id="a&quot;&lt;x&gt;z"' in result
         assert '<x>' not in result
+
+
+class TestGlossaryLinker:
+    """Tests for the compiled linker and its auto-link mode."""
+
+    TERMS = {
+        'new-spain': 'New Spain',
+        'viceroyalty-ns': 'Viceroyalty of New Spain',
+        'spain': 'Spain',
+        'iiif': 'IIIF',
+        'ox': 'Ox',
+    }
+
+    def test_matches_process_glossary_links(self):
+        linker = GlossaryLinker(self.TERMS)
+        text = 'The [[New-Spain]] and [[spain|the crown]] and [[missing]].'
+        warnings_a, warnings_b = [], []
+        assert linker.link(text, warnings_a, 2, 'layer1') == process_glossary_links(
+            text, self.TERMS, warnings_b, 2, 'layer1')
+        assert warnings_a == warnings_b and len(warnings_a) == 1
+        assert process_glossary_links(text, linker) == linker.link(text)
+
+    def test_auto_link_off_by_default(self):
+        assert GlossaryLinker(self.TERMS).link('<p>New Spain</p>') == '<p>New Spain</p>'
+
+    def test_auto_links_first_whole_word_mention(self):
+        linker = GlossaryLinker(self.TERMS, auto_link=True)
+        result = linker.link('<p>The Viceroyalty of New Spain, not Spanish; spain and Spain.</p>')
+        assert result.count('data-term-id="viceroyalty-ns">Viceroyalty of New Spain</a>') == 1
+        assert 'data-term-id="spain">spain</a> and Spain.' in result
+        assert 'Spanish' in result and 'data-term-id="new-spain"' not in result
+
+    def test_auto_link_skips_markup_code_and_existing_links(self):
+        linker = GlossaryLinker(self.TERMS, auto_link=True)
+        text = ('<p class="Spain"><a href="/x">Spain</a> <code>IIIF</code> [[iiif]] IIIF '
+                'and an ox</p>')
+        result = linker.link(text)
+        assert '<p class="Spain"><a href="/x">Spain</a> <code>IIIF</code>' in result
+        # Linked explicitly already, so the bare mention stays plain
+        assert result.count('data-term-id="iiif"') == 1
+        # Titles shorter than AUTO_LINK_MIN_LENGTH are not auto-linked
+        assert 'data-term-id="ox"' not in result
+
+    def test_auto_link_skips_headings(self):
+        linker = GlossaryLinker(self.TERMS, auto_link=True)
+        assert linker.link('<h2>Spain</h2>') == '<h2>Spain</h2>'
+        result = linker.link('<h3 id="spain">Spain</h3><p>Spain</p>')
+        assert result.startswith('<h3 id="spain">Spain</h3><p><a ')
+        assert result.count('data-term-id="spain"') == 1
+
+    def test_auto_link_leaves_character_references_intact(self):
+        linker = GlossaryLinker({'amp': 'amp', 'quot': 'quot'}, auto_link=True)
+        text = '<p>Salt &amp; pepper, &quot;quoted&quot; &#38; &#x26;</p>'
+        assert linker.link(text) == text
+
+    def test_auto_link_matches_titles_with_escaped_characters(self):
+        linker = GlossaryLinker({'rock': 'Rock & Roll', 'lt': 'a < b', 'cafe': 'Café Society'},
+                                auto_link=True)
+        result = linker.link('<p>Rock &amp; Roll, where a &lt; b, at the Caf&eacute; Society.</p>')
+        assert 'data-term-id="rock">Rock &amp; Roll</a>,' in result
+        assert 'data-term-id="lt">a &lt; b</a>,' in result
+        assert 'data-term-id="cafe">Caf&eacute; Society</a>.' in result
+
+    def test_auto_link_can_be_turned_off_per_call(self):
+        linker = GlossaryLinker(self.TERMS, auto_link=True)
+        assert linker.link('New Spain', auto_link=False) == 'New Spain'
+
+    def test_auto_link_scales_to_large_glossaries(self):
+        terms = {f'term-{n}': f'Term {n} of the realm' for n in range(5000)}
+        linker = GlossaryLinker(terms, auto_link=True)
+        result = linker.link('<p>' + ' '.join(f'Term {n} of the realm.' for n in range(0, 5000, 50)) + '</p>')
+        assert result.count('glossary-inline-link') == 100
@@ -0,0 +1,165 @@
+"""
+Unit Tests for Image Dimension Probing
+
+This module tests get_image_dimensions() and get_image_dimensions_many() in
+telar.images against a local HTTP server that honours Range requests and
+ETags, so the tests see exactly which bytes of an image were sent.
+
+Key behavior:
+- A remote image is sized from a ranged read of its header, not downloaded
+- A header longer than the first range is read on from where it ended
+- A server that ignores Range is only read up to the header
+- Stored sizes are revalidated with If-None-Match after the TTL (304)
+- get_image_dimensions_many() keeps the order of its paths and sizes local
+  and remote images alike; what its probe threads record reaches the
+  caller's build ledger tracking
+- An unreachable image gives None and marks the conversion volatile
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import io
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+from PIL import Image, ImageFile
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import telar.images
+from telar.images import get_image_dimensions, get_image_dimensions_many, HEADER_PROBE_BYTES
+from telar.build_state import get_build_state
+from telar.build_ledger import track_inputs
+
+
+def _jpeg(width, height, comments=0):
+    rng = random.Random(width * height)
+    img = Image.frombytes('RGB', (width, height), rng.randbytes(width * height * 3))
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=95)
+    data = buffer.getvalue()
+    # 60 KB comment segments between the start marker and the frame header
+    segment = b'\xff\xfe' + (60002).to_bytes(2, 'big') + b'c' * 60000
+    return data[:2] + segment * comments + data[2:]
+
+
+IMAGES = {
+    '/wide.jpg': _jpeg(400, 200),
+    '/tall.jpg': _jpeg(150, 300),
+    # Comment segments push the size past the first range
+    '/long-header.jpg': _jpeg(120, 90, comments=2),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    sent = {}
+    requests = []
+    honour_range = True
+
+    def do_GET(self):
+        body = IMAGES.get(self.path.split('?')[0])
+        if body is None:
+            self.send_error(404)
+            return
+        self.requests.append((self.path, dict(self.headers)))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        status, start, end = 200, 0, len(body) - 1
+        byte_range = self.headers.get('Range')
+        if byte_range and self.honour_range:
+            first, _, last = byte_range[len('bytes='):].partition('-')
+            status, start = 206, int(first)
+            end = min(int(last), end) if last else end
+        self.send_response(status)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(end - start + 1))
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(body)}')
+        self.end_headers()
+        try:
+            for offset in range(start, end + 1, 4096):
+                chunk = body[offset:min(offset + 4096, end + 1)]
+                self.wfile.write(chunk)
+                self.sent[self.path] = self.sent.get(self.path, 0) + len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Handler.sent, Handler.requests, Handler.honour_range = {}, [], True
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestRemoteDimensions:
+    def test_reads_only_the_header(self, server):
+        assert get_image_dimensions(f'{server}/wide.jpg') == (400, 200)
+        assert Handler.requests[0][1]['Range'] == f'bytes=0-{HEADER_PROBE_BYTES - 1}'
+        assert Handler.sent['/wide.jpg'] <= HEADER_PROBE_BYTES < len(IMAGES['/wide.jpg'])
+
+    def test_long_header_is_read_on(self, server):
+        assert get_image_dimensions(f'{server}/long-header.jpg') == (120, 90)
+        assert [headers['Range'] for _, headers in Handler.requests] == [
+            f'bytes=0-{HEADER_PROBE_BYTES - 1}', f'bytes={HEADER_PROBE_BYTES}-'
+        ]
+
+    def test_server_without_range_support(self, server, monkeypatch):
+        fed = []
+        feed = ImageFile.Parser.feed
+        monkeypatch.setattr(ImageFile.Parser, 'feed', lambda parser, data: fed.append(len(data)) or feed(parser, data))
+        Handler.honour_range = False
+        assert get_image_dimensions(f'{server}/wide.jpg') == (400, 200)
+        assert sum(fed) <= HEADER_PROBE_BYTES < len(IMAGES['/wide.jpg'])
+
+    def test_cached_then_revalidated(self, server, monkeypatch):
+        url = f'{server}/tall.jpg'
+        assert get_image_dimensions(url) == (150, 300)
+        assert get_image_dimensions(url) == (150, 300)
+        assert len(Handler.requests) == 1
+
+        monkeypatch.setattr(telar.images, 'REMOTE_DIMENSIONS_TTL_S', 0)
+        assert get_image_dimensions(url) == (150, 300)
+        assert Handler.requests[1][1]['If-None-Match'] == '"v1"'
+        assert Handler.sent['/tall.jpg'] <= HEADER_PROBE_BYTES
+
+    def test_old_cache_entry_is_still_used(self, server):
+        url = f'{server}/tall.jpg'
+        get_build_state().put('image_size', url, [15, 30])
+        assert get_image_dimensions(url) == (15, 30)
+        assert not Handler.requests
+
+    def test_unreachable_marks_volatile(self, server):
+        with track_inputs() as tracked:
+            assert get_image_dimensions(f'{server}/missing.jpg') is None
+        assert tracked['volatile']
+
+
+class TestManyDimensions:
+    def test_keeps_order_local_and_remote(self, server, tmp_path):
+        (tmp_path / 'assets' / 'images').mkdir(parents=True)
+        Image.new('RGB', (30, 10)).save(tmp_path / 'assets' / 'images' / 'local.png')
+        paths = [f'{server}/tall.jpg', 'local.png', f'{server}/wide.jpg', 'missing.png', f'{server}/tall.jpg']
+        assert get_image_dimensions_many(paths) == [(150, 300), (30, 10), (400, 200), None, (150, 300)]
+        assert sorted(path for path, _ in Handler.requests) == ['/tall.jpg', '/wide.jpg']
+
+    def test_probe_threads_report_to_the_caller(self, server):
+        with track_inputs() as tracked:
+            sizes = get_image_dimensions_many([f'{server}/missing-1.jpg', f'{server}/missing-2.jpg'])
+        assert sizes == [None, None]
+        assert len(tracked['volatile']) == 2
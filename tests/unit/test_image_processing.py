@@ -10,6 +10,9 @@ Supported syntax:
 - ![alt](path){size} — image with size class (sm, md, lg, full)
 - Line after image becomes caption (optional "caption:" prefix stripped)
 
+Image paths are resolved case-insensitively from cached directory
+listings, with the exact path first.
+
 Version: v0.7.0-beta
 """
 
@@ -21,6 +24,7 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
 
 from csv_to_json import process_images
+from telar.images import resolve_path_case_insensitive, validate_image_path
 
 
 class TestProcessImages:
@@ -165,3 +169,34 @@ Caption for second"""
         assert result.count('<figure') == 2
         assert 'img-sm' in result
         assert 'img-lg' in result
+
+
+class TestPathResolution:
+    """Case-insensitive fallbacks, answered from directory listings."""
+
+    @pytest.fixture
+    def images(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        folder = tmp_path / 'assets' / 'images'
+        (folder / 'maps').mkdir(parents=True)
+        (folder / 'sub').mkdir()
+        for name in ('maps/old.png', 'maps/Old.PNG', 'maps/lower.jpg', 'sub/shout.JPG'):
+            (folder / name).write_text('')
+        past = 1_600_000_000 * 10**9
+        for directory in (folder, folder / 'maps', folder / 'sub'):
+            os.utime(directory, ns=(past, past))
+        return folder
+
+    def test_precedence(self, images):
+        assert resolve_path_case_insensitive('assets/images', 'maps/Old.PNG').name == 'Old.PNG'
+        assert resolve_path_case_insensitive('assets/images', 'maps/LOWER.jpg').name == 'lower.jpg'
+        assert resolve_path_case_insensitive('assets/images', 'MAPS/LOWER.JPG').as_posix() == 'assets/images/maps/lower.jpg'
+        assert resolve_path_case_insensitive('assets/images', 'maps/none.png') is None
+
+    def test_extension_case_fallback(self, images):
+        assert validate_image_path('sub/shout.jpg', 'test.md') == (True, 'assets/images/sub/shout.JPG')
+        assert validate_image_path('sub/whisper.jpg', 'test.md') == (False, 'assets/images/sub/whisper.jpg')
+
+    def test_no_exists_probes(self, images, monkeypatch):
+        monkeypatch.setattr(type(images), 'exists', lambda self: pytest.fail('exists() probe'))
+        assert validate_image_path('maps/LOWER.JPG', 'test.md')[0]
@@ -0,0 +1,105 @@
+"""
+Unit Tests for Start-up Import Cost
+
+This module tests that the lightweight entry points — the telar package
+itself, the config and search modules, the stage runner, and the audio,
+IIIF and local build scripts — start without importing the heavy
+dependencies (pandas, Pillow, markdown, jinja2, cryptography) and within an
+import-time budget. Each module is imported in a fresh interpreter with
+`python -X importtime`, whose per-module report is parsed.
+
+Key behavior:
+- Heavy dependencies are only imported at first use
+- telar.config does not import the build state store (sqlite3)
+- Each lightweight entry point imports in under IMPORT_BUDGET_US (best of
+  several cold starts, to ride out a busy machine)
+- The lazy re-exports of `telar` resolve to the same objects as the
+  submodules and reject unknown names
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import subprocess
+
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts')
+
+# Add scripts directory to path for imports
+sys.path.insert(0, SCRIPTS_DIR)
+
+import telar
+
+# Cumulative import time allowed per entry point, in microseconds
+IMPORT_BUDGET_US = 150_000
+ATTEMPTS = 3
+
+LIGHT_MODULES = [
+    'telar',
+    'telar.config',
+    'telar.search',
+    'telar.pipeline',
+    'telar.encryption',
+    'process_audio',
+    'generate_iiif',
+    'build_local_site',
+    'encrypt_protected_stories',
+]
+
+HEAVY_MODULES = {'pandas', 'PIL', 'markdown', 'jinja2', 'cryptography'}
+
+
+def import_report(module):
+    """
+    Import a module in a fresh interpreter and parse the -X importtime report.
+
+    Returns:
+        dict: top-level package name -> largest cumulative time (us) seen
+        for any of its modules, e.g. {'telar': 41000, 'yaml': 22000}
+    """
+    code = f'import sys; sys.path.insert(0, {os.path.abspath(SCRIPTS_DIR)!r}); import {module}'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    report = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        top = name.strip().split('.')[0]
+        report[top] = max(report.get(top, 0), int(cumulative))
+        if name.strip() == module:
+            report[module] = int(cumulative)
+    return report
+
+
+@pytest.mark.parametrize('module', LIGHT_MODULES)
+def test_light_entry_point_skips_heavy_imports(module):
+    imported = set(import_report(module))
+    assert not imported & HEAVY_MODULES, f'{module} imports {sorted(imported & HEAVY_MODULES)}'
+
+
+@pytest.mark.parametrize('module', LIGHT_MODULES)
+def test_light_entry_point_import_budget(module):
+    best = min(import_report(module)[module] for _ in range(ATTEMPTS))
+    assert best < IMPORT_BUDGET_US, f'{module} took {best / 1000:.0f} ms to import'
+
+
+def test_config_skips_the_build_state_store():
+    # telar.config is loaded by every script; it takes RACY_WINDOW_NS from
+    # telar.constants rather than from telar.build_ledger
+    assert 'sqlite3' not in import_report('telar.config')
+
+
+class TestLazyExports:
+    def test_exports_resolve_to_submodule_objects(self):
+        from telar.processors.stories import process_story
+        from telar.config import load_site_config
+        assert telar.process_story is process_story
+        assert telar.load_site_config is load_site_config
+        assert 'process_story' in dir(telar)
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError):
+            telar.not_a_function
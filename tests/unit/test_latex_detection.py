@@ -16,7 +16,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
 
 import pytest
-from telar.latex import has_latex, protect_latex, restore_latex
+from telar.latex import has_latex, texts_have_latex, protect_latex, restore_latex
 
 
 class TestDisplayMath:
@@ -186,6 +186,29 @@ class TestProtectRestore:
         assert replacements == {}
 
 
+class TestTextsHaveLatex:
+    """texts_have_latex() scans many cells at once, as has_latex() on each."""
+
+    @pytest.mark.parametrize("texts", [
+        [],
+        ["", "plain"],
+        ["It cost $50", "and $100 later"],
+        ["$ spaced $"],
+        ["$x", "$"],
+        ["$$", "x$$"],
+        ["$x$$y$$"],
+        ["Price $5", "then \\ce{H2O}"],
+        ["ok", "The equation $E = mc^2$"],
+        ["\\(a\\)"],
+        ["$a$"],
+    ])
+    def test_matches_has_latex_per_text(self, texts):
+        assert texts_have_latex(texts) == any(has_latex(t) for t in texts)
+
+    def test_match_does_not_span_cells(self):
+        assert not texts_have_latex(["Cost $5 and", "x^2 for $6"])
+
+
 class TestStoryLatexFlag:
     """process_story sets df.attrs['has_latex'] for every documented LaTeX
     surface ("Where LaTeX Works"): step question/answer prose and layer
@@ -0,0 +1,123 @@
+"""
+Unit Tests for Build-Scoped Lookups
+
+This module tests telar.lookups: while shared_lookups() is active, every
+process_story() call takes the glossary and _data/objects.json from one
+BuildLookups instead of loading them again per story.
+
+Key behavior:
+- The glossary and objects.json are loaded once for any number of stories
+- Each story still records the files they were loaded from for the ledger
+- invalidate_lookups() makes a rewritten objects.json visible, and the demo
+  merge calls it after appending demo objects
+- Outside shared_lookups(), process_story() loads them itself
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+
+import pandas as pd
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import telar.glossary
+import telar.lookups
+import telar.processors.stories as stories
+from telar.lookups import shared_lookups, invalidate_lookups, active_lookups
+from telar.processors.stories import process_story
+from telar.build_ledger import track_inputs
+from telar.demo import merge_demo_content
+
+MANIFEST = 'https://example.org/iiif/manifest.json'
+
+
+def _story_df(object_id, answer=''):
+    return pd.DataFrame([{'step': '1', 'question': 'Q', 'answer': answer,
+                          'object': object_id, 'x': '0.5', 'y': '0.5', 'zoom': '1'}])
+
+
+def _viewer_warnings(df):
+    return [w['message'] for w in df.attrs.get('viewer_warnings') or []]
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '_data').mkdir()
+    (tmp_path / 'telar-content' / 'objects').mkdir(parents=True)
+    sheets = tmp_path / 'telar-content' / 'spreadsheets'
+    sheets.mkdir()
+    (sheets / 'glossary.csv').write_text('term_id,title\nkcsb,KCSB\n', encoding='utf-8')
+    write_objects(tmp_path, ['map'])
+    return tmp_path
+
+
+def write_objects(site, object_ids):
+    objects = [{'object_id': object_id, 'title': object_id, 'iiif_manifest': MANIFEST}
+               for object_id in object_ids]
+    (site / '_data' / 'objects.json').write_text(json.dumps(objects), encoding='utf-8')
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+    load_terms = telar.glossary.load_glossary_terms
+    load_objects = telar.lookups.load_objects
+
+    def counting_terms():
+        calls.append('glossary')
+        return load_terms()
+
+    def counting_objects(path):
+        calls.append('objects')
+        return load_objects(path)
+
+    monkeypatch.setattr(telar.glossary, 'load_glossary_terms', counting_terms)
+    monkeypatch.setattr(telar.lookups, 'load_objects', counting_objects)
+    monkeypatch.setattr(stories, 'load_objects', counting_objects)
+    return calls
+
+
+class TestSharedLookups:
+    def test_loaded_once_for_all_stories(self, site, loads):
+        with shared_lookups():
+            for _ in range(3):
+                df = process_story(_story_df('MAP', 'Tune in to [[kcsb]]'))
+                assert df.iloc[0]['object'] == 'map'
+                assert 'data-term-id="kcsb"' in df.iloc[0]['answer']
+        assert sorted(loads) == ['glossary', 'objects']
+
+    def test_every_story_records_the_shared_inputs(self, site):
+        with shared_lookups():
+            process_story(_story_df('map'))
+            with track_inputs() as tracked:
+                process_story(_story_df('map'))
+        assert os.path.join('_data', 'objects.json') in tracked['files']
+        assert os.path.join('telar-content', 'spreadsheets', 'glossary.csv') in tracked['files']
+
+    def test_invalidate_picks_up_rewritten_objects(self, site, loads):
+        with shared_lookups():
+            assert _viewer_warnings(process_story(_story_df('globe')))
+            write_objects(site, ['map', 'globe'])
+            invalidate_lookups('objects')
+            assert not _viewer_warnings(process_story(_story_df('globe')))
+        assert sorted(loads) == ['glossary', 'objects', 'objects']
+        assert active_lookups() is None
+
+    def test_demo_merge_invalidates_objects(self, site, loads):
+        bundle = {'objects': {'demo-map': {'title': 'Demo map', 'source_url': MANIFEST}}}
+        with shared_lookups():
+            process_story(_story_df('map'))
+            merge_demo_content(bundle)
+            assert not _viewer_warnings(process_story(_story_df('demo-map')))
+        assert loads.count('objects') == 2
+
+    def test_loads_itself_outside_shared_lookups(self, site, loads):
+        process_story(_story_df('map'))
+        process_story(_story_df('map'))
+        assert loads.count('objects') == 2
@@ -0,0 +1,71 @@
+"""
+Unit Tests for the Reusable Markdown Engine
+
+This module tests telar.markdown.render_markdown(), which keeps one
+configured Markdown instance per extension profile (and thread) instead of
+building a new one for every cell.
+
+Key behavior:
+- Output is identical to markdown.markdown() with the same extensions
+- Per-document state (footnotes, abbreviations, raw HTML) does not leak
+  into the next document
+- Each thread gets its own instances
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import threading
+
+import markdown
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import telar.markdown
+from telar.markdown import render_markdown, PANEL_EXTENSIONS, PAGE_EXTENSIONS
+
+DOCUMENTS = [
+    'Plain *text* with a [link](https://example.org).\nSecond line.',
+    'Text with a note.[^1]\n\n[^1]: The note.',
+    '*[HTML]: Hyper Text Markup Language\n\nThe HTML spec.',
+    'The HTML spec, with no abbreviation defined here.',
+    'Another note.[^1]\n\n[^1]: A different note.',
+    '| a | b |\n|---|---|\n| 1 | 2 |',
+    '<div markdown="1">**inside**</div>\n\n<span>raw</span>',
+    '1. one\n2. two\n\n* bullet\n* list',
+    'Term\n:   Definition',
+    '```\ncode\n```',
+    '',
+]
+
+
+class TestRenderMarkdown:
+    @pytest.mark.parametrize('extensions', [(), PANEL_EXTENSIONS, PAGE_EXTENSIONS])
+    def test_matches_markdown_markdown(self, extensions):
+        for document in DOCUMENTS + DOCUMENTS:
+            assert render_markdown(document, extensions) == markdown.markdown(
+                document, extensions=list(extensions))
+
+    def test_one_instance_per_profile(self):
+        render_markdown('a', PANEL_EXTENSIONS)
+        engines = telar.markdown._engines.by_profile
+        engine = engines[PANEL_EXTENSIONS]
+        render_markdown('b', list(PANEL_EXTENSIONS))
+        assert engines[PANEL_EXTENSIONS] is engine
+
+    def test_threads_get_their_own_instances(self):
+        render_markdown('a', PANEL_EXTENSIONS)
+        main_engine = telar.markdown._engines.by_profile[PANEL_EXTENSIONS]
+        seen = []
+
+        def worker():
+            render_markdown('b', PANEL_EXTENSIONS)
+            seen.append(telar.markdown._engines.by_profile[PANEL_EXTENSIONS])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert seen and seen[0] is not main_engine
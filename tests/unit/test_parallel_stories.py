@@ -0,0 +1,89 @@
+"""
+Unit Tests for Parallel Story Conversion
+
+This module tests core._convert_stories, which converts the story CSVs that
+are out of date across a pool of worker processes.
+
+Key behavior:
+- Parallel output matches a serial build
+- Each story's log is printed as one block, in input order
+- A failing story fails alone, with csv_to_json's False result
+- Converted stories are recorded in the build ledger; up-to-date ones are skipped
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.core import _convert_stories
+from telar.build_ledger import load_ledger
+
+KEYS = {'code': 'c1', 'config': 'k1', 'language': 'l1'}
+
+STORY_CSV = (
+    'step,question,answer,object,x,y,zoom,layer1_button,layer1_content\n'
+    '1,Question {n},Answer {n},obj-{n},0.5,0.5,1,More,story{n}.md\n'
+)
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    texts = tmp_path / 'telar-content' / 'texts' / 'stories'
+    texts.mkdir(parents=True)
+    (tmp_path / '_data').mkdir()
+    stories = []
+    for n in range(4):
+        (tmp_path / f'story{n}.csv').write_text(STORY_CSV.format(n=n), encoding='utf-8')
+        (texts / f'story{n}.md').write_text(f'---\ntitle: Panel {n}\n---\n**Body {n}**', encoding='utf-8')
+        stories.append((f'story{n}.csv', f'_data/story{n}.json'))
+    return tmp_path, stories
+
+
+def read_outputs(stories):
+    return [json.loads(open(json_path, encoding='utf-8').read()) for _, json_path in stories]
+
+
+class TestConvertStories:
+    def test_parallel_matches_serial(self, site):
+        _, stories = site
+        serial = _convert_stories(load_ledger(), KEYS, stories, jobs=1)
+        serial_outputs = read_outputs(stories)
+        parallel = _convert_stories(load_ledger(), KEYS, stories, jobs=3)
+        assert serial == parallel == {json_path: True for _, json_path in stories}
+        assert read_outputs(stories) == serial_outputs
+
+    def test_logs_are_printed_per_story_in_order(self, site, capsys):
+        _, stories = site
+        _convert_stories(load_ledger(), KEYS, stories, jobs=3)
+        out = capsys.readouterr().out
+        positions = [out.index(f'Converted {csv_path} to {json_path}') for csv_path, json_path in stories]
+        assert positions == sorted(positions)
+
+    def test_failure_is_isolated(self, site, capsys):
+        tmp_path, stories = site
+        (tmp_path / 'story2.csv').write_text('', encoding='utf-8')
+        results = _convert_stories(load_ledger(), KEYS, stories, jobs=2)
+        assert results['_data/story2.json'] is False
+        assert all(ok for json_path, ok in results.items() if json_path != '_data/story2.json')
+        assert 'Error converting story2.csv' in capsys.readouterr().out
+
+    def test_ledger_records_worker_inputs(self, site):
+        tmp_path, stories = site
+        ledger = load_ledger()
+        _convert_stories(ledger, KEYS, stories, jobs=2)
+        entry = ledger['outputs'][os.path.normpath('_data/story1.json')]
+        assert os.path.normpath('telar-content/texts/stories/story1.md') in entry['inputs']
+        assert os.path.normpath('_data/objects.json') in entry['inputs']
+
+        (tmp_path / 'telar-content' / 'texts' / 'stories' / 'story1.md').write_text('Edited panel', encoding='utf-8')
+        results = _convert_stories(ledger, KEYS, stories, jobs=2)
+        assert all(results.values())
+        assert 'Edited panel' in json.dumps(read_outputs(stories)[1])
@@ -0,0 +1,259 @@
+"""
+Unit Tests for the In-Process Build Pipeline
+
+This module tests telar.pipeline: the BuildContext shared between stages
+and the run_pipeline() stage runner used by build_local_site.py.
+
+Key behavior:
+- Stages run in order and a stage returning False stops the pipeline
+- Per-stage timings are printed
+- Context values are loaded once and reloaded after a stage that writes them
+- objects is None until _data/objects.json exists
+- With a CPU budget, independent stages overlap and dependents wait for
+  their dependencies; a failure stops the stages that depend on it
+- Concurrent stages do not see each other's validate-only mode or widget IDs
+- Stages with inputs and outputs are skipped until one of them changes
+- The critical path through the stage graph is reported
+- The collections stage renders with, and reserves, the run's CPU budget
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.pipeline import BuildContext, Stage, run_pipeline, critical_path, _resolve_deps
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '_data').mkdir()
+    return tmp_path
+
+
+def write_objects(site, objects):
+    (site / '_data' / 'objects.json').write_text(json.dumps(objects), encoding='utf-8')
+
+
+class TestRunPipeline:
+    def test_runs_stages_in_order_and_prints_timings(self, site, capsys):
+        calls = []
+        stages = [
+            Stage('first', 'Step 1: First', lambda context: calls.append('first')),
+            Stage('second', None, lambda context: calls.append('second')),
+        ]
+        assert run_pipeline(stages) is True
+        assert calls == ['first', 'second']
+        out = capsys.readouterr().out
+        assert 'Step 1: First' in out
+        assert 'Stage timings' in out
+        assert 'second' in out.split('Stage timings')[1]
+
+    def test_false_stops_the_pipeline(self, site, capsys):
+        calls = []
+        stages = [
+            Stage('broken', 'Step 1: Broken', lambda context: False),
+            Stage('later', None, lambda context: calls.append('later')),
+        ]
+        assert run_pipeline(stages) is False
+        assert calls == []
+        assert 'Step 1: Broken failed' in capsys.readouterr().out
+
+    def test_written_values_are_reloaded(self, site):
+        write_objects(site, [{'object_id': 'old'}])
+        context = BuildContext()
+        seen = []
+
+        def rewrite(context):
+            seen.append(context.objects[0]['object_id'])
+            write_objects(site, [{'object_id': 'new'}])
+
+        def read(context):
+            seen.append(context.objects[0]['object_id'])
+
+        run_pipeline([Stage('data', None, rewrite, writes=('objects',)),
+                      Stage('collections', None, read)], context)
+        assert seen == ['old', 'new']
+
+
+def backdate(path, seconds=60):
+    """Move a file's mtime into the past so the stage state trusts it."""
+    past = time.time_ns() - seconds * 10**9
+    os.utime(path, ns=(past, past))
+
+
+class TestStageGraph:
+    def test_independent_stages_overlap(self, site):
+        both_running = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def meet(name):
+            def run(context):
+                both_running.wait()
+                calls.append(name)
+            return run
+
+        stages = [
+            Stage('a', None, meet('a'), deps=[]),
+            Stage('b', None, meet('b'), deps=[]),
+            Stage('c', None, lambda context: calls.append('c'), deps=['a', 'b']),
+        ]
+        assert run_pipeline(stages, jobs=2) is True
+        assert sorted(calls[:2]) == ['a', 'b'] and calls[2] == 'c'
+
+    def test_concurrent_stages_do_not_share_mode_state(self, site):
+        from telar.check import validate_only, checking
+        from telar.widgets import get_widget_id, used_widget_ids
+        both_running = threading.Barrier(2, timeout=5)
+        seen = {}
+
+        def checker(context):
+            with validate_only():
+                get_widget_id('carousel a')
+                both_running.wait()
+                both_running.wait()
+
+        def renderer(context):
+            both_running.wait()
+            seen['checking'] = checking()
+            seen['widget_ids'] = used_widget_ids()
+            both_running.wait()
+
+        stages = [Stage('check', None, checker, deps=[]), Stage('render', None, renderer, deps=[])]
+        assert run_pipeline(stages, jobs=2) is True
+        assert seen == {'checking': False, 'widget_ids': set()}
+
+    def test_output_is_printed_per_stage(self, site, capsys):
+        def chatty(name):
+            def run(context):
+                for n in range(3):
+                    print(f'{name} line {n}')
+                    time.sleep(0.01)
+            return run
+
+        stages = [Stage(name, None, chatty(name), deps=[]) for name in ('a', 'b')]
+        run_pipeline(stages, jobs=2)
+        out = capsys.readouterr().out
+        assert 'a line 0\na line 1\na line 2\n' in out
+        assert 'b line 0\nb line 1\nb line 2\n' in out
+
+    def test_failure_stops_dependents(self, site, capsys):
+        calls = []
+        stages = [
+            Stage('broken', None, lambda context: False, deps=[]),
+            Stage('other', None, lambda context: calls.append('other'), deps=[]),
+            Stage('after', None, lambda context: calls.append('after'), deps=['broken']),
+        ]
+        assert run_pipeline(stages, jobs=2) is False
+        assert 'after' not in calls
+        assert 'broken failed' in capsys.readouterr().out
+
+    def test_deps_must_be_listed_first(self):
+        with pytest.raises(ValueError):
+            _resolve_deps([Stage('a', None, None, deps=['b']), Stage('b', None, None)])
+
+    def test_up_to_date_stage_is_skipped(self, site, capsys):
+        (site / 'in.txt').write_text('one', encoding='utf-8')
+        backdate(site / 'in.txt')
+        calls = []
+
+        def copy(context):
+            calls.append('copy')
+            (site / 'out.txt').write_text((site / 'in.txt').read_text(encoding='utf-8'), encoding='utf-8')
+
+        stage = Stage('copy', None, copy, inputs=['in.txt'], outputs=['out.txt'])
+        run_pipeline([stage])
+        run_pipeline([stage])
+        assert calls == ['copy']
+        assert 'copy: up to date' in capsys.readouterr().out
+
+        run_pipeline([stage], force=True)
+        (site / 'in.txt').write_text('two', encoding='utf-8')
+        run_pipeline([stage])
+        assert calls == ['copy', 'copy', 'copy']
+
+        backdate(site / 'in.txt')
+        run_pipeline([stage])
+        (site / 'out.txt').unlink()
+        run_pipeline([stage])
+        assert len(calls) == 5
+        run_pipeline([stage._replace(key='other')])
+        assert len(calls) == 6
+
+    def test_critical_path(self, site, capsys):
+        stages = [
+            Stage('fetch', None, None, deps=[]),
+            Stage('data', None, None, deps=['fetch']),
+            Stage('tiles', None, None, deps=['data']),
+            Stage('pages', None, None, deps=['data']),
+            Stage('js', None, None, deps=[]),
+            Stage('site', None, None, deps=['tiles', 'pages', 'js']),
+        ]
+        timings = {'fetch': 1.0, 'data': 2.0, 'tiles': 5.0, 'pages': 1.0, 'js': 7.0, 'site': 1.0}
+        path, seconds = critical_path(stages, _resolve_deps(stages), timings)
+        assert path == ['fetch', 'data', 'tiles', 'site']
+        assert seconds == 9.0
+
+        stages = [Stage('a', None, lambda context: None), Stage('b', None, lambda context: None)]
+        run_pipeline(stages, jobs=2)
+        assert 'Critical path' in capsys.readouterr().out
+
+
+class TestBuildContext:
+    def test_objects_loaded_once(self, site):
+        context = BuildContext()
+        assert context.objects is None
+        write_objects(site, [{'object_id': 'a'}])
+        # Still the cached (absent) value until invalidated
+        assert context.objects is None
+        context.invalidate('objects')
+        assert context.objects == [{'object_id': 'a'}]
+        assert context.objects is context.objects
+
+    def test_shared_values(self, site):
+        (site / 'telar-content' / 'objects').mkdir(parents=True)
+        (site / 'telar-content' / 'objects' / 'a.jpg').write_text('')
+        (site / '_config.yml').write_text('telar_language: en\n', encoding='utf-8')
+        context = BuildContext()
+        assert context.config == {'telar_language': 'en'}
+        assert 'a.jpg' in context.inventory['files']
+        assert context.glossary == {}
+
+
+    def test_language_strings_reloaded_after_invalidate(self, site):
+        (site / '_config.yml').write_text('telar_language: en\n', encoding='utf-8')
+        (site / '_data' / 'languages').mkdir()
+        strings = site / '_data' / 'languages' / 'en.yml'
+        strings.write_text('greeting: Hello\n', encoding='utf-8')
+        context = BuildContext()
+        context.invalidate('lang')
+        assert context.lang == {'greeting': 'Hello'}
+        strings.write_text('greeting: Hi\n', encoding='utf-8')
+        assert context.lang == {'greeting': 'Hello'}
+        context.invalidate('lang')
+        assert context.lang == {'greeting': 'Hi'}
+        context.invalidate('lang')
+
+
+class TestBuildStages:
+    def test_collections_stage(self, monkeypatch):
+        import argparse
+        import build_local_site
+        calls = []
+        monkeypatch.setattr(build_local_site, 'generate_collection_files',
+                            lambda context, jobs=1: calls.append(jobs) or True)
+        args = argparse.Namespace(jobs=None, force=False, skip_audio=True, skip_iiif=True, port=4001)
+        stages = {stage.name: stage for stage in build_local_site.build_stages(args, serve=True, jobs=4)}
+        assert stages['collections'].cpus == 4
+        assert 'telar-content/spreadsheets' in stages['collections'].inputs
+        stages['collections'].run(None)
+        assert calls == [4]
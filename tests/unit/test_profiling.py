@@ -0,0 +1,111 @@
+"""
+Unit Tests for Build Profiling
+
+This module tests telar.profiling, which backs the --profile and
+--profile-network flags of the build scripts.
+
+Key behavior:
+- --profile writes a .prof file, a hotspot summary limited to Telar's own
+  code and a tracemalloc memory summary into _build-profile/
+- --profile-network attributes request time, bytes and errors to each host
+  and restores urllib.request.urlopen afterwards
+- Without either flag nothing is written
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import pstats
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.profiling import profile_stage, track_network, PROFILE_DIR
+from telar.build_ledger import files_digest
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        body = b'x' * 2048
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestProfileStage:
+    def test_writes_reports(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'input.txt').write_text('data', encoding='utf-8')
+        with profile_stage('csv_to_json'):
+            for _ in range(5):
+                files_digest(['input.txt'])
+            blob = ['allocated'] * 50000
+
+        assert pstats.Stats(str(PROFILE_DIR / 'csv_to_json.prof')).total_calls > 0
+        hotspots = (PROFILE_DIR / 'csv_to_json-hotspots.txt').read_text(encoding='utf-8')
+        assert 'telar/build_ledger.py' in hotspots and '(files_digest)' in hotspots
+        assert 'pytest' not in hotspots
+        memory = (PROFILE_DIR / 'csv_to_json-memory.txt').read_text(encoding='utf-8')
+        assert memory.startswith('Peak traced memory')
+        assert 'test_profiling.py' in memory
+        assert not (PROFILE_DIR / 'csv_to_json-network.txt').exists()
+        assert 'Profile report: _build-profile/csv_to_json.prof' in capsys.readouterr().out
+        del blob
+
+    def test_disabled_writes_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with profile_stage('generate_iiif', profile=False, network=False):
+            pass
+        assert not PROFILE_DIR.exists()
+
+    def test_network_only(self, tmp_path, monkeypatch, server):
+        monkeypatch.chdir(tmp_path)
+        with profile_stage('generate_iiif', profile=False, network=True):
+            with urllib.request.urlopen(f'http://{server}/image.jpg') as response:
+                response.read()
+        report = (PROFILE_DIR / 'generate_iiif-network.txt').read_text(encoding='utf-8')
+        assert server in report
+        assert not (PROFILE_DIR / 'generate_iiif.prof').exists()
+
+
+class TestTrackNetwork:
+    def test_attributes_requests_to_hosts(self, server):
+        original = urllib.request.urlopen
+        with track_network() as log:
+            request = urllib.request.Request(f'http://{server}/manifest.json')
+            with urllib.request.urlopen(request, timeout=5) as response:
+                assert len(response.read()) == 2048
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f'http://{server}/missing', timeout=5)
+
+        assert urllib.request.urlopen is original
+        entry = log.hosts[server]
+        assert entry['requests'] == 2
+        assert entry['errors'] == 1
+        assert entry['bytes'] == 2048
+        assert entry['seconds'] > 0
+        assert log.report().splitlines()[1].endswith(server)
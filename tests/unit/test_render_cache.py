@@ -0,0 +1,114 @@
+"""
+Unit Tests for the Markdown Render Cache
+
+This module tests the render cache in telar.markdown: inside
+cached_rendering(), a panel whose text, pipeline and input files are
+unchanged is served from the build state store instead of being run
+through the widget/image/LaTeX/markdown pipeline again.
+
+Key behavior:
+- A cache hit returns the same HTML and replays the same widget warnings
+- Changing a file the render read (a widget template) invalidates it
+- Inputs of a cached panel are still recorded for the build ledger
+- Widget IDs stay unique on a page; renders with suffixed IDs are not stored
+- Nothing is cached outside cached_rendering()
+- Language strings changed between builds (a watch session) miss the cache
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import telar.markdown
+from telar.markdown import cached_rendering, process_inline_content
+from telar.build_state import BuildState
+from telar.build_ledger import track_inputs
+from telar.widgets import reset_widget_ids
+
+TABS = ':::tabs\n## One\nFirst\n## Two\nSecond\n:::'
+ONE_TAB = ':::tabs\n## Only\nText\n:::'
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    widgets = tmp_path / '_includes' / 'widgets'
+    widgets.mkdir(parents=True)
+    (widgets / 'tabs.html').write_text('<div id="{{ widget_id }}">v1</div>', encoding='utf-8')
+    state = BuildState(tmp_path / 'build.db')
+    yield state
+    state.close()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+    render = telar.markdown._render
+
+    def counting_render(body, widget_source, widget_warnings):
+        calls.append(body)
+        return render(body, widget_source, widget_warnings)
+
+    monkeypatch.setattr(telar.markdown, '_render', counting_render)
+    return calls
+
+
+def render_page(text, state, warnings=None):
+    reset_widget_ids()
+    with cached_rendering(state):
+        return process_inline_content(text, warnings)['content']
+
+
+class TestRenderCache:
+    def test_hit_returns_same_html_and_warnings(self, site, renders):
+        first_warnings, second_warnings = [], []
+        first = render_page(f'**Bold**\n\n{ONE_TAB}', site, first_warnings)
+        second = render_page(f'**Bold**\n\n{ONE_TAB}', site, second_warnings)
+        assert second == first
+        assert second_warnings == first_warnings and first_warnings
+        assert len(renders) == 1
+
+    def test_changed_template_invalidates(self, site, renders):
+        assert 'v1' in render_page(TABS, site)
+        template = site.path.parent / '_includes' / 'widgets' / 'tabs.html'
+        template.write_text('<div id="{{ widget_id }}">v2-changed</div>', encoding='utf-8')
+        assert 'v2-changed' in render_page(TABS, site)
+        assert len(renders) == 2
+
+    def test_hit_records_inputs(self, site):
+        render_page(TABS, site)
+        with track_inputs() as tracked:
+            render_page(TABS, site)
+        assert os.path.join('_includes', 'widgets', 'tabs.html') in tracked['files']
+
+    def test_widget_ids_stay_unique_on_a_page(self, site, renders):
+        reset_widget_ids()
+        with cached_rendering(site):
+            first = process_inline_content(TABS)['content']
+            repeat = process_inline_content(TABS)['content']
+        assert first != repeat and '-2"' in repeat
+        # The suffixed render was not stored; a new page reuses the first one
+        assert render_page(TABS, site) == first
+        assert len(renders) == 2
+
+    def test_inactive_outside_cached_rendering(self, site, renders):
+        process_inline_content(TABS)
+        process_inline_content(TABS)
+        assert len(renders) == 2
+        assert site.items('render') == {}
+
+    def test_language_change_between_builds_invalidates(self, site, renders, monkeypatch):
+        strings = {'widget': 'one'}
+        monkeypatch.setattr(telar.markdown, 'load_language_data', lambda: strings)
+        render_page(TABS, site)
+        strings = {'widget': 'two'}
+        render_page(TABS, site)
+        assert len(renders) == 2
+        render_page(TABS, site)
+        assert len(renders) == 2
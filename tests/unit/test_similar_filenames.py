@@ -0,0 +1,87 @@
+"""
+Unit Tests for Near-Match Image Filename Suggestions
+
+This module tests _find_similar_image_filenames, which suggests image files
+whose names are close to an object_id that has no exact local image. The
+directory is indexed once and SequenceMatcher only runs on a shortlist, so
+the tests compare it against a straightforward full scan.
+
+Key behavior:
+- Case and hyphen/underscore variations are suggested
+- The exact object_id file is never suggested
+- Only image extensions are considered
+- Results match a full SequenceMatcher scan at the 0.85 threshold
+- The index is rebuilt when the directory changes
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import re
+import random
+from difflib import SequenceMatcher
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.processors.objects import _find_similar_image_filenames
+
+
+def full_scan(object_id, images_dir):
+    """Reference implementation: compare against every image file."""
+    normalized_id = re.sub(r'[-_\s]', '', object_id.lower())
+    similar = []
+    for file_path in images_dir.iterdir():
+        if not file_path.is_file():
+            continue
+        if file_path.suffix.lower() not in {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.tif', '.tiff'}:
+            continue
+        if file_path.stem.lower() == object_id.lower():
+            continue
+        normalized_file = re.sub(r'[-_\s]', '', file_path.stem.lower())
+        if SequenceMatcher(None, normalized_id, normalized_file).ratio() > 0.85:
+            similar.append(file_path.name)
+    return similar
+
+
+class TestFindSimilarImageFilenames:
+    def test_suggests_case_and_separator_variants(self, tmp_path):
+        for name in ('My_Object.jpg', 'my-object-2.png', 'unrelated.jpg', 'my-object.txt'):
+            (tmp_path / name).write_text('')
+        result = _find_similar_image_filenames('my-object', tmp_path)
+        assert sorted(result) == ['My_Object.jpg', 'my-object-2.png']
+
+    def test_exact_match_is_not_suggested(self, tmp_path):
+        (tmp_path / 'Map-1650.jpg').write_text('')
+        assert _find_similar_image_filenames('map-1650', tmp_path) == []
+
+    def test_missing_directory(self, tmp_path):
+        assert _find_similar_image_filenames('obj', tmp_path / 'missing') == []
+
+    def test_matches_full_scan(self, tmp_path):
+        rng = random.Random(7)
+        alphabet = 'abcab-_ 12'
+        names = set()
+        for _ in range(300):
+            stem = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) or 'x'
+            names.add(stem + rng.choice(['.jpg', '.PNG', '.tif', '.txt']))
+        for name in names:
+            (tmp_path / name).write_text('')
+
+        object_ids = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                      for _ in range(150)]
+        object_ids += [name.rsplit('.', 1)[0] for name in sorted(names)[:20]]
+        for object_id in object_ids:
+            assert sorted(_find_similar_image_filenames(object_id, tmp_path)) == \
+                sorted(full_scan(object_id, tmp_path)), object_id
+
+    def test_index_refreshes_when_directory_changes(self, tmp_path):
+        (tmp_path / 'codex-a.jpg').write_text('')
+        assert _find_similar_image_filenames('codex-b', tmp_path) == []
+
+        (tmp_path / 'codex_b1.jpg').write_text('')
+        # Force a visible mtime change on filesystems with coarse timestamps
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert _find_similar_image_filenames('codex-b', tmp_path) == ['codex_b1.jpg']
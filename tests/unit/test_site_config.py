@@ -0,0 +1,106 @@
+"""
+Unit Tests for the Cached Site Config Accessor
+
+This module tests load_site_config and its typed views in telar.config.
+_config.yml is read by many pipeline stages; the accessor parses it once per
+process and again only when the file changes.
+
+Key behavior:
+- A missing or empty config is an empty dict
+- Repeated reads reuse the cached parse; each caller gets its own copy
+- Edits are picked up, including same-size edits within the mtime window
+- Typed views: language, base URL, development features, story_key
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import time
+
+import yaml
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.config import (
+    load_site_config, load_site_language, get_base_url,
+    get_development_features, get_story_key
+)
+
+
+def write_config(path, text, mtime_ns=None):
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadSiteConfig:
+    def test_missing_and_empty(self, tmp_path):
+        assert load_site_config(tmp_path / '_config.yml') == {}
+        write_config(tmp_path / '_config.yml', '')
+        assert load_site_config(tmp_path / '_config.yml') == {}
+
+    def test_cached_until_changed(self, tmp_path, monkeypatch):
+        config_path = tmp_path / '_config.yml'
+        past = time.time_ns() - 60 * 10**9
+        write_config(config_path, 'title: One\n', past)
+        parses = []
+        load = yaml.load
+        monkeypatch.setattr(yaml, 'load', lambda *args, **kwargs: parses.append(1) or load(*args, **kwargs))
+        assert load_site_config(config_path) == {'title': 'One'}
+        assert load_site_config(config_path) == {'title': 'One'}
+        assert len(parses) == 1
+
+        write_config(config_path, 'title: Two and more\n', past + 10**9)
+        assert load_site_config(config_path) == {'title': 'Two and more'}
+
+    def test_callers_get_their_own_copy(self, tmp_path):
+        config_path = tmp_path / '_config.yml'
+        write_config(config_path, 'collection_interface:\n  featured_count: 4\n',
+                     time.time_ns() - 60 * 10**9)
+        config = load_site_config(config_path)
+        config['collection_interface']['featured_count'] = 8
+        config['title'] = 'Changed'
+        assert load_site_config(config_path) == {'collection_interface': {'featured_count': 4}}
+
+    def test_same_size_edit_in_same_tick_is_seen(self, tmp_path):
+        config_path = tmp_path / '_config.yml'
+        write_config(config_path, 'telar_language: en\n')
+        mtime = config_path.stat().st_mtime_ns
+        assert load_site_config(config_path)['telar_language'] == 'en'
+
+        # Same size, same mtime: only the fresh-mtime content check catches it
+        write_config(config_path, 'telar_language: es\n', mtime)
+        assert load_site_config(config_path)['telar_language'] == 'es'
+
+
+class TestTypedViews:
+    def test_views_read_the_cwd_config(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        write_config(tmp_path / '_config.yml', (
+            'telar_language: es\n'
+            'url: https://example.org\n'
+            'baseurl: /site\n'
+            'story_key: secret\n'
+            'testing-features:\n'
+            '  christmas_tree_mode: true\n'
+        ))
+        assert load_site_language() == 'es'
+        assert get_base_url() == 'https://example.org/site'
+        assert get_story_key() == 'secret'
+        assert get_development_features() == {'christmas_tree_mode': True}
+
+    def test_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert load_site_language() == 'en'
+        assert get_base_url() is None
+        assert get_story_key() == ''
+        assert get_development_features() == {}
+
+    def test_development_features_preferred_over_legacy(self):
+        config = {
+            'development-features': {'skip_stories': True},
+            'testing-features': {'christmas_tree_mode': True},
+        }
+        assert get_development_features(config) == {'skip_stories': True}
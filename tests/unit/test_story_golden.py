@@ -0,0 +1,87 @@
+"""
+Golden-File Tests for Story Conversion
+
+This module converts a set of story spreadsheets with process_story() and
+compares the JSON written by csv_to_json() with known-good copies in
+tests/fixtures/golden-stories/expected/. It pins the exact output of the
+story processor, so refactors of its passes cannot change a published
+story without a test noticing.
+
+The stories are the two blank templates shipped in telar-content/ plus
+fixture stories that go through every branch: valid, invalid and
+fractional page values, object references with other case, file
+extensions, missing objects, objects without a source and local images,
+markdown panels that exist, are missing, escape the texts folder or carry
+the legacy "Content Missing" title, inline panels with valid and broken
+widgets, glossary links in answers and panels, LaTeX in several forms,
+default coordinates, blank rows and out-of-order steps.
+
+Key behavior:
+- Every story converts to exactly the JSON in expected/
+- Christmas Tree Mode adds its test warnings to the same output
+
+Set TELAR_UPDATE_GOLDEN=1 to rewrite the expected files after an intended
+change, and review the diff.
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import shutil
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar import config as telar_config
+from telar.core import csv_to_json
+from telar.processors.stories import process_story
+
+REPO = Path(__file__).resolve().parents[2]
+FIXTURE = REPO / 'tests' / 'fixtures' / 'golden-stories'
+EXPECTED = FIXTURE / 'expected'
+
+STORIES = ['tour', 'plain', 'blank_template', 'plantilla_en_blanco']
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    shutil.copytree(FIXTURE, tmp_path, dirs_exist_ok=True, ignore=shutil.ignore_patterns('expected'))
+    shutil.copytree(REPO / '_includes' / 'widgets', tmp_path / '_includes' / 'widgets')
+    shutil.copytree(REPO / '_data' / 'languages', tmp_path / '_data' / 'languages')
+    for template in STORIES[2:]:
+        shutil.copy(REPO / 'telar-content' / 'spreadsheets' / f'{template}.csv',
+                    tmp_path / 'telar-content' / 'spreadsheets')
+        shutil.copytree(REPO / 'telar-content' / 'texts' / 'stories' / template,
+                        tmp_path / 'telar-content' / 'texts' / 'stories' / template)
+    monkeypatch.chdir(tmp_path)
+    telar_config.clear_language_cache()
+    yield tmp_path
+    telar_config.clear_language_cache()
+
+
+def convert(site, story, christmas_tree=False):
+    out = site / f'{story}.json'
+    process_func = partial(process_story, christmas_tree=christmas_tree)
+    assert csv_to_json(str(site / 'telar-content' / 'spreadsheets' / f'{story}.csv'), str(out), process_func)
+    return out.read_text(encoding='utf-8')
+
+
+def check_golden(name, actual):
+    expected_path = EXPECTED / f'{name}.json'
+    if os.environ.get('TELAR_UPDATE_GOLDEN'):
+        expected_path.write_text(actual, encoding='utf-8')
+    assert actual == expected_path.read_text(encoding='utf-8')
+
+
+class TestStoryGolden:
+    @pytest.mark.parametrize('story', STORIES)
+    def test_story_matches_golden(self, site, story):
+        check_golden(story, convert(site, story))
+
+    def test_christmas_tree_matches_golden(self, site):
+        check_golden('tour-christmas-tree', convert(site, 'tour', christmas_tree=True))
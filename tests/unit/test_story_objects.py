@@ -0,0 +1,81 @@
+"""
+Unit Tests for Per-Story Objects Data
+
+This module tests that a story's data file lists the objects the story
+uses, so _layouts/story.html can give the page only those instead of the
+whole objects catalogue.
+
+Key behavior:
+- process_story() keeps each referenced object once, in order of first use,
+  under its canonical ID (references are matched case-insensitively)
+- Missing objects and steps without an object add nothing
+- csv_to_json() writes the list into the story's _metadata block, even when
+  it is empty
+- Demo stories list their objects the same way
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import json
+
+import pandas as pd
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.core import csv_to_json
+from telar.processors.stories import process_story
+from telar.demo import merge_demo_content
+
+MANIFEST = 'https://example.org/iiif/manifest.json'
+OBJECTS = {
+    object_id: {'object_id': object_id, 'title': object_id.title(), 'iiif_manifest': MANIFEST}
+    for object_id in ('map', 'globe', 'atlas')
+}
+
+
+def _story_df(objects):
+    return pd.DataFrame([
+        {'step': str(n), 'question': 'Q', 'answer': '', 'object': object_id,
+         'x': '0.5', 'y': '0.5', 'zoom': '1'}
+        for n, object_id in enumerate(objects, 1)
+    ])
+
+
+class TestStoryObjects:
+    def test_referenced_objects_in_order_of_first_use(self):
+        df = process_story(_story_df(['globe', 'MAP', 'globe', '', 'ghost']), objects_data=OBJECTS)
+        assert df.attrs['objects'] == [OBJECTS['globe'], OBJECTS['map']]
+
+    def test_written_to_metadata(self, tmp_path):
+        csv = tmp_path / 'tour.csv'
+        csv.write_text('step,question,answer,object\n1,Q,A,map\n2,Q,A,map\n', encoding='utf-8')
+        out = tmp_path / 'tour.json'
+        assert csv_to_json(str(csv), str(out), lambda df: process_story(df, objects_data=OBJECTS))
+        metadata = json.loads(out.read_text(encoding='utf-8'))[0]
+        assert metadata['_metadata'] is True
+        assert metadata['objects'] == [OBJECTS['map']]
+
+    def test_story_without_objects_writes_empty_list(self, tmp_path):
+        csv = tmp_path / 'tour.csv'
+        csv.write_text('step,question,answer,object\n1,Q,A,\n', encoding='utf-8')
+        out = tmp_path / 'tour.json'
+        assert csv_to_json(str(csv), str(out), lambda df: process_story(df, objects_data=OBJECTS))
+        assert json.loads(out.read_text(encoding='utf-8'))[0] == {'_metadata': True, 'objects': []}
+
+    def test_demo_story_lists_its_objects(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / '_data').mkdir()
+        (tmp_path / '_data' / 'objects.json').write_text(json.dumps([OBJECTS['map']]), encoding='utf-8')
+        merge_demo_content({
+            'objects': {'demo-globe': {'title': 'Globe', 'source_url': MANIFEST}},
+            'stories': {'demo-tour': {'steps': [
+                {'step': 1, 'object': 'demo-globe'}, {'step': 2, 'object': 'map'},
+                {'step': 3, 'object': 'demo-globe'},
+            ]}},
+        })
+        steps = json.loads((tmp_path / '_data' / 'demo-tour.json').read_text(encoding='utf-8'))
+        assert [obj['object_id'] for obj in steps[0]['objects']] == ['demo-globe', 'map']
+        assert len(steps) == 4
@@ -0,0 +1,175 @@
+"""
+Unit Tests for Watch Mode
+
+This module tests telar.watch, which rebuilds the data and collection
+files affected by edits under telar-content/ while an author works.
+
+Key behavior:
+- Snapshots detect added, removed and modified files
+- Each kind of content file maps to the data step and the collection parts
+  that depend on it; pages skip the data step, _config.yml rebuilds all
+- The watch loop waits for a burst of writes to settle, then rebuilds once
+  with the plan for every changed file
+- A failed rebuild, including one that exits, is reported and watching
+  goes on
+- The data step of a rebuild uses the language set in an edited _config.yml
+
+Version: v1.6.0
+"""
+
+import sys
+import os
+import time
+import threading
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.watch import snapshot, changed_paths, plan_rebuild, watch, ALL_PARTS
+
+
+def p(path):
+    return os.path.normpath(path)
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stories = tmp_path / 'telar-content' / 'texts' / 'stories'
+    stories.mkdir(parents=True)
+    (stories / 'panel.md').write_text('Hello', encoding='utf-8')
+    (tmp_path / '_config.yml').write_text('title: Test\n', encoding='utf-8')
+    return tmp_path
+
+
+class TestSnapshot:
+    def test_detects_changes(self, site):
+        before = snapshot()
+        assert p('telar-content/texts/stories/panel.md') in before
+        assert p('_config.yml') in before
+
+        (site / 'telar-content' / 'texts' / 'stories' / 'panel.md').write_text('Hello again', encoding='utf-8')
+        (site / 'telar-content' / 'texts' / 'stories' / 'new.md').write_text('New', encoding='utf-8')
+        (site / '_config.yml').unlink()
+        assert changed_paths(before, snapshot()) == sorted([
+            p('_config.yml'),
+            p('telar-content/texts/stories/new.md'),
+            p('telar-content/texts/stories/panel.md'),
+        ])
+
+
+class TestPlanRebuild:
+    @pytest.mark.parametrize('path, data, parts', [
+        ('telar-content/texts/stories/my-story/panel.md', True, {'stories'}),
+        ('telar-content/spreadsheets/my-story.csv', True, {'stories'}),
+        ('telar-content/spreadsheets/project.csv', True, {'stories'}),
+        ('telar-content/spreadsheets/objetos.csv', True, {'objects', 'stories'}),
+        ('telar-content/objects/map.jpg', True, {'objects', 'stories'}),
+        ('telar-content/spreadsheets/glossary.csv', True, {'glossary', 'pages'}),
+        ('telar-content/texts/glossary/term.md', True, {'glossary', 'pages'}),
+        ('telar-content/texts/pages/about.md', False, {'pages'}),
+        ('telar-content/texts/README.md', False, set()),
+    ])
+    def test_maps_paths_to_work(self, path, data, parts):
+        plan = plan_rebuild([p(path)])
+        assert plan['data'] is data
+        assert plan['parts'] == parts
+        assert plan['fetch_demo'] is False
+
+    def test_config_rebuilds_everything(self):
+        plan = plan_rebuild([p('_config.yml')])
+        assert plan == {'data': True, 'fetch_demo': True, 'parts': set(ALL_PARTS)}
+
+    def test_plans_are_combined(self):
+        plan = plan_rebuild([p('telar-content/texts/pages/about.md'),
+                             p('telar-content/objects/map.jpg')])
+        assert plan['data'] is True
+        assert plan['parts'] == {'objects', 'stories', 'pages'}
+
+
+class TestWatchLoop:
+    def test_burst_of_edits_rebuilds_once(self, site, capsys):
+        plans = []
+        pages = site / 'telar-content' / 'texts' / 'pages'
+
+        def edit():
+            time.sleep(0.1)
+            pages.mkdir()
+            (pages / 'about.md').write_text('About', encoding='utf-8')
+            (site / 'telar-content' / 'texts' / 'stories' / 'panel.md').write_text('Edited', encoding='utf-8')
+
+        thread = threading.Thread(target=edit)
+        thread.start()
+        watch(context=object(), interval=0.05,
+              rebuild_func=lambda plan, context: plans.append(plan), max_rebuilds=1)
+        thread.join()
+
+        assert plans == [{'data': True, 'fetch_demo': False, 'parts': {'stories', 'pages'}}]
+        assert 'Rebuilt data, pages, stories' in capsys.readouterr().out
+
+    def test_failed_rebuild_keeps_watching(self, site, capsys):
+        def boom(plan, context):
+            raise ValueError('bad CSV')
+
+        def edit():
+            time.sleep(0.1)
+            (site / '_config.yml').write_text('title: Changed\n', encoding='utf-8')
+
+        thread = threading.Thread(target=edit)
+        thread.start()
+        watch(context=object(), interval=0.05, rebuild_func=boom, max_rebuilds=1)
+        thread.join()
+        out = capsys.readouterr().out
+        assert 'Rebuild failed: bad CSV' in out
+        assert 'Rebuild incomplete' in out
+
+    def test_exiting_rebuild_keeps_watching(self, site, capsys):
+        calls = []
+
+        def exits(plan, context):
+            calls.append(plan)
+            if len(calls) == 1:
+                raise SystemExit(1)
+
+        def edit():
+            time.sleep(0.1)
+            (site / '_config.yml').write_text('title: Changed\n', encoding='utf-8')
+            time.sleep(0.3)
+            (site / '_config.yml').write_text('title: Fixed\n', encoding='utf-8')
+
+        thread = threading.Thread(target=edit)
+        thread.start()
+        watch(context=object(), interval=0.05, rebuild_func=exits, max_rebuilds=2)
+        thread.join()
+        out = capsys.readouterr().out
+        assert len(calls) == 2
+        assert 'Rebuild failed (exit status 1)' in out
+        assert '✓ Rebuilt' in out
+
+
+class TestRebuild:
+    def test_language_change_reaches_the_data_step(self, site, monkeypatch):
+        import telar.core
+        from telar.config import get_lang_string, clear_language_cache
+        from telar.pipeline import BuildContext
+        from telar.watch import rebuild
+        languages = site / '_data' / 'languages'
+        languages.mkdir(parents=True)
+        (languages / 'en.yml').write_text('greeting: Hello\n', encoding='utf-8')
+        (languages / 'es.yml').write_text('greeting: Hola\n', encoding='utf-8')
+        (site / '_config.yml').write_text('telar_language: en\n', encoding='utf-8')
+        clear_language_cache()
+        context = BuildContext()
+        assert get_lang_string('greeting') == 'Hello'
+
+        seen = []
+        monkeypatch.setattr(telar.core, 'build_data',
+                            lambda jobs, fetch_demo: seen.append(get_lang_string('greeting')) or True)
+        (site / '_config.yml').write_text('telar_language: es\n', encoding='utf-8')
+        try:
+            assert rebuild({'data': True, 'fetch_demo': False, 'parts': set()}, context)
+        finally:
+            clear_language_cache()
+        assert seen == ['Hola']